@@ -0,0 +1,87 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the event loop responsiveness while iterating over addresses, blocking vs asynchronous iterator.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_async [addr_num]
+"""
+
+# Imports
+import asyncio
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletBip84Coins, HdWalletBipFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 2000
+# Period of the heartbeat task in seconds
+HEARTBEAT_PERIOD = 0.001
+
+
+# Heartbeat task, which measures the maximum delay of the event loop
+async def heartbeat(max_delay):
+    while True:
+        start_time = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_PERIOD)
+        max_delay[0] = max(max_delay[0], time.perf_counter() - start_time - HEARTBEAT_PERIOD)
+
+
+# Measure the iteration time and the maximum event loop delay
+async def bench_iter(hd_wallet, addr_num, chunk_size):
+    max_delay = [0.0]
+    heartbeat_task = asyncio.ensure_future(heartbeat(max_delay))
+    await asyncio.sleep(0)
+
+    start_time = time.perf_counter()
+    if chunk_size is None:
+        for _ in hd_wallet.IterAddresses(stop=addr_num):
+            pass
+    else:
+        async for _ in hd_wallet.IterAddressesAsync(stop=addr_num, chunk_size=chunk_size):
+            pass
+    elapsed = time.perf_counter() - start_time
+
+    # Let the heartbeat task measure the last delay
+    await asyncio.sleep(HEARTBEAT_PERIOD * 2)
+    heartbeat_task.cancel()
+    return elapsed, max_delay[0]
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+
+    print(f"Addresses: {addr_num}")
+    for chunk_size in (None, 256, 32, 8):
+        elapsed, max_delay = asyncio.run(bench_iter(hd_wallet, addr_num, chunk_size))
+        print(f"{'Blocking' if chunk_size is None else f'Async chunk size {chunk_size}'}: {elapsed:.2f} s, "
+              f"max event loop delay {max_delay * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of batch wallet creation from mnemonics in the current process vs worker processes.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_batch [wallets_num] [workers]
+"""
+
+# Imports
+import os
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of wallets
+DEF_WALLETS_NUM = 2000
+
+
+# Measure the creation time of the wallets
+def bench_create(hd_wallet_fact, mnemonics, workers):
+    start_time = time.perf_counter()
+    hd_wallets = list(hd_wallet_fact.CreateFromMnemonics(mnemonics, workers))
+    return time.perf_counter() - start_time, hd_wallets
+
+
+# Main function
+def main():
+    wallets_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_WALLETS_NUM
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    hd_wallet_fact = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN)
+    # Use a different passphrase for each wallet, so that every seed is different
+    mnemonics = [(f"wallet_{i}", TEST_MNEMONIC, str(i)) for i in range(wallets_num)]
+
+    serial_time, serial_wallets = bench_create(hd_wallet_fact, mnemonics, None)
+    workers_time, workers_wallets = bench_create(hd_wallet_fact, mnemonics, workers)
+    assert [w.ToJson() for w in serial_wallets] == [w.ToJson() for w in workers_wallets]
+
+    print(f"Wallets: {wallets_num}")
+    print(f"Current process      : {serial_time:.3f} s")
+    print(f"Worker processes ({workers}): {workers_time:.3f} s")
+    print(f"Speedup              : {serial_time / workers_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the Cardano Shelley addresses generation of both change chains, encoding each address with the staking
+key by bip_utils vs in batch with the staking credential computed once for the account.
+Since bip_utils caches the keys of each CardanoShelley object, a new object is used for each measurement.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_cardano_shelley_addr [addr_num]
+"""
+
+# Imports
+import sys
+import time
+
+from bip_utils import CardanoShelley, Cip1852, Cip1852Coins
+
+from py_crypto_hd_wallet import (
+    HdWalletCardanoShelleyChangeAddresses,
+    HdWalletCardanoShelleyChanges,
+    HdWalletCardanoShelleyDerivedKeys,
+)
+
+
+# Seed used for the benchmark
+TEST_SEED = bytes(range(32))
+# Default number of addresses for each change chain
+DEF_ADDR_NUM = 1000
+
+
+# Generate addresses one at a time, each one encoded with the staking key
+def generate_single(shelley_obj, addr_num):
+    return [HdWalletCardanoShelleyDerivedKeys(shelley_obj.Change(change_idx).AddressIndex(i)).ToDict()
+            for change_idx in HdWalletCardanoShelleyChanges
+            for i in range(addr_num)]
+
+
+# Generate addresses of both change chains in batch
+def generate_batch(shelley_obj, addr_num):
+    change_objs = {change_idx: shelley_obj.Change(change_idx) for change_idx in HdWalletCardanoShelleyChanges}
+    return [addr.ToDict() for addr in HdWalletCardanoShelleyChangeAddresses(change_objs, addr_num, 0)]
+
+
+# Measure the time of the specified function
+def bench_fct(fct, addr_num):
+    shelley_obj = CardanoShelley.FromCip1852Object(
+        Cip1852.FromSeed(TEST_SEED, Cip1852Coins.CARDANO_ICARUS).Purpose().Coin().Account(0)
+    )
+    start_time = time.perf_counter()
+    addrs = fct(shelley_obj, addr_num)
+    return time.perf_counter() - start_time, addrs
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+    tot_addr_num = addr_num * len(HdWalletCardanoShelleyChanges)
+
+    single_time, single_addrs = bench_fct(generate_single, addr_num)
+    batch_time, batch_addrs = bench_fct(generate_batch, addr_num)
+    if single_addrs != batch_addrs:
+        raise RuntimeError("Addresses mismatch")
+
+    print(f"Addresses: {tot_addr_num} ({addr_num} for each change chain)")
+    print(f"Single   : {single_time:8.3f} s ({single_time / tot_addr_num * 1e6:8.2f} us per address)")
+    print(f"Batch    : {batch_time:8.3f} s ({batch_time / tot_addr_num * 1e6:8.2f} us per address)")
+    print(f"Speedup  : {single_time / batch_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Microbenchmark of the per-coin constants, resolved from the coin configuration for each key vs cached once.
+Since bip_utils caches the address and WIF of each key object, every measurement uses freshly derived keys.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_coin_info [addr_num]
+"""
+
+# Imports
+import sys
+import time
+
+from bip_utils import Bip39SeedGenerator, Bip44Changes, Bip84, Bip84Coins
+
+from py_crypto_hd_wallet.common import HdWalletCoinInfo
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 1000
+# Number of repetitions (the best time is taken)
+REPEAT_NUM = 5
+
+
+# Derive fresh address objects (public and private keys are computed in advance, since they are not measured)
+def derive_addresses(change_obj, addr_num):
+    bip_objs = [change_obj.AddressIndex(i) for i in range(addr_num)]
+    for bip_obj in bip_objs:
+        bip_obj.PublicKey()
+        bip_obj.PrivateKey()
+    return bip_objs
+
+
+# Measure the time per address of the specified function
+def bench_fct(fct, bip_objs):
+    start_time = time.perf_counter()
+    for bip_obj in bip_objs:
+        fct(bip_obj)
+    return (time.perf_counter() - start_time) / len(bip_objs) * 1e6
+
+
+# Print the best time per address of both cases
+def print_times(name, change_obj, addr_num, uncached_fct, cached_fct):
+    uncached_time = min(bench_fct(uncached_fct, derive_addresses(change_obj, addr_num)) for _ in range(REPEAT_NUM))
+    cached_time = min(bench_fct(cached_fct, derive_addresses(change_obj, addr_num)) for _ in range(REPEAT_NUM))
+    print(f"{name:<9}: {uncached_time:8.2f} us -> {cached_time:8.2f} us ({uncached_time - cached_time:+.2f} us)")
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    change_obj = (Bip84.FromSeed(Bip39SeedGenerator(TEST_MNEMONIC).Generate(), Bip84Coins.BITCOIN)
+                  .Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT))
+    coin_conf = change_obj.CoinConf()
+    coin_info = HdWalletCoinInfo.FromConf(coin_conf)
+
+    print(f"Addresses: {addr_num}, time per address (uncached -> cached)")
+    print_times("Coin name", change_obj, addr_num,
+                lambda _: f"{coin_conf.CoinNames().Name()} ({coin_conf.CoinNames().Abbreviation()})",
+                lambda _: coin_info.Name())
+    print_times("Address", change_obj, addr_num,
+                lambda bip_obj: bip_obj.PublicKey().ToAddress(),
+                lambda bip_obj: coin_info.EncodeAddress(bip_obj.PublicKey().Bip32Key().KeyObject()))
+    print_times("WIF", change_obj, addr_num,
+                lambda bip_obj: bip_obj.PrivateKey().ToWif(),
+                lambda bip_obj: coin_info.EncodeWif(bip_obj.PrivateKey().Bip32Key().KeyObject()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of reading saved addresses, JSON format vs columnar format.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_columnar [addr_num]
+"""
+
+# Imports
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipFactory, HdWalletColumnarReader, HdWalletSaver
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 20000
+# Number of random accesses
+ACCESS_NUM = 1000
+
+
+# Measure the time of loading a JSON file and accessing some random addresses
+def bench_json(file_path, rows):
+    start_time = time.perf_counter()
+    with open(file_path, "r") as f:
+        addr_dict = json.load(f)["address"]
+    addresses = [addr_dict[f"address_{row}"]["address"] for row in rows]
+    return time.perf_counter() - start_time, addresses
+
+
+# Measure the time of opening a columnar file and accessing some random addresses
+def bench_columnar(file_path, rows):
+    start_time = time.perf_counter()
+    with HdWalletColumnarReader(file_path) as reader:
+        addresses = [reader.GetValue(row, "address") for row in rows]
+    return time.perf_counter() - start_time, addresses
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+    hd_wallet.Generate(addr_num=addr_num)
+    rows = [random.randrange(addr_num) for _ in range(ACCESS_NUM)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "wallet.json")
+        columnar_path = os.path.join(tmp_dir, "wallet.hdwc")
+        HdWalletSaver(hd_wallet).SaveToFile(json_path)
+        HdWalletSaver(hd_wallet).SaveToColumnarFile(columnar_path, include_priv=True)
+
+        json_time, json_addresses = bench_json(json_path, rows)
+        columnar_time, columnar_addresses = bench_columnar(columnar_path, rows)
+        json_size = os.path.getsize(json_path)
+        columnar_size = os.path.getsize(columnar_path)
+    assert json_addresses == columnar_addresses
+
+    print(f"Addresses: {addr_num}, random accesses: {ACCESS_NUM}")
+    print(f"JSON    : {json_time:.3f} s, file size {json_size / 1024 ** 2:.1f} MB (all keys)")
+    print(f"Columnar: {columnar_time:.3f} s, file size {columnar_size / 1024 ** 2:.1f} MB (all keys)")
+    print(f"Speedup : {json_time / columnar_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
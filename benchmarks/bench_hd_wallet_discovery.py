@@ -0,0 +1,85 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the account discovery with a simulated remote function, fixed vs adaptive batch size.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_discovery [latency_ms]
+"""
+
+# Imports
+import asyncio
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletBip84Coins, HdWalletBipDiscovery, HdWalletBipFactory, HdWalletBipUsedAddresses
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default latency of the simulated function in milliseconds
+DEF_LATENCY_MS = 50
+# Number of used addresses in the external chain of the used accounts
+USED_ADDR_NUM = 200
+# Number of used accounts
+USED_ACC_NUM = 2
+
+
+# Get the used addresses (one every 10 addresses, so that the gap limit is never reached before the last one)
+def get_used_addresses(hd_wallet):
+    used_addr = []
+    for acc_idx in range(USED_ACC_NUM):
+        for i, addr in enumerate(hd_wallet.IterAddresses(acc_idx, start=0, stop=USED_ADDR_NUM * 10)):
+            if i % 10 == 0:
+                used_addr.append(addr.ToDict()["address"])
+    return HdWalletBipUsedAddresses(used_addr)
+
+
+# Measure the discovery time
+def bench_discovery(hd_wallet, used_addr, latency, batch_size):
+    async def is_used(addresses):
+        await asyncio.sleep(latency)
+        return used_addr(addresses)
+
+    discovery = HdWalletBipDiscovery(hd_wallet, is_used, batch_size=batch_size)
+    start_time = time.perf_counter()
+    asyncio.run(discovery.DiscoverAsync())
+    return time.perf_counter() - start_time, discovery.Stats()
+
+
+# Main function
+def main():
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else DEF_LATENCY_MS) / 1000
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+    used_addr = get_used_addresses(hd_wallet)
+
+    print(f"Callback latency: {latency * 1000:.0f} ms")
+    for batch_size in (20, None):
+        elapsed, stats = bench_discovery(hd_wallet, used_addr, latency, batch_size)
+        print(f"Batch size {batch_size or 'adaptive'}: {elapsed:.2f} s, "
+              f"{stats.CallbackCalls()} calls, {stats.DerivedAddresses()} derived addresses, "
+              f"{stats.DerivationsPerSecond():.0f} derivations/s, "
+              f"{stats.AvgCallbackLatency() * 1000:.1f} ms avg latency")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the Electrum derived keys, deriving the key pair once for each address vs once for each key type.
+The latter is the previous behavior, replicated here by calling the ElectrumV1/ElectrumV2 getters for each key.
+Fresh Electrum objects are used for each measurement, since bip_utils caches some derivations.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_electrum [addr_num]
+"""
+
+# Imports
+import sys
+import time
+
+from bip_utils import ElectrumV1, ElectrumV2Standard
+
+from py_crypto_hd_wallet import (
+    HdWalletElectrumV1DerivedKeys,
+    HdWalletElectrumV1KeyTypes,
+    HdWalletElectrumV2DerivedKeys,
+    HdWalletElectrumV2KeyTypes,
+)
+from py_crypto_hd_wallet.common import HdWalletKeysBase
+from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_keys import HdWalletElectrumV1KeyUtils
+from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_keys import (
+    HdWalletElectrumV1KeyUtils as HdWalletElectrumV2KeyUtils,
+)
+
+
+# Seed used for the benchmark
+TEST_SEED = bytes(range(32))
+# Default number of addresses
+DEF_ADDR_NUM = 10000
+# Number of repetitions (the best time is taken)
+REPEAT_NUM = 3
+
+
+# Electrum V1 derived keys, deriving the key pair for each key type
+class PerKeyElectrumV1DerivedKeys(HdWalletKeysBase):
+    def __init__(self, electrum_obj, change_idx, addr_idx):
+        super().__init__(HdWalletElectrumV1KeyTypes)
+        self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PUB,
+                     lambda: electrum_obj.GetPublicKey(change_idx, addr_idx).RawUncompressed().ToBytes()[1:])
+        self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PRIV,
+                     lambda: electrum_obj.GetPrivateKey(change_idx, addr_idx).Raw().ToBytes())
+        self._SetKey(HdWalletElectrumV1KeyTypes.WIF_PRIV,
+                     lambda: HdWalletElectrumV1KeyUtils.PrivToWif(electrum_obj.GetPrivateKey(change_idx, addr_idx)))
+        self._SetKey(HdWalletElectrumV1KeyTypes.ADDRESS,
+                     lambda: electrum_obj.GetAddress(change_idx, addr_idx))
+
+
+# Electrum V2 derived keys, deriving the key pair again for the address
+class PerKeyElectrumV2DerivedKeys(HdWalletKeysBase):
+    def __init__(self, electrum_obj, change_idx, addr_idx):
+        super().__init__(HdWalletElectrumV2KeyTypes)
+        pub_key = electrum_obj.GetPublicKey(change_idx, addr_idx)
+        self._SetKey(HdWalletElectrumV2KeyTypes.EX_PUB, pub_key.ToExtended)
+        self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PUB, lambda: pub_key.RawUncompressed().ToBytes()[1:])
+        priv_key = electrum_obj.GetPrivateKey(change_idx, addr_idx)
+        self._SetKey(HdWalletElectrumV2KeyTypes.EX_PRIV, priv_key.ToExtended)
+        self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PRIV, lambda: priv_key.Raw().ToBytes())
+        self._SetKey(HdWalletElectrumV2KeyTypes.WIF_PRIV, lambda: HdWalletElectrumV2KeyUtils.PrivToWif(priv_key))
+        self._SetKey(HdWalletElectrumV2KeyTypes.ADDRESS, lambda: electrum_obj.GetAddress(change_idx, addr_idx))
+
+
+# Measure the best time for computing the keys of all the addresses
+def bench_keys(create_fct, keys_cls, addr_num):
+    best_time = float("inf")
+    for _ in range(REPEAT_NUM):
+        electrum_obj = create_fct()
+        start_time = time.perf_counter()
+        for addr_idx in range(addr_num):
+            keys_cls(electrum_obj, 0, addr_idx)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+# Print the times of both cases
+def print_times(name, create_fct, per_key_cls, once_cls, addr_num):
+    per_key_time = bench_keys(create_fct, per_key_cls, addr_num)
+    once_time = bench_keys(create_fct, lambda electrum_obj, change_idx, addr_idx: once_cls(electrum_obj,
+                                                                                             change_idx,
+                                                                                             addr_idx,
+                                                                                             0),
+                           addr_num)
+    print(f"{name}: {per_key_time:.2f} s -> {once_time:.2f} s (speedup: {per_key_time / once_time:.2f}x)")
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    print(f"Addresses: {addr_num}, derivation for each key type -> once for each address")
+    print_times("Electrum V1",
+                lambda: ElectrumV1.FromSeed(TEST_SEED),
+                PerKeyElectrumV1DerivedKeys,
+                HdWalletElectrumV1DerivedKeys,
+                addr_num)
+    print_times("Electrum V2",
+                lambda: ElectrumV2Standard.FromSeed(TEST_SEED * 2),
+                PerKeyElectrumV2DerivedKeys,
+                HdWalletElectrumV2DerivedKeys,
+                addr_num)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark of full vs projected wallet generation.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_fields [addr_num]
+"""
+
+# Imports
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipDataTypes, HdWalletBipFactory, HdWalletBipKeyTypes
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 10000
+# Number of repetitions (the best time is taken)
+REPEAT_NUM = 3
+
+
+# Measure the best generation time of a wallet
+def bench_generate(hd_wallet, **kwargs):
+    best_time = float("inf")
+    for _ in range(REPEAT_NUM):
+        start_time = time.perf_counter()
+        hd_wallet.Generate(**kwargs)
+        hd_wallet.ToDict()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+
+    full_time = bench_generate(hd_wallet, addr_num=addr_num)
+    proj_time = bench_generate(hd_wallet,
+                               addr_num=addr_num,
+                               fields={HdWalletBipDataTypes.ADDRESS, HdWalletBipKeyTypes.ADDRESS})
+
+    print(f"Addresses: {addr_num}")
+    print(f"Full generation     : {full_time:.3f} s")
+    print(f"Projected generation: {proj_time:.3f} s (addresses only)")
+    print(f"Speedup             : {full_time / proj_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the memory used by generated addresses, stored as dictionaries vs compact form.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_memory [addr_num]
+"""
+
+# Imports
+import sys
+import tracemalloc
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipDataTypes, HdWalletBipFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 10000
+
+
+# Measure the memory retained by the generated addresses
+def bench_memory(hd_wallet_fact, addr_num, compact):
+    tracemalloc.start()
+    hd_wallet = hd_wallet_fact.CreateFromMnemonic("bench", TEST_MNEMONIC)
+    base_mem, _ = tracemalloc.get_traced_memory()
+    hd_wallet.Generate(addr_num=addr_num, compact=compact)
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return mem - base_mem, hd_wallet
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    hd_wallet_fact = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN)
+
+    dict_mem, dict_wallet = bench_memory(hd_wallet_fact, addr_num, False)
+    compact_mem, compact_wallet = bench_memory(hd_wallet_fact, addr_num, True)
+    assert (dict_wallet.GetData(HdWalletBipDataTypes.ADDRESS).ToDict()
+            == compact_wallet.GetData(HdWalletBipDataTypes.ADDRESS).ToDict())
+
+    print(f"Addresses: {addr_num}")
+    print(f"Dictionaries: {dict_mem / addr_num:.0f} B/address")
+    print(f"Compact     : {compact_mem / addr_num:.0f} B/address")
+    print(f"Reduction   : {(1 - compact_mem / dict_mem) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
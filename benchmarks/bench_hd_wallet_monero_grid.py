@@ -0,0 +1,97 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the generation of the subaddresses of multiple accounts, by calling Generate for each account
+vs generating the subaddress grid at once (in the current process and with worker processes).
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_monero_grid [acc_num] [subaddr_num] [workers]
+"""
+
+# Imports
+import os
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletMoneroDataTypes, HdWalletMoneroFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = ("larve wacht ommegaand budget puppy bombarde stoven kilsdonk stijf epileer bachelor klus tukje teisman "
+                 "eeneiig kluif vrucht opel galvlieg ugandees zworen afzijdig fornuis giraal fornuis")
+# Default number of accounts
+DEF_ACC_NUM = 100
+# Default number of subaddresses for each account
+DEF_SUBADDR_NUM = 100
+
+
+# Create a new wallet, so that no subaddress is cached by bip_utils
+def create_wallet():
+    return HdWalletMoneroFactory().CreateFromMnemonic("bench_wallet", TEST_MNEMONIC)
+
+
+# Generate the subaddresses by calling Generate for each account
+def generate_loop(acc_num, subaddr_num, workers):
+    hd_wallet = create_wallet()
+    subaddrs = []
+    for acc_idx in range(acc_num):
+        hd_wallet.Generate(acc_idx=acc_idx, subaddr_num=subaddr_num, workers=workers)
+        subaddrs.extend(hd_wallet.GetData(HdWalletMoneroDataTypes.SUBADDRESS))
+    return subaddrs
+
+
+# Generate the subaddress grid
+def generate_grid(acc_num, subaddr_num, workers):
+    hd_wallet = create_wallet()
+    hd_wallet.GenerateSubaddressGrid(acc_num, subaddr_num, workers=workers)
+    return list(hd_wallet.GetData(HdWalletMoneroDataTypes.SUBADDRESS_GRID))
+
+
+# Measure the time of the specified function
+def bench_fct(fct, *args):
+    start_time = time.perf_counter()
+    res = fct(*args)
+    return time.perf_counter() - start_time, res
+
+
+# Main function
+def main():
+    acc_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ACC_NUM
+    subaddr_num = int(sys.argv[2]) if len(sys.argv) > 2 else DEF_SUBADDR_NUM
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+
+    print(f"Accounts: {acc_num}, subaddresses per account: {subaddr_num}, workers: {workers}")
+
+    ref_subaddrs = None
+    for name, fct, fct_workers in (("Generate loop", generate_loop, None),
+                                   ("Generate loop (workers)", generate_loop, workers),
+                                   ("Grid", generate_grid, None),
+                                   ("Grid (workers)", generate_grid, workers)):
+        elapsed_time, subaddrs = bench_fct(fct, acc_num, subaddr_num, fct_workers)
+        if ref_subaddrs is None:
+            ref_subaddrs = subaddrs
+        elif subaddrs != ref_subaddrs:
+            raise RuntimeError("Subaddresses mismatch")
+        print(f"{name:<23}: {elapsed_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the Monero spend key lookup table: building it by computing the subaddress keys one at a time with
+bip_utils into a dictionary vs BuildSpendKeyIndex, and loading a large table by reading the file vs memory mapping it.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_monero_spend_keys [subaddr_num] [entries_num]
+"""
+
+# Imports
+import os
+import sys
+import tempfile
+import time
+
+from bip_utils import Monero
+from bip_utils.monero.monero_subaddr import MoneroSubaddress
+
+from py_crypto_hd_wallet import HdWalletMoneroFactory
+from py_crypto_hd_wallet.common import HdWalletReverseIndex
+
+
+# Seed used for the benchmark
+TEST_SEED = bytes(range(32))
+# Default number of subaddresses
+DEF_SUBADDR_NUM = 5000
+# Default number of entries of the table to be loaded
+DEF_ENTRIES_NUM = 1000000
+# Account index
+ACC_IDX = 1
+
+
+# Build the table into a dictionary, computing the subaddress keys one at a time
+def build_dict(monero_obj, subaddr_num):
+    monero_subaddr = MoneroSubaddress(monero_obj.PrivateViewKey(), monero_obj.PublicSpendKey())
+    return {monero_subaddr.ComputeKeys(i, ACC_IDX)[0].RawCompressed().ToBytes(): (ACC_IDX, i)
+            for i in range(subaddr_num)}
+
+
+# Build the table with BuildSpendKeyIndex
+def build_index(monero_obj, subaddr_num):
+    hd_wallet = HdWalletMoneroFactory().CreateFromWatchOnly("bench_wallet",
+                                                           monero_obj.PrivateViewKey().Raw().ToBytes(),
+                                                           monero_obj.PublicSpendKey().RawCompressed().ToBytes())
+    return hd_wallet.BuildSpendKeyIndex([ACC_IDX], subaddr_num)
+
+
+# Measure the time of the specified function
+def bench_fct(fct, *args):
+    start_time = time.perf_counter()
+    res = fct(*args)
+    return time.perf_counter() - start_time, res
+
+
+# Main function
+def main():
+    subaddr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_SUBADDR_NUM
+    entries_num = int(sys.argv[2]) if len(sys.argv) > 2 else DEF_ENTRIES_NUM
+
+    monero_obj = Monero.FromSeed(TEST_SEED)
+    dict_time, spend_key_dict = bench_fct(build_dict, monero_obj, subaddr_num)
+    index_time, spend_key_index = bench_fct(build_index, monero_obj, subaddr_num)
+    if any(spend_key_index.Lookup(pub_skey) != (ACC_IDX, None, subaddr_idx)
+           for pub_skey, (_, subaddr_idx) in spend_key_dict.items()):
+        raise RuntimeError("Lookup table mismatch")
+
+    print(f"Build, subaddresses: {subaddr_num}")
+    print(f"  bip_utils keys + dict: {dict_time:8.3f} s ({dict_time / subaddr_num * 1e6:8.2f} us per entry)")
+    print(f"  BuildSpendKeyIndex   : {index_time:8.3f} s ({index_time / subaddr_num * 1e6:8.2f} us per entry)")
+
+    # Table with random keys, since only the loading is measured
+    spend_key_index = HdWalletReverseIndex(entries_num * 2)
+    for i in range(entries_num):
+        spend_key_index.Add(os.urandom(32), ACC_IDX, None, i)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "spend_keys.hdwr")
+        spend_key_index.Save(file_path)
+
+        print(f"Load, entries: {entries_num}, file size: {os.path.getsize(file_path) / 2**20:.1f} MiB")
+        for name, use_mmap in (("Read", False), ("Memory mapping", True)):
+            load_time, loaded_index = bench_fct(HdWalletReverseIndex.Load, file_path, use_mmap)
+            lookup_time, _ = bench_fct(lambda idx: [idx.Lookup(os.urandom(32)) for _ in range(10000)], loaded_index)
+            print(f"  {name:<14}: load {load_time * 1e3:8.2f} ms, lookup {lookup_time / 10000 * 1e6:6.2f} us")
+            del loaded_index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the Monero subaddresses computation, one at a time by bip_utils vs in batch with the account data
+computed once.
+Since bip_utils caches the subaddresses of each Monero object, a new Monero object is used for each measurement.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_monero_subaddr [subaddr_num]
+"""
+
+# Imports
+import sys
+import time
+
+from bip_utils import Monero, MoneroCoins
+
+from py_crypto_hd_wallet import HdWalletMoneroSubaddressBatch
+
+
+# Seed used for the benchmark
+TEST_SEED = bytes(range(32))
+# Default number of subaddresses
+DEF_SUBADDR_NUM = 10000
+# Account index
+ACC_IDX = 1
+
+
+# Compute subaddresses one at a time
+def compute_single(monero_obj, subaddr_num):
+    return [monero_obj.Subaddress(i, ACC_IDX) for i in range(subaddr_num)]
+
+
+# Compute subaddresses in batch
+def compute_batch(monero_obj, subaddr_num):
+    return list(HdWalletMoneroSubaddressBatch(monero_obj).Iter(ACC_IDX, subaddr_num, 0))
+
+
+# Measure the time of the specified function
+def bench_fct(fct, subaddr_num):
+    monero_obj = Monero.FromSeed(TEST_SEED, MoneroCoins.MONERO_MAINNET)
+    start_time = time.perf_counter()
+    subaddrs = fct(monero_obj, subaddr_num)
+    return time.perf_counter() - start_time, subaddrs
+
+
+# Main function
+def main():
+    subaddr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_SUBADDR_NUM
+
+    single_time, single_subaddrs = bench_fct(compute_single, subaddr_num)
+    batch_time, batch_subaddrs = bench_fct(compute_batch, subaddr_num)
+    if single_subaddrs != batch_subaddrs:
+        raise RuntimeError("Subaddresses mismatch")
+
+    print(f"Subaddresses: {subaddr_num}")
+    print(f"Single : {single_time:8.3f} s ({single_time / subaddr_num * 1e6:8.2f} us per subaddress)")
+    print(f"Batch  : {batch_time:8.3f} s ({batch_time / subaddr_num * 1e6:8.2f} us per subaddress)")
+    print(f"Speedup: {single_time / batch_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of looking up addresses, Python dictionary vs reverse index.
+Synthetic address strings are used, so that the benchmark does not depend on the derivation time.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_reverse_index [addr_num]
+"""
+
+# Imports
+import hashlib
+import random
+import sys
+import time
+import tracemalloc
+
+from py_crypto_hd_wallet.common import HdWalletReverseIndex
+
+
+# Default number of addresses
+DEF_ADDR_NUM = 1000000
+# Number of random lookups
+LOOKUP_NUM = 100000
+
+
+# Get a synthetic address string (same length of a P2PKH address)
+def get_address(addr_idx):
+    return "1" + hashlib.sha256(addr_idx.to_bytes(4, "little")).hexdigest()[:33]
+
+
+# Build a dictionary and measure its memory usage (address strings excluded, since they are shared)
+def build_dict(addresses):
+    tracemalloc.start()
+    addr_dict = {addr: (0, 0, i) for i, addr in enumerate(addresses)}
+    peak_mem = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return addr_dict, peak_mem
+
+
+# Build a reverse index and measure its memory usage
+def build_rev_index(addresses):
+    tracemalloc.start()
+    rev_index = HdWalletReverseIndex(len(addresses) * 2)
+    for i, addr in enumerate(addresses):
+        rev_index.Add(addr, 0, 0, i)
+    peak_mem = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return rev_index, peak_mem
+
+
+# Measure the lookup time
+def bench_lookup(lookup_fct, addresses):
+    start_time = time.perf_counter()
+    entries = [lookup_fct(addr) for addr in addresses]
+    return time.perf_counter() - start_time, entries
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    addresses = [get_address(i) for i in range(addr_num)]
+    lookup_addresses = [addresses[random.randrange(addr_num)] for _ in range(LOOKUP_NUM)]
+
+    addr_dict, dict_mem = build_dict(addresses)
+    rev_index, rev_index_mem = build_rev_index(addresses)
+    dict_time, dict_entries = bench_lookup(addr_dict.get, lookup_addresses)
+    rev_index_time, rev_index_entries = bench_lookup(rev_index.Lookup, lookup_addresses)
+    assert dict_entries == rev_index_entries
+
+    print(f"Addresses: {addr_num}, lookups: {LOOKUP_NUM}")
+    print(f"Dictionary   : {dict_mem / addr_num:.1f} B/address (keys excluded), "
+          f"{dict_time / LOOKUP_NUM * 1e6:.2f} us/lookup")
+    print(f"Reverse index: {rev_index_mem / addr_num:.1f} B/address, "
+          f"{rev_index_time / LOOKUP_NUM * 1e6:.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of wallet saving, building the whole JSON document vs stream mode.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_save [addr_num]
+"""
+
+# Imports
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipFactory, HdWalletSaver
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 20000
+
+
+# Measure the time and the peak memory (traced separately, since tracing slows down the execution) of saving a wallet
+def bench_save(hd_wallet, file_path, stream):
+    start_time = time.perf_counter()
+    HdWalletSaver(hd_wallet).SaveToFile(file_path, stream=stream)
+    elapsed_time = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    HdWalletSaver(hd_wallet).SaveToFile(file_path, stream=stream)
+    _, peak_mem = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    with open(file_path, "rb") as f:
+        return elapsed_time, peak_mem, f.read()
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+    hd_wallet.Generate(addr_num=addr_num)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "wallet.json")
+        json_time, json_mem, json_data = bench_save(hd_wallet, file_path, False)
+        stream_time, stream_mem, stream_data = bench_save(hd_wallet, file_path, True)
+    assert json_data == stream_data
+
+    print(f"Addresses: {addr_num}")
+    print(f"Whole document: {json_time:.3f} s, peak memory {json_mem / 1024 ** 2:.1f} MB")
+    print(f"Stream mode   : {stream_time:.3f} s, peak memory {stream_mem / 1024 ** 2:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
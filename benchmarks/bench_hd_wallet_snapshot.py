@@ -0,0 +1,93 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the cold start of watch-only wallets, extended keys vs snapshots.
+The cold start includes creating the wallets and getting both change chains of each account ready for deriving
+addresses (the address derivation itself has the same cost in both cases).
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_snapshot [acc_num]
+"""
+
+# Imports
+import os
+import sys
+import tempfile
+import time
+
+from py_crypto_hd_wallet import (
+    HdWalletBip84Coins,
+    HdWalletBipChanges,
+    HdWalletBipDataTypes,
+    HdWalletBipFactory,
+    HdWalletBipSnapshot,
+)
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of accounts
+DEF_ACC_NUM = 1000
+
+
+# Start the wallets, i.e. create them and get the address iterators of both change chains
+def start_wallets(create_fct, items):
+    addr_iters = []
+    for item in items:
+        hd_wallet = create_fct(item)
+        addr_iters += [hd_wallet.IterAddresses(change_idx=change_idx) for change_idx in HdWalletBipChanges]
+    return addr_iters
+
+
+# Main function
+def main():
+    acc_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ACC_NUM
+
+    hd_wallet_fact = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN)
+    hd_wallet = hd_wallet_fact.CreateFromMnemonic("bench", TEST_MNEMONIC)
+
+    # Prepare the account extended keys and the snapshots
+    ex_keys = []
+    for acc_idx in range(acc_num):
+        hd_wallet.Generate(acc_idx=acc_idx, addr_num=0)
+        ex_keys.append(hd_wallet.GetData(HdWalletBipDataTypes.ACCOUNT_KEY).ToDict()["ex_pub"])
+    file_path = os.path.join(tempfile.gettempdir(), "bench_hd_wallet_snapshot.hdws")
+    HdWalletBipSnapshot.SaveToFile(file_path,
+                                   [hd_wallet_fact.CreateFromExtendedKey(f"acc_{i}", ex_key).Snapshot()
+                                    for i, ex_key in enumerate(ex_keys)])
+
+    print(f"Accounts: {acc_num}, snapshot file size: {os.path.getsize(file_path)} bytes")
+
+    start_time = time.perf_counter()
+    start_wallets(lambda ex_key: hd_wallet_fact.CreateFromExtendedKey("bench", ex_key), ex_keys)
+    print(f"Extended keys: {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    start_time = time.perf_counter()
+    snapshots = HdWalletBipSnapshot.LoadFromFile(file_path)
+    load_time = time.perf_counter() - start_time
+    start_wallets(hd_wallet_fact.CreateFromSnapshot, snapshots)
+    print(f"Snapshots: {(time.perf_counter() - start_time) * 1000:.1f} ms (file loading: {load_time * 1000:.1f} ms)")
+
+    os.remove(file_path)
+
+
+if __name__ == "__main__":
+    main()
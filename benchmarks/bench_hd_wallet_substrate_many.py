@@ -0,0 +1,87 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of the generation of multiple Substrate paths sharing a prefix (e.g. "//hard/soft/0..N"),
+derived from the root for each path vs derived once for each junction of the prefix trie.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_substrate_many [path_num]
+"""
+
+# Imports
+import sys
+import time
+
+from bip_utils import SubstratePathParser
+
+from py_crypto_hd_wallet import HdWalletSubstrateCoins, HdWalletSubstrateDataTypes, HdWalletSubstrateFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of paths
+DEF_PATH_NUM = 1000
+# Prefix of the paths
+PATH_PREFIX = "//parachain//account/soft"
+
+
+# Generate each path from the root
+def generate_single(hd_wallet, paths):
+    keys = []
+    for path in paths:
+        hd_wallet.Generate(path=path)
+        keys.append(hd_wallet.GetData(HdWalletSubstrateDataTypes.KEY))
+    return keys
+
+
+# Generate all paths at once
+def generate_many(hd_wallet, paths):
+    hd_wallet.GenerateMany(paths)
+    return hd_wallet.GetData(HdWalletSubstrateDataTypes.PATH_KEYS)
+
+
+# Measure the time of the specified function
+def bench_fct(fct, *args):
+    start_time = time.perf_counter()
+    res = fct(*args)
+    return time.perf_counter() - start_time, res
+
+
+# Main function
+def main():
+    path_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_PATH_NUM
+    paths = [f"{PATH_PREFIX}/{i}" for i in range(path_num)]
+
+    hd_wallet = HdWalletSubstrateFactory(HdWalletSubstrateCoins.POLKADOT).CreateFromMnemonic("bench_wallet",
+                                                                                               TEST_MNEMONIC)
+
+    single_time, _ = bench_fct(generate_single, hd_wallet, paths)
+    many_time, path_keys = bench_fct(generate_many, hd_wallet, paths)
+    junctions_num = SubstratePathParser.Parse(paths[0]).Length()
+
+    print(f"Paths: {path_num}, junctions per path: {junctions_num}")
+    print(f"Generate     : {single_time:8.3f} s ({path_num * junctions_num} derivations)")
+    print(f"GenerateMany : {many_time:8.3f} s ({path_keys.DerivationsNum()} derivations)")
+    print(f"Speedup      : {single_time / many_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
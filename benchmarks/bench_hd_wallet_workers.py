@@ -0,0 +1,69 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark of address derivation in the current process vs worker processes.
+
+Usage:
+    python -m benchmarks.bench_hd_wallet_workers [addr_num] [workers]
+"""
+
+# Imports
+import os
+import sys
+import time
+
+from py_crypto_hd_wallet import HdWalletBip44Coins, HdWalletBipFactory
+
+
+# Mnemonic used for the benchmark
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Default number of addresses
+DEF_ADDR_NUM = 100000
+
+
+# Measure the generation time of a wallet
+def bench_generate(hd_wallet, **kwargs):
+    start_time = time.perf_counter()
+    hd_wallet.Generate(**kwargs)
+    return time.perf_counter() - start_time
+
+
+# Main function
+def main():
+    addr_num = int(sys.argv[1]) if len(sys.argv) > 1 else DEF_ADDR_NUM
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    hd_wallet = HdWalletBipFactory(HdWalletBip44Coins.BITCOIN).CreateFromMnemonic("bench", TEST_MNEMONIC)
+
+    serial_time = bench_generate(hd_wallet, addr_num=addr_num)
+    serial_json = hd_wallet.ToJson()
+    workers_time = bench_generate(hd_wallet, addr_num=addr_num, workers=workers)
+    assert serial_json == hd_wallet.ToJson()
+
+    print(f"Addresses: {addr_num}")
+    print(f"Current process      : {serial_time:.3f} s")
+    print(f"Worker processes ({workers}): {workers_time:.3f} s")
+    print(f"Speedup              : {serial_time / workers_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
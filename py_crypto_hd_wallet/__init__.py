@@ -22,17 +22,25 @@ from py_crypto_hd_wallet.bip import (
     HdWalletBipAddresses,
     HdWalletBipChanges,
     HdWalletBipDataTypes,
+    HdWalletBipDiscoveredChain,
+    HdWalletBipDiscovery,
+    HdWalletBipDiscoveryStats,
     HdWalletBipFactory,
+    HdWalletBipFilterBuilder,
     HdWalletBipKeys,
     HdWalletBipKeyTypes,
     HdWalletBipLanguages,
+    HdWalletBipSnapshot,
+    HdWalletBipUsedAddresses,
     HdWalletBipWordsNum,
 )
 
 # Cardano Shelley
 from py_crypto_hd_wallet.cardano.shelley import (
     HdWalletCardanoShelley,
+    HdWalletCardanoShelleyAddressBatch,
     HdWalletCardanoShelleyAddresses,
+    HdWalletCardanoShelleyChangeAddresses,
     HdWalletCardanoShelleyChanges,
     HdWalletCardanoShelleyCoins,
     HdWalletCardanoShelleyDataTypes,
@@ -81,12 +89,23 @@ from py_crypto_hd_wallet.monero import (
     HdWalletMoneroKeys,
     HdWalletMoneroKeyTypes,
     HdWalletMoneroLanguages,
+    HdWalletMoneroSubaddressBatch,
     HdWalletMoneroSubaddresses,
+    HdWalletMoneroSubaddressGrid,
     HdWalletMoneroWordsNum,
 )
 
 # Saver
-from py_crypto_hd_wallet.saver import HdWalletSaver
+from py_crypto_hd_wallet.saver import (
+    HdWalletAddrIndexReader,
+    HdWalletAddrIndexView,
+    HdWalletAddrIndexWriter,
+    HdWalletColumnarReader,
+    HdWalletColumnarWriter,
+    HdWalletJsonWriter,
+    HdWalletNdjsonWriter,
+    HdWalletSaver,
+)
 
 # Substrate
 from py_crypto_hd_wallet.substrate import (
@@ -97,5 +116,6 @@ from py_crypto_hd_wallet.substrate import (
     HdWalletSubstrateKeys,
     HdWalletSubstrateKeyTypes,
     HdWalletSubstrateLanguages,
+    HdWalletSubstratePathKeys,
     HdWalletSubstrateWordsNum,
 )
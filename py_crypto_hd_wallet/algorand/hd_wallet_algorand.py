@@ -21,14 +21,13 @@
 """Module for generating Algorand wallets."""
 
 # Imports
-from typing import Any
+from typing import Any, Optional
 
 from bip_utils.bip.bip44_base import Bip44Base
 
 from py_crypto_hd_wallet.algorand.hd_wallet_algorand_enum import HdWalletAlgorandDataTypes
 from py_crypto_hd_wallet.algorand.hd_wallet_algorand_keys import HdWalletAlgorandKeys
-from py_crypto_hd_wallet.common import HdWalletBase
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.common import HdWalletBase, HdWalletCoinInfo
 
 
 class HdWalletAlgorand(HdWalletBase):
@@ -38,6 +37,7 @@ class HdWalletAlgorand(HdWalletBase):
     """
 
     m_bip_obj: Bip44Base
+    m_coin_info: HdWalletCoinInfo
 
     #
     # Public methods
@@ -47,18 +47,23 @@ class HdWalletAlgorand(HdWalletBase):
                  wallet_name: str,
                  bip_obj: Bip44Base,
                  mnemonic: str = "",
-                 seed_bytes: bytes = b"") -> None:
+                 seed_bytes: bytes = b"",
+                 *,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            wallet_name (str)           : Wallet name
-            bip_obj (Bip44Base object)  : Bip44Base object
-            mnemonic (str, optional)    : Mnemonic, empty if not specified
-            seed_bytes (bytes, optional): Seed_bytes, empty if not specified
+            wallet_name (str)                            : Wallet name
+            bip_obj (Bip44Base object)                   : Bip44Base object
+            mnemonic (str, optional)                     : Mnemonic, empty if not specified
+            seed_bytes (bytes, optional)                 : Seed_bytes, empty if not specified
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved by the factory, None for
+                                                           resolving it from bip_obj (default)
         """
         super().__init__(HdWalletAlgorandDataTypes)
         self.m_bip_obj = bip_obj
+        self.m_coin_info = coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(bip_obj.CoinConf())
         # Initialize data
         self.__InitData(wallet_name, mnemonic, seed_bytes)
 
@@ -96,11 +101,10 @@ class HdWalletAlgorand(HdWalletBase):
         # Set wallet name
         self._Set(HdWalletAlgorandDataTypes.WALLET_NAME, wallet_name)
         # Set coin name
-        coin_names = self.m_bip_obj.CoinConf().CoinNames()
-        self._Set(HdWalletAlgorandDataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletAlgorandDataTypes.COIN_NAME, self.m_coin_info.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletAlgorandDataTypes.MNEMONIC, mnemonic)
         if seed_bytes != b"":
-            self._Set(HdWalletAlgorandDataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletAlgorandDataTypes.SEED_BYTES, seed_bytes)
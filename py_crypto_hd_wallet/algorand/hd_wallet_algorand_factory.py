@@ -21,6 +21,9 @@
 """Module for creating Algorand wallet factories."""
 
 # Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
 from bip_utils import (
     AlgorandMnemonicEncoder,
     AlgorandMnemonicGenerator,
@@ -28,26 +31,46 @@ from bip_utils import (
     Bip32KeyError,
     Bip44,
     Bip44Coins,
+    Bip44ConfGetter,
     MnemonicChecksumError,
 )
 
 from py_crypto_hd_wallet.algorand.hd_wallet_algorand import HdWalletAlgorand
 from py_crypto_hd_wallet.algorand.hd_wallet_algorand_enum import HdWalletAlgorandLanguages, HdWalletAlgorandWordsNum
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletCoinInfo, HdWalletWorkers
 from py_crypto_hd_wallet.utils import Utils
 
 
+def _GenerateSeed(mnemonic: str) -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic (str): Mnemonic
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        return AlgorandSeedGenerator(mnemonic).Generate()
+    except (ValueError, MnemonicChecksumError) as ex:
+        raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+
+
 class HdWalletAlgorandFactory:
     """
     HD wallet Algorand factory class.
     It allows a HdWalletAlgorand to be created in different way.
     """
 
+    m_coin_info: HdWalletCoinInfo
+
     def __init__(self) -> None:
-        """
-        Construct class.
-        No need to have a constructor, but it's kept to have the same usage of other factories.
-        """
+        """Construct class."""
+        self.m_coin_info = HdWalletCoinInfo.FromConf(Bip44ConfGetter.GetConfig(Bip44Coins.ALGORAND))
 
     def CreateRandom(self,
                      wallet_name: str,
@@ -92,11 +115,53 @@ class HdWalletAlgorandFactory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        try:
-            seed_bytes = AlgorandSeedGenerator(mnemonic).Generate()
-        except (ValueError, MnemonicChecksumError) as ex:
-            raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
-        return self.CreateFromSeed(wallet_name, seed_bytes)
+        return self.CreateFromSeed(wallet_name, _GenerateSeed(mnemonic))
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
+
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.CreateFromSeed(item[0], seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed, mnemonics, lambda item: item[1:], workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -143,7 +208,8 @@ class HdWalletAlgorandFactory:
         return HdWalletAlgorand(wallet_name=wallet_name,
                                 bip_obj=bip_obj,
                                 mnemonic=AlgorandMnemonicEncoder().Encode(priv_key_bytes).ToStr(),
-                                seed_bytes=priv_key_bytes)
+                                seed_bytes=priv_key_bytes,
+                                coin_info=self.m_coin_info)
 
     def CreateFromPublicKey(self,
                             wallet_name: str,
@@ -167,4 +233,5 @@ class HdWalletAlgorandFactory:
             raise ValueError(f"Invalid public key: {Utils.BytesToHexString(pub_key_bytes)}") from ex
 
         return HdWalletAlgorand(wallet_name=wallet_name,
-                                bip_obj=bip_obj)
+                                bip_obj=bip_obj,
+                                coin_info=self.m_coin_info)
@@ -55,11 +55,11 @@ class HdWalletAlgorandKeys(HdWalletKeysBase):
         """
 
         # Add public key
-        self._Set(HdWalletAlgorandKeyTypes.PUB, bip_obj.PublicKey().RawCompressed().ToHex())
+        self._Set(HdWalletAlgorandKeyTypes.PUB, bip_obj.PublicKey().RawCompressed().ToBytes())
 
         # Add private key only if Algorand object is not public-only
         if not bip_obj.IsPublicOnly():
-            self._Set(HdWalletAlgorandKeyTypes.PRIV, bip_obj.PrivateKey().Raw().ToHex())
+            self._Set(HdWalletAlgorandKeyTypes.PRIV, bip_obj.PrivateKey().Raw().ToBytes())
 
         # Address
         self._Set(HdWalletAlgorandKeyTypes.ADDRESS, bip_obj.PublicKey().ToAddress())
@@ -1,5 +1,11 @@
 from py_crypto_hd_wallet.bip.hd_wallet_bip import HdWalletBip
 from py_crypto_hd_wallet.bip.hd_wallet_bip_addr import HdWalletBipAddresses
+from py_crypto_hd_wallet.bip.hd_wallet_bip_discovery import (
+    HdWalletBipDiscoveredChain,
+    HdWalletBipDiscovery,
+    HdWalletBipDiscoveryStats,
+    HdWalletBipUsedAddresses,
+)
 from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import (
     HdWalletBip44Coins,
     HdWalletBip49Coins,
@@ -12,4 +18,6 @@ from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import (
     HdWalletBipWordsNum,
 )
 from py_crypto_hd_wallet.bip.hd_wallet_bip_factory import HdWalletBipFactory
+from py_crypto_hd_wallet.bip.hd_wallet_bip_filter import HdWalletBipFilterBuilder
 from py_crypto_hd_wallet.bip.hd_wallet_bip_keys import HdWalletBipKeys
+from py_crypto_hd_wallet.bip.hd_wallet_bip_snapshot import HdWalletBipSnapshot
@@ -21,17 +21,30 @@
 """Module for generating wallets based on BIP specifications."""
 
 # Imports
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Any, AsyncIterator, Iterable, Iterator, Optional, Set, Tuple
 
 from bip_utils import Bip44Levels
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from bip_utils.bip.bip44_base import Bip44Base
 
 from py_crypto_hd_wallet.bip.hd_wallet_bip_addr import HdWalletBipAddresses
-from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import HdWalletBipChanges, HdWalletBipDataTypes
+from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import HdWalletBipChanges, HdWalletBipDataTypes, HdWalletBipKeyTypes
+from py_crypto_hd_wallet.bip.hd_wallet_bip_filter import HdWalletBipFilterBuilder
 from py_crypto_hd_wallet.bip.hd_wallet_bip_keys import HdWalletBipKeys
-from py_crypto_hd_wallet.common import HdWalletBase
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.bip.hd_wallet_bip_snapshot import HdWalletBipSnapshot
+from py_crypto_hd_wallet.common import (
+    HdWalletAsync,
+    HdWalletBase,
+    HdWalletBloomFilter,
+    HdWalletCoinInfo,
+    HdWalletDataTypes,
+    HdWalletDerivationCache,
+    HdWalletWorkers,
+)
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsyncConst
+from py_crypto_hd_wallet.common.hd_wallet_bloom_filter import HdWalletBloomFilterConst
+from py_crypto_hd_wallet.common.hd_wallet_workers import WorkersType
 
 
 class HdWalletBip(HdWalletBase):
@@ -41,6 +54,8 @@ class HdWalletBip(HdWalletBase):
     """
 
     m_bip_obj: Bip44Base
+    m_coin_info: HdWalletCoinInfo
+    m_deriv_cache: HdWalletDerivationCache
 
     #
     # Public methods
@@ -51,19 +66,32 @@ class HdWalletBip(HdWalletBase):
                  bip_obj: Bip44Base,
                  mnemonic: str = "",
                  passphrase: str = "",
-                 seed_bytes: bytes = b"") -> None:
+                 seed_bytes: bytes = b"",
+                 *,
+                 change_objs: Iterable[Bip44Base] = (),
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            wallet_name (str)           : Wallet name
-            bip_obj (Bip44Base object)  : Bip44Base object
-            mnemonic (str, optional)    : Mnemonic, empty if not specified
-            passphrase (str, optional)  : Passphrase, empty if not specified
-            seed_bytes (bytes, optional): Seed_bytes, empty if not specified
+            wallet_name (str)                            : Wallet name
+            bip_obj (Bip44Base object)                   : Bip44Base object
+            mnemonic (str, optional)                     : Mnemonic, empty if not specified
+            passphrase (str, optional)                   : Passphrase, empty if not specified
+            seed_bytes (bytes, optional)                 : Seed_bytes, empty if not specified
+            change_objs (iterable, optional)             : Bip44Base objects at change level already derived from an
+                                                           account level bip_obj (e.g. restored from a snapshot), which
+                                                           are added to the derivation cache (default: none)
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved by the factory, None for
+                                                           resolving it from bip_obj (default)
         """
         super().__init__(HdWalletBipDataTypes)
         self.m_bip_obj = bip_obj
+        self.m_coin_info = coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(bip_obj.CoinConf())
+        self.m_deriv_cache = HdWalletDerivationCache()
+        for change_obj in change_objs:
+            self.m_deriv_cache.Put(self.__ChangeCacheKey(0, HdWalletBipChanges(int(change_obj.Bip32Object().Index()))),
+                                   change_obj)
         # Initialize data
         self.__InitData(wallet_name, mnemonic, passphrase, seed_bytes)
 
@@ -77,6 +105,15 @@ class HdWalletBip(HdWalletBase):
             change_idx (HdWalletBipChanges, optional): Change index (default: external)
             addr_num (int, optional)                 : Number of addresses to be generated (default: 20)
             addr_off (int, optional)                 : Starting address index (default: 0)
+            lazy_keys (bool, optional)               : True for computing keys only when requested (default: false)
+            fields (set, optional)                   : HdWalletBipDataTypes and HdWalletBipKeyTypes to be generated
+                                                       (default: all)
+            workers (int, optional)                  : Number of worker processes for deriving addresses
+                                                       (default: None, i.e. current process only)
+            compact (bool, optional)                 : True for storing address keys in a compact columnar form,
+                                                       which reduces memory usage for many addresses (default: false)
+            append (bool, optional)                  : True for deriving addresses after the already generated ones
+                                                       and appending them, instead of replacing them (default: false)
         """
 
         # Get parameters
@@ -84,6 +121,16 @@ class HdWalletBip(HdWalletBase):
         change_idx = kwargs.get("change_idx", HdWalletBipChanges.CHAIN_EXT)
         addr_num = kwargs.get("addr_num", 20)
         addr_off = kwargs.get("addr_off", 0)
+        lazy_keys = kwargs.get("lazy_keys", False)
+        data_types, key_types = self._SplitFields(kwargs.get("fields", None), HdWalletBipKeyTypes)
+        workers = kwargs.get("workers", None)
+        compact = kwargs.get("compact", False)
+        append = kwargs.get("append", False)
+
+        # When appending, addresses are derived starting from the one following the last generated address
+        append_addr = self.__AddressesToAppend(append, acc_idx, change_idx, data_types)
+        if append_addr is not None:
+            addr_off = append_addr.NextIndex()
 
         # Check parameters
         if not isinstance(change_idx, HdWalletBipChanges):
@@ -92,41 +139,226 @@ class HdWalletBip(HdWalletBase):
             raise ValueError("Address number shall be greater or equal to zero and less than 2^32")
         if addr_off < 0 or ((addr_off + addr_num) > Bip32KeyDataConst.KEY_INDEX_MAX_VAL):
             raise ValueError("Address offset shall be greater or equal to zero and less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
 
         # Save the BIP object
         bip_obj = self.m_bip_obj
 
         # Set master keys and derive purpose if correct level
         if bip_obj.IsLevel(Bip44Levels.MASTER):
-            self._Set(HdWalletBipDataTypes.MASTER_KEY, HdWalletBipKeys(bip_obj))
-            bip_obj = bip_obj.Purpose()
+            self._SetIfSelected(HdWalletBipDataTypes.MASTER_KEY, data_types,
+                                HdWalletBipKeys, bip_obj, lazy_keys, key_types, coin_info=self.m_coin_info)
+            bip_obj = self.__DeriveChild(bip_obj, acc_idx, change_idx)
         # Set purpose keys and derive coin if correct level
         if bip_obj.IsLevel(Bip44Levels.PURPOSE):
-            self._Set(HdWalletBipDataTypes.PURPOSE_KEY, HdWalletBipKeys(bip_obj))
-            bip_obj = bip_obj.Coin()
+            self._SetIfSelected(HdWalletBipDataTypes.PURPOSE_KEY, data_types,
+                                HdWalletBipKeys, bip_obj, lazy_keys, key_types, coin_info=self.m_coin_info)
+            bip_obj = self.__DeriveChild(bip_obj, acc_idx, change_idx)
         # Set coin keys and derive account if correct level
         if bip_obj.IsLevel(Bip44Levels.COIN):
-            self._Set(HdWalletBipDataTypes.COIN_KEY, HdWalletBipKeys(bip_obj))
+            self._SetIfSelected(HdWalletBipDataTypes.COIN_KEY, data_types,
+                                HdWalletBipKeys, bip_obj, lazy_keys, key_types, coin_info=self.m_coin_info)
             self._Set(HdWalletBipDataTypes.ACCOUNT_IDX, acc_idx)
-            bip_obj = bip_obj.Account(acc_idx)
+            bip_obj = self.__DeriveChild(bip_obj, acc_idx, change_idx)
         # Set account keys and derive change if correct level
         if bip_obj.IsLevel(Bip44Levels.ACCOUNT):
-            self._Set(HdWalletBipDataTypes.ACCOUNT_KEY, HdWalletBipKeys(bip_obj))
+            self._SetIfSelected(HdWalletBipDataTypes.ACCOUNT_KEY, data_types,
+                                HdWalletBipKeys, bip_obj, lazy_keys, key_types, coin_info=self.m_coin_info)
             self._Set(HdWalletBipDataTypes.CHANGE_IDX, int(change_idx))
-            bip_obj = bip_obj.Change(change_idx)
+            bip_obj = self.__DeriveChild(bip_obj, acc_idx, change_idx)
 
         # Set change keys and derive addresses if correct level
         if bip_obj.IsLevel(Bip44Levels.CHANGE):
-            self._Set(HdWalletBipDataTypes.CHANGE_KEY, HdWalletBipKeys(bip_obj))
+            self._SetIfSelected(HdWalletBipDataTypes.CHANGE_KEY, data_types,
+                                HdWalletBipKeys, bip_obj, lazy_keys, key_types, coin_info=self.m_coin_info)
 
-            self._Set(HdWalletBipDataTypes.ADDRESS_OFF, addr_off)
-            self._Set(HdWalletBipDataTypes.ADDRESS,
-                      HdWalletBipAddresses(bip_obj, addr_num, addr_off))
+            self.__SetAddresses(bip_obj, addr_num, addr_off,
+                                append_addr=append_addr,
+                                data_types=data_types,
+                                lazy_keys=lazy_keys,
+                                key_types=key_types,
+                                workers=workers,
+                                compact=compact)
         # In this case, the wallet was created from an address index extended key,
         # so there is only one address to generate
         else:
-            self._Set(HdWalletBipDataTypes.ADDRESS,
-                      HdWalletBipAddresses(bip_obj, 1, 0))
+            self._SetIfSelected(HdWalletBipDataTypes.ADDRESS, data_types,
+                                HdWalletBipAddresses, bip_obj, 1, 0, lazy_keys, key_types,
+                                rev_index=self.m_rev_index, coin_info=self.m_coin_info)
+
+    def IterAddresses(self,
+                      acc_idx: int = 0,
+                      change_idx: HdWalletBipChanges = HdWalletBipChanges.CHAIN_EXT,
+                      start: int = 0,
+                      stop: Optional[int] = None,
+                      *,
+                      lazy_keys: bool = False,
+                      key_types: Optional[Set[HdWalletBipKeyTypes]] = None,
+                      workers: Optional[WorkersType] = None) -> Iterator[HdWalletBipKeys]:
+        """
+        Iterate over the addresses in the specified index range.
+        Differently from Generate, addresses are derived one at a time and not stored in the wallet,
+        so memory usage does not depend on the range size.
+
+        Args:
+            acc_idx (int, optional)                       : Account index (default: 0)
+            change_idx (HdWalletBipChanges, optional)     : Change index (default: external)
+            start (int, optional)                         : Starting address index (default: 0)
+            stop (int, optional)                          : Ending address index, excluded (default: 2^32 - 1)
+            lazy_keys (bool, optional)                    : True for computing keys only when requested (default: false)
+            key_types (set, optional)                     : Key types to be computed, None for all (default)
+            workers (int or HdWalletWorkersPool, optional): Number or pool of worker processes for deriving addresses
+                                                            (default: None, i.e. current process only)
+
+        Returns:
+            Iterator object: Iterator over the address keys
+
+        Raises:
+            TypeError: If change index is not a HdWalletBipChanges enum
+            ValueError: If the address index range is not valid
+        """
+        stop = Bip32KeyDataConst.KEY_INDEX_MAX_VAL if stop is None else stop
+
+        # Check parameters
+        if not isinstance(change_idx, HdWalletBipChanges):
+            raise TypeError("Change index is not an enumerative of HdWalletBipChanges")
+        if start < 0 or start > stop:
+            raise ValueError("Starting address index shall be greater or equal to zero and less than the ending one")
+        if stop > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError("Ending address index shall be less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        return HdWalletBipAddresses.Iter(self.__DeriveChange(acc_idx, change_idx),
+                                         stop - start,
+                                         start,
+                                         lazy_keys,
+                                         key_types,
+                                         workers=workers,
+                                         coin_info=self.m_coin_info)
+
+    def IterAddressesAsync(self,
+                           *args: Any,
+                           chunk_size: int = HdWalletAsyncConst.DEF_CHUNK_SIZE,
+                           executor: Optional[ThreadPoolExecutor] = None,
+                           **kwargs: Any) -> AsyncIterator[HdWalletBipKeys]:
+        """
+        Iterate asynchronously over the addresses in the specified index range.
+        The addresses are derived in the executor in chunks and control is given back to the event loop after each
+        chunk, so that the iteration does not block it and it can be cancelled between chunks.
+        Parameters are checked as in IterAddresses.
+
+        Args:
+            *args                                  : Arguments of IterAddresses
+            chunk_size (int, optional)             : Number of addresses derived for each chunk (default: 32)
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of IterAddresses
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the address keys
+        """
+        return HdWalletAsync.Iter(self.IterAddresses, *args, chunk_size=chunk_size, executor=executor, **kwargs)
+
+    def BuildFilter(self,
+                    acc_idxs: Iterable[int] = (0,),
+                    addr_num: int = 20,
+                    addr_off: int = 0,
+                    *,
+                    fp_rate: float = HdWalletBloomFilterConst.DEF_FP_RATE) -> HdWalletBloomFilter:
+        """
+        Build a Bloom filter of the addresses of both change chains of the specified accounts.
+        Both addresses and scriptPubKeys (for Bitcoin-like coins) are added, so that the filter can be used for
+        quickly discarding the transaction outputs not belonging to the wallet.
+        Addresses are derived and added one at a time, without storing them in the wallet.
+        If the wallet is at account level, only its account is used. If it is at change or address index level,
+        only its chain is used.
+
+        Args:
+            acc_idxs (iterable, optional): Account indexes (default: only account 0)
+            addr_num (int, optional)     : Number of addresses for each chain (default: 20)
+            addr_off (int, optional)     : Starting address index (default: 0)
+            fp_rate (float, optional)    : False positive rate of the filter (default: 0.001)
+
+        Returns:
+            HdWalletBloomFilter object: HdWalletBloomFilter object
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if addr_num <= 0 or addr_num > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError("Address number shall be greater than zero and less than 2^32")
+        if addr_off < 0 or ((addr_off + addr_num) > Bip32KeyDataConst.KEY_INDEX_MAX_VAL):
+            raise ValueError("Address offset shall be greater or equal to zero and less than 2^32")
+
+        # Get the objects at change (or address index) level
+        if self.m_bip_obj.Level() >= Bip44Levels.CHANGE:
+            chain_objs = [self.m_bip_obj]
+        else:
+            acc_idxs = list(acc_idxs) if self.m_bip_obj.Level() < Bip44Levels.ACCOUNT else [0]
+            chain_objs = [self.__DeriveChange(acc_idx, change_idx)
+                          for acc_idx in acc_idxs
+                          for change_idx in HdWalletBipChanges]
+        if len(chain_objs) == 0:
+            raise ValueError("At least one account index shall be specified")
+
+        # Size the filter for addresses and scriptPubKeys
+        filter_builder = HdWalletBipFilterBuilder(HdWalletBloomFilter(len(chain_objs) * addr_num * 2, fp_rate))
+        for chain_obj in chain_objs:
+            filter_builder.AddAddresses(chain_obj, addr_num, addr_off)
+        return filter_builder.Filter()
+
+    def Snapshot(self,
+                 acc_idx: int = 0) -> HdWalletBipSnapshot:
+        """
+        Get a snapshot of the public nodes of the wallet at account level (and of both its change chains),
+        which can be saved and used for restoring a watch-only wallet by HdWalletBipFactory.CreateFromSnapshot.
+        If the wallet is below account level, the specified account is derived.
+        If the wallet is at change level, the snapshot only contains its chain.
+
+        Args:
+            acc_idx (int, optional): Account index, used only if the wallet is below account level (default: 0)
+
+        Returns:
+            HdWalletBipSnapshot object: HdWalletBipSnapshot object
+
+        Raises:
+            ValueError: If the wallet is at address index level or public derivation is not supported by the coin
+        """
+        if self.m_bip_obj.IsLevel(Bip44Levels.ADDRESS_INDEX):
+            raise ValueError("Snapshot is not supported for wallets at address index level")
+        if not self.m_bip_obj.Bip32Object().IsPublicDerivationSupported():
+            raise ValueError("Snapshot is not supported for coins without public derivation")
+
+        wallet_name = str(self.GetData(HdWalletBipDataTypes.WALLET_NAME))
+        if self.m_bip_obj.IsLevel(Bip44Levels.CHANGE):
+            return HdWalletBipSnapshot.FromBipObjects(wallet_name, self.m_bip_obj)
+
+        acc_obj = self.m_bip_obj
+        while acc_obj.Level() < Bip44Levels.ACCOUNT:
+            acc_obj = self.__DeriveChild(acc_obj, acc_idx, HdWalletBipChanges.CHAIN_EXT)
+        return HdWalletBipSnapshot.FromBipObjects(wallet_name,
+                                                  acc_obj,
+                                                  [self.__DeriveChange(acc_idx, change_idx)
+                                                   for change_idx in HdWalletBipChanges])
+
+    def DerivationCache(self) -> HdWalletDerivationCache:
+        """
+        Get the cache of the derived nodes (i.e. purpose, coin, account and change levels).
+        It can be used for getting the hit/miss counters or for changing its size.
+
+        Returns:
+            HdWalletDerivationCache object: HdWalletDerivationCache object
+        """
+        return self.m_deriv_cache
+
+    def Level(self) -> Bip44Levels:
+        """
+        Get the wallet level, i.e. the level of the key from which the wallet was created.
+
+        Returns:
+            Bip44Levels: Wallet level
+        """
+        return self.m_bip_obj.Level()
 
     def IsWatchOnly(self) -> bool:
         """
@@ -141,6 +373,133 @@ class HdWalletBip(HdWalletBase):
     # Private methods
     #
 
+    def __SetAddresses(self,
+                       bip_obj: Bip44Base,
+                       addr_num: int,
+                       addr_off: int,
+                       **kwargs: Any) -> None:
+        """
+        Set addresses, by either generating them or appending them to the already generated ones.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at change level
+            addr_num (int)            : Number of addresses to be generated
+            addr_off (int)            : Starting address index
+
+        Other Parameters:
+            append_addr (HdWalletBipAddresses or None): Addresses to append to, None for generating them
+            data_types (set or None)                  : Selected data types, None for all
+            lazy_keys (bool)                          : True for computing keys only when requested
+            key_types (set or None)                   : Key types to be computed, None for all
+            workers (int or None)                     : Number of worker processes, None for current process only
+            compact (bool)                            : True for storing address keys in a compact columnar form
+        """
+        append_addr = kwargs["append_addr"]
+        if append_addr is not None:
+            append_addr.Append(bip_obj, addr_num, kwargs["lazy_keys"], kwargs["key_types"],
+                               workers=kwargs["workers"], coin_info=self.m_coin_info)
+        else:
+            self._Set(HdWalletBipDataTypes.ADDRESS_OFF, addr_off)
+            self._SetIfSelected(HdWalletBipDataTypes.ADDRESS, kwargs["data_types"],
+                                HdWalletBipAddresses, bip_obj, addr_num, addr_off, kwargs["lazy_keys"],
+                                kwargs["key_types"], workers=kwargs["workers"], compact=kwargs["compact"],
+                                rev_index=self.m_rev_index,
+                                acc_idx=self.GetData(HdWalletBipDataTypes.ACCOUNT_IDX),
+                                change_idx=self.GetData(HdWalletBipDataTypes.CHANGE_IDX),
+                                coin_info=self.m_coin_info)
+
+    def __AddressesToAppend(self,
+                            append: bool,
+                            acc_idx: int,
+                            change_idx: HdWalletBipChanges,
+                            data_types: Optional[AbstractSet[HdWalletDataTypes]]) -> Optional[HdWalletBipAddresses]:
+        """
+        Get the generated addresses to which the new ones shall be appended.
+
+        Args:
+            append (bool)                  : True if appending, false otherwise
+            acc_idx (int)                  : Account index
+            change_idx (HdWalletBipChanges): Change index
+            data_types (set or None)       : Selected data types, None for all
+
+        Returns:
+            HdWalletBipAddresses object: HdWalletBipAddresses object
+            None: If not appending, addresses are not selected or not generated yet
+
+        Raises:
+            ValueError: If the generated addresses belong to different account or change indexes
+        """
+        if not append or (data_types is not None and HdWalletBipDataTypes.ADDRESS not in data_types):
+            return None
+
+        addr = self.GetData(HdWalletBipDataTypes.ADDRESS)
+        if addr is None:
+            return None
+        if (self.GetData(HdWalletBipDataTypes.ACCOUNT_IDX) not in (None, acc_idx)
+                or self.GetData(HdWalletBipDataTypes.CHANGE_IDX) not in (None, int(change_idx))):
+            raise ValueError("Account and change indexes shall be the same of the generated addresses for appending")
+        return addr
+
+    def __DeriveChange(self,
+                       acc_idx: int,
+                       change_idx: HdWalletBipChanges) -> Bip44Base:
+        """
+        Derive the change level starting from the wallet level.
+        If the wallet is at change or address index level, it is returned as it is.
+
+        Args:
+            acc_idx (int)                  : Account index
+            change_idx (HdWalletBipChanges): Change index
+
+        Returns:
+            Bip44Base object: Bip44Base object at change (or address index) level
+        """
+        bip_obj = self.m_bip_obj
+        while bip_obj.Level() < Bip44Levels.CHANGE:
+            bip_obj = self.__DeriveChild(bip_obj, acc_idx, change_idx)
+        return bip_obj
+
+    def __DeriveChild(self,
+                      bip_obj: Bip44Base,
+                      acc_idx: int,
+                      change_idx: HdWalletBipChanges) -> Bip44Base:
+        """
+        Derive the next level of the specified object, using the derivation cache.
+
+        Args:
+            bip_obj (Bip44Base object)     : Bip44Base object below change level
+            acc_idx (int)                  : Account index
+            change_idx (HdWalletBipChanges): Change index
+
+        Returns:
+            Bip44Base object: Bip44Base object at the next level
+        """
+        if bip_obj.IsLevel(Bip44Levels.MASTER):
+            return self.m_deriv_cache.GetOrDerive((Bip44Levels.PURPOSE,), bip_obj.Purpose)
+        if bip_obj.IsLevel(Bip44Levels.PURPOSE):
+            return self.m_deriv_cache.GetOrDerive((Bip44Levels.COIN,), bip_obj.Coin)
+        if bip_obj.IsLevel(Bip44Levels.COIN):
+            return self.m_deriv_cache.GetOrDerive((Bip44Levels.ACCOUNT, acc_idx), bip_obj.Account, acc_idx)
+        return self.m_deriv_cache.GetOrDerive(self.__ChangeCacheKey(acc_idx, change_idx), bip_obj.Change, change_idx)
+
+    def __ChangeCacheKey(self,
+                         acc_idx: int,
+                         change_idx: HdWalletBipChanges) -> Tuple[int, ...]:
+        """
+        Get the derivation cache key of a change node.
+        If the wallet is at account level, the account index is not relevant and it is not part of the key.
+
+        Args:
+            acc_idx (int)                  : Account index
+            change_idx (HdWalletBipChanges): Change index
+
+        Returns:
+            tuple: Cache key
+        """
+        if self.m_bip_obj.Level() >= Bip44Levels.ACCOUNT:
+            return Bip44Levels.CHANGE, int(change_idx)
+        return Bip44Levels.CHANGE, acc_idx, int(change_idx)
+
     def __InitData(self,
                    wallet_name: str,
                    mnemonic: str,
@@ -161,12 +520,11 @@ class HdWalletBip(HdWalletBase):
         # Set specification name
         self._Set(HdWalletBipDataTypes.SPEC_NAME, self.m_bip_obj.SpecName())
         # Set coin name
-        coin_names = self.m_bip_obj.CoinConf().CoinNames()
-        self._Set(HdWalletBipDataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletBipDataTypes.COIN_NAME, self.m_coin_info.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletBipDataTypes.MNEMONIC, mnemonic)
             self._Set(HdWalletBipDataTypes.PASSPHRASE, passphrase)
         if seed_bytes != b"":
-            self._Set(HdWalletBipDataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletBipDataTypes.SEED_BYTES, seed_bytes)
@@ -21,11 +21,18 @@
 """Module with helper class for storing BIP addresses."""
 
 # Imports
+from typing import Iterator, List, Optional, Set, Tuple, Type
+
 from bip_utils import Bip44Levels
 from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf
 
+from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import HdWalletBipKeyTypes
 from py_crypto_hd_wallet.bip.hd_wallet_bip_keys import HdWalletBipKeys
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_coin_info import HdWalletCoinInfo
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers, WorkersType
 
 
 class HdWalletBipAddresses(HdWalletAddrBase):
@@ -38,36 +45,144 @@ class HdWalletBipAddresses(HdWalletAddrBase):
     def __init__(self,
                  bip_obj: Bip44Base,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 lazy_keys: bool = False,
+                 key_types: Optional[Set[HdWalletBipKeyTypes]] = None,
+                 *,
+                 workers: Optional[int] = None,
+                 compact: bool = False,
+                 rev_index: Optional[HdWalletReverseIndex] = None,
+                 acc_idx: Optional[int] = None,
+                 change_idx: Optional[int] = None,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            bip_obj (Bip44Base object): Bip44Base object
-            addr_num (int)            : Address number
-            addr_off (int)            : Starting address index
+            bip_obj (Bip44Base object)                       : Bip44Base object
+            addr_num (int)                                   : Address number
+            addr_off (int)                                   : Starting address index
+            lazy_keys (bool, optional)                       : True for computing keys only when requested, false
+                                                               otherwise (default)
+            key_types (set, optional)                        : Key types to be computed, None for all (default)
+            workers (int, optional)                          : Number of worker processes, None for deriving in the
+                                                               current process (default)
+            compact (bool, optional)                         : True for storing keys in a compact columnar form, false
+                                                               otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which addresses are added (also when
+                                                               appended), None for no reverse index (default)
+            acc_idx (int, optional)                          : Account index of the addresses, for the reverse index
+                                                               (default: None)
+            change_idx (int, optional)                       : Change index of the addresses, for the reverse index
+                                                               (default: None)
+            coin_info (HdWalletCoinInfo object, optional)    : Coin information already resolved from the coin
+                                                               configuration, None for resolving it from the Bip object
+                                                               (default)
         """
-        super().__init__(addr_off)
-        self.__FromBipObj(bip_obj, addr_num, addr_off)
+        super().__init__(addr_off, compact=compact, rev_index=rev_index, acc_idx=acc_idx, change_idx=change_idx)
+        for addr in self.Iter(bip_obj, addr_num, addr_off, lazy_keys, key_types, workers=workers, coin_info=coin_info):
+            self._AddAddr(addr)
 
-    def __FromBipObj(self,
-                     bip_obj: Bip44Base,
-                     addr_num: int,
-                     addr_off: int) -> None:
+    def Append(self,
+               bip_obj: Bip44Base,
+               addr_num: int,
+               lazy_keys: bool = False,
+               key_types: Optional[Set[HdWalletBipKeyTypes]] = None,
+               *,
+               workers: Optional[int] = None,
+               coin_info: Optional[HdWalletCoinInfo] = None) -> None:
+        """
+        Derive the specified number of addresses following the last one and append them.
+        The Bip object shall be the same used for deriving the current addresses.
+
+        Args:
+            bip_obj (Bip44Base object)                   : Bip44Base object
+            addr_num (int)                               : Address number
+            lazy_keys (bool, optional)                   : True for computing keys only when requested, false otherwise
+                                                           (default)
+            key_types (set, optional)                    : Key types to be computed, None for all (default)
+            workers (int, optional)                      : Number of worker processes, None for deriving in the current
+                                                           process (default)
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved from the coin
+                                                           configuration, None for resolving it from the Bip object
+                                                           (default)
+        """
+        for addr in self.Iter(bip_obj, addr_num, self.NextIndex(), lazy_keys, key_types,
+                              workers=workers, coin_info=coin_info):
+            self._AddAddr(addr)
+
+    @staticmethod
+    def Iter(bip_obj: Bip44Base,
+             addr_num: int,
+             addr_off: int,
+             lazy_keys: bool = False,
+             key_types: Optional[Set[HdWalletBipKeyTypes]] = None,
+             *,
+             workers: Optional[WorkersType] = None,
+             coin_info: Optional[HdWalletCoinInfo] = None) -> Iterator[HdWalletBipKeys]:
         """
-        Create addresses from the specified Bip object.
+        Iterate over addresses derived from the specified Bip object, one at a time and without storing them.
         If the Bip object is at address index level, only one address will be computed.
+        If workers are specified, keys are always computed by the workers (i.e. lazy_keys is ignored).
 
         Args:
-            bip_obj (Bip44Base object): Bip44Base object
-            addr_num (int)            : Address number
-            addr_off (int)            : Starting address index
+            bip_obj (Bip44Base object)                    : Bip44Base object
+            addr_num (int)                                : Address number
+            addr_off (int)                                : Starting address index
+            lazy_keys (bool, optional)                    : True for computing keys only when requested, false otherwise
+                                                            (default)
+            key_types (set, optional)                     : Key types to be computed, None for all (default)
+            workers (int or HdWalletWorkersPool, optional): Number or pool of worker processes, None for deriving in the
+                                                            current process (default)
+            coin_info (HdWalletCoinInfo object, optional) : Coin information already resolved from the coin
+                                                            configuration, None for resolving it from the Bip object
+                                                            (default)
+
+        Returns:
+            Iterator object: Iterator over the address keys
         """
 
+        # Resolve coin information only once for all the addresses
+        if coin_info is None:
+            coin_info = HdWalletCoinInfo.FromConf(bip_obj.CoinConf())
+
         # Only 1 address if address level
         if bip_obj.IsLevel(Bip44Levels.ADDRESS_INDEX):
-            self._AddAddr(HdWalletBipKeys(bip_obj))
+            yield HdWalletBipKeys(bip_obj, lazy_keys, key_types, coin_info=coin_info)
+        # Only the change-level extended key is sent to the workers
+        elif workers is not None:
+            ex_key = (bip_obj.PublicKey().ToExtended()
+                      if bip_obj.IsPublicOnly()
+                      else bip_obj.PrivateKey().ToExtended())
+            yield from HdWalletWorkers.Iter(_DeriveAddresses,
+                                            (type(bip_obj), bip_obj.CoinConf(), ex_key, key_types, coin_info),
+                                            addr_num,
+                                            addr_off,
+                                            workers)
         else:
             for i in range(addr_num):
-                bip_obj_addr = bip_obj.AddressIndex(i + addr_off)
-                self._AddAddr(HdWalletBipKeys(bip_obj_addr))
+                yield HdWalletBipKeys(bip_obj.AddressIndex(i + addr_off), lazy_keys, key_types, coin_info=coin_info)
+
+
+def _DeriveAddresses(worker_args: Tuple[Type[Bip44Base],
+                                        BipCoinConf,
+                                        str,
+                                        Optional[Set[HdWalletBipKeyTypes]],
+                                        HdWalletCoinInfo],
+                     addr_num: int,
+                     addr_off: int) -> List[HdWalletBipKeys]:
+    """
+    Derive addresses from a change-level extended key (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): Bip44Base class, BipCoinConf object, change-level extended key, key types and coin
+                             information
+        addr_num (int)     : Address number
+        addr_off (int)     : Starting address index
+
+    Returns:
+        list[HdWalletBipKeys]: Address keys
+    """
+    bip_cls, coin_conf, ex_key, key_types, coin_info = worker_args
+    bip_obj = bip_cls(coin_conf.Bip32Class().FromExtendedKey(ex_key, coin_conf.KeyNetVersions()), coin_conf)
+    return list(HdWalletBipAddresses.Iter(bip_obj, addr_num, addr_off, False, key_types, coin_info=coin_info))
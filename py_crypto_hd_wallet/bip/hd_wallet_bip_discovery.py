@@ -0,0 +1,532 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for discovering the used accounts and addresses of a BIP wallet (gap limit rule)."""
+
+# Imports
+import contextlib
+import inspect
+import time
+from typing import Any, Awaitable, Callable, ContextManager, Generator, Iterable, List, Optional, Sequence, Set, Union
+
+from bip_utils import Bip44Levels
+
+from py_crypto_hd_wallet.bip.hd_wallet_bip import HdWalletBip
+from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import HdWalletBipChanges, HdWalletBipKeyTypes
+from py_crypto_hd_wallet.common import HdWalletWorkers, HdWalletWorkersPool
+
+
+# Type of the function for checking if addresses are used, either synchronous or asynchronous
+IsUsedFctType = Callable[[List[str]], Union[Iterable[bool], Awaitable[Iterable[bool]]]]
+# Type of the generator that performs the discovery: it yields address batches and receives their used flags
+DiscoveryGenType = Generator[List[str], List[bool], Any]
+
+
+class HdWalletBipDiscoveryConst:
+    """Class container for HD wallet BIP discovery constants."""
+
+    # Default gap limit
+    DEF_GAP_LIMIT: int = 20
+    # Maximum batch size when batches are sized automatically
+    MAX_BATCH_SIZE: int = 1000
+    # Maximum account index (accounts are hardened)
+    ACC_MAX_IDX: int = 2**31 - 1
+
+
+class HdWalletBipUsedAddresses:
+    """
+    HD wallet BIP used addresses class.
+    It is an in-memory set of used addresses that can be passed as the function for checking if addresses are used,
+    e.g. for tests or for addresses already got from a local index.
+    """
+
+    m_used_addr: Set[str]
+
+    def __init__(self,
+                 used_addr: Iterable[str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            used_addr (iterable): Used addresses
+        """
+        self.m_used_addr = set(used_addr)
+
+    def __call__(self,
+                 addresses: List[str]) -> List[bool]:
+        """
+        Get if the specified addresses are used.
+
+        Args:
+            addresses (list[str]): Addresses
+
+        Returns:
+            list[bool]: True for each used address, false otherwise
+        """
+        return [addr in self.m_used_addr for addr in addresses]
+
+
+class HdWalletBipDiscoveryStats:
+    """
+    HD wallet BIP discovery statistics class.
+    It collects the number and time of address derivations and callback calls.
+    """
+
+    m_deriv_num: int
+    m_deriv_time: float
+    m_callback_num: int
+    m_callback_time: float
+    m_callback_max_time: float
+
+    def __init__(self) -> None:
+        """Construct class."""
+        self.Reset()
+
+    def Reset(self) -> None:
+        """Reset statistics."""
+        self.m_deriv_num = 0
+        self.m_deriv_time = 0.0
+        self.m_callback_num = 0
+        self.m_callback_time = 0.0
+        self.m_callback_max_time = 0.0
+
+    def DerivedAddresses(self) -> int:
+        """
+        Get the number of derived addresses.
+
+        Returns:
+            int: Number of derived addresses
+        """
+        return self.m_deriv_num
+
+    def DerivationTime(self) -> float:
+        """
+        Get the total time spent deriving addresses.
+
+        Returns:
+            float: Time in seconds
+        """
+        return self.m_deriv_time
+
+    def DerivationsPerSecond(self) -> float:
+        """
+        Get the number of derived addresses per second.
+
+        Returns:
+            float: Derived addresses per second (zero if no address was derived)
+        """
+        return self.m_deriv_num / self.m_deriv_time if self.m_deriv_time > 0 else 0.0
+
+    def CallbackCalls(self) -> int:
+        """
+        Get the number of callback calls.
+
+        Returns:
+            int: Number of callback calls
+        """
+        return self.m_callback_num
+
+    def CallbackTime(self) -> float:
+        """
+        Get the total time spent in the callback.
+
+        Returns:
+            float: Time in seconds
+        """
+        return self.m_callback_time
+
+    def AvgCallbackLatency(self) -> float:
+        """
+        Get the average latency of a callback call.
+
+        Returns:
+            float: Latency in seconds (zero if the callback was never called)
+        """
+        return self.m_callback_time / self.m_callback_num if self.m_callback_num > 0 else 0.0
+
+    def MaxCallbackLatency(self) -> float:
+        """
+        Get the maximum latency of a callback call.
+
+        Returns:
+            float: Latency in seconds
+        """
+        return self.m_callback_max_time
+
+    def AddDerivation(self,
+                       deriv_num: int,
+                       deriv_time: float) -> None:
+        """
+        Add a derivation of addresses.
+
+        Args:
+            deriv_num (int)   : Number of derived addresses
+            deriv_time (float): Derivation time in seconds
+        """
+        self.m_deriv_num += deriv_num
+        self.m_deriv_time += deriv_time
+
+    def AddCallback(self,
+                     callback_time: float) -> None:
+        """
+        Add a callback call.
+
+        Args:
+            callback_time (float): Callback time in seconds
+        """
+        self.m_callback_num += 1
+        self.m_callback_time += callback_time
+        self.m_callback_max_time = max(self.m_callback_max_time, callback_time)
+
+
+class HdWalletBipDiscoveredChain:
+    """
+    HD wallet BIP discovered chain class.
+    It contains the used address indexes of a chain (i.e. account and change indexes).
+    """
+
+    m_acc_idx: int
+    m_change_idx: HdWalletBipChanges
+    m_used_idxs: List[int]
+
+    def __init__(self,
+                 acc_idx: int,
+                 change_idx: HdWalletBipChanges,
+                 used_idxs: List[int]) -> None:
+        """
+        Construct class.
+
+        Args:
+            acc_idx (int)                  : Account index
+            change_idx (HdWalletBipChanges): Change index
+            used_idxs (list[int])          : Used address indexes, in ascending order
+        """
+        self.m_acc_idx = acc_idx
+        self.m_change_idx = change_idx
+        self.m_used_idxs = used_idxs
+
+    def AccountIndex(self) -> int:
+        """
+        Get the account index.
+
+        Returns:
+            int: Account index
+        """
+        return self.m_acc_idx
+
+    def ChangeIndex(self) -> HdWalletBipChanges:
+        """
+        Get the change index.
+
+        Returns:
+            HdWalletBipChanges: Change index
+        """
+        return self.m_change_idx
+
+    def UsedIndexes(self) -> List[int]:
+        """
+        Get the used address indexes.
+
+        Returns:
+            list[int]: Used address indexes, in ascending order
+        """
+        return self.m_used_idxs
+
+    def IsUsed(self) -> bool:
+        """
+        Get if at least one address of the chain is used.
+
+        Returns:
+            bool: True if used, false otherwise
+        """
+        return len(self.m_used_idxs) > 0
+
+    def AddressNum(self) -> int:
+        """
+        Get the number of addresses up to the last used one, i.e. the addr_num to be passed to Generate.
+
+        Returns:
+            int: Number of addresses
+        """
+        return self.m_used_idxs[-1] + 1 if self.m_used_idxs else 0
+
+
+class HdWalletBipDiscovery:
+    """
+    HD wallet BIP discovery class.
+    It discovers the used accounts and addresses of a wallet following the BIP44 account discovery:
+    accounts are scanned in order starting from zero, the external chain of each account is scanned until
+    gap limit consecutive addresses are unused and the discovery stops at the first account with no used address
+    in the external chain. The internal chain is scanned only for used accounts.
+
+    A function is called for getting if addresses are used. It receives a list of addresses and returns a used flag
+    for each of them, either directly or as an awaitable (in this case, DiscoverAsync shall be used).
+    Addresses are derived in batches. If the batch size is not specified, it is adapted to the callback:
+    the more its latency compared to the time of deriving an address, the bigger the batch, so that the number
+    of calls is reduced for slow callbacks (e.g. remote queries) without deriving too many addresses beyond the gap
+    for fast ones. Adapted batches are never smaller than the gap limit, while a specified batch size is used as is
+    (e.g. for a callback with a limit on the addresses of each query), since the gap is counted across batches.
+    If workers are specified, a single pool of worker processes is kept for the whole discovery. Since each batch
+    is sent to the workers, they are worth it only for big batches (i.e. slow callbacks).
+    """
+
+    m_hd_wallet: HdWalletBip
+    m_is_used_fct: IsUsedFctType
+    m_gap_limit: int
+    m_batch_size: Optional[int]
+    m_workers: Optional[int]
+    m_stats: HdWalletBipDiscoveryStats
+
+    def __init__(self,
+                 hd_wallet: HdWalletBip,
+                 is_used_fct: IsUsedFctType,
+                 *,
+                 gap_limit: int = HdWalletBipDiscoveryConst.DEF_GAP_LIMIT,
+                 batch_size: Optional[int] = None,
+                 workers: Optional[int] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            hd_wallet (HdWalletBip object): HdWalletBip object at account level or above
+            is_used_fct (function)        : Function for getting if addresses are used (synchronous or asynchronous)
+            gap_limit (int, optional)     : Gap limit (default: 20)
+            batch_size (int, optional)    : Number of addresses for each callback call, None for adapting it to
+                                            the callback (default)
+            workers (int, optional)       : Number of worker processes for deriving addresses
+                                            (default: None, i.e. current process only)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if hd_wallet.Level() > Bip44Levels.ACCOUNT:
+            raise ValueError("The wallet shall be at account level or above for discovering addresses")
+        if gap_limit <= 0:
+            raise ValueError("Gap limit shall be greater than zero")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size shall be greater than zero")
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        self.m_hd_wallet = hd_wallet
+        self.m_is_used_fct = is_used_fct
+        self.m_gap_limit = gap_limit
+        self.m_batch_size = batch_size
+        self.m_workers = workers
+        self.m_stats = HdWalletBipDiscoveryStats()
+
+    def Discover(self) -> List[HdWalletBipDiscoveredChain]:
+        """
+        Discover the used accounts and addresses, calling the function synchronously.
+
+        Returns:
+            list[HdWalletBipDiscoveredChain]: External and internal chains of each used account
+
+        Raises:
+            TypeError: If the function returns an awaitable
+            ValueError: If the function does not return a flag for each address
+        """
+        with self.__OpenWorkersPool() as workers_pool:
+            discovery_gen = self.__Discover(workers_pool)
+            try:
+                addresses = next(discovery_gen)
+                while True:
+                    start_time = time.perf_counter()
+                    used_flags = self.m_is_used_fct(addresses)
+                    if inspect.isawaitable(used_flags):
+                        if inspect.iscoroutine(used_flags):
+                            used_flags.close()
+                        raise TypeError("Asynchronous function for checking addresses, DiscoverAsync shall be used")
+                    self.m_stats.AddCallback(time.perf_counter() - start_time)
+                    addresses = discovery_gen.send(self.__CheckUsedFlags(addresses, used_flags))
+            except StopIteration as ex:
+                return ex.value
+
+    async def DiscoverAsync(self) -> List[HdWalletBipDiscoveredChain]:
+        """
+        Discover the used accounts and addresses, awaiting the function if asynchronous.
+        Addresses are derived in the current thread.
+
+        Returns:
+            list[HdWalletBipDiscoveredChain]: External and internal chains of each used account
+
+        Raises:
+            ValueError: If the function does not return a flag for each address
+        """
+        with self.__OpenWorkersPool() as workers_pool:
+            discovery_gen = self.__Discover(workers_pool)
+            try:
+                addresses = next(discovery_gen)
+                while True:
+                    start_time = time.perf_counter()
+                    used_flags = self.m_is_used_fct(addresses)
+                    if inspect.isawaitable(used_flags):
+                        used_flags = await used_flags
+                    self.m_stats.AddCallback(time.perf_counter() - start_time)
+                    addresses = discovery_gen.send(self.__CheckUsedFlags(addresses, used_flags))
+            except StopIteration as ex:
+                return ex.value
+
+    def Stats(self) -> HdWalletBipDiscoveryStats:
+        """
+        Get the statistics of the discovery (derivations per second, callback latency, ...).
+        They are accumulated over multiple discoveries until reset.
+
+        Returns:
+            HdWalletBipDiscoveryStats object: HdWalletBipDiscoveryStats object
+        """
+        return self.m_stats
+
+    def __OpenWorkersPool(self) -> ContextManager[Optional[HdWalletWorkersPool]]:
+        """
+        Open the pool of worker processes for a discovery.
+
+        Returns:
+            Context manager object: Context manager of the pool, None if no worker is specified
+        """
+        return contextlib.nullcontext() if self.m_workers is None else HdWalletWorkersPool(self.m_workers)
+
+    def __Discover(self,
+                   workers_pool: Optional[HdWalletWorkersPool]) -> DiscoveryGenType:
+        """
+        Discover the used accounts and addresses.
+        It is a generator that yields the addresses to be checked and receives their used flags,
+        so that it can be driven either synchronously or asynchronously.
+
+        Args:
+            workers_pool (HdWalletWorkersPool or None): Pool of worker processes, None for deriving in the current
+                                                        process
+
+        Returns:
+            Generator object: Generator returning the list of discovered chains
+        """
+        chains = []
+        # If the wallet is at account level, only its account can be discovered
+        acc_max_idx = 0 if self.m_hd_wallet.Level() == Bip44Levels.ACCOUNT else HdWalletBipDiscoveryConst.ACC_MAX_IDX
+        acc_idx = 0
+        while acc_idx <= acc_max_idx:
+            ext_chain = yield from self.__DiscoverChain(acc_idx, HdWalletBipChanges.CHAIN_EXT, workers_pool)
+            if not ext_chain.IsUsed():
+                break
+            int_chain = yield from self.__DiscoverChain(acc_idx, HdWalletBipChanges.CHAIN_INT, workers_pool)
+            chains += [ext_chain, int_chain]
+            acc_idx += 1
+        return chains
+
+    def __DiscoverChain(self,
+                        acc_idx: int,
+                        change_idx: HdWalletBipChanges,
+                        workers_pool: Optional[HdWalletWorkersPool]) -> DiscoveryGenType:
+        """
+        Discover the used addresses of a chain, until gap limit consecutive addresses are unused.
+
+        Args:
+            acc_idx (int)                             : Account index
+            change_idx (HdWalletBipChanges)           : Change index
+            workers_pool (HdWalletWorkersPool or None): Pool of worker processes, None for deriving in the current
+                                                        process
+
+        Returns:
+            Generator object: Generator returning the discovered chain
+        """
+        used_idxs = []
+        addr_idx = 0
+        unused_num = 0
+        while unused_num < self.m_gap_limit:
+            addresses = self.__DeriveAddresses(acc_idx, change_idx, addr_idx, self.__BatchSize(), workers_pool)
+            used_flags = yield addresses
+            # Addresses following the gap are ignored even if used, as other wallets would do
+            for is_used in used_flags:
+                if is_used:
+                    used_idxs.append(addr_idx)
+                    unused_num = 0
+                else:
+                    unused_num += 1
+                    if unused_num == self.m_gap_limit:
+                        break
+                addr_idx += 1
+        return HdWalletBipDiscoveredChain(acc_idx, change_idx, used_idxs)
+
+    def __DeriveAddresses(self,
+                          acc_idx: int,
+                          change_idx: HdWalletBipChanges,
+                          addr_idx: int,
+                          addr_num: int,
+                          workers_pool: Optional[HdWalletWorkersPool]) -> List[str]:
+        """
+        Derive the specified addresses, computing only the address key.
+
+        Args:
+            acc_idx (int)                             : Account index
+            change_idx (HdWalletBipChanges)           : Change index
+            addr_idx (int)                            : Starting address index
+            addr_num (int)                            : Address number
+            workers_pool (HdWalletWorkersPool or None): Pool of worker processes, None for deriving in the current
+                                                        process
+
+        Returns:
+            list[str]: Addresses
+        """
+        start_time = time.perf_counter()
+        addresses = [str(addr.GetKey(HdWalletBipKeyTypes.ADDRESS))
+                     for addr in self.m_hd_wallet.IterAddresses(acc_idx,
+                                                                change_idx,
+                                                                addr_idx,
+                                                                addr_idx + addr_num,
+                                                                key_types={HdWalletBipKeyTypes.ADDRESS},
+                                                                workers=workers_pool)]
+        self.m_stats.AddDerivation(len(addresses), time.perf_counter() - start_time)
+        return addresses
+
+    def __BatchSize(self) -> int:
+        """
+        Get the size of the next batch.
+        If not specified, it is the ratio between the callback latency and the time of deriving an address.
+
+        Returns:
+            int: Batch size
+        """
+        if self.m_batch_size is not None:
+            return self.m_batch_size
+        if self.m_stats.CallbackCalls() == 0 or self.m_stats.DerivationsPerSecond() == 0:
+            return self.m_gap_limit
+
+        batch_size = round(self.m_stats.AvgCallbackLatency() * self.m_stats.DerivationsPerSecond())
+        return min(max(batch_size, self.m_gap_limit), max(self.m_gap_limit, HdWalletBipDiscoveryConst.MAX_BATCH_SIZE))
+
+    @staticmethod
+    def __CheckUsedFlags(addresses: Sequence[str],
+                         used_flags: Iterable[bool]) -> List[bool]:
+        """
+        Check the used flags returned by the function.
+
+        Args:
+            addresses (list[str]): Addresses
+            used_flags (iterable): Used flags
+
+        Returns:
+            list[bool]: Used flags
+
+        Raises:
+            ValueError: If there is not a flag for each address
+        """
+        used_flags = [bool(is_used) for is_used in used_flags]
+        if len(used_flags) != len(addresses):
+            raise ValueError("The function for checking addresses shall return a flag for each address")
+        return used_flags
@@ -21,19 +21,25 @@
 """Module for creating BIP wallet factories."""
 
 # Imports
-from typing import Dict, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Type
 
 from bip_utils import (
     Bip32KeyError,
     Bip39MnemonicGenerator,
     Bip39SeedGenerator,
     Bip44,
+    Bip44ConfGetter,
     Bip49,
+    Bip49ConfGetter,
     Bip84,
+    Bip84ConfGetter,
     Bip86,
+    Bip86ConfGetter,
     MnemonicChecksumError,
 )
 from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf
 
 from py_crypto_hd_wallet.bip.hd_wallet_bip import HdWalletBip
 from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import (
@@ -42,10 +48,12 @@ from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import (
     HdWalletBip84Coins,
     HdWalletBip86Coins,
     HdWalletBipCoins,
+    HdWalletBipDataTypes,
     HdWalletBipLanguages,
     HdWalletBipWordsNum,
 )
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.bip.hd_wallet_bip_snapshot import HdWalletBipSnapshot
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletCoinInfo, HdWalletWorkers
 
 
 class HdWalletBipFactoryConst:
@@ -58,6 +66,34 @@ class HdWalletBipFactoryConst:
         HdWalletBip84Coins: Bip84,
         HdWalletBip86Coins: Bip86,
     }
+    # BIP coin to configuration getter map
+    BIP_COIN_TO_CONF_GETTER: Dict[Type[HdWalletBipCoins], Callable[..., BipCoinConf]] = {
+        HdWalletBip44Coins: Bip44ConfGetter.GetConfig,
+        HdWalletBip49Coins: Bip49ConfGetter.GetConfig,
+        HdWalletBip84Coins: Bip84ConfGetter.GetConfig,
+        HdWalletBip86Coins: Bip86ConfGetter.GetConfig,
+    }
+
+
+def _GenerateSeed(mnemonic: str,
+                  passphrase: str = "") -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic (str)            : Mnemonic
+        passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        return Bip39SeedGenerator(mnemonic).Generate(passphrase)
+    except (ValueError, MnemonicChecksumError) as ex:
+        raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
 
 
 class HdWalletBipFactory:
@@ -68,6 +104,8 @@ class HdWalletBipFactory:
 
     m_bip_coin: HdWalletBipCoins
     m_bip_cls: Type[Bip44Base]
+    m_coin_conf: BipCoinConf
+    m_coin_info: HdWalletCoinInfo
 
     def __init__(self,
                  coin_type: HdWalletBipCoins) -> None:
@@ -82,6 +120,9 @@ class HdWalletBipFactory:
         """
         self.m_bip_cls = self.__BipClassFromCoinType(coin_type)
         self.m_bip_coin = coin_type
+        # Coin configuration and information are resolved only once for all the created wallets
+        self.m_coin_conf = HdWalletBipFactoryConst.BIP_COIN_TO_CONF_GETTER[type(coin_type)](coin_type)
+        self.m_coin_info = HdWalletCoinInfo.FromConf(self.m_coin_conf)
 
     def CreateRandom(self,
                      wallet_name: str,
@@ -127,17 +168,56 @@ class HdWalletBipFactory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        try:
-            seed_bytes = Bip39SeedGenerator(mnemonic).Generate(passphrase)
-        except (ValueError, MnemonicChecksumError) as ex:
-            raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+        seed_bytes = _GenerateSeed(mnemonic, passphrase)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, passphrase, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      passphrase: str = "",
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
 
-        bip_obj = self.m_bip_cls.FromSeed(seed_bytes, self.m_bip_coin)
-        return HdWalletBip(wallet_name=wallet_name,
-                           bip_obj=bip_obj,
-                           mnemonic=mnemonic,
-                           passphrase=passphrase,
-                           seed_bytes=seed_bytes)
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            passphrase (str, optional)             : Passphrase for protecting mnemonic, empty if not specified
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, passphrase, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) or (wallet name, mnemonic, passphrase) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed, mnemonics, lambda item: item[1:], workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -158,7 +238,8 @@ class HdWalletBipFactory:
         bip_obj = self.m_bip_cls.FromSeed(seed_bytes, self.m_bip_coin)
         return HdWalletBip(wallet_name=wallet_name,
                            bip_obj=bip_obj,
-                           seed_bytes=seed_bytes)
+                           seed_bytes=seed_bytes,
+                           coin_info=self.m_coin_info)
 
     def CreateFromExtendedKey(self,
                               wallet_name: str,
@@ -182,7 +263,61 @@ class HdWalletBipFactory:
             raise ValueError(f"Invalid extended key: {ex_key_str}") from ex
 
         return HdWalletBip(wallet_name=wallet_name,
-                           bip_obj=bip_obj)
+                           bip_obj=bip_obj,
+                           coin_info=self.m_coin_info)
+
+    def CreateFromSnapshot(self,
+                           snapshot: HdWalletBipSnapshot) -> HdWalletBase:
+        """
+        Create a watch-only wallet from a snapshot (see HdWalletBip.Snapshot).
+        Differently from CreateFromExtendedKey, no extended key is decoded and the change nodes of the snapshot
+        are not derived again, so addresses are derived directly.
+
+        Args:
+            snapshot (HdWalletBipSnapshot object): HdWalletBipSnapshot object
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the snapshot is not valid or it does not belong to the factory coin
+        """
+        bip_obj, change_objs = snapshot.ToBipObjects(self.m_bip_cls, self.m_coin_conf)
+
+        hd_wallet = HdWalletBip(wallet_name=snapshot.WalletName(),
+                                bip_obj=bip_obj,
+                                change_objs=change_objs,
+                                coin_info=self.m_coin_info)
+        if (hd_wallet.GetData(HdWalletBipDataTypes.SPEC_NAME) != snapshot.SpecName()
+                or hd_wallet.GetData(HdWalletBipDataTypes.COIN_NAME) != snapshot.CoinName()):
+            raise ValueError(f"Snapshot of {snapshot.CoinName()} ({snapshot.SpecName()}) does not belong to the coin")
+        return hd_wallet
+
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 passphrase: str = "",
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
+        """
+        Create wallet from mnemonic and the seed generated from it.
+
+        Args:
+            wallet_name (str)         : Wallet name
+            mnemonic (str)            : Mnemonic
+            passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+            seed_bytes (bytes)        : Seed bytes
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+        """
+        bip_obj = self.m_bip_cls.FromSeed(seed_bytes, self.m_bip_coin)
+        return HdWalletBip(wallet_name=wallet_name,
+                           bip_obj=bip_obj,
+                           mnemonic=mnemonic,
+                           passphrase=passphrase,
+                           seed_bytes=seed_bytes,
+                           coin_info=self.m_coin_info)
 
     @staticmethod
     def __BipClassFromCoinType(coin_type: HdWalletBipCoins) -> Type[Bip44Base]:
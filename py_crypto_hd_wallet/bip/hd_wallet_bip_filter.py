@@ -0,0 +1,146 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for building a Bloom filter of BIP addresses."""
+
+# Imports
+from typing import Dict, Optional, Tuple, Type
+
+from bip_utils import (
+    BchP2PKHAddrDecoder,
+    BchP2PKHAddrEncoder,
+    BchP2SHAddrDecoder,
+    BchP2SHAddrEncoder,
+    Bip44Levels,
+    P2PKHAddrDecoder,
+    P2PKHAddrEncoder,
+    P2SHAddrDecoder,
+    P2SHAddrEncoder,
+    P2TRAddrDecoder,
+    P2TRAddrEncoder,
+    P2WPKHAddrDecoder,
+    P2WPKHAddrEncoder,
+)
+from bip_utils.addr.iaddr_decoder import IAddrDecoder
+from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf
+
+from py_crypto_hd_wallet.common import HdWalletBloomFilter
+
+
+class HdWalletBipFilterBuilderConst:
+    """Class container for HD wallet BIP filter builder constants."""
+
+    # Address decoder, scriptPubKey prefix and suffix for each address encoder class having a scriptPubKey
+    SCRIPT_PUB_KEY_PARTS: Dict[type, Tuple[Type[IAddrDecoder], bytes, bytes]] = {
+        # OP_DUP OP_HASH160 <hash160> OP_EQUALVERIFY OP_CHECKSIG
+        P2PKHAddrEncoder: (P2PKHAddrDecoder, b"\x76\xa9\x14", b"\x88\xac"),
+        BchP2PKHAddrEncoder: (BchP2PKHAddrDecoder, b"\x76\xa9\x14", b"\x88\xac"),
+        # OP_HASH160 <hash160> OP_EQUAL
+        P2SHAddrEncoder: (P2SHAddrDecoder, b"\xa9\x14", b"\x87"),
+        BchP2SHAddrEncoder: (BchP2SHAddrDecoder, b"\xa9\x14", b"\x87"),
+        # OP_0 <hash160>
+        P2WPKHAddrEncoder: (P2WPKHAddrDecoder, b"\x00\x14", b""),
+        # OP_1 <x-only public key>
+        P2TRAddrEncoder: (P2TRAddrDecoder, b"\x51\x20", b""),
+    }
+
+
+class HdWalletBipFilterBuilder:
+    """
+    HD wallet BIP filter builder class.
+    It adds addresses and their scriptPubKeys to a Bloom filter while deriving them, without creating keys objects.
+    """
+
+    m_filter: HdWalletBloomFilter
+
+    def __init__(self,
+                 bloom_filter: HdWalletBloomFilter) -> None:
+        """
+        Construct class.
+
+        Args:
+            bloom_filter (HdWalletBloomFilter object): Bloom filter to which items are added
+        """
+        self.m_filter = bloom_filter
+
+    def AddAddresses(self,
+                     bip_obj: Bip44Base,
+                     addr_num: int,
+                     addr_off: int = 0) -> None:
+        """
+        Derive the specified addresses and add them, with their scriptPubKeys, to the filter.
+        If the Bip object is at address index level, only its address will be added.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object at change (or address index) level
+            addr_num (int)            : Address number
+            addr_off (int, optional)  : Starting address index (default: 0)
+        """
+        coin_conf = bip_obj.CoinConf()
+        if bip_obj.IsLevel(Bip44Levels.ADDRESS_INDEX):
+            self.AddAddress(bip_obj.PublicKey().ToAddress(), coin_conf)
+        else:
+            for i in range(addr_num):
+                self.AddAddress(bip_obj.AddressIndex(i + addr_off).PublicKey().ToAddress(), coin_conf)
+
+    def AddAddress(self,
+                   address: str,
+                   coin_conf: BipCoinConf) -> None:
+        """
+        Add an address and its scriptPubKey (if the coin has one) to the filter.
+
+        Args:
+            address (str)                 : Address
+            coin_conf (BipCoinConf object): Coin configuration
+        """
+        self.m_filter.Add(address)
+        script_pub_key = self.ScriptPubKey(address, coin_conf)
+        if script_pub_key is not None:
+            self.m_filter.Add(script_pub_key)
+
+    def Filter(self) -> HdWalletBloomFilter:
+        """
+        Get the Bloom filter.
+
+        Returns:
+            HdWalletBloomFilter object: HdWalletBloomFilter object
+        """
+        return self.m_filter
+
+    @staticmethod
+    def ScriptPubKey(address: str,
+                     coin_conf: BipCoinConf) -> Optional[bytes]:
+        """
+        Get the scriptPubKey of the specified address.
+
+        Args:
+            address (str)                 : Address
+            coin_conf (BipCoinConf object): Coin configuration
+
+        Returns:
+            bytes: scriptPubKey bytes
+            None: If the coin has no scriptPubKey (i.e. it is not Bitcoin-like)
+        """
+        script_parts = HdWalletBipFilterBuilderConst.SCRIPT_PUB_KEY_PARTS.get(coin_conf.AddrClass())
+        if script_parts is None:
+            return None
+        addr_dec_cls, script_prefix, script_suffix = script_parts
+        return script_prefix + addr_dec_cls.DecodeAddr(address, **coin_conf.AddrParams()) + script_suffix
@@ -21,10 +21,12 @@
 """Module with helper class for storing BIP keys."""
 
 # Imports
+from typing import Optional, Set
+
 from bip_utils.bip.bip44_base import Bip44Base
 
 from py_crypto_hd_wallet.bip.hd_wallet_bip_enum import HdWalletBipKeyTypes
-from py_crypto_hd_wallet.common import HdWalletKeysBase
+from py_crypto_hd_wallet.common import HdWalletCoinInfo, HdWalletKeysBase
 
 
 class HdWalletBipKeys(HdWalletKeysBase):
@@ -35,39 +37,54 @@ class HdWalletBipKeys(HdWalletKeysBase):
     """
 
     def __init__(self,
-                 bip_obj: Bip44Base) -> None:
+                 bip_obj: Bip44Base,
+                 lazy: bool = False,
+                 key_types: Optional[Set[HdWalletBipKeyTypes]] = None,
+                 *,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            bip_obj (Bip44Base object): Bip44Base object
+            bip_obj (Bip44Base object)                   : Bip44Base object
+            lazy (bool, optional)                        : True for computing keys only when requested, false otherwise
+                                                           (default)
+            key_types (set, optional)                    : Key types to be computed, None for all (default)
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved from the coin
+                                                           configuration, None for resolving it from the Bip object
+                                                           (default)
         """
-        super().__init__(HdWalletBipKeyTypes)
-        self.__FromBipObj(bip_obj)
+        super().__init__(HdWalletBipKeyTypes, lazy, key_types)
+        self.__FromBipObj(bip_obj,
+                          coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(bip_obj.CoinConf()))
 
     def __FromBipObj(self,
-                     bip_obj: Bip44Base) -> None:
+                     bip_obj: Bip44Base,
+                     coin_info: HdWalletCoinInfo) -> None:
         """
         Create keys from the specified Bip object.
 
         Args:
-            bip_obj (Bip44Base object): Bip44Base object
+            bip_obj (Bip44Base object)         : Bip44Base object
+            coin_info (HdWalletCoinInfo object): Coin information
         """
 
         # Add public keys
-        self._Set(HdWalletBipKeyTypes.EX_PUB, bip_obj.PublicKey().ToExtended())
-        self._Set(HdWalletBipKeyTypes.RAW_COMPR_PUB, bip_obj.PublicKey().RawCompressed().ToHex())
-        self._Set(HdWalletBipKeyTypes.RAW_UNCOMPR_PUB, bip_obj.PublicKey().RawUncompressed().ToHex())
+        pub_key = bip_obj.PublicKey()
+        self._SetKey(HdWalletBipKeyTypes.EX_PUB, pub_key.ToExtended)
+        self._SetKey(HdWalletBipKeyTypes.RAW_COMPR_PUB, lambda: pub_key.RawCompressed().ToBytes())
+        self._SetKey(HdWalletBipKeyTypes.RAW_UNCOMPR_PUB, lambda: pub_key.RawUncompressed().ToBytes())
 
         # Add private keys only if not public-only
         if not bip_obj.IsPublicOnly():
-            self._Set(HdWalletBipKeyTypes.EX_PRIV, bip_obj.PrivateKey().ToExtended())
-            self._Set(HdWalletBipKeyTypes.RAW_PRIV, bip_obj.PrivateKey().Raw().ToHex())
-
+            priv_key = bip_obj.PrivateKey()
+            self._SetKey(HdWalletBipKeyTypes.EX_PRIV, priv_key.ToExtended)
+            self._SetKey(HdWalletBipKeyTypes.RAW_PRIV, lambda: priv_key.Raw().ToBytes())
             # Add WIF if supported
-            wif = bip_obj.PrivateKey().ToWif()
-            if wif != "":
-                self._Set(HdWalletBipKeyTypes.WIF_PRIV, wif)
+            self._SetKey(HdWalletBipKeyTypes.WIF_PRIV, lambda: coin_info.EncodeWif(priv_key.Bip32Key().KeyObject()))
 
-        # Address
-        self._Set(HdWalletBipKeyTypes.ADDRESS, bip_obj.PublicKey().ToAddress())
+        # Address (the cached encoder is not available if it depends on the configuration or on the key)
+        if coin_info.HasAddressEncoder():
+            self._SetKey(HdWalletBipKeyTypes.ADDRESS, lambda: coin_info.EncodeAddress(pub_key.Bip32Key().KeyObject()))
+        else:
+            self._SetKey(HdWalletBipKeyTypes.ADDRESS, pub_key.ToAddress)
@@ -0,0 +1,376 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for saving and loading snapshots of BIP wallets."""
+
+# Imports
+import struct
+from typing import Any, Iterable, List, Sequence, Tuple, Type
+
+from bip_utils import Bip32KeyData, Bip32KeyError, Bip44DepthError, Bip44Levels
+from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf
+
+from py_crypto_hd_wallet.common import HdWalletCoinInfo
+
+
+class HdWalletBipSnapshotConst:
+    """Class container for HD wallet BIP snapshot constants."""
+
+    # File magic
+    MAGIC: bytes = b"HDWBSN01"
+    # Structure of a string length
+    STR_LEN_STRUCT: struct.Struct = struct.Struct("<H")
+    # Structure of a count (i.e. number of nodes or snapshots)
+    COUNT_STRUCT: struct.Struct = struct.Struct("<I")
+    # Structure of a node, followed by the public point bytes
+    # (depth, index, parent fingerprint, chain code, public point length)
+    NODE_STRUCT: struct.Struct = struct.Struct("<BI4s32sB")
+
+
+class HdWalletBipSnapshot:
+    """
+    HD wallet BIP snapshot class.
+    It contains the public nodes of a wallet at account (or change) level and the change nodes already derived
+    from it, with the chain code and the public point already decoded.
+    It allows watch-only wallets to be restored without decoding extended keys and deriving the change level again,
+    so that address derivation resumes directly.
+    Snapshots are created by the HdWalletBip.Snapshot method and wallets are restored by the
+    HdWalletBipFactory.CreateFromSnapshot method.
+    """
+
+    m_wallet_name: str
+    m_spec_name: str
+    m_coin_name: str
+    m_nodes: List[bytes]
+
+    def __init__(self,
+                 wallet_name: str,
+                 spec_name: str,
+                 coin_name: str,
+                 nodes: Sequence[bytes]) -> None:
+        """
+        Construct class.
+
+        Args:
+            wallet_name (str): Wallet name
+            spec_name (str)  : Specification name
+            coin_name (str)  : Coin name
+            nodes (list)     : Encoded nodes, the first one is the wallet node and the others are change nodes
+
+        Raises:
+            ValueError: If no node is specified
+        """
+        if len(nodes) == 0:
+            raise ValueError("At least the wallet node shall be specified")
+
+        self.m_wallet_name = wallet_name
+        self.m_spec_name = spec_name
+        self.m_coin_name = coin_name
+        self.m_nodes = list(nodes)
+
+    @classmethod
+    def FromBipObjects(cls,
+                       wallet_name: str,
+                       wallet_obj: Bip44Base,
+                       change_objs: Iterable[Bip44Base] = ()) -> "HdWalletBipSnapshot":
+        """
+        Create a snapshot from Bip44Base objects.
+        Only public keys are stored.
+
+        Args:
+            wallet_name (str)            : Wallet name
+            wallet_obj (Bip44Base object): Bip44Base object at account or change level
+            change_objs (iterable)       : Bip44Base objects at change level derived from wallet_obj (default: none)
+
+        Returns:
+            HdWalletBipSnapshot object: HdWalletBipSnapshot object
+        """
+        return cls(wallet_name,
+                   wallet_obj.SpecName(),
+                   HdWalletCoinInfo.FromConf(wallet_obj.CoinConf()).Name(),
+                   [_EncodeNode(bip_obj) for bip_obj in (wallet_obj, *change_objs)])
+
+    def ToBipObjects(self,
+                     bip_cls: Type[Bip44Base],
+                     coin_conf: BipCoinConf) -> Tuple[Bip44Base, List[Bip44Base]]:
+        """
+        Get the public-only Bip44Base objects of the snapshot.
+
+        Args:
+            bip_cls (Bip44Base class): Bip44Base class
+            coin_conf (BipCoinConf)  : BipCoinConf object
+
+        Returns:
+            tuple[Bip44Base object, list[Bip44Base object]]: Wallet object and change objects
+
+        Raises:
+            ValueError: If the nodes are not valid
+        """
+        try:
+            bip_objs = [_DecodeNode(node, bip_cls, coin_conf) for node in self.m_nodes]
+        except (Bip32KeyError, Bip44DepthError, ValueError) as ex:
+            raise ValueError("Invalid snapshot nodes") from ex
+        if any(not bip_obj.IsLevel(Bip44Levels.CHANGE) for bip_obj in bip_objs[1:]):
+            raise ValueError("Invalid snapshot nodes")
+        return bip_objs[0], bip_objs[1:]
+
+    def WalletName(self) -> str:
+        """
+        Get the wallet name.
+
+        Returns:
+            str: Wallet name
+        """
+        return self.m_wallet_name
+
+    def SpecName(self) -> str:
+        """
+        Get the specification name.
+
+        Returns:
+            str: Specification name
+        """
+        return self.m_spec_name
+
+    def CoinName(self) -> str:
+        """
+        Get the coin name.
+
+        Returns:
+            str: Coin name
+        """
+        return self.m_coin_name
+
+    def ToBytes(self) -> bytes:
+        """
+        Encode the snapshot to bytes.
+
+        Returns:
+            bytes: Encoded snapshot
+        """
+        return b"".join([
+            _EncodeStr(self.m_wallet_name),
+            _EncodeStr(self.m_spec_name),
+            _EncodeStr(self.m_coin_name),
+            HdWalletBipSnapshotConst.COUNT_STRUCT.pack(len(self.m_nodes)),
+            *self.m_nodes,
+        ])
+
+    @classmethod
+    def FromBytes(cls,
+                  data: bytes) -> "HdWalletBipSnapshot":
+        """
+        Decode a snapshot from bytes.
+
+        Args:
+            data (bytes): Encoded snapshot
+
+        Returns:
+            HdWalletBipSnapshot object: HdWalletBipSnapshot object
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        snapshot, off = cls.__Decode(data, 0)
+        if off != len(data):
+            raise ValueError("Invalid snapshot data")
+        return snapshot
+
+    @staticmethod
+    def SaveToFile(file_path: str,
+                   snapshots: Iterable["HdWalletBipSnapshot"]) -> None:
+        """
+        Save the specified snapshots to file.
+
+        Args:
+            file_path (str)     : File path
+            snapshots (iterable): HdWalletBipSnapshot objects
+        """
+        snapshots_bytes = [snapshot.ToBytes() for snapshot in snapshots]
+        with open(file_path, "wb") as f:
+            f.write(HdWalletBipSnapshotConst.MAGIC)
+            f.write(HdWalletBipSnapshotConst.COUNT_STRUCT.pack(len(snapshots_bytes)))
+            f.write(b"".join(snapshots_bytes))
+
+    @staticmethod
+    def LoadFromFile(file_path: str) -> List["HdWalletBipSnapshot"]:
+        """
+        Load the snapshots from file.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            list[HdWalletBipSnapshot object]: HdWalletBipSnapshot objects, in the same order they were saved
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as f:
+            data = f.read()
+
+        magic_len = len(HdWalletBipSnapshotConst.MAGIC)
+        if data[:magic_len] != HdWalletBipSnapshotConst.MAGIC:
+            raise ValueError("Invalid snapshot file")
+        (snapshot_num,), off = _Unpack(HdWalletBipSnapshotConst.COUNT_STRUCT, data, magic_len)
+
+        snapshots = []
+        for _ in range(snapshot_num):
+            snapshot, off = HdWalletBipSnapshot.__Decode(data, off)
+            snapshots.append(snapshot)
+        if off != len(data):
+            raise ValueError("Invalid snapshot file")
+        return snapshots
+
+    @staticmethod
+    def __Decode(data: bytes,
+                 off: int) -> Tuple["HdWalletBipSnapshot", int]:
+        """
+        Decode a snapshot starting from the specified offset.
+
+        Args:
+            data (bytes): Data
+            off (int)   : Offset
+
+        Returns:
+            tuple[HdWalletBipSnapshot object, int]: HdWalletBipSnapshot object and offset after it
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        wallet_name, off = _DecodeStr(data, off)
+        spec_name, off = _DecodeStr(data, off)
+        coin_name, off = _DecodeStr(data, off)
+        (node_num,), off = _Unpack(HdWalletBipSnapshotConst.COUNT_STRUCT, data, off)
+
+        nodes = []
+        for _ in range(node_num):
+            node_fields, node_end = _Unpack(HdWalletBipSnapshotConst.NODE_STRUCT, data, off)
+            node_end += node_fields[-1]
+            if node_end > len(data):
+                raise ValueError("Invalid snapshot data")
+            nodes.append(data[off:node_end])
+            off = node_end
+
+        return HdWalletBipSnapshot(wallet_name, spec_name, coin_name, nodes), off
+
+
+def _Unpack(struct_obj: struct.Struct,
+            data: bytes,
+            off: int) -> Tuple[Tuple[Any, ...], int]:
+    """
+    Unpack a structure starting from the specified offset.
+
+    Args:
+        struct_obj (struct.Struct): Structure
+        data (bytes)              : Data
+        off (int)                 : Offset
+
+    Returns:
+        tuple[tuple, int]: Unpacked fields and offset after them
+
+    Raises:
+        ValueError: If the data is too short
+    """
+    try:
+        return struct_obj.unpack_from(data, off), off + struct_obj.size
+    except struct.error as ex:
+        raise ValueError("Invalid snapshot data") from ex
+
+
+def _EncodeStr(data_str: str) -> bytes:
+    """
+    Encode a string, prefixed by its length.
+
+    Args:
+        data_str (str): String
+
+    Returns:
+        bytes: Encoded string
+    """
+    data = data_str.encode("utf-8")
+    return HdWalletBipSnapshotConst.STR_LEN_STRUCT.pack(len(data)) + data
+
+
+def _DecodeStr(data: bytes,
+               off: int) -> Tuple[str, int]:
+    """
+    Decode a string starting from the specified offset.
+
+    Args:
+        data (bytes): Data
+        off (int)   : Offset
+
+    Returns:
+        tuple[str, int]: String and offset after it
+
+    Raises:
+        ValueError: If the data is not valid
+    """
+    (str_len,), off = _Unpack(HdWalletBipSnapshotConst.STR_LEN_STRUCT, data, off)
+    if off + str_len > len(data):
+        raise ValueError("Invalid snapshot data")
+    try:
+        return data[off:off + str_len].decode("utf-8"), off + str_len
+    except UnicodeDecodeError as ex:
+        raise ValueError("Invalid snapshot data") from ex
+
+
+def _EncodeNode(bip_obj: Bip44Base) -> bytes:
+    """
+    Encode the public node of a Bip44Base object.
+
+    Args:
+        bip_obj (Bip44Base object): Bip44Base object
+
+    Returns:
+        bytes: Encoded node
+    """
+    pub_key = bip_obj.Bip32Object().PublicKey()
+    key_data = pub_key.Data()
+    point_bytes = pub_key.KeyObject().RawUncompressed().ToBytes()
+    return HdWalletBipSnapshotConst.NODE_STRUCT.pack(int(key_data.Depth()),
+                                                     int(key_data.Index()),
+                                                     key_data.ParentFingerPrint().ToBytes(),
+                                                     key_data.ChainCode().ToBytes(),
+                                                     len(point_bytes)) + point_bytes
+
+
+def _DecodeNode(node: bytes,
+                bip_cls: Type[Bip44Base],
+                coin_conf: BipCoinConf) -> Bip44Base:
+    """
+    Decode a node to a public-only Bip44Base object.
+
+    Args:
+        node (bytes)             : Encoded node
+        bip_cls (Bip44Base class): Bip44Base class
+        coin_conf (BipCoinConf)  : BipCoinConf object
+
+    Returns:
+        Bip44Base object: Bip44Base object
+    """
+    depth, index, parent_fprint, chain_code, _ = HdWalletBipSnapshotConst.NODE_STRUCT.unpack_from(node)
+    bip32_obj = coin_conf.Bip32Class()(None,
+                                       node[HdWalletBipSnapshotConst.NODE_STRUCT.size:],
+                                       Bip32KeyData(depth, index, chain_code, parent_fprint),
+                                       coin_conf.KeyNetVersions())
+    return bip_cls(bip32_obj, coin_conf)
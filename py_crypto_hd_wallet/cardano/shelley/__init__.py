@@ -1,5 +1,9 @@
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley import HdWalletCardanoShelley
-from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr import HdWalletCardanoShelleyAddresses
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr import (
+    HdWalletCardanoShelleyAddresses,
+    HdWalletCardanoShelleyChangeAddresses,
+)
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr_batch import HdWalletCardanoShelleyAddressBatch
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_enum import (
     HdWalletCardanoShelleyChanges,
     HdWalletCardanoShelleyCoins,
@@ -21,24 +21,35 @@
 """Module for generating wallets based on Cardano Shelley."""
 
 # Imports
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, Optional, Set, Tuple
 
 from bip_utils import Bip44Levels, CardanoShelley, Cip1852
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from bip_utils.bip.bip44_base import Bip44Base
 
-from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr import HdWalletCardanoShelleyAddresses
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr import (
+    HdWalletCardanoShelleyAddresses,
+    HdWalletCardanoShelleyChangeAddresses,
+)
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_enum import (
     HdWalletCardanoShelleyChanges,
     HdWalletCardanoShelleyDataTypes,
+    HdWalletCardanoShelleyKeyTypes,
 )
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_keys import (
     HdWalletCardanoShelleyDerivedKeys,
     HdWalletCardanoShelleyMasterKeys,
     HdWalletCardanoShelleyStakingKeys,
 )
-from py_crypto_hd_wallet.common import HdWalletBase
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.common import (
+    HdWalletAsync,
+    HdWalletBase,
+    HdWalletCoinInfo,
+    HdWalletDerivationCache,
+    HdWalletWorkers,
+)
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsyncConst
 
 
 class HdWalletCardanoShelley(HdWalletBase):
@@ -48,6 +59,8 @@ class HdWalletCardanoShelley(HdWalletBase):
     """
 
     m_bip_obj: Bip44Base
+    m_coin_info: HdWalletCoinInfo
+    m_deriv_cache: HdWalletDerivationCache
 
     #
     # Public methods
@@ -58,16 +71,20 @@ class HdWalletCardanoShelley(HdWalletBase):
                  bip_obj: Bip44Base,
                  mnemonic: str = "",
                  passphrase: str = "",
-                 seed_bytes: bytes = b"") -> None:
+                 seed_bytes: bytes = b"",
+                 *,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            wallet_name (str)           : Wallet name
-            bip_obj (Bip44Base object)  : Bip44Base object
-            mnemonic (str, optional)    : Mnemonic, empty if not specified
-            passphrase (str, optional)  : Passphrase, empty if not specified
-            seed_bytes (bytes, optional): Seed_bytes, empty if not specified
+            wallet_name (str)                            : Wallet name
+            bip_obj (Bip44Base object)                   : Bip44Base object
+            mnemonic (str, optional)                     : Mnemonic, empty if not specified
+            passphrase (str, optional)                   : Passphrase, empty if not specified
+            seed_bytes (bytes, optional)                 : Seed_bytes, empty if not specified
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved by the factory, None for
+                                                           resolving it from bip_obj (default)
 
         Raises:
             TypeError: If the BIP object is not a Cip1852 class instance
@@ -80,6 +97,8 @@ class HdWalletCardanoShelley(HdWalletBase):
 
         super().__init__(HdWalletCardanoShelleyDataTypes)
         self.m_bip_obj = bip_obj
+        self.m_coin_info = coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(bip_obj.CoinConf())
+        self.m_deriv_cache = HdWalletDerivationCache()
         # Initialize data
         self.__InitData(wallet_name, mnemonic, passphrase, seed_bytes)
 
@@ -93,6 +112,17 @@ class HdWalletCardanoShelley(HdWalletBase):
             change_idx (HdWalletCardanoShelleyChanges, optional): Change index (default: external)
             addr_num (int, optional)                            : Number of addresses to be generated (default: 20)
             addr_off (int, optional)                            : Starting address index (default: 0)
+            fields (set, optional)                              : HdWalletCardanoShelleyDataTypes and
+                                                                  HdWalletCardanoShelleyKeyTypes to be generated
+                                                                  (default: all)
+            workers (int, optional)                             : Number of worker processes for deriving addresses
+                                                                  (default: None, i.e. current process only)
+            compact (bool, optional)                            : True for storing address keys in a compact
+                                                                  columnar form, which reduces memory usage for
+                                                                  many addresses (default: false)
+            all_changes (bool, optional)                        : True for generating the addresses of both change
+                                                                  chains in a HdWalletCardanoShelleyChangeAddresses
+                                                                  object, ignoring the change index (default: false)
         """
 
         # Get parameters
@@ -100,6 +130,10 @@ class HdWalletCardanoShelley(HdWalletBase):
         change_idx = kwargs.get("change_idx", HdWalletCardanoShelleyChanges.CHAIN_EXT)
         addr_num = kwargs.get("addr_num", 20)
         addr_off = kwargs.get("addr_off", 0)
+        data_types, key_types = self._SplitFields(kwargs.get("fields", None), HdWalletCardanoShelleyKeyTypes)
+        workers = kwargs.get("workers", None)
+        compact = kwargs.get("compact", False)
+        all_changes = kwargs.get("all_changes", False)
 
         # Check parameters
         if not isinstance(change_idx, HdWalletCardanoShelleyChanges):
@@ -108,34 +142,129 @@ class HdWalletCardanoShelley(HdWalletBase):
             raise ValueError("Address number shall be greater or equal to zero and less than 2^32")
         if addr_off < 0 or ((addr_off + addr_num) > Bip32KeyDataConst.KEY_INDEX_MAX_VAL):
             raise ValueError("Address offset shall be greater or equal to zero and less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
 
-        # Save the BIP object
-        bip_obj = self.m_bip_obj
-
-        # Set master keys and derive purpose if correct level
-        if bip_obj.IsLevel(Bip44Levels.MASTER):
-            self._Set(HdWalletCardanoShelleyDataTypes.MASTER_KEY, HdWalletCardanoShelleyMasterKeys(bip_obj))
-            bip_obj = bip_obj.Purpose()
-        # Set purpose keys and derive coin if correct level
-        if bip_obj.IsLevel(Bip44Levels.PURPOSE):
-            bip_obj = bip_obj.Coin()
-        # Set coin keys and derive account if correct level
-        if bip_obj.IsLevel(Bip44Levels.COIN):
+        # Set master keys if correct level
+        if self.m_bip_obj.IsLevel(Bip44Levels.MASTER):
+            self._SetIfSelected(HdWalletCardanoShelleyDataTypes.MASTER_KEY, data_types,
+                                HdWalletCardanoShelleyMasterKeys, self.m_bip_obj, key_types)
+        # Set account index if account shall be derived
+        if self.m_bip_obj.Level() < Bip44Levels.ACCOUNT:
             self._Set(HdWalletCardanoShelleyDataTypes.ACCOUNT_IDX, acc_idx)
-            bip_obj = bip_obj.Account(acc_idx)
 
-        # Set account keys and derive change
-        shelley_obj = CardanoShelley.FromCip1852Object(bip_obj)
-        self._Set(HdWalletCardanoShelleyDataTypes.CHANGE_IDX, int(change_idx))
-        self._Set(HdWalletCardanoShelleyDataTypes.ACCOUNT_KEY, HdWalletCardanoShelleyDerivedKeys(shelley_obj))
-        shelley_obj = shelley_obj.Change(change_idx)
+        # Set account keys
+        acc_bip_obj, shelley_obj = self.__DeriveAccount(acc_idx)
+        if all_changes:
+            self._Remove(HdWalletCardanoShelleyDataTypes.CHANGE_IDX)
+        else:
+            self._Set(HdWalletCardanoShelleyDataTypes.CHANGE_IDX, int(change_idx))
+        self._SetIfSelected(HdWalletCardanoShelleyDataTypes.ACCOUNT_KEY, data_types,
+                            HdWalletCardanoShelleyDerivedKeys, shelley_obj, key_types)
 
-        # Set change keys and derive addresses
+        # Derive addresses of both change chains (sharing the staking credential) or of the specified one
         self._Set(HdWalletCardanoShelleyDataTypes.ADDRESS_OFF, addr_off)
-        self._Set(HdWalletCardanoShelleyDataTypes.ADDRESS,
-                  HdWalletCardanoShelleyAddresses(shelley_obj, addr_num, addr_off))
+        if all_changes:
+            change_objs = {change: self.__DeriveChangeFromAccount(acc_bip_obj, shelley_obj, acc_idx, change)
+                           for change in HdWalletCardanoShelleyChanges}
+            self._SetIfSelected(HdWalletCardanoShelleyDataTypes.ADDRESS, data_types,
+                                HdWalletCardanoShelleyChangeAddresses,
+                                {change: objs[1] for change, objs in change_objs.items()},
+                                addr_num, addr_off, key_types,
+                                workers=workers, compact=compact, rev_index=self.m_rev_index,
+                                acc_idx=self.GetData(HdWalletCardanoShelleyDataTypes.ACCOUNT_IDX),
+                                bip_objs={change: objs[0] for change, objs in change_objs.items()})
+        else:
+            change_bip_obj, change_shelley_obj = self.__DeriveChangeFromAccount(acc_bip_obj, shelley_obj,
+                                                                                acc_idx, change_idx)
+            self._SetIfSelected(HdWalletCardanoShelleyDataTypes.ADDRESS, data_types,
+                                HdWalletCardanoShelleyAddresses, change_shelley_obj, addr_num, addr_off, key_types,
+                                workers=workers, compact=compact, rev_index=self.m_rev_index,
+                                acc_idx=self.GetData(HdWalletCardanoShelleyDataTypes.ACCOUNT_IDX),
+                                change_idx=int(change_idx), bip_obj=change_bip_obj)
         # Set staking keys
-        self._Set(HdWalletCardanoShelleyDataTypes.STAKING_KEY, HdWalletCardanoShelleyStakingKeys(shelley_obj))
+        self._SetIfSelected(HdWalletCardanoShelleyDataTypes.STAKING_KEY, data_types,
+                            HdWalletCardanoShelleyStakingKeys, shelley_obj, key_types)
+
+    def IterAddresses(self,
+                      acc_idx: int = 0,
+                      change_idx: HdWalletCardanoShelleyChanges = HdWalletCardanoShelleyChanges.CHAIN_EXT,
+                      start: int = 0,
+                      stop: Optional[int] = None,
+                      *,
+                      key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None,
+                      workers: Optional[int] = None) -> Iterator[HdWalletCardanoShelleyDerivedKeys]:
+        """
+        Iterate over the addresses in the specified index range.
+        Differently from Generate, addresses are derived one at a time and not stored in the wallet,
+        so memory usage does not depend on the range size.
+
+        Args:
+            acc_idx (int, optional)                             : Account index (default: 0)
+            change_idx (HdWalletCardanoShelleyChanges, optional): Change index (default: external)
+            start (int, optional)                               : Starting address index (default: 0)
+            stop (int, optional)                                : Ending address index, excluded (default: 2^32 - 1)
+            key_types (set, optional)                           : Key types to be computed, None for all (default)
+            workers (int, optional)                             : Number of worker processes for deriving addresses
+                                                                  (default: None, i.e. current process only)
+
+        Returns:
+            Iterator object: Iterator over the address keys
+
+        Raises:
+            TypeError: If change index is not a HdWalletCardanoShelleyChanges enum
+            ValueError: If the address index range is not valid
+        """
+        stop = Bip32KeyDataConst.KEY_INDEX_MAX_VAL if stop is None else stop
+
+        # Check parameters
+        if not isinstance(change_idx, HdWalletCardanoShelleyChanges):
+            raise TypeError("Change index is not an enumerative of HdWalletCardanoShelleyChanges")
+        if start < 0 or start > stop:
+            raise ValueError("Starting address index shall be greater or equal to zero and less than the ending one")
+        if stop > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError("Ending address index shall be less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        bip_obj, shelley_obj = self.__DeriveChange(acc_idx, change_idx)
+        return HdWalletCardanoShelleyAddresses.Iter(shelley_obj,
+                                                    stop - start,
+                                                    start,
+                                                    key_types,
+                                                    workers=workers,
+                                                    bip_obj=bip_obj)
+
+    def IterAddressesAsync(self,
+                           *args: Any,
+                           chunk_size: int = HdWalletAsyncConst.DEF_CHUNK_SIZE,
+                           executor: Optional[ThreadPoolExecutor] = None,
+                           **kwargs: Any) -> AsyncIterator[HdWalletCardanoShelleyDerivedKeys]:
+        """
+        Iterate asynchronously over the addresses in the specified index range.
+        The addresses are derived in the executor in chunks and control is given back to the event loop after each
+        chunk, so that the iteration does not block it and it can be cancelled between chunks.
+        Parameters are checked as in IterAddresses.
+
+        Args:
+            *args                                  : Arguments of IterAddresses
+            chunk_size (int, optional)             : Number of addresses derived for each chunk (default: 32)
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of IterAddresses
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the address keys
+        """
+        return HdWalletAsync.Iter(self.IterAddresses, *args, chunk_size=chunk_size, executor=executor, **kwargs)
+
+    def DerivationCache(self) -> HdWalletDerivationCache:
+        """
+        Get the cache of the derived nodes (i.e. purpose, coin, account and change levels).
+        It can be used for getting the hit/miss counters or for changing its size.
+
+        Returns:
+            HdWalletDerivationCache object: HdWalletDerivationCache object
+        """
+        return self.m_deriv_cache
 
     def IsWatchOnly(self) -> bool:
         """
@@ -150,6 +279,83 @@ class HdWalletCardanoShelley(HdWalletBase):
     # Private methods
     #
 
+    def __DeriveChange(self,
+                       acc_idx: int,
+                       change_idx: HdWalletCardanoShelleyChanges) -> Tuple[Bip44Base, CardanoShelley]:
+        """
+        Derive the change level starting from the wallet level, using the derivation cache.
+
+        Args:
+            acc_idx (int)                             : Account index
+            change_idx (HdWalletCardanoShelleyChanges): Change index
+
+        Returns:
+            tuple[Bip44Base object, CardanoShelley object]: Cip1852 and CardanoShelley objects at change level
+        """
+        return self.__DeriveChangeFromAccount(*self.__DeriveAccount(acc_idx), acc_idx, change_idx)
+
+    def __DeriveChangeFromAccount(self,
+                                  bip_obj: Bip44Base,
+                                  shelley_obj: CardanoShelley,
+                                  acc_idx: int,
+                                  change_idx: HdWalletCardanoShelleyChanges) -> Tuple[Bip44Base, CardanoShelley]:
+        """
+        Derive the change level starting from the account level, using the derivation cache.
+        The change level is derived from the Cip1852 object, so that it is available for worker processes too,
+        and the CardanoShelley object shares the staking keys of the account.
+
+        Args:
+            bip_obj (Bip44Base object)                : Cip1852 object at account level
+            shelley_obj (CardanoShelley object)       : CardanoShelley object at account level
+            acc_idx (int)                             : Account index
+            change_idx (HdWalletCardanoShelleyChanges): Change index
+
+        Returns:
+            tuple[Bip44Base object, CardanoShelley object]: Cip1852 and CardanoShelley objects at change level
+        """
+        def derive_change() -> Tuple[Bip44Base, CardanoShelley]:
+            change_bip_obj = bip_obj.Change(change_idx)
+            return change_bip_obj, CardanoShelley(change_bip_obj, shelley_obj.StakingObject())
+
+        return self.m_deriv_cache.GetOrDerive((Bip44Levels.CHANGE, acc_idx, int(change_idx)), derive_change)
+
+    def __DeriveAccount(self,
+                        acc_idx: int) -> Tuple[Bip44Base, CardanoShelley]:
+        """
+        Derive the account level starting from the wallet level, using the derivation cache.
+
+        Args:
+            acc_idx (int): Account index
+
+        Returns:
+            tuple[Bip44Base object, CardanoShelley object]: Cip1852 and CardanoShelley objects at account level
+        """
+        bip_obj = self.m_bip_obj
+
+        if bip_obj.IsLevel(Bip44Levels.MASTER):
+            bip_obj = self.m_deriv_cache.GetOrDerive((Bip44Levels.PURPOSE,), bip_obj.Purpose)
+        if bip_obj.IsLevel(Bip44Levels.PURPOSE):
+            bip_obj = self.m_deriv_cache.GetOrDerive((Bip44Levels.COIN,), bip_obj.Coin)
+        if bip_obj.IsLevel(Bip44Levels.COIN):
+            return self.m_deriv_cache.GetOrDerive((Bip44Levels.ACCOUNT, acc_idx),
+                                                  lambda: self.__AccountObjects(bip_obj.Account(acc_idx)))
+        return self.m_deriv_cache.GetOrDerive((Bip44Levels.ACCOUNT,),
+                                              self.__AccountObjects,
+                                              bip_obj)
+
+    @staticmethod
+    def __AccountObjects(bip_obj: Bip44Base) -> Tuple[Bip44Base, CardanoShelley]:
+        """
+        Get the objects at account level from a Cip1852 object.
+
+        Args:
+            bip_obj (Bip44Base object): Cip1852 object at account level
+
+        Returns:
+            tuple[Bip44Base object, CardanoShelley object]: Cip1852 and CardanoShelley objects at account level
+        """
+        return bip_obj, CardanoShelley.FromCip1852Object(bip_obj)
+
     def __InitData(self,
                    wallet_name: str,
                    mnemonic: str,
@@ -168,12 +374,11 @@ class HdWalletCardanoShelley(HdWalletBase):
         # Set wallet name
         self._Set(HdWalletCardanoShelleyDataTypes.WALLET_NAME, wallet_name)
         # Set coin name
-        coin_names = self.m_bip_obj.CoinConf().CoinNames()
-        self._Set(HdWalletCardanoShelleyDataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletCardanoShelleyDataTypes.COIN_NAME, self.m_coin_info.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletCardanoShelleyDataTypes.MNEMONIC, mnemonic)
             self._Set(HdWalletCardanoShelleyDataTypes.PASSPHRASE, passphrase)
         if seed_bytes != b"":
-            self._Set(HdWalletCardanoShelleyDataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletCardanoShelleyDataTypes.SEED_BYTES, seed_bytes)
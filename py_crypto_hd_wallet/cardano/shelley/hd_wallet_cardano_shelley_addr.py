@@ -21,10 +21,22 @@
 """Module with helper class for storing Cardano Shelley addresses."""
 
 # Imports
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+
 from bip_utils import CardanoShelley
+from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoinConf
 
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr_batch import HdWalletCardanoShelleyAddressBatch
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_enum import (
+    HdWalletCardanoShelleyChanges,
+    HdWalletCardanoShelleyKeyTypes,
+)
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_keys import HdWalletCardanoShelleyDerivedKeys
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_change_addr_base import HdWalletChangeAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers
 
 
 class HdWalletCardanoShelleyAddresses(HdWalletAddrBase):
@@ -37,31 +49,186 @@ class HdWalletCardanoShelleyAddresses(HdWalletAddrBase):
     def __init__(self,
                  shelley_obj: CardanoShelley,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None,
+                 *,
+                 workers: Optional[int] = None,
+                 compact: bool = False,
+                 rev_index: Optional[HdWalletReverseIndex] = None,
+                 acc_idx: Optional[int] = None,
+                 change_idx: Optional[int] = None,
+                 addr_batch: Optional[HdWalletCardanoShelleyAddressBatch] = None,
+                 bip_obj: Optional[Bip44Base] = None) -> None:
         """
         Construct class.
 
         Args:
-            shelley_obj (CardanoShelley object): CardanoShelley object
-            addr_num (int)                     : Address number
-            addr_off (int)                     : Starting address index
+            shelley_obj (CardanoShelley object)                             : CardanoShelley object
+            addr_num (int)                                                  : Address number
+            addr_off (int)                                                  : Starting address index
+            key_types (set, optional)                                       : Key types to be computed, None for all
+                                                                              (default)
+            workers (int, optional)                                         : Number of worker processes, None for
+                                                                              deriving in the current process (default)
+            compact (bool, optional)                                        : True for storing keys in a compact
+                                                                              columnar form, false otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional)               : Reverse index to which addresses are
+                                                                              added, None for no reverse index (default)
+            acc_idx (int, optional)                                         : Account index of the addresses, for the
+                                                                              reverse index (default: None)
+            change_idx (int, optional)                                      : Change index of the addresses, for the
+                                                                              reverse index (default: None)
+            addr_batch (HdWalletCardanoShelleyAddressBatch object, optional): Address batch of the account, None for
+                                                                              creating it (default)
+            bip_obj (Bip44Base object, optional)                            : Cip1852 object of the CardanoShelley
+                                                                              object, required by worker processes
+                                                                              (default: None)
+
+        Raises:
+            ValueError: If worker processes are used without the Cip1852 object
         """
-        super().__init__(addr_off)
-        self.__FromShelleyObj(shelley_obj, addr_num, addr_off)
+        super().__init__(addr_off, compact=compact, rev_index=rev_index, acc_idx=acc_idx, change_idx=change_idx)
+        for addr in self.Iter(shelley_obj, addr_num, addr_off, key_types,
+                              addr_batch=addr_batch, workers=workers, bip_obj=bip_obj):
+            self._AddAddr(addr)
 
-    def __FromShelleyObj(self,
-                         shelley_obj: CardanoShelley,
-                         addr_num: int,
-                         addr_off: int) -> None:
+    @staticmethod
+    def Iter(shelley_obj: CardanoShelley,
+             addr_num: int,
+             addr_off: int,
+             key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None,
+             *,
+             addr_batch: Optional[HdWalletCardanoShelleyAddressBatch] = None,
+             workers: Optional[int] = None,
+             bip_obj: Optional[Bip44Base] = None) -> Iterator[HdWalletCardanoShelleyDerivedKeys]:
         """
-        Create addresses from the specified CardanoShelley object.
-        If the Bip object is at address index level, only one address will be computed.
+        Iterate over addresses derived from the specified CardanoShelley object, one at a time and without storing them.
+        The staking credential is computed once and shared by all the addresses (see
+        HdWalletCardanoShelleyAddressBatch).
 
         Args:
-            shelley_obj (CardanoShelley object): CardanoShelley object
-            addr_num (int)                     : Address number
-            addr_off (int)                     : Starting address index
+            shelley_obj (CardanoShelley object)                             : CardanoShelley object
+            addr_num (int)                                                  : Address number
+            addr_off (int)                                                  : Starting address index
+            key_types (set, optional)                                       : Key types to be computed, None for all
+                                                                              (default)
+            addr_batch (HdWalletCardanoShelleyAddressBatch object, optional): Address batch of the account, None for
+                                                                              creating it (default)
+            workers (int, optional)                                         : Number of worker processes, None for
+                                                                              deriving in the current process (default)
+            bip_obj (Bip44Base object, optional)                            : Cip1852 object of the CardanoShelley
+                                                                              object, required by worker processes
+                                                                              (default: None)
+
+        Returns:
+            Iterator object: Iterator over the address keys
+
+        Raises:
+            ValueError: If worker processes are used without the Cip1852 object
         """
-        for i in range(addr_num):
-            shelley_obj_addr = shelley_obj.AddressIndex(i + addr_off)
-            self._AddAddr(HdWalletCardanoShelleyDerivedKeys(shelley_obj_addr))
+
+        # Only the change-level and staking extended keys are sent to the workers
+        if workers is not None:
+            if bip_obj is None:
+                raise ValueError("The Cip1852 object is required for deriving addresses with worker processes")
+            bip_sk_obj = shelley_obj.StakingObject()
+            if shelley_obj.IsPublicOnly():
+                ex_keys = (bip_obj.PublicKey().ToExtended(), bip_sk_obj.PublicKey().ToExtended())
+            else:
+                ex_keys = (bip_obj.PrivateKey().ToExtended(), bip_sk_obj.PrivateKey().ToExtended())
+            yield from HdWalletWorkers.Iter(_DeriveAddresses,
+                                            (type(bip_obj), bip_obj.CoinConf(), *ex_keys, key_types),
+                                            addr_num,
+                                            addr_off,
+                                            workers)
+        else:
+            addr_batch = addr_batch if addr_batch is not None else HdWalletCardanoShelleyAddressBatch(shelley_obj)
+            for i in range(addr_num):
+                yield HdWalletCardanoShelleyDerivedKeys(shelley_obj.AddressIndex(i + addr_off),
+                                                        key_types,
+                                                        addr_batch=addr_batch)
+
+
+class HdWalletCardanoShelleyChangeAddresses(HdWalletChangeAddrBase):
+    """
+    HD wallet Cardano Shelley change addresses class.
+    It creates the addresses of both the change chains (i.e. external and internal) of an account from their
+    CardanoShelley objects and stores them by change index, as HdWalletCardanoShelleyAddresses objects.
+    The staking credential is computed once and shared by all the addresses of both chains.
+    Addresses can be got individually, as dictionary or in JSON format.
+    """
+
+    def __init__(self,
+                 change_objs: Dict[HdWalletCardanoShelleyChanges, CardanoShelley],
+                 addr_num: int,
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None,
+                 *,
+                 workers: Optional[int] = None,
+                 compact: bool = False,
+                 rev_index: Optional[HdWalletReverseIndex] = None,
+                 acc_idx: Optional[int] = None,
+                 bip_objs: Optional[Dict[HdWalletCardanoShelleyChanges, Bip44Base]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            change_objs (dict)                               : CardanoShelley objects of the account at change level,
+                                                               by change index
+            addr_num (int)                                   : Address number for each change chain
+            addr_off (int)                                   : Starting address index
+            key_types (set, optional)                        : Key types to be computed, None for all (default)
+            workers (int, optional)                          : Number of worker processes, None for deriving in the
+                                                               current process (default)
+            compact (bool, optional)                         : True for storing keys in a compact columnar form,
+                                                               false otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which addresses are added, None for no
+                                                               reverse index (default)
+            acc_idx (int, optional)                          : Account index of the addresses, for the reverse index
+                                                               (default: None)
+            bip_objs (dict, optional)                        : Cip1852 objects of the CardanoShelley objects, by change
+                                                               index, required by worker processes (default: None)
+
+        Raises:
+            ValueError: If worker processes are used without the Cip1852 objects
+        """
+        addr_batch = HdWalletCardanoShelleyAddressBatch(next(iter(change_objs.values())))
+        super().__init__({
+            change_idx: HdWalletCardanoShelleyAddresses(shelley_obj,
+                                                        addr_num,
+                                                        addr_off,
+                                                        key_types,
+                                                        workers=workers,
+                                                        compact=compact,
+                                                        rev_index=rev_index,
+                                                        acc_idx=acc_idx,
+                                                        change_idx=int(change_idx),
+                                                        addr_batch=addr_batch,
+                                                        bip_obj=bip_objs[change_idx] if bip_objs is not None else None)
+            for change_idx, shelley_obj in change_objs.items()
+        })
+
+
+def _DeriveAddresses(worker_args: Tuple[Type[Bip44Base], BipCoinConf, str, str,
+                                         Optional[Set[HdWalletCardanoShelleyKeyTypes]]],
+                     addr_num: int,
+                     addr_off: int) -> List[HdWalletCardanoShelleyDerivedKeys]:
+    """
+    Derive addresses from a change-level extended key (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): Bip44Base class, BipCoinConf object, change-level extended key,
+                             staking extended key and key types
+        addr_num (int)     : Address number
+        addr_off (int)     : Starting address index
+
+    Returns:
+        list[HdWalletCardanoShelleyDerivedKeys]: Address keys
+    """
+    bip_cls, coin_conf, ex_key, sk_ex_key, key_types = worker_args
+    bip32_cls = coin_conf.Bip32Class()
+    shelley_obj = CardanoShelley(
+        bip_cls(bip32_cls.FromExtendedKey(ex_key, coin_conf.KeyNetVersions()), coin_conf),
+        bip_cls(bip32_cls.FromExtendedKey(sk_ex_key, coin_conf.KeyNetVersions()), coin_conf)
+    )
+    return list(HdWalletCardanoShelleyAddresses.Iter(shelley_obj, addr_num, addr_off, key_types))
@@ -0,0 +1,187 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for encoding Cardano Shelley addresses in batch."""
+
+# Imports
+from typing import Dict, Iterable, Tuple
+
+from bip_utils import AdaShelleyAddrNetworkTags, Blake2b224, CardanoShelley, CoinsConf
+
+
+class HdWalletCardanoShelleyAddressBatchConst:
+    """Class container for HD wallet Cardano Shelley address batch constants."""
+
+    # Network tag to address HRP
+    NETWORK_TAG_TO_ADDR_HRP: Dict[AdaShelleyAddrNetworkTags, str] = {
+        AdaShelleyAddrNetworkTags.MAINNET: CoinsConf.CardanoMainNet.ParamByKey("addr_hrp"),
+        AdaShelleyAddrNetworkTags.TESTNET: CoinsConf.CardanoTestNet.ParamByKey("addr_hrp"),
+    }
+    # Header type of base addresses with payment and staking key hashes (CIP-19)
+    BASE_ADDR_HDR_TYPE: int = 0x00
+    # Key hash length in bytes
+    KEY_HASH_BYTE_LEN: int = 28
+    # Payload length in bytes (header byte, address key hash and staking key hash)
+    PAYLOAD_BYTE_LEN: int = 1 + 2 * KEY_HASH_BYTE_LEN
+    # Payload padding in bits for converting it two 5-bit values at a time.
+    # The payload length is fixed (456 bits), so the padded length (460 bits) is also the one of the standard
+    # 5-bit conversion and the values are the same.
+    PAYLOAD_PAD_BIT_LEN: int = -(PAYLOAD_BYTE_LEN * 8) % 10
+
+    # Bech32 characters
+    BECH32_CHARSET: str = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    # Bech32 separator
+    BECH32_SEPARATOR: str = "1"
+    # Bech32 checksum length in characters
+    BECH32_CHECKSUM_LEN: int = 6
+    # Bech32 checksum constant
+    BECH32_CHECKSUM_CONST: int = 1
+    # Bech32 generator polynomial
+    BECH32_GENERATOR: Tuple[int, ...] = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+
+
+def _PolyMod(polymod: int,
+             values: Iterable[int]) -> int:
+    """
+    Continue the bech32 polynomial modulus computation from the specified state, one 5-bit value at a time.
+
+    Args:
+        polymod (int)    : Polymod state
+        values (iterable): 5-bit values
+
+    Returns:
+        int: Polymod state
+    """
+    for value in values:
+        top = polymod >> 25
+        polymod = ((polymod & 0x1ffffff) << 5) ^ value
+        for i, gen in enumerate(HdWalletCardanoShelleyAddressBatchConst.BECH32_GENERATOR):
+            polymod ^= gen if (top >> i) & 1 else 0
+    return polymod
+
+
+class HdWalletCardanoShelleyAddressBatchTables:
+    """
+    Class container for HD wallet Cardano Shelley address batch tables.
+    They allow to convert and checksum the data part two 5-bit values (i.e. 10 bits) at a time.
+    """
+
+    # Value to be xor-ed to the polymod when shifting it by 10 bits, for each value of its top 10 bits
+    POLYMOD: Tuple[int, ...] = tuple(_PolyMod(top << 20, (0, 0)) for top in range(1 << 10))
+    # Bech32 characters of each 10-bit value
+    CHARS: Tuple[str, ...] = tuple(HdWalletCardanoShelleyAddressBatchConst.BECH32_CHARSET[val >> 5]
+                                   + HdWalletCardanoShelleyAddressBatchConst.BECH32_CHARSET[val & 0x1f]
+                                   for val in range(1 << 10))
+
+
+class HdWalletCardanoShelleyAddressBatch:
+    """
+    HD wallet Cardano Shelley address batch class.
+    It encodes the base addresses of a CardanoShelley object in batch, giving the same result of
+    CardanoShelleyPublicKeys.ToAddress.
+
+    A base address is the bech32 encoding of the header byte, the hash of the address public key and the hash of the
+    staking public key (i.e. the staking credential). The values that do not depend on the address (i.e. the staking
+    credential and the checksum state after the HRP) are computed once, and the data part is converted and
+    checksummed two 5-bit values at a time.
+    """
+
+    m_hrp: str
+    m_hrp_polymod: int
+    m_prefix_byte: bytes
+    m_staking_key_hash: bytes
+
+    def __init__(self,
+                 shelley_obj: CardanoShelley) -> None:
+        """
+        Construct class.
+        The staking key is derived at account level, so the object can be constructed from a CardanoShelley object at
+        account, change or address level and used for all the addresses of the account.
+
+        Args:
+            shelley_obj (CardanoShelley object): CardanoShelley object
+        """
+        staking_obj = shelley_obj.StakingObject()
+        net_tag = staking_obj.CoinConf().AddrParams()["net_tag"]
+
+        self.m_hrp = HdWalletCardanoShelleyAddressBatchConst.NETWORK_TAG_TO_ADDR_HRP[net_tag]
+        self.m_hrp_polymod = _PolyMod(1, self.__HrpExpand(self.m_hrp))
+        self.m_prefix_byte = bytes([(HdWalletCardanoShelleyAddressBatchConst.BASE_ADDR_HDR_TYPE << 4) + net_tag])
+        self.m_staking_key_hash = Blake2b224.QuickDigest(staking_obj.PublicKey().RawCompressed().ToBytes()[1:])
+
+    def StakingKeyHash(self) -> bytes:
+        """
+        Get the staking key hash, i.e. the staking credential shared by all the base addresses.
+
+        Returns:
+            bytes: Staking key hash bytes
+        """
+        return self.m_staking_key_hash
+
+    def EncodeKey(self,
+                  pub_key_bytes: bytes) -> str:
+        """
+        Encode the address public key to a base address, without validating it since it was derived by the wallet.
+
+        Args:
+            pub_key_bytes (bytes): Address public key bytes (without the 0x00 prefix)
+
+        Returns:
+            str: Address string
+        """
+        polymod_table = HdWalletCardanoShelleyAddressBatchTables.POLYMOD
+        chars_table = HdWalletCardanoShelleyAddressBatchTables.CHARS
+        pad_bit_len = HdWalletCardanoShelleyAddressBatchConst.PAYLOAD_PAD_BIT_LEN
+
+        # The payload length is always PAYLOAD_BYTE_LEN, since both key hashes have a fixed length
+        payload_int = int.from_bytes(self.m_prefix_byte
+                                     + Blake2b224.QuickDigest(pub_key_bytes)
+                                     + self.m_staking_key_hash, "big") << pad_bit_len
+
+        polymod = self.m_hrp_polymod
+        data_chars = []
+        for shift in range(HdWalletCardanoShelleyAddressBatchConst.PAYLOAD_BYTE_LEN * 8 + pad_bit_len - 10, -10, -10):
+            val = (payload_int >> shift) & 0x3ff
+            polymod = ((polymod & 0xfffff) << 10) ^ val ^ polymod_table[polymod >> 20]
+            data_chars.append(chars_table[val])
+        # Shift by the checksum length (i.e. 6 zero values)
+        for _ in range(HdWalletCardanoShelleyAddressBatchConst.BECH32_CHECKSUM_LEN // 2):
+            polymod = ((polymod & 0xfffff) << 10) ^ polymod_table[polymod >> 20]
+        polymod ^= HdWalletCardanoShelleyAddressBatchConst.BECH32_CHECKSUM_CONST
+
+        return (self.m_hrp
+                + HdWalletCardanoShelleyAddressBatchConst.BECH32_SEPARATOR
+                + "".join(data_chars)
+                + chars_table[polymod >> 20]
+                + chars_table[(polymod >> 10) & 0x3ff]
+                + chars_table[polymod & 0x3ff])
+
+    @staticmethod
+    def __HrpExpand(hrp: str) -> Tuple[int, ...]:
+        """
+        Expand the HRP into values for checksum computation.
+
+        Args:
+            hrp (str): HRP
+
+        Returns:
+            tuple[int]: Expanded HRP values
+        """
+        return tuple([ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 0x1f for c in hrp])
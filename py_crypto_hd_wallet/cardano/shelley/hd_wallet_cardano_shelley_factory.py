@@ -21,7 +21,8 @@
 """Module for creating Cardano Shelley wallet factories."""
 
 # Imports
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
 
 from bip_utils import (
     Bip32KeyData,
@@ -31,6 +32,7 @@ from bip_utils import (
     Bip44Levels,
     CardanoIcarusSeedGenerator,
     Cip1852,
+    Cip1852ConfGetter,
     Ed25519KholawPrivateKey,
     Ed25519KholawPublicKey,
     MnemonicChecksumError,
@@ -42,10 +44,36 @@ from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_enum import (
     HdWalletCardanoShelleyLanguages,
     HdWalletCardanoShelleyWordsNum,
 )
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletCoinInfo, HdWalletWorkers
 from py_crypto_hd_wallet.utils import Utils
 
 
+def _GenerateSeed(coin_type: HdWalletCardanoShelleyCoins,
+                  mnemonic: str,
+                  passphrase: str = "") -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        coin_type (HdWalletCardanoShelleyCoins): Coin type
+        mnemonic (str)                         : Mnemonic
+        passphrase (str, optional)             : Passphrase for protecting mnemonic, empty if not specified
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        if coin_type in (HdWalletCardanoShelleyCoins.CARDANO_ICARUS,
+                         HdWalletCardanoShelleyCoins.CARDANO_ICARUS_TESTNET):
+            return CardanoIcarusSeedGenerator(mnemonic).Generate()
+        return Bip39SeedGenerator(mnemonic).Generate(passphrase)
+    except (ValueError, MnemonicChecksumError) as ex:
+        raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+
+
 class HdWalletCardanoShelleyFactory:
     """
     HD wallet Cardano Shelley factory class.
@@ -53,6 +81,7 @@ class HdWalletCardanoShelleyFactory:
     """
 
     m_coin: HdWalletCardanoShelleyCoins
+    m_coin_info: HdWalletCoinInfo
 
     def __init__(self,
                  coin_type: HdWalletCardanoShelleyCoins) -> None:
@@ -68,6 +97,7 @@ class HdWalletCardanoShelleyFactory:
         if not isinstance(coin_type, HdWalletCardanoShelleyCoins):
             raise TypeError("Coin type is not an accepted enumerative")
         self.m_coin = coin_type
+        self.m_coin_info = HdWalletCoinInfo.FromConf(Cip1852ConfGetter.GetConfig(coin_type))
 
     def CreateRandom(self,
                      wallet_name: str,
@@ -119,21 +149,59 @@ class HdWalletCardanoShelleyFactory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        try:
-            if self.m_coin in (HdWalletCardanoShelleyCoins.CARDANO_ICARUS,
-                               HdWalletCardanoShelleyCoins.CARDANO_ICARUS_TESTNET):
-                seed_bytes = CardanoIcarusSeedGenerator(mnemonic).Generate()
-            else:
-                seed_bytes = Bip39SeedGenerator(mnemonic).Generate(passphrase)
-        except (ValueError, MnemonicChecksumError) as ex:
-            raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+        seed_bytes = _GenerateSeed(self.m_coin, mnemonic, passphrase)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, passphrase, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      passphrase: str = "",
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
 
-        bip_obj = Cip1852.FromSeed(seed_bytes, self.m_coin)
-        return HdWalletCardanoShelley(wallet_name=wallet_name,
-                                      bip_obj=bip_obj,
-                                      mnemonic=mnemonic,
-                                      passphrase=passphrase,
-                                      seed_bytes=seed_bytes)
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            passphrase (str, optional)             : Passphrase for protecting mnemonic, empty if not specified
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, passphrase, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) or (wallet name, mnemonic, passphrase) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed,
+                                                            mnemonics,
+                                                            lambda item: (self.m_coin, *item[1:]),
+                                                            workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -154,7 +222,8 @@ class HdWalletCardanoShelleyFactory:
         bip_obj = Cip1852.FromSeed(seed_bytes, self.m_coin)
         return HdWalletCardanoShelley(wallet_name=wallet_name,
                                       bip_obj=bip_obj,
-                                      seed_bytes=seed_bytes)
+                                      seed_bytes=seed_bytes,
+                                      coin_info=self.m_coin_info)
 
     def CreateFromPrivateKey(self,
                              wallet_name: str,
@@ -185,7 +254,8 @@ class HdWalletCardanoShelleyFactory:
             raise ValueError(f"Invalid private key: {Utils.BytesToHexString(priv_key_bytes)}") from ex
 
         return HdWalletCardanoShelley(wallet_name=wallet_name,
-                                      bip_obj=bip_obj)
+                                      bip_obj=bip_obj,
+                                      coin_info=self.m_coin_info)
 
     def CreateFromPublicKey(self,
                             wallet_name: str,
@@ -218,4 +288,31 @@ class HdWalletCardanoShelleyFactory:
             raise ValueError(f"Invalid public key: {Utils.BytesToHexString(pub_key_bytes)}") from ex
 
         return HdWalletCardanoShelley(wallet_name=wallet_name,
-                                      bip_obj=bip_obj)
+                                      bip_obj=bip_obj,
+                                      coin_info=self.m_coin_info)
+
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 passphrase: str = "",
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
+        """
+        Create wallet from mnemonic and the seed generated from it.
+
+        Args:
+            wallet_name (str)         : Wallet name
+            mnemonic (str)            : Mnemonic
+            passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+            seed_bytes (bytes)        : Seed bytes
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+        """
+        bip_obj = Cip1852.FromSeed(seed_bytes, self.m_coin)
+        return HdWalletCardanoShelley(wallet_name=wallet_name,
+                                      bip_obj=bip_obj,
+                                      mnemonic=mnemonic,
+                                      passphrase=passphrase,
+                                      seed_bytes=seed_bytes,
+                                      coin_info=self.m_coin_info)
@@ -21,11 +21,12 @@
 """Module with helper class for storing Cardano Shelley keys."""
 
 # Imports
-from typing import Union
+from typing import Optional, Set, Union
 
 from bip_utils import Bip32PrivateKey, Bip32PublicKey, Bip44PrivateKey, Bip44PublicKey, CardanoShelley
 from bip_utils.bip.bip44_base import Bip44Base
 
+from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_addr_batch import HdWalletCardanoShelleyAddressBatch
 from py_crypto_hd_wallet.cardano.shelley.hd_wallet_cardano_shelley_enum import HdWalletCardanoShelleyKeyTypes
 from py_crypto_hd_wallet.common import HdWalletKeysBase
 
@@ -44,8 +45,8 @@ class HdWalletCardanoShelleyKeysBase(HdWalletKeysBase):
         Args:
             priv_key (Bip32PrivateKey or Bip44PrivateKey object): Private key object
         """
-        self._Set(HdWalletCardanoShelleyKeyTypes.RAW_PRIV,
-                  priv_key.Raw().ToHex() + priv_key.ChainCode().ToHex())
+        self._SetKey(HdWalletCardanoShelleyKeyTypes.RAW_PRIV,
+                     lambda: priv_key.Raw().ToBytes() + priv_key.ChainCode().ToBytes())
 
     def _SetPublicKey(self,
                       pub_key: Union[Bip32PublicKey, Bip44PublicKey]) -> None:
@@ -55,8 +56,8 @@ class HdWalletCardanoShelleyKeysBase(HdWalletKeysBase):
         Args:
             pub_key (Bip32PublicKey or Bip44PublicKey object): Public key object
         """
-        self._Set(HdWalletCardanoShelleyKeyTypes.RAW_PUB,
-                  pub_key.RawCompressed().ToHex()[2:] + pub_key.ChainCode().ToHex())
+        self._SetKey(HdWalletCardanoShelleyKeyTypes.RAW_PUB,
+                     lambda: pub_key.RawCompressed().ToBytes()[1:] + pub_key.ChainCode().ToBytes())
 
 
 class HdWalletCardanoShelleyMasterKeys(HdWalletCardanoShelleyKeysBase):
@@ -67,14 +68,16 @@ class HdWalletCardanoShelleyMasterKeys(HdWalletCardanoShelleyKeysBase):
     """
 
     def __init__(self,
-                 bip_obj: Bip44Base) -> None:
+                 bip_obj: Bip44Base,
+                 key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None) -> None:
         """
         Construct class.
 
         Args:
             bip_obj (Bip44Base object): Bip44Base object
+            key_types (set, optional) : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletCardanoShelleyKeyTypes)
+        super().__init__(HdWalletCardanoShelleyKeyTypes, key_types=key_types)
         self.__FromBipObj(bip_obj)
 
     def __FromBipObj(self,
@@ -99,14 +102,16 @@ class HdWalletCardanoShelleyStakingKeys(HdWalletCardanoShelleyKeysBase):
     """
 
     def __init__(self,
-                 shelley_obj: CardanoShelley) -> None:
+                 shelley_obj: CardanoShelley,
+                 key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None) -> None:
         """
         Construct class.
 
         Args:
             shelley_obj (CardanoShelley object): CardanoShelley object
+            key_types (set, optional)          : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletCardanoShelleyKeyTypes)
+        super().__init__(HdWalletCardanoShelleyKeyTypes, key_types=key_types)
         self.__FromShelleyObj(shelley_obj)
 
     def __FromShelleyObj(self,
@@ -124,7 +129,7 @@ class HdWalletCardanoShelleyStakingKeys(HdWalletCardanoShelleyKeysBase):
         if not staking_obj.IsPublicOnly():
             self._SetPrivateKey(staking_obj.PrivateKey())
 
-        self._Set(HdWalletCardanoShelleyKeyTypes.ADDRESS, staking_obj.PublicKey().ToAddress())
+        self._SetKey(HdWalletCardanoShelleyKeyTypes.ADDRESS, staking_obj.PublicKey().ToAddress)
 
 
 class HdWalletCardanoShelleyDerivedKeys(HdWalletCardanoShelleyKeysBase):
@@ -135,27 +140,42 @@ class HdWalletCardanoShelleyDerivedKeys(HdWalletCardanoShelleyKeysBase):
     """
 
     def __init__(self,
-                 shelley_obj: CardanoShelley) -> None:
+                 shelley_obj: CardanoShelley,
+                 key_types: Optional[Set[HdWalletCardanoShelleyKeyTypes]] = None,
+                 *,
+                 addr_batch: Optional[HdWalletCardanoShelleyAddressBatch] = None) -> None:
         """
         Construct class.
 
         Args:
-            shelley_obj (CardanoShelley object): CardanoShelley object
+            shelley_obj (CardanoShelley object)                             : CardanoShelley object
+            key_types (set, optional)                                       : Key types to be computed, None for all
+                                                                              (default)
+            addr_batch (HdWalletCardanoShelleyAddressBatch object, optional): Address batch, None for encoding the
+                                                                              address without it (default)
         """
-        super().__init__(HdWalletCardanoShelleyKeyTypes)
-        self.__FromShelleyObj(shelley_obj)
+        super().__init__(HdWalletCardanoShelleyKeyTypes, key_types=key_types)
+        self.__FromShelleyObj(shelley_obj, addr_batch)
 
     def __FromShelleyObj(self,
-                         shelley_obj: CardanoShelley) -> None:
+                         shelley_obj: CardanoShelley,
+                         addr_batch: Optional[HdWalletCardanoShelleyAddressBatch]) -> None:
         """
         Create keys from the specified Bip object.
 
         Args:
-            shelley_obj (CardanoShelley object): CardanoShelley object
+            shelley_obj (CardanoShelley object)                   : CardanoShelley object
+            addr_batch (HdWalletCardanoShelleyAddressBatch object): Address batch, None if not available
         """
-        self._SetPublicKey(shelley_obj.PublicKeys().AddressKey())
+        pub_keys = shelley_obj.PublicKeys()
+
+        self._SetPublicKey(pub_keys.AddressKey())
 
         if not shelley_obj.IsPublicOnly():
             self._SetPrivateKey(shelley_obj.PrivateKeys().AddressKey())
 
-        self._Set(HdWalletCardanoShelleyKeyTypes.ADDRESS, shelley_obj.PublicKeys().ToAddress())
+        if addr_batch is not None:
+            self._SetKey(HdWalletCardanoShelleyKeyTypes.ADDRESS,
+                         lambda: addr_batch.EncodeKey(pub_keys.AddressKey().RawCompressed().ToBytes()[1:]))
+        else:
+            self._SetKey(HdWalletCardanoShelleyKeyTypes.ADDRESS, pub_keys.ToAddress)
@@ -1,4 +1,12 @@
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_addr_store import HdWalletAddrStore, HdWalletAddrStoreView
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsync
 from py_crypto_hd_wallet.common.hd_wallet_base import HdWalletBase
+from py_crypto_hd_wallet.common.hd_wallet_bloom_filter import HdWalletBloomFilter
+from py_crypto_hd_wallet.common.hd_wallet_change_addr_base import HdWalletChangeAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_coin_info import HdWalletCoinInfo
 from py_crypto_hd_wallet.common.hd_wallet_data_types import HdWalletDataTypes, HdWalletKeyTypes
+from py_crypto_hd_wallet.common.hd_wallet_derivation_cache import HdWalletDerivationCache
 from py_crypto_hd_wallet.common.hd_wallet_keys_base import HdWalletKeysBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers, HdWalletWorkersPool
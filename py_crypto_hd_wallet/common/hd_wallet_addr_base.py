@@ -23,7 +23,10 @@
 # Imports
 import json
 from abc import ABC
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from py_crypto_hd_wallet.common.hd_wallet_addr_store import HdWalletAddrStore
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
 
 
 class HdWalletAddrBaseConst:
@@ -31,6 +34,8 @@ class HdWalletAddrBaseConst:
 
     # Default key string format for dictionary
     DICT_KEY_DEF_FORMAT: str = "address_{:d}"
+    # Name of the address key, used for adding keys objects to the reverse index
+    ADDRESS_KEY_NAME: str = "ADDRESS"
 
 
 class HdWalletAddrBase(ABC):
@@ -40,22 +45,39 @@ class HdWalletAddrBase(ABC):
     """
 
     m_addr_off: int
-    m_addr: List[Any]
+    m_addr: Union[List[Any], HdWalletAddrStore]
     m_dict_key_str_format: str
+    m_rev_index: Optional[HdWalletReverseIndex]
+    m_acc_idx: Optional[int]
+    m_change_idx: Optional[int]
 
     def __init__(self,
                  addr_off: int,
-                 dict_key_str_format: Optional[str] = None) -> None:
+                 dict_key_str_format: Optional[str] = None,
+                 compact: bool = False,
+                 *,
+                 rev_index: Optional[HdWalletReverseIndex] = None,
+                 acc_idx: Optional[int] = None,
+                 change_idx: Optional[int] = None) -> None:
         """
         Construct class.
 
         Args:
-            addr_off (int)                     : Address offset
-            dict_key_str_format (str, optional): Dict key string format
+            addr_off (int)                                   : Address offset
+            dict_key_str_format (str, optional)              : Dict key string format
+            compact (bool, optional)                         : True for storing address keys in a compact columnar
+                                                               form, false otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which addresses are added,
+                                                               None for no reverse index (default)
+            acc_idx (int, optional)                          : Account index of the addresses, for the reverse index
+            change_idx (int, optional)                       : Change index of the addresses, for the reverse index
         """
         self.m_addr_off = addr_off
-        self.m_addr = []
+        self.m_addr = HdWalletAddrStore() if compact else []
         self.m_dict_key_str_format = dict_key_str_format or HdWalletAddrBaseConst.DICT_KEY_DEF_FORMAT
+        self.m_rev_index = rev_index
+        self.m_acc_idx = acc_idx
+        self.m_change_idx = change_idx
 
     def ToDict(self) -> Dict[str, Any]:
         """
@@ -65,12 +87,32 @@ class HdWalletAddrBase(ABC):
             dict: Addresses as a dictionary
         """
         addr_dict = {}
-        for i, addr in enumerate(self.m_addr):
-            dict_key = self.m_dict_key_str_format.format(i + self.m_addr_off)
+        for dict_key, addr in self.IterDictItems():
             addr_dict[dict_key] = addr.ToDict() if hasattr(addr, "ToDict") else addr
 
         return addr_dict
 
+    def IterDictItems(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over addresses as dictionary items, without converting keys objects.
+        It allows the addresses to be serialized incrementally.
+
+        Returns:
+            Iterator object: Iterator over (dict key, address) tuples
+        """
+        for addr_idx, addr in self.IterWithIndex():
+            yield self.m_dict_key_str_format.format(addr_idx), addr
+
+    def IterWithIndex(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Iterate over addresses together with their indexes.
+
+        Returns:
+            Iterator object: Iterator over (address index, address) tuples
+        """
+        for i, addr in enumerate(self.m_addr):
+            yield i + self.m_addr_off, addr
+
     def ToJson(self,
                json_indent: int = 4) -> str:
         """
@@ -93,6 +135,44 @@ class HdWalletAddrBase(ABC):
         """
         return len(self.m_addr)
 
+    def ReverseIndex(self) -> Optional[HdWalletReverseIndex]:
+        """
+        Get the reverse index where addresses are added.
+
+        Returns:
+            HdWalletReverseIndex object: HdWalletReverseIndex object
+            None: If there is no reverse index
+        """
+        return self.m_rev_index
+
+    def ChangeIndex(self) -> Optional[int]:
+        """
+        Get the change index of the addresses.
+
+        Returns:
+            int: Change index
+            None: If not specified
+        """
+        return self.m_change_idx
+
+    def IsCompact(self) -> bool:
+        """
+        Get if address keys are stored in a compact columnar form.
+
+        Returns:
+            bool: True if compact, false otherwise
+        """
+        return isinstance(self.m_addr, HdWalletAddrStore)
+
+    def NextIndex(self) -> int:
+        """
+        Get the index following the last address (i.e. the starting index for appending addresses).
+
+        Returns:
+            int: Next address index
+        """
+        return self.m_addr_off + len(self.m_addr)
+
     def __getitem__(self,
                     addr_idx: int) -> Any:
         """
@@ -106,7 +186,7 @@ class HdWalletAddrBase(ABC):
         """
         return self.m_addr[addr_idx]
 
-    def __iter__(self) -> Iterator[str]:
+    def __iter__(self) -> Iterator[Any]:
         """
         Get the iterator to the current element.
 
@@ -119,8 +199,16 @@ class HdWalletAddrBase(ABC):
                  addr: Any) -> None:
         """
         Add address.
+        If a reverse index is present, the address string is also added to it.
 
         Args:
             addr (any): Address
         """
+        if self.m_rev_index is not None:
+            addr_str = (addr
+                        if isinstance(addr, str)
+                        else addr.GetKey(addr.KeyEnum()[HdWalletAddrBaseConst.ADDRESS_KEY_NAME]))
+            # The address could be excluded from the computed keys
+            if addr_str is not None:
+                self.m_rev_index.Add(addr_str, self.m_acc_idx, self.m_change_idx, self.NextIndex())
         self.m_addr.append(addr)
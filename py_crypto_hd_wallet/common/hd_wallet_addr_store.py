@@ -0,0 +1,342 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper classes for storing addresses in a compact form."""
+
+# Imports
+import json
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from py_crypto_hd_wallet.common.hd_wallet_keys_base import HdWalletKeysBase
+from py_crypto_hd_wallet.utils import Utils
+
+
+class HdWalletAddrStoreView:
+    """
+    HD wallet address store view class.
+    It gives access to the keys of a single address of a HdWalletAddrStore, with the same interface of the keys classes.
+    Views are created on request and they only hold a reference to the store and the address position.
+    """
+
+    __slots__ = ("m_store", "m_idx")
+
+    m_store: "HdWalletAddrStore"
+    m_idx: int
+
+    def __init__(self,
+                 store: "HdWalletAddrStore",
+                 idx: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            store (HdWalletAddrStore object): Address store
+            idx (int)                       : Address position in the store
+        """
+        self.m_store = store
+        self.m_idx = idx
+
+    def KeyEnum(self) -> Type[Enum]:
+        """
+        Get key enumerative type.
+
+        Returns:
+            Enum: Key enumerative type
+        """
+        return self.m_store.KeyEnum()
+
+    def IsLazy(self) -> bool:
+        """
+        Get if keys are computed lazily (always false, since keys are computed before storing them).
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def HasKey(self,
+               key: Enum) -> bool:
+        """
+        Get if the specified key is present.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            bool: True if present, false otherwise
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        return self.GetKey(key) is not None
+
+    def GetKey(self,
+               key: Enum) -> Optional[Any]:
+        """
+        Get the specified key value.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            str: Key value
+            None: If the key type is not found
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        return self.m_store.GetKey(self.m_idx, key)
+
+    def GetKeyBytes(self,
+                    key: Enum) -> Optional[bytes]:
+        """
+        Get the specified key value as raw bytes, without converting it to hex string.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            bytes: Key value
+            None: If the key type is not found or it is not a binary key
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        return self.m_store.GetKeyBytes(self.m_idx, key)
+
+    def ToDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return self.m_store.ToDict(self.m_idx)
+
+    def ToRawDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary, with binary keys as raw bytes.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return self.m_store.ToRawDict(self.m_idx)
+
+    def ToJson(self,
+               json_indent: int = 4) -> str:
+        """
+        Get keys as string in JSON format.
+
+        Args:
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Returns:
+            str: Keys as string in JSON format
+        """
+        return json.dumps(self.ToDict(), indent=json_indent)
+
+
+class HdWalletAddrStore:
+    """
+    HD wallet address store class.
+    It stores the keys of many addresses in a columnar form, i.e. a list of values for each key type, so each
+    address only costs a reference for each key instead of a keys object with its own dictionary.
+    Binary keys are stored as raw bytes and converted to hex strings only when got or serialized.
+    It behaves like a list of keys objects: addresses are added with append and got by index or by iterating,
+    as HdWalletAddrStoreView objects.
+    """
+
+    m_key_enum: Optional[Type[Enum]]
+    m_columns: Dict[str, List[Optional[Any]]]
+    m_count: int
+
+    def __init__(self) -> None:
+        """Construct class."""
+        self.m_key_enum = None
+        self.m_columns = {}
+        self.m_count = 0
+
+    def KeyEnum(self) -> Type[Enum]:
+        """
+        Get key enumerative type.
+
+        Returns:
+            Enum: Key enumerative type
+
+        Raises:
+            RuntimeError: If the store is empty
+        """
+        if self.m_key_enum is None:
+            raise RuntimeError("Address store is empty")
+        return self.m_key_enum
+
+    def GetKey(self,
+               idx: int,
+               key: Enum) -> Optional[Any]:
+        """
+        Get the specified key value of the specified address.
+
+        Args:
+            idx (int)             : Address position in the store
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            str: Key value
+            None: If the key type is not found
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        value = self.__GetRaw(idx, key)
+        return Utils.BytesToHexString(value) if isinstance(value, bytes) else value
+
+    def GetKeyBytes(self,
+                    idx: int,
+                    key: Enum) -> Optional[bytes]:
+        """
+        Get the specified key value of the specified address as raw bytes.
+
+        Args:
+            idx (int)             : Address position in the store
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            bytes: Key value
+            None: If the key type is not found or it is not a binary key
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        value = self.__GetRaw(idx, key)
+        return value if isinstance(value, bytes) else None
+
+    def ToDict(self,
+               idx: int) -> Dict[str, Any]:
+        """
+        Get the keys of the specified address as a dictionary.
+
+        Args:
+            idx (int): Address position in the store
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return {
+            dict_key: Utils.BytesToHexString(value) if isinstance(value, bytes) else value
+            for dict_key, value in self.ToRawDict(idx).items()
+        }
+
+    def ToRawDict(self,
+                  idx: int) -> Dict[str, Any]:
+        """
+        Get the keys of the specified address as a dictionary, with binary keys as raw bytes.
+
+        Args:
+            idx (int): Address position in the store
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return {
+            dict_key: column[idx]
+            for dict_key, column in self.m_columns.items()
+            if column[idx] is not None
+        }
+
+    def append(self,
+               keys: HdWalletKeysBase) -> None:
+        """
+        Add the keys of an address.
+        Lazy keys are computed before being stored.
+
+        Args:
+            keys (HdWalletKeysBase object): Address keys
+        """
+        if self.m_key_enum is None:
+            self.m_key_enum = keys.KeyEnum()
+
+        keys_dict = keys.ToRawDict()
+        for dict_key, value in keys_dict.items():
+            if dict_key not in self.m_columns:
+                self.m_columns[dict_key] = [None] * self.m_count
+            self.m_columns[dict_key].append(value)
+        # Keep all the columns aligned
+        for dict_key, column in self.m_columns.items():
+            if dict_key not in keys_dict:
+                column.append(None)
+        self.m_count += 1
+
+    def __GetRaw(self,
+                 idx: int,
+                 key: Enum) -> Optional[Any]:
+        """
+        Get the specified key value of the specified address as it is stored.
+
+        Args:
+            idx (int)             : Address position in the store
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            Any: Key value
+            None: If the key type is not found
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        if not isinstance(key, self.KeyEnum()):
+            raise TypeError(f"Key is not an enumerative of {self.m_key_enum} type")
+        column = self.m_columns.get(key.name.lower())
+        return column[idx] if column is not None else None
+
+    def __len__(self) -> int:
+        """
+        Get the number of addresses.
+
+        Returns:
+            int: Number of addresses
+        """
+        return self.m_count
+
+    def __getitem__(self,
+                    idx: int) -> HdWalletAddrStoreView:
+        """
+        Get the specified address.
+
+        Args:
+            idx (int): Address position in the store (negative values count from the end)
+
+        Returns:
+            HdWalletAddrStoreView object: Address view
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        return HdWalletAddrStoreView(self, range(self.m_count)[idx])
+
+    def __iter__(self) -> Iterator[HdWalletAddrStoreView]:
+        """
+        Get the iterator over the addresses.
+
+        Returns:
+            Iterator object: Iterator over the address views
+        """
+        for idx in range(self.m_count):
+            yield HdWalletAddrStoreView(self, idx)
@@ -0,0 +1,147 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for using wallets from asyncio."""
+
+# Imports
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+
+# Item type for iterating
+IterItemType = TypeVar("IterItemType")
+
+
+class HdWalletAsyncConst:
+    """Class container for HD wallet async constants."""
+
+    # Default number of items computed in the executor for each chunk when iterating
+    DEF_CHUNK_SIZE: int = 32
+
+
+class HdWalletAsync:
+    """
+    HD wallet async class.
+    It runs the CPU-bound wallet functions (e.g. seed generation and key derivation) in an executor,
+    so that the event loop is not blocked.
+    If no executor is specified, the default one of the event loop (i.e. a thread pool) is used.
+    Only thread pool executors are supported, since wallet objects cannot be sent to other processes
+    (worker processes can be used by the wallet functions instead, e.g. with the workers parameter).
+    """
+
+    @staticmethod
+    async def Run(fct: Callable[..., Any],
+                  *args: Any,
+                  executor: Optional[ThreadPoolExecutor] = None,
+                  **kwargs: Any) -> Any:
+        """
+        Run the specified function in the executor and wait for its result.
+        If the waiting coroutine is cancelled, the function is not stopped but its result is discarded.
+
+        Args:
+            fct (function)                         : Function
+            *args                                  : Arguments of the function
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of the function
+
+        Returns:
+            Any: Function result
+
+        Raises:
+            TypeError: If the executor is not a thread pool executor
+        """
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise TypeError("Only thread pool executors are supported")
+        return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(fct, *args, **kwargs))
+
+    @staticmethod
+    async def Iter(iter_fct: Callable[..., Iterator[IterItemType]],
+                   *args: Any,
+                   chunk_size: int = HdWalletAsyncConst.DEF_CHUNK_SIZE,
+                   executor: Optional[ThreadPoolExecutor] = None,
+                   **kwargs: Any) -> AsyncIterator[IterItemType]:
+        """
+        Iterate asynchronously over the (blocking) iterator returned by the specified function.
+        The iterator is created in the executor together with the first chunk, since creating it can already be
+        CPU-bound (e.g. deriving the parent keys of the addresses). Items are then computed in the executor in chunks
+        and control is given back to the event loop after each chunk, so the iteration can be cancelled between chunks.
+
+        Args:
+            iter_fct (function)                    : Function returning the iterator over the items
+            *args                                  : Arguments of the function
+            chunk_size (int, optional)             : Number of items computed for each chunk (default: 32)
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of the function
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the items
+
+        Raises:
+            TypeError: If the executor is not a thread pool executor
+            ValueError: If the chunk size is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size shall be greater than zero")
+
+        items, chunk = await HdWalletAsync.Run(_FirstChunk, iter_fct, args, kwargs, chunk_size, executor=executor)
+        while chunk:
+            for item in chunk:
+                yield item
+            chunk = await HdWalletAsync.Run(_NextChunk, items, chunk_size, executor=executor)
+
+
+def _FirstChunk(iter_fct: Callable[..., Iterator[IterItemType]],
+                args: Tuple[Any, ...],
+                kwargs: Dict[str, Any],
+                chunk_size: int) -> Tuple[Iterator[IterItemType], List[IterItemType]]:
+    """
+    Create the iterator and get the first chunk of items.
+
+    Args:
+        iter_fct (function): Function returning the iterator over the items
+        args (tuple)       : Arguments of the function
+        kwargs (dict)      : Keyword arguments of the function
+        chunk_size (int)   : Chunk size
+
+    Returns:
+        tuple[Iterator object, list]: Iterator over the items and first chunk (empty if the iterator is exhausted)
+    """
+    items = iter_fct(*args, **kwargs)
+    return items, _NextChunk(items, chunk_size)
+
+
+def _NextChunk(items: Iterator[IterItemType],
+               chunk_size: int) -> List[IterItemType]:
+    """
+    Get the next chunk of items.
+
+    Args:
+        items (Iterator object): Iterator over the items
+        chunk_size (int)       : Chunk size
+
+    Returns:
+        list: Items (empty if the iterator is exhausted)
+    """
+    return list(itertools.islice(items, chunk_size))
@@ -22,10 +22,14 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, Type
 
-from py_crypto_hd_wallet.common.hd_wallet_data_types import HdWalletDataTypes
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsync
+from py_crypto_hd_wallet.common.hd_wallet_data_types import HdWalletDataTypes, HdWalletKeyTypes
 from py_crypto_hd_wallet.common.hd_wallet_enum_dict import HdWalletEnumDict
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
 
 
 class HdWalletBase(HdWalletEnumDict, ABC):
@@ -34,6 +38,19 @@ class HdWalletBase(HdWalletEnumDict, ABC):
     It shall be inherited by wallet classes.
     """
 
+    m_rev_index: Optional[HdWalletReverseIndex]
+
+    def __init__(self,
+                 key_enum: Type[HdWalletDataTypes]) -> None:
+        """
+        Construct class.
+
+        Args:
+            key_enum (HdWalletDataTypes): Data type enumerative
+        """
+        super().__init__(key_enum)
+        self.m_rev_index = None
+
     @abstractmethod
     def Generate(self,
                  **kwargs: Any) -> None:
@@ -44,6 +61,23 @@ class HdWalletBase(HdWalletEnumDict, ABC):
             **kwargs: Arbitrary arguments depending on the wallet type
         """
 
+    async def GenerateAsync(self,
+                            *,
+                            executor: Optional[ThreadPoolExecutor] = None,
+                            **kwargs: Any) -> None:
+        """
+        Generate wallet keys and addresses in an executor, without blocking the event loop.
+        The wallet shall not be used until the generation is completed.
+        If the coroutine is cancelled, the generation in progress is anyway completed in the executor.
+        For a fine-grained cancellation, the asynchronous address iterators can be used.
+
+        Args:
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Arguments of Generate, depending on the wallet type
+        """
+        await HdWalletAsync.Run(self.Generate, executor=executor, **kwargs)
+
     @abstractmethod
     def IsWatchOnly(self) -> bool:
         """
@@ -53,6 +87,28 @@ class HdWalletBase(HdWalletEnumDict, ABC):
             bool: True if watch-only, false otherwise
         """
 
+    def SetReverseIndex(self,
+                        rev_index: Optional[HdWalletReverseIndex]) -> None:
+        """
+        Set the reverse index to which the addresses are added when generated.
+        The index is shared by all the generations, so it maps every generated address to its indexes.
+        It has no effect for wallets without an addresses container (i.e. Algorand and Substrate).
+
+        Args:
+            rev_index (HdWalletReverseIndex object or None): Reverse index, None for disabling it
+        """
+        self.m_rev_index = rev_index
+
+    def ReverseIndex(self) -> Optional[HdWalletReverseIndex]:
+        """
+        Get the reverse index to which the addresses are added when generated.
+
+        Returns:
+            HdWalletReverseIndex object: HdWalletReverseIndex object
+            None: If no reverse index is set
+        """
+        return self.m_rev_index
+
     def ToDict(self) -> Dict[str, Any]:
         """
         Get wallet data as a dictionary.
@@ -61,11 +117,22 @@ class HdWalletBase(HdWalletEnumDict, ABC):
             dict: Wallet data as a dictionary
         """
         wallet_dict = {}
-        for key, value in self.m_dict_data.items():
+        for key, value in self.IterDictItems():
             wallet_dict[key] = value.ToDict() if hasattr(value, "ToDict") else value
 
         return wallet_dict
 
+    def IterDictItems(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over wallet data as dictionary items, without converting keys and addresses objects.
+        It allows the wallet to be serialized incrementally.
+
+        Returns:
+            Iterator object: Iterator over (dict key, value) tuples
+        """
+        for key, value in self.m_dict_data.items():
+            yield key, value if hasattr(value, "ToDict") else self._EncodeValue(value)
+
     def HasData(self,
                 key: HdWalletDataTypes) -> bool:
         """
@@ -98,3 +165,58 @@ class HdWalletBase(HdWalletEnumDict, ABC):
             TypeError: If the enumerative is not of the correct type
         """
         return super()._Get(key)
+
+    def _SplitFields(self,
+                     fields: Optional[Iterable[Enum]],
+                     key_enum: Type[HdWalletKeyTypes]) -> Tuple[Optional[Set[HdWalletDataTypes]],
+                                                                 Optional[Set[HdWalletKeyTypes]]]:
+        """
+        Split the fields to be generated into data types and key types.
+        An empty set is returned as None, meaning that all the data types (or key types) shall be generated.
+
+        Args:
+            fields (iterable or None): Data types and key types to be generated, None for all
+            key_enum (HdWalletKeyTypes): Key type enumerative of the wallet
+
+        Returns:
+            tuple[set or None, set or None]: Data types and key types
+
+        Raises:
+            TypeError: If a field is not a data type or a key type of the wallet
+        """
+        if fields is None:
+            return None, None
+
+        data_types: Set[Any] = set()
+        key_types: Set[Any] = set()
+        for field in fields:
+            if isinstance(field, self.KeyEnum()):
+                data_types.add(field)
+            elif isinstance(field, key_enum):
+                key_types.add(field)
+            else:
+                raise TypeError(f"Field is not an enumerative of {self.KeyEnum()} or {key_enum} type")
+
+        return data_types or None, key_types or None
+
+    def _SetIfSelected(self,
+                       key: HdWalletDataTypes,
+                       data_types: Optional[AbstractSet[HdWalletDataTypes]],
+                       value_fct: Callable[..., Any],
+                       *args: Any,
+                       **kwargs: Any) -> None:
+        """
+        Set key value only if the key is selected, otherwise remove it.
+        The value is computed by calling the specified function with the specified arguments.
+
+        Args:
+            key (HdWalletDataTypes): Key
+            data_types (set or None): Selected data types, None for all
+            value_fct (function)   : Function for computing the value
+            *args                  : Arguments of the function
+            **kwargs               : Keyword arguments of the function
+        """
+        if data_types is None or key in data_types:
+            self._Set(key, value_fct(*args, **kwargs))
+        else:
+            self._Remove(key)
@@ -0,0 +1,249 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for checking if an item probably belongs to a set."""
+
+# Imports
+import hashlib
+import json
+import math
+from typing import Iterator, Union
+
+
+class HdWalletBloomFilterConst:
+    """Class container for HD wallet Bloom filter constants."""
+
+    # Default false positive rate
+    DEF_FP_RATE: float = 0.001
+    # Hash size in bytes (split in two 64-bit halves for double hashing)
+    HASH_BYTE_LEN: int = 16
+    # File magic
+    MAGIC: bytes = b"HDWBLM01"
+    # File version
+    VERSION: int = 1
+    # Length of the header length field in bytes
+    HEADER_LEN_BYTE_LEN: int = 4
+
+
+class HdWalletBloomFilter:
+    """
+    HD wallet Bloom filter class.
+    It allows to check if an item (e.g. an address or a scriptPubKey) was added, with no false negatives
+    and a configurable false positive rate. The items themselves are not stored.
+    Only one hash is computed for each item: the bit positions are obtained from its two halves by double hashing.
+    """
+
+    m_bit_num: int
+    m_hash_num: int
+    m_count: int
+    m_bits: bytearray
+
+    def __init__(self,
+                 item_num: int,
+                 fp_rate: float = HdWalletBloomFilterConst.DEF_FP_RATE) -> None:
+        """
+        Construct class.
+        The filter is sized for the specified number of items, adding more items increases the false positive rate.
+
+        Args:
+            item_num (int)           : Expected number of items
+            fp_rate (float, optional): False positive rate (default: 0.001)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if item_num <= 0:
+            raise ValueError("Item number shall be greater than zero")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("False positive rate shall be between zero and one")
+
+        bit_num = math.ceil(-item_num * math.log(fp_rate) / (math.log(2) ** 2))
+        self.__Init(bit_num, max(1, round(bit_num / item_num * math.log(2))), 0, bytearray((bit_num + 7) // 8))
+
+    def Add(self,
+            item: Union[bytes, str]) -> None:
+        """
+        Add an item.
+
+        Args:
+            item (str or bytes): Item
+        """
+        bits = self.m_bits
+        for bit_idx in self.__BitIndexes(item):
+            bits[bit_idx >> 3] |= 1 << (bit_idx & 7)
+        self.m_count += 1
+
+    def MayContain(self,
+                   item: Union[bytes, str]) -> bool:
+        """
+        Get if the specified item may have been added.
+
+        Args:
+            item (str or bytes): Item
+
+        Returns:
+            bool: True if the item may have been added, false if it was surely not added
+        """
+        bits = self.m_bits
+        return all(bits[bit_idx >> 3] & (1 << (bit_idx & 7)) for bit_idx in self.__BitIndexes(item))
+
+    def Count(self) -> int:
+        """
+        Get the number of added items.
+
+        Returns:
+            int: Number of added items
+        """
+        return self.m_count
+
+    def BitNum(self) -> int:
+        """
+        Get the number of bits of the filter.
+
+        Returns:
+            int: Number of bits
+        """
+        return self.m_bit_num
+
+    def HashNum(self) -> int:
+        """
+        Get the number of bits set for each item.
+
+        Returns:
+            int: Number of hash functions
+        """
+        return self.m_hash_num
+
+    def Save(self,
+             file_path: str) -> None:
+        """
+        Save the filter to file.
+
+        Args:
+            file_path (str): File path
+        """
+        header = json.dumps({
+            "version": HdWalletBloomFilterConst.VERSION,
+            "bit_num": self.m_bit_num,
+            "hash_num": self.m_hash_num,
+            "count": self.m_count,
+        }).encode("utf-8")
+
+        with open(file_path, "wb") as f:
+            f.write(HdWalletBloomFilterConst.MAGIC)
+            f.write(len(header).to_bytes(HdWalletBloomFilterConst.HEADER_LEN_BYTE_LEN, "little"))
+            f.write(header)
+            f.write(self.m_bits)
+
+    @staticmethod
+    def Load(file_path: str) -> "HdWalletBloomFilter":
+        """
+        Load a filter from file.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            HdWalletBloomFilter object: HdWalletBloomFilter object
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as f:
+            data = f.read()
+
+        magic_len = len(HdWalletBloomFilterConst.MAGIC)
+        header_off = magic_len + HdWalletBloomFilterConst.HEADER_LEN_BYTE_LEN
+        if len(data) < header_off or data[:magic_len] != HdWalletBloomFilterConst.MAGIC:
+            raise ValueError("Invalid Bloom filter file")
+        header_len = int.from_bytes(data[magic_len:header_off], "little")
+        try:
+            header = json.loads(data[header_off:header_off + header_len].decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as ex:
+            raise ValueError("Invalid Bloom filter file") from ex
+        if header.get("version") != HdWalletBloomFilterConst.VERSION:
+            raise ValueError("Invalid Bloom filter file")
+
+        bits = bytearray(data[header_off + header_len:])
+        if len(bits) != (header["bit_num"] + 7) // 8:
+            raise ValueError("Invalid Bloom filter file")
+
+        bloom_filter = HdWalletBloomFilter.__new__(HdWalletBloomFilter)
+        bloom_filter.__Init(header["bit_num"], header["hash_num"], header["count"], bits)
+        return bloom_filter
+
+    def __len__(self) -> int:
+        """
+        Get the number of added items.
+
+        Returns:
+            int: Number of added items
+        """
+        return self.m_count
+
+    def __contains__(self,
+                     item: Union[bytes, str]) -> bool:
+        """
+        Get if the specified item may have been added.
+
+        Args:
+            item (str or bytes): Item
+
+        Returns:
+            bool: True if the item may have been added, false if it was surely not added
+        """
+        return self.MayContain(item)
+
+    def __Init(self,
+               bit_num: int,
+               hash_num: int,
+               count: int,
+               bits: bytearray) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            bit_num (int)   : Number of bits
+            hash_num (int)  : Number of hash functions
+            count (int)     : Number of added items
+            bits (bytearray): Filter bits
+        """
+        self.m_bit_num = bit_num
+        self.m_hash_num = hash_num
+        self.m_count = count
+        self.m_bits = bits
+
+    def __BitIndexes(self,
+                     item: Union[bytes, str]) -> Iterator[int]:
+        """
+        Get the bit indexes of the specified item, computed as (h1 + i * h2) mod m.
+
+        Args:
+            item (str or bytes): Item
+
+        Returns:
+            Iterator object: Iterator over the bit indexes
+        """
+        item_bytes = item.encode("utf-8") if isinstance(item, str) else item
+        digest = hashlib.blake2b(item_bytes, digest_size=HdWalletBloomFilterConst.HASH_BYTE_LEN).digest()
+        hash_1 = int.from_bytes(digest[:8], "little")
+        hash_2 = int.from_bytes(digest[8:], "little") | 1
+        bit_num = self.m_bit_num
+        return ((hash_1 + i * hash_2) % bit_num for i in range(self.m_hash_num))
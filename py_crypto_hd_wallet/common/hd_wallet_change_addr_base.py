@@ -0,0 +1,132 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with base class for wallet addresses of more than one change chain."""
+
+# Imports
+import json
+from abc import ABC
+from typing import Any, Dict, Iterator, Tuple
+
+from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+
+
+class HdWalletChangeAddrBaseConst:
+    """Class container for HD wallet change addresses base constants."""
+
+    # Change key string format for dictionary
+    CHANGE_DICT_KEY_FORMAT: str = "change_{:d}"
+
+
+class HdWalletChangeAddrBase(ABC):
+    """
+    HD wallet change addresses base class.
+    It stores the addresses of more than one change chain of an account by change index, each one as a
+    HdWalletAddrBase object, and it shall be inherited by the classes creating them.
+    """
+
+    m_addrs: Dict[int, HdWalletAddrBase]
+
+    def __init__(self,
+                 addrs: Dict[int, HdWalletAddrBase]) -> None:
+        """
+        Construct class.
+
+        Args:
+            addrs (dict): Addresses by change index (e.g. HdWalletBipChanges enums)
+        """
+        self.m_addrs = addrs
+
+    def ToDict(self) -> Dict[str, Any]:
+        """
+        Get addresses as a dictionary, indexed by change and then by address.
+
+        Returns:
+            dict: Addresses as a dictionary
+        """
+        return dict(self.IterDictItems())
+
+    def IterDictItems(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the change chains as dictionary items.
+        It allows the addresses to be serialized incrementally.
+
+        Returns:
+            Iterator object: Iterator over (dict key, change addresses dictionary) tuples
+        """
+        for change_idx, addrs in self.m_addrs.items():
+            yield HdWalletChangeAddrBaseConst.CHANGE_DICT_KEY_FORMAT.format(change_idx), addrs.ToDict()
+
+    def ToJson(self,
+               json_indent: int = 4) -> str:
+        """
+        Get addresses as string in JSON format.
+
+        Args:
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Returns:
+            str: Addresses as string in JSON format
+        """
+        return json.dumps(self.ToDict(), indent=json_indent)
+
+    def Count(self) -> int:
+        """
+        Get the addresses count of all the change chains.
+
+        Returns:
+            int: Number of addresses
+        """
+        return sum(addrs.Count() for addrs in self.m_addrs.values())
+
+    def Items(self) -> Iterator[Tuple[int, HdWalletAddrBase]]:
+        """
+        Iterate over the change chains together with their change index.
+
+        Returns:
+            Iterator object: Iterator over (change index, addresses) tuples
+        """
+        yield from self.m_addrs.items()
+
+    def __getitem__(self,
+                    change_idx: int) -> HdWalletAddrBase:
+        """
+        Get the addresses of the specified change chain.
+
+        Args:
+            change_idx (int): Change index (e.g. a HdWalletBipChanges enum)
+
+        Returns:
+            HdWalletAddrBase object: Addresses
+
+        Raises:
+            KeyError: If the change index is not valid
+        """
+        return self.m_addrs[change_idx]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Get the iterator to the current element, i.e. the addresses of each change chain in turn.
+
+        Returns:
+            Iterator object: Iterator to the current element
+        """
+        for addrs in self.m_addrs.values():
+            yield from addrs
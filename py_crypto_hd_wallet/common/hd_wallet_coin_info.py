@@ -0,0 +1,168 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for caching coin information."""
+
+# Imports
+from typing import Any, Dict, Optional, Type, Union
+
+from bip_utils import AdaShelleyAddrEncoder, WifEncoder, WifPubKeyModes, XmrAddrEncoder
+from bip_utils.addr.iaddr_encoder import IAddrEncoder
+from bip_utils.bip.conf.common import BipCoinConf
+from bip_utils.coin_conf import CoinConf
+from bip_utils.ecc import IPrivateKey, IPublicKey, Secp256k1PrivateKey
+from bip_utils.utils.conf import CoinNames
+
+
+class HdWalletCoinInfoConst:
+    """Class container for HD wallet coin information constants."""
+
+    # Parameter key of the WIF net version in generic coin configurations
+    WIF_NET_VER_KEY: str = "wif_net_ver"
+    # Attribute of BipCoinConf telling if any address parameter is a function call (i.e. not constant)
+    ADDR_PARAMS_FCT_CALL_ATTR: str = "m_any_addr_params_fct_call"
+
+
+class HdWalletCoinInfo:
+    """
+    HD wallet coin information class.
+    It resolves once the per-coin constants (i.e. name, address encoder and parameters, WIF net version),
+    so that they are not looked up again from the coin configuration for each wallet or key.
+    """
+
+    m_name: str
+    m_wif_net_ver: Optional[bytes]
+    m_addr_cls: Optional[Type[IAddrEncoder]]
+    m_addr_params: Dict[str, Any]
+
+    @classmethod
+    def FromConf(cls,
+                 coin_conf: Any) -> "HdWalletCoinInfo":
+        """
+        Create from coin configuration.
+        Address encoder and parameters are resolved only if they are constant, i.e. if they don't depend on
+        mutable configuration flags or on the public key itself.
+        The flag is an internal attribute of BipCoinConf, so if it is not found (e.g. in a different bip_utils
+        version) the encoder is not cached and addresses are encoded by the public key.
+
+        Args:
+            coin_conf (any): Coin configuration (e.g. BipCoinConf, CoinConf, MoneroCoinConf)
+
+        Returns:
+            HdWalletCoinInfo object: HdWalletCoinInfo object
+        """
+        if isinstance(coin_conf, BipCoinConf):
+            addr_cls = coin_conf.AddrClass()
+            is_addr_const = (type(coin_conf) is BipCoinConf
+                             and not getattr(coin_conf, HdWalletCoinInfoConst.ADDR_PARAMS_FCT_CALL_ATTR, True)
+                             and addr_cls not in (AdaShelleyAddrEncoder, XmrAddrEncoder))
+            return cls(coin_conf.CoinNames(),
+                       wif_net_ver=coin_conf.WifNetVersion(),
+                       addr_cls=addr_cls if is_addr_const else None,
+                       addr_params=coin_conf.AddrParams() if is_addr_const else None)
+        if isinstance(coin_conf, CoinConf):
+            return cls(coin_conf.CoinNames(),
+                       wif_net_ver=coin_conf.ParamByKey(HdWalletCoinInfoConst.WIF_NET_VER_KEY))
+        return cls(coin_conf.CoinNames())
+
+    def __init__(self,
+                 coin_names: CoinNames,
+                 *,
+                 wif_net_ver: Optional[bytes] = None,
+                 addr_cls: Optional[Type[IAddrEncoder]] = None,
+                 addr_params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            coin_names (CoinNames object)    : Coin names
+            wif_net_ver (bytes, optional)    : WIF net version, None if not supported (default)
+            addr_cls (IAddrEncoder, optional): Address encoder class, None if not constant (default)
+            addr_params (dict, optional)     : Address parameters, None for empty (default)
+        """
+        self.m_name = f"{coin_names.Name()} ({coin_names.Abbreviation()})"
+        self.m_wif_net_ver = wif_net_ver
+        self.m_addr_cls = addr_cls
+        self.m_addr_params = addr_params or {}
+
+    def Name(self) -> str:
+        """
+        Get coin display name.
+
+        Returns:
+            str: Coin name and abbreviation
+        """
+        return self.m_name
+
+    def WifNetVersion(self) -> Optional[bytes]:
+        """
+        Get WIF net version.
+
+        Returns:
+            bytes: WIF net version, None if not supported
+        """
+        return self.m_wif_net_ver
+
+    def HasAddressEncoder(self) -> bool:
+        """
+        Get if the address encoder is constant and cached.
+
+        Returns:
+            bool: True if cached, false otherwise
+        """
+        return self.m_addr_cls is not None
+
+    def EncodeAddress(self,
+                      pub_key: IPublicKey) -> str:
+        """
+        Encode the address of the specified public key using the cached encoder and parameters.
+
+        Args:
+            pub_key (IPublicKey object): Public key
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the address encoder is not cached
+        """
+        if self.m_addr_cls is None:
+            raise ValueError("Address encoder is not available for the coin")
+        return self.m_addr_cls.EncodeKey(pub_key, **self.m_addr_params)
+
+    def EncodeWif(self,
+                  priv_key: Union[bytes, IPrivateKey],
+                  pub_key_mode: WifPubKeyModes = WifPubKeyModes.COMPRESSED) -> Optional[str]:
+        """
+        Encode the specified private key in WIF format using the cached net version.
+        A secp256k1 key object is encoded as is, without validating its bytes again.
+
+        Args:
+            priv_key (bytes or IPrivateKey object) : Private key
+            pub_key_mode (WifPubKeyModes, optional): Public key mode (default: compressed)
+
+        Returns:
+            str: Key in WIF format, None if WIF is not supported
+        """
+        if self.m_wif_net_ver is None:
+            return None
+        if isinstance(priv_key, IPrivateKey) and not isinstance(priv_key, Secp256k1PrivateKey):
+            priv_key = priv_key.Raw().ToBytes()
+        return WifEncoder.Encode(priv_key, self.m_wif_net_ver, pub_key_mode)
@@ -0,0 +1,165 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for caching derived nodes."""
+
+# Imports
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+class HdWalletDerivationCacheConst:
+    """Class container for HD wallet derivation cache constants."""
+
+    # Default maximum number of cached nodes
+    DEF_MAX_SIZE: int = 32
+
+
+class HdWalletDerivationCache:
+    """
+    HD wallet derivation cache class.
+    It keeps the derived nodes identified by their level and indexes, so that the same path is not derived again.
+    The number of nodes is bounded and the least recently used ones are evicted first.
+    """
+
+    m_max_size: int
+    m_nodes: "OrderedDict[Tuple[Hashable, ...], Any]"
+    m_hits: int
+    m_misses: int
+
+    def __init__(self,
+                 max_size: int = HdWalletDerivationCacheConst.DEF_MAX_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached nodes, zero for disabling the cache (default: 32)
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        self.m_nodes = OrderedDict()
+        self.SetMaxSize(max_size)
+        self.Clear()
+
+    def GetOrDerive(self,
+                    key: Tuple[Hashable, ...],
+                    derive_fct: Callable[..., Any],
+                    *args: Any) -> Any:
+        """
+        Get the node with the specified key, deriving and caching it if not present.
+
+        Args:
+            key (tuple)          : Node key (i.e. level and indexes)
+            derive_fct (function): Function for deriving the node
+            *args                : Arguments of the derive function
+
+        Returns:
+            Any: Node
+        """
+        if key in self.m_nodes:
+            self.m_hits += 1
+            self.m_nodes.move_to_end(key)
+            return self.m_nodes[key]
+
+        self.m_misses += 1
+        node = derive_fct(*args)
+        self.Put(key, node)
+        return node
+
+    def Put(self,
+            key: Tuple[Hashable, ...],
+            node: Any) -> None:
+        """
+        Put a node already derived (e.g. restored from a snapshot) into the cache.
+        Counters are not changed.
+
+        Args:
+            key (tuple): Node key (i.e. level and indexes)
+            node (Any) : Node
+        """
+        if self.m_max_size > 0:
+            self.m_nodes[key] = node
+            self.m_nodes.move_to_end(key)
+            self.__Evict()
+
+    def Clear(self) -> None:
+        """Remove all the cached nodes and reset counters."""
+        self.m_nodes.clear()
+        self.m_hits = 0
+        self.m_misses = 0
+
+    def SetMaxSize(self,
+                   max_size: int) -> None:
+        """
+        Set the maximum number of cached nodes.
+        Least recently used nodes are evicted if the current size is greater.
+
+        Args:
+            max_size (int): Maximum number of cached nodes, zero for disabling the cache
+
+        Raises:
+            ValueError: If the maximum size is not valid
+        """
+        if max_size < 0:
+            raise ValueError("Cache size shall be greater or equal to zero")
+        self.m_max_size = max_size
+        self.__Evict()
+
+    def MaxSize(self) -> int:
+        """
+        Get the maximum number of cached nodes.
+
+        Returns:
+            int: Maximum number of cached nodes
+        """
+        return self.m_max_size
+
+    def Size(self) -> int:
+        """
+        Get the number of cached nodes.
+
+        Returns:
+            int: Number of cached nodes
+        """
+        return len(self.m_nodes)
+
+    def Hits(self) -> int:
+        """
+        Get the number of cache hits.
+
+        Returns:
+            int: Number of cache hits
+        """
+        return self.m_hits
+
+    def Misses(self) -> int:
+        """
+        Get the number of cache misses.
+
+        Returns:
+            int: Number of cache misses
+        """
+        return self.m_misses
+
+    def __Evict(self) -> None:
+        """Evict the least recently used nodes until the maximum size is reached."""
+        while len(self.m_nodes) > self.m_max_size:
+            self.m_nodes.popitem(last=False)
@@ -23,7 +23,38 @@
 # Imports
 import json
 from enum import Enum
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type
+
+from py_crypto_hd_wallet.utils import Utils
+
+
+class HdWalletEnumDictLazyValue:
+    """
+    HD wallet enum dictionary lazy value class.
+    It wraps a function that computes the value the first time it is requested.
+    """
+
+    m_value_fct: Callable[[], Optional[Any]]
+
+    def __init__(self,
+                 value_fct: Callable[[], Optional[Any]]) -> None:
+        """
+        Construct class.
+
+        Args:
+            value_fct (function): Function for computing the value (it can return None if the value is not present)
+        """
+        self.m_value_fct = value_fct
+
+    def Compute(self) -> Optional[Any]:
+        """
+        Compute the value.
+
+        Returns:
+            Any: Value
+            None: If the value is not present
+        """
+        return self.m_value_fct()
 
 
 class HdWalletEnumDict:
@@ -31,10 +62,12 @@ class HdWalletEnumDict:
     HD wallet enum dictionary class.
     It allows a dictionary to be accessed using enum as string keys.
     It shall be inherited by all classes needed to use dictionaries to be accessed by enums.
+    Values can be stored as raw bytes, in which case they are converted to hex strings only when got or serialized.
     """
 
     m_key_enum: Type[Enum]
     m_dict_data: Dict[str, Any]
+    m_lazy_num: int
 
     def __init__(self,
                  key_enum: Type[Enum]) -> None:
@@ -46,6 +79,7 @@ class HdWalletEnumDict:
         """
         self.m_key_enum = key_enum
         self.m_dict_data = {}
+        self.m_lazy_num = 0
 
     def KeyEnum(self) -> Type[Enum]:
         """
@@ -63,7 +97,10 @@ class HdWalletEnumDict:
         Returns:
             dict: Keys as a dictionary
         """
-        return self.m_dict_data
+        return {
+            dict_key: self._EncodeValue(value)
+            for dict_key, value in self._ToRawDict().items()
+        }
 
     def ToJson(self,
                json_indent: int = 4) -> str:
@@ -78,6 +115,18 @@ class HdWalletEnumDict:
         """
         return json.dumps(self.ToDict(), indent=json_indent)
 
+    def _ToRawDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary, with values stored as bytes not converted to hex strings.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        if self.m_lazy_num > 0:
+            for dict_key in list(self.m_dict_data.keys()):
+                self.__ResolveLazy(dict_key)
+        return self.m_dict_data
+
     def _Has(self,
              key: Enum) -> bool:
         """
@@ -92,13 +141,35 @@ class HdWalletEnumDict:
         Raises:
             TypeError: If the enumerative is not of the correct type
         """
-        return self.__EnumToDictKey(key) in self.m_dict_data
+        dict_key = self.__EnumToDictKey(key)
+        if dict_key not in self.m_dict_data:
+            return False
+
+        self.__ResolveLazy(dict_key)
+        return dict_key in self.m_dict_data
 
     def _Get(self,
              key: Enum) -> Optional[Any]:
         """
         Get key value.
 
+        Args:
+            key (Enum): Key
+
+        Returns:
+            Any: Key value (bytes are converted to hex string)
+            None: If the key type is not found
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        return self._EncodeValue(self._GetRaw(key))
+
+    def _GetRaw(self,
+                key: Enum) -> Optional[Any]:
+        """
+        Get key value as it is stored, i.e. without converting bytes to hex string.
+
         Args:
             key (Enum): Key
 
@@ -123,7 +194,71 @@ class HdWalletEnumDict:
             key (Enum) : Key
             value (Any): Value
         """
-        self.m_dict_data[self.__EnumToDictKey(key)] = value
+        dict_key = self.__EnumToDictKey(key)
+        if isinstance(self.m_dict_data.get(dict_key), HdWalletEnumDictLazyValue):
+            self.m_lazy_num -= 1
+        self.m_dict_data[dict_key] = value
+
+    def _Remove(self,
+                key: Enum) -> None:
+        """
+        Remove key, if present.
+
+        Args:
+            key (Enum): Key
+        """
+        dict_key = self.__EnumToDictKey(key)
+        if isinstance(self.m_dict_data.get(dict_key), HdWalletEnumDictLazyValue):
+            self.m_lazy_num -= 1
+        self.m_dict_data.pop(dict_key, None)
+
+    def _SetLazy(self,
+                 key: Enum,
+                 value_fct: Callable[[], Optional[Any]]) -> None:
+        """
+        Set key value lazily.
+        The function is called the first time the key is requested and its result is cached.
+        The key position in the dictionary is reserved, so the keys order is the same as setting them directly.
+        If the function returns None, the key is removed.
+
+        Args:
+            key (Enum)          : Key
+            value_fct (function): Function for computing the value
+        """
+        self._Set(key, HdWalletEnumDictLazyValue(value_fct))
+        self.m_lazy_num += 1
+
+    @staticmethod
+    def _EncodeValue(value: Any) -> Any:
+        """
+        Encode a value for getting or serializing it, i.e. convert it to hex string if bytes.
+
+        Args:
+            value (Any): Value
+
+        Returns:
+            Any: Encoded value
+        """
+        return Utils.BytesToHexString(value) if isinstance(value, bytes) else value
+
+    def __ResolveLazy(self,
+                      dict_key: str) -> None:
+        """
+        Compute the value of the specified dict key, if lazy.
+
+        Args:
+            dict_key (str): Dict key
+        """
+        value = self.m_dict_data[dict_key]
+        if not isinstance(value, HdWalletEnumDictLazyValue):
+            return
+
+        self.m_lazy_num -= 1
+        computed_value = value.Compute()
+        if computed_value is None:
+            del self.m_dict_data[dict_key]
+        else:
+            self.m_dict_data[dict_key] = computed_value
 
     def __EnumToDictKey(self,
                         key: Enum) -> str:
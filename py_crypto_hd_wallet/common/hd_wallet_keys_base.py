@@ -21,7 +21,7 @@
 """Module with base class for wallet keys."""
 
 # Imports
-from typing import Optional
+from typing import AbstractSet, Any, Callable, Dict, Optional, Type
 
 from py_crypto_hd_wallet.common.hd_wallet_data_types import HdWalletKeyTypes
 from py_crypto_hd_wallet.common.hd_wallet_enum_dict import HdWalletEnumDict
@@ -31,8 +31,41 @@ class HdWalletKeysBase(HdWalletEnumDict):
     """
     HD wallet keys base class.
     It shall be inherited by wallet keys classes.
+    Derived classes shall derive their key pair only once, so that every key is just rendered from it
+    (i.e. no key function shall derive again).
+    In lazy mode, each key is computed the first time it is requested and then cached.
+    If key types are specified, only those keys are computed.
+    Binary keys are stored as raw bytes and converted to hex strings only when got or serialized.
     """
 
+    m_lazy: bool
+    m_key_types: Optional[AbstractSet[HdWalletKeyTypes]]
+
+    def __init__(self,
+                 key_enum: Type[HdWalletKeyTypes],
+                 lazy: bool = False,
+                 key_types: Optional[AbstractSet[HdWalletKeyTypes]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            key_enum (HdWalletKeyTypes): Key type enumerative
+            lazy (bool, optional)      : True for computing keys only when requested, false otherwise (default)
+            key_types (set, optional)  : Key types to be computed, None for all (default)
+        """
+        super().__init__(key_enum)
+        self.m_lazy = lazy
+        self.m_key_types = key_types
+
+    def IsLazy(self) -> bool:
+        """
+        Get if keys are computed lazily.
+
+        Returns:
+            bool: True if lazy, false otherwise
+        """
+        return self.m_lazy
+
     def HasKey(self,
                key: HdWalletKeyTypes) -> bool:
         """
@@ -65,3 +98,53 @@ class HdWalletKeysBase(HdWalletEnumDict):
             TypeError: If the enumerative is not of the correct type
         """
         return super()._Get(key)
+
+    def GetKeyBytes(self,
+                    key: HdWalletKeyTypes) -> Optional[bytes]:
+        """
+        Get the specified key value as raw bytes, without converting it to hex string.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            bytes: Key value
+            None: If the key type is not found or it is not a binary key (e.g. addresses and extended keys)
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        value = super()._GetRaw(key)
+        return value if isinstance(value, bytes) else None
+
+    def ToRawDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary, with binary keys as raw bytes.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return dict(super()._ToRawDict())
+
+    def _SetKey(self,
+                key: HdWalletKeyTypes,
+                value_fct: Callable[[], Optional[Any]]) -> None:
+        """
+        Set key value from the specified function.
+        The function shall only render an already derived key (e.g. encoding it), without deriving it again.
+        In lazy mode, the function is called only when the key is requested.
+        If the key type is not selected, the function is never called.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+            value_fct (function)  : Function for computing the value (it can return None if the key is not present)
+        """
+        if self.m_key_types is not None and key not in self.m_key_types:
+            return
+
+        if self.m_lazy:
+            self._SetLazy(key, value_fct)
+        else:
+            value = value_fct()
+            if value is not None:
+                self._Set(key, value)
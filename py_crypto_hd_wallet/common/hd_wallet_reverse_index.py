@@ -0,0 +1,418 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for looking up addresses by value."""
+
+# Imports
+import hashlib
+import json
+import mmap
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class HdWalletReverseIndexConst:
+    """Class container for HD wallet reverse index constants."""
+
+    # Default initial capacity (power of 2)
+    DEF_CAPACITY: int = 1024
+    # Maximum load factor, expressed as numerator/denominator to avoid floating point comparisons
+    MAX_LOAD_NUM: int = 7
+    MAX_LOAD_DEN: int = 10
+    # Hash size in bytes
+    HASH_BYTE_LEN: int = 8
+    # Empty slot marker
+    EMPTY_HASH: int = 0
+    # Maximum address index
+    MAX_ADDR_IDX: int = 0xFFFFFFFF
+    # Maximum number of different derivation paths (i.e. account and change indexes couples)
+    MAX_PATH_NUM: int = 0xFFFF
+    # File magic
+    MAGIC: bytes = b"HDWRIX01"
+    # File version
+    VERSION: int = 1
+    # Length of the header length field in bytes
+    HEADER_LEN_BYTE_LEN: int = 4
+    # Type codes of the slot arrays (hashes, address indexes and path identifiers)
+    SLOT_TYPECODES: Tuple[str, str, str] = ("Q", "I", "H")
+    # Alignment of the arrays in the file, obtained by padding the header with spaces
+    ARR_ALIGNMENT: int = 8
+
+
+class HdWalletReverseIndex:
+    """
+    HD wallet reverse index class.
+    It maps an address (or any other key, e.g. a public key hash) to the indexes that derived it, i.e.
+    account index, change index and address index.
+
+    Entries are kept in an open addressing hash table with linear probing. For each slot, only the first
+    8 bytes of the BLAKE2b hash of the key (stored in a uint64 array), the address index (uint32) and the
+    identifier of the (account, change) couple (uint16) are stored, i.e. 14 bytes per slot.
+    Keys themselves are not stored, so two different keys can collide with a probability of about
+    n / 2^64 (where n is the number of entries): the found indexes can be verified by deriving the address again.
+    An index loaded with memory mapping reads the slots directly from the file, and they are copied to memory only
+    when an entry is added.
+    """
+
+    m_count: int
+    m_hashes: Union[array, memoryview]
+    m_addr_idxs: Union[array, memoryview]
+    m_path_ids: Union[array, memoryview]
+    m_paths: List[Tuple[Optional[int], Optional[int]]]
+    m_path_to_id: Dict[Tuple[Optional[int], Optional[int]], int]
+
+    def __init__(self,
+                 capacity: int = HdWalletReverseIndexConst.DEF_CAPACITY) -> None:
+        """
+        Construct class.
+
+        Args:
+            capacity (int, optional): Initial capacity, rounded up to a power of 2 (default: 1024).
+                                      The table grows automatically, but a proper capacity avoids rehashing.
+
+        Raises:
+            ValueError: If the capacity is not valid
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity shall be greater than zero")
+        self.m_paths = []
+        self.m_path_to_id = {}
+        self.__Allocate(1 << (capacity - 1).bit_length())
+
+    def Add(self,
+            key: Union[bytes, str],
+            acc_idx: Optional[int],
+            change_idx: Optional[int],
+            addr_idx: int) -> None:
+        """
+        Add an entry. If the key is already present, its indexes are replaced.
+
+        Args:
+            key (str or bytes)      : Key (e.g. address string)
+            acc_idx (int or None)   : Account index, None if not known
+            change_idx (int or None): Change index, None if not known
+            addr_idx (int)          : Address index
+
+        Raises:
+            ValueError: If the indexes are not valid
+        """
+        if addr_idx < 0 or addr_idx > HdWalletReverseIndexConst.MAX_ADDR_IDX:
+            raise ValueError("Address index shall be greater or equal to zero and less than 2^32")
+        if self.IsMapped():
+            self.__CopyToMemory()
+
+        path_id = self.__GetPathId((acc_idx, change_idx))
+        key_hash = self.__Hash(key)
+        slot = self.__FindSlot(key_hash)
+        if self.m_hashes[slot] == HdWalletReverseIndexConst.EMPTY_HASH:
+            # Grow before exceeding the load factor, then find the slot again in the new table
+            if ((self.m_count + 1) * HdWalletReverseIndexConst.MAX_LOAD_DEN
+                    > len(self.m_hashes) * HdWalletReverseIndexConst.MAX_LOAD_NUM):
+                self.__Resize(len(self.m_hashes) * 2)
+                slot = self.__FindSlot(key_hash)
+            self.m_hashes[slot] = key_hash
+            self.m_count += 1
+        self.m_addr_idxs[slot] = addr_idx
+        self.m_path_ids[slot] = path_id
+
+    def Lookup(self,
+               key: Union[bytes, str]) -> Optional[Tuple[Optional[int], Optional[int], int]]:
+        """
+        Look up the indexes of the specified key.
+
+        Args:
+            key (str or bytes): Key (e.g. address string)
+
+        Returns:
+            tuple[int or None, int or None, int]: Account index, change index and address index
+            None: If the key is not present
+        """
+        slot = self.__FindSlot(self.__Hash(key))
+        if self.m_hashes[slot] == HdWalletReverseIndexConst.EMPTY_HASH:
+            return None
+        acc_idx, change_idx = self.m_paths[self.m_path_ids[slot]]
+        return acc_idx, change_idx, self.m_addr_idxs[slot]
+
+    def Count(self) -> int:
+        """
+        Get the number of entries.
+
+        Returns:
+            int: Number of entries
+        """
+        return self.m_count
+
+    def Capacity(self) -> int:
+        """
+        Get the current capacity (i.e. number of slots).
+
+        Returns:
+            int: Capacity
+        """
+        return len(self.m_hashes)
+
+    def IsMapped(self) -> bool:
+        """
+        Get if the slots are read from a memory mapped file.
+
+        Returns:
+            bool: True if memory mapped, false otherwise
+        """
+        return isinstance(self.m_hashes, memoryview)
+
+    def Clear(self) -> None:
+        """Remove all the entries, keeping the current capacity."""
+        self.m_paths = []
+        self.m_path_to_id = {}
+        self.__Allocate(len(self.m_hashes))
+
+    def Save(self,
+             file_path: str) -> None:
+        """
+        Save the index to file.
+        The arrays are written as they are in memory (in little endian), so saving and loading are fast.
+
+        Args:
+            file_path (str): File path
+        """
+        header = json.dumps({
+            "version": HdWalletReverseIndexConst.VERSION,
+            "count": self.m_count,
+            "capacity": len(self.m_hashes),
+            "paths": self.m_paths,
+        }).encode("utf-8")
+        # Pad the header so that the arrays are aligned when the file is memory mapped
+        header += b" " * (-(len(HdWalletReverseIndexConst.MAGIC)
+                           + HdWalletReverseIndexConst.HEADER_LEN_BYTE_LEN
+                           + len(header)) % HdWalletReverseIndexConst.ARR_ALIGNMENT)
+
+        with open(file_path, "wb") as f:
+            f.write(HdWalletReverseIndexConst.MAGIC)
+            f.write(len(header).to_bytes(HdWalletReverseIndexConst.HEADER_LEN_BYTE_LEN, "little"))
+            f.write(header)
+            for arr in (self.m_hashes, self.m_addr_idxs, self.m_path_ids):
+                f.write(arr.tobytes() if isinstance(arr, memoryview) else self.__ToLittleEndian(arr).tobytes())
+
+    @staticmethod
+    def Load(file_path: str,
+             use_mmap: bool = False) -> "HdWalletReverseIndex":
+        """
+        Load an index from file.
+        With memory mapping, the file is not read at once and only the accessed slots are loaded by the operating
+        system, so loading is immediate also for large indexes. It is not used on big endian machines, where the
+        slots shall be converted.
+
+        Args:
+            file_path (str)          : File path
+            use_mmap (bool, optional): True for memory mapping the file, false for reading it (default)
+
+        Returns:
+            HdWalletReverseIndex object: HdWalletReverseIndex object
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(file_path, "rb") as f:
+            if use_mmap and sys.byteorder == "little":
+                try:
+                    data: Union[bytes, memoryview] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                except ValueError as ex:
+                    # Empty file
+                    raise ValueError("Invalid reverse index file") from ex
+            else:
+                data = f.read()
+
+        magic_len = len(HdWalletReverseIndexConst.MAGIC)
+        header_off = magic_len + HdWalletReverseIndexConst.HEADER_LEN_BYTE_LEN
+        if len(data) < header_off or data[:magic_len] != HdWalletReverseIndexConst.MAGIC:
+            raise ValueError("Invalid reverse index file")
+        header_len = int.from_bytes(data[magic_len:header_off], "little")
+        try:
+            header = json.loads(bytes(data[header_off:header_off + header_len]).decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as ex:
+            raise ValueError("Invalid reverse index file") from ex
+        if header.get("version") != HdWalletReverseIndexConst.VERSION:
+            raise ValueError("Invalid reverse index file")
+
+        capacity = header["capacity"]
+        if not isinstance(capacity, int) or capacity <= 0 or capacity & (capacity - 1) != 0:
+            raise ValueError("Invalid reverse index file")
+
+        arrs: List[Union[array, memoryview]] = []
+        arr_off = header_off + header_len
+        for typecode in HdWalletReverseIndexConst.SLOT_TYPECODES:
+            arr_len = capacity * array(typecode).itemsize
+            if len(data) < arr_off + arr_len:
+                raise ValueError("Invalid reverse index file")
+            if isinstance(data, memoryview):
+                arrs.append(data[arr_off:arr_off + arr_len].cast(typecode))  # type: ignore [call-overload]
+            else:
+                arrs.append(HdWalletReverseIndex.__ToLittleEndian(array(typecode, data[arr_off:arr_off + arr_len])))
+            arr_off += arr_len
+
+        rev_index = HdWalletReverseIndex(1)
+        rev_index.m_hashes, rev_index.m_addr_idxs, rev_index.m_path_ids = arrs
+        rev_index.m_count = header["count"]
+        rev_index.m_paths = [(acc_idx, change_idx) for acc_idx, change_idx in header["paths"]]
+        rev_index.m_path_to_id = {path: i for i, path in enumerate(rev_index.m_paths)}
+        return rev_index
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries.
+
+        Returns:
+            int: Number of entries
+        """
+        return self.m_count
+
+    def __contains__(self,
+                     key: Union[bytes, str]) -> bool:
+        """
+        Get if the specified key is present.
+
+        Args:
+            key (str or bytes): Key
+
+        Returns:
+            bool: True if present, false otherwise
+        """
+        return self.Lookup(key) is not None
+
+    def __Allocate(self,
+                   capacity: int) -> None:
+        """
+        Allocate empty arrays with the specified capacity.
+
+        Args:
+            capacity (int): Capacity (power of 2)
+        """
+        self.m_count = 0
+        self.m_hashes, self.m_addr_idxs, self.m_path_ids = (
+            array(typecode, bytes(capacity * array(typecode).itemsize))
+            for typecode in HdWalletReverseIndexConst.SLOT_TYPECODES
+        )
+
+    def __CopyToMemory(self) -> None:
+        """Copy the slots of a memory mapped index to memory, so that entries can be added."""
+        arrs = []
+        for typecode, slots in zip(HdWalletReverseIndexConst.SLOT_TYPECODES,
+                                   (self.m_hashes, self.m_addr_idxs, self.m_path_ids)):
+            arr = array(typecode)
+            arr.frombytes(slots.tobytes())
+            arrs.append(arr)
+        self.m_hashes, self.m_addr_idxs, self.m_path_ids = arrs
+
+    def __Resize(self,
+                 capacity: int) -> None:
+        """
+        Resize the table to the specified capacity, inserting again all the entries.
+
+        Args:
+            capacity (int): New capacity (power of 2)
+        """
+        old_hashes, old_addr_idxs, old_path_ids = self.m_hashes, self.m_addr_idxs, self.m_path_ids
+        self.__Allocate(capacity)
+
+        for old_slot, key_hash in enumerate(old_hashes):
+            if key_hash != HdWalletReverseIndexConst.EMPTY_HASH:
+                slot = self.__FindSlot(key_hash)
+                self.m_hashes[slot] = key_hash
+                self.m_addr_idxs[slot] = old_addr_idxs[old_slot]
+                self.m_path_ids[slot] = old_path_ids[old_slot]
+                self.m_count += 1
+
+    def __FindSlot(self,
+                   key_hash: int) -> int:
+        """
+        Find the slot of the specified hash, i.e. the slot containing it or the empty slot where it shall be put.
+
+        Args:
+            key_hash (int): Key hash
+
+        Returns:
+            int: Slot index
+        """
+        mask = len(self.m_hashes) - 1
+        slot = key_hash & mask
+        while True:
+            slot_hash = self.m_hashes[slot]
+            if slot_hash in (key_hash, HdWalletReverseIndexConst.EMPTY_HASH):
+                return slot
+            slot = (slot + 1) & mask
+
+    def __GetPathId(self,
+                    path: Tuple[Optional[int], Optional[int]]) -> int:
+        """
+        Get the identifier of the specified (account, change) couple, adding it if not present.
+
+        Args:
+            path (tuple): Account index and change index
+
+        Returns:
+            int: Path identifier
+
+        Raises:
+            ValueError: If the maximum number of paths is reached
+        """
+        path_id = self.m_path_to_id.get(path)
+        if path_id is None:
+            if len(self.m_paths) > HdWalletReverseIndexConst.MAX_PATH_NUM:
+                raise ValueError("Maximum number of account and change indexes couples reached")
+            path_id = len(self.m_paths)
+            self.m_paths.append(path)
+            self.m_path_to_id[path] = path_id
+        return path_id
+
+    @staticmethod
+    def __Hash(key: Union[bytes, str]) -> int:
+        """
+        Compute the hash of the specified key.
+        The empty slot marker is never returned.
+
+        Args:
+            key (str or bytes): Key
+
+        Returns:
+            int: Key hash
+        """
+        key_bytes = key.encode("utf-8") if isinstance(key, str) else key
+        key_hash = int.from_bytes(
+            hashlib.blake2b(key_bytes, digest_size=HdWalletReverseIndexConst.HASH_BYTE_LEN).digest(),
+            "little"
+        )
+        return key_hash or 1
+
+    @staticmethod
+    def __ToLittleEndian(arr: array) -> array:
+        """
+        Convert the specified array from/to little endian, if the machine is big endian.
+
+        Args:
+            arr (array): Array
+
+        Returns:
+            array: Converted array (the same one if no conversion is needed)
+        """
+        if sys.byteorder != "little":
+            arr = array(arr.typecode, arr)
+            arr.byteswap()
+        return arr
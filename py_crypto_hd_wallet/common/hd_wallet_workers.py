@@ -0,0 +1,321 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for deriving addresses and creating wallets with multiple processes."""
+
+# Imports
+import itertools
+import math
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+
+# Item type for mapping
+MapItemType = TypeVar("MapItemType")
+
+
+class HdWalletWorkersConst:
+    """Class container for HD wallet workers constants."""
+
+    # Number of chunks for each worker, to balance the load between workers
+    CHUNKS_PER_WORKER: int = 4
+    # Minimum number of addresses in a chunk
+    CHUNK_MIN_SIZE: int = 32
+    # Maximum number of addresses in a chunk
+    CHUNK_MAX_SIZE: int = 4096
+    # Maximum number of pending chunks for each worker
+    PENDING_CHUNKS_PER_WORKER: int = 2
+    # Number of items in a chunk when mapping
+    MAP_CHUNK_SIZE: int = 16
+
+
+class HdWalletWorkersPool:
+    """
+    HD wallet workers pool class.
+    It keeps a pool of worker processes open, so that it can be used in place of the number of workers by more than
+    one derivation (e.g. for deriving addresses in many small batches) without creating a new pool each time.
+    It shall be closed when not needed anymore.
+    """
+
+    m_workers: int
+    m_executor: ProcessPoolExecutor
+
+    def __init__(self,
+                 workers: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            workers (int): Number of workers
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        self.m_workers = workers
+        self.m_executor = ProcessPoolExecutor(max_workers=workers)
+
+    def Close(self) -> None:
+        """Close the pool, waiting for the pending tasks."""
+        self.m_executor.shutdown()
+
+    def Workers(self) -> int:
+        """
+        Get the number of workers.
+
+        Returns:
+            int: Number of workers
+        """
+        return self.m_workers
+
+    def Executor(self) -> ProcessPoolExecutor:
+        """
+        Get the executor of the worker processes.
+
+        Returns:
+            ProcessPoolExecutor object: ProcessPoolExecutor object
+        """
+        return self.m_executor
+
+    def __enter__(self) -> "HdWalletWorkersPool":
+        """
+        Enter the context (the pool is closed when exiting).
+
+        Returns:
+            HdWalletWorkersPool object: This object
+        """
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """
+        Exit the context, closing the pool.
+
+        Args:
+            *args: Exception information
+        """
+        self.Close()
+
+
+# Type of the workers parameter: number of workers or pool of workers
+WorkersType = Union[int, HdWalletWorkersPool]
+
+
+def _MapChunk(worker_fct: Callable[..., Any],
+              args_chunk: List[Tuple[Any, ...]]) -> List[Any]:
+    """
+    Apply the worker function to a chunk of arguments (worker function for mapping).
+
+    Args:
+        worker_fct (function): Worker function
+        args_chunk (list)    : Arguments chunk
+
+    Returns:
+        list: Results
+    """
+    return [worker_fct(*args) for args in args_chunk]
+
+
+class HdWalletWorkers:
+    """
+    HD wallet workers class.
+    It splits an address index range (or a sequence of items) into chunks and processes them in a pool of processes.
+    Worker functions shall be module-level functions, so that they can be sent to the processes.
+    Workers are specified either by their number (a new pool is created for each call) or by a HdWalletWorkersPool
+    object (its pool is used).
+    Only the worker arguments are sent to the processes, so they shall contain the minimum data needed
+    for the computation (e.g. the change-level extended key, not the seed).
+    """
+
+    @staticmethod
+    def CheckWorkersNum(workers: Optional[WorkersType]) -> None:
+        """
+        Check the number of workers.
+
+        Args:
+            workers (int, HdWalletWorkersPool or None): Number or pool of workers, None for deriving in the current
+                                                        process
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        if isinstance(workers, int) and workers <= 0:
+            raise ValueError("Number of workers shall be greater than zero")
+
+    @staticmethod
+    def Iter(worker_fct: Callable[..., List[Any]],
+             worker_args: Tuple[Any, ...],
+             addr_num: int,
+             addr_off: int,
+             workers: WorkersType) -> Iterator[Any]:
+        """
+        Iterate over the addresses derived by the workers, in index order.
+        Only a bounded number of chunks is pending at any time, so memory usage does not depend on the range size.
+
+        Args:
+            worker_fct (function)               : Worker function
+            worker_args (tuple)                 : Worker arguments
+            addr_num (int)                      : Address number
+            addr_off (int)                      : Starting address index
+            workers (int or HdWalletWorkersPool): Number or pool of workers
+
+        Returns:
+            Iterator object: Iterator over the addresses
+        """
+        if addr_num == 0:
+            return
+
+        chunk_size = HdWalletWorkers.__ChunkSize(addr_num, HdWalletWorkers.__WorkersNum(workers))
+        addr_end = addr_off + addr_num
+        tasks = ((worker_fct, worker_args, min(chunk_size, addr_end - chunk_off), chunk_off)
+                 for chunk_off in range(addr_off, addr_end, chunk_size))
+
+        for addrs in HdWalletWorkers.__Results(tasks, workers):
+            yield from addrs
+
+    @staticmethod
+    def Map(worker_fct: Callable[..., Any],
+            items: Iterable[MapItemType],
+            args_fct: Callable[[MapItemType], Tuple[Any, ...]],
+            workers: Optional[WorkersType]) -> Iterator[Tuple[MapItemType, Any]]:
+        """
+        Iterate over the items together with the result of the worker function, in items order.
+        The worker function is called with the arguments returned by args_fct for each item.
+        Items are consumed lazily and only a bounded number of chunks is pending at any time,
+        so memory usage does not depend on the number of items.
+
+        Args:
+            worker_fct (function)                     : Worker function
+            items (iterable)                          : Items
+            args_fct (function)                       : Function returning the worker arguments of an item
+            workers (int, HdWalletWorkersPool or None): Number or pool of workers, None for computing in the current
+                                                        process
+
+        Returns:
+            Iterator object: Iterator over (item, result) tuples
+        """
+        if workers is None:
+            return ((item, worker_fct(*args_fct(item))) for item in items)
+
+        items, args_items = itertools.tee(items)
+        tasks = ((_MapChunk, worker_fct, args_chunk)
+                 for args_chunk in HdWalletWorkers.__Chunks(map(args_fct, args_items),
+                                                            HdWalletWorkersConst.MAP_CHUNK_SIZE))
+        results = itertools.chain.from_iterable(HdWalletWorkers.__Results(tasks, workers))
+        return zip(items, results)
+
+    @staticmethod
+    def __Chunks(args_iter: Iterator[Tuple[Any, ...]],
+                 chunk_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Iterate over the arguments in chunks.
+
+        Args:
+            args_iter (iterator): Arguments iterator
+            chunk_size (int)    : Chunk size
+
+        Returns:
+            Iterator object: Iterator over the arguments chunks
+        """
+        while True:
+            args_chunk = list(itertools.islice(args_iter, chunk_size))
+            if not args_chunk:
+                return
+            yield args_chunk
+
+    @staticmethod
+    def __Results(tasks: Iterator[Tuple[Any, ...]],
+                  workers: WorkersType) -> Iterator[Any]:
+        """
+        Iterate over the results of the tasks executed in a pool of processes, in tasks order.
+
+        Args:
+            tasks (iterator)                    : Tasks, each one as a tuple of function and its arguments
+            workers (int or HdWalletWorkersPool): Number or pool of workers
+
+        Returns:
+            Iterator object: Iterator over the results
+        """
+        if isinstance(workers, HdWalletWorkersPool):
+            yield from HdWalletWorkers.__ExecutorResults(tasks, workers.Executor(), workers.Workers())
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                yield from HdWalletWorkers.__ExecutorResults(tasks, executor, workers)
+
+    @staticmethod
+    def __ExecutorResults(tasks: Iterator[Tuple[Any, ...]],
+                          executor: ProcessPoolExecutor,
+                          workers: int) -> Iterator[Any]:
+        """
+        Iterate over the results of the tasks executed in the specified executor, in tasks order.
+
+        Args:
+            tasks (iterator)                     : Tasks, each one as a tuple of function and its arguments
+            executor (ProcessPoolExecutor object): Executor
+            workers (int)                        : Number of workers
+
+        Returns:
+            Iterator object: Iterator over the results
+        """
+        pending: Deque[Future] = deque()
+        try:
+            while True:
+                # Keep the pool busy without submitting all the tasks at once
+                while len(pending) < workers * HdWalletWorkersConst.PENDING_CHUNKS_PER_WORKER:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    pending.append(executor.submit(*task))
+                if not pending:
+                    break
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def __WorkersNum(workers: WorkersType) -> int:
+        """
+        Get the number of workers.
+
+        Args:
+            workers (int or HdWalletWorkersPool): Number or pool of workers
+
+        Returns:
+            int: Number of workers
+        """
+        return workers.Workers() if isinstance(workers, HdWalletWorkersPool) else workers
+
+    @staticmethod
+    def __ChunkSize(addr_num: int,
+                    workers: int) -> int:
+        """
+        Get the chunk size for the specified address number and workers.
+
+        Args:
+            addr_num (int): Address number
+            workers (int) : Number of workers
+
+        Returns:
+            int: Chunk size
+        """
+        chunk_size = math.ceil(addr_num / (workers * HdWalletWorkersConst.CHUNKS_PER_WORKER))
+        return min(max(chunk_size, HdWalletWorkersConst.CHUNK_MIN_SIZE), HdWalletWorkersConst.CHUNK_MAX_SIZE)
@@ -21,9 +21,14 @@
 """Module with helper class for storing Electrum V1 addresses."""
 
 # Imports
+from typing import Iterator, List, Optional, Set, Tuple
+
 from bip_utils import ElectrumV1
 
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers
+from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_enum import HdWalletElectrumV1KeyTypes
 from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_keys import HdWalletElectrumV1DerivedKeys
 
 
@@ -38,34 +43,87 @@ class HdWalletElectrumV1Addresses(HdWalletAddrBase):
                  electrum_obj: ElectrumV1,
                  change_idx: int,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletElectrumV1KeyTypes]] = None,
+                 *,
+                 workers: Optional[int] = None,
+                 compact: bool = False,
+                 rev_index: Optional[HdWalletReverseIndex] = None) -> None:
         """
         Construct class.
 
         Args:
-            electrum_obj (ElectrumV1 object): ElectrumV1 object
-            change_idx (int)                : Change index
-            addr_num (int)                  : Address number
-            addr_off (int)                  : Starting address index
+            electrum_obj (ElectrumV1 object)                 : ElectrumV1 object
+            change_idx (int)                                 : Change index
+            addr_num (int)                                   : Address number
+            addr_off (int)                                   : Starting address index
+            key_types (set, optional)                        : Key types to be computed, None for all (default)
+            workers (int, optional)                          : Number of worker processes, None for deriving in the
+                                                               current process (default)
+            compact (bool, optional)                         : True for storing keys in a compact columnar form,
+                                                               false otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which addresses are added, None for no
+                                                               reverse index (default)
         """
-        super().__init__(addr_off)
-        self.__FromElectrumObj(electrum_obj, change_idx, addr_num, addr_off)
-
-    def __FromElectrumObj(self,
-                          electrum_obj: ElectrumV1,
-                          change_idx: int,
-                          addr_num: int,
-                          addr_off: int) -> None:
+        super().__init__(addr_off, compact=compact, rev_index=rev_index, change_idx=change_idx)
+        for addr in self.Iter(electrum_obj, change_idx, addr_num, addr_off, key_types, workers=workers):
+            self._AddAddr(addr)
+
+    @staticmethod
+    def Iter(electrum_obj: ElectrumV1,
+             change_idx: int,
+             addr_num: int,
+             addr_off: int,
+             key_types: Optional[Set[HdWalletElectrumV1KeyTypes]] = None,
+             *,
+             workers: Optional[int] = None) -> Iterator[HdWalletElectrumV1DerivedKeys]:
         """
-        Create addresses from the specified Electrum object.
+        Iterate over addresses derived from the specified Electrum object, one at a time and without storing them.
 
         Args:
             electrum_obj (ElectrumV1 object): ElectrumV1 object
             change_idx (int)                : Change index
             addr_num (int)                  : Address number
             addr_off (int)                  : Starting address index
+            key_types (set, optional)       : Key types to be computed, None for all (default)
+            workers (int, optional)         : Number of worker processes, None for deriving in the current
+                                              process (default)
+
+        Returns:
+            Iterator object: Iterator over the address keys
         """
-        for i in range(addr_num):
-            self._AddAddr(
-                HdWalletElectrumV1DerivedKeys(electrum_obj, change_idx, i, addr_off)
-            )
+
+        # Only the master key is sent to the workers
+        if workers is not None:
+            master_key = (electrum_obj.MasterPublicKey().RawUncompressed().ToBytes()
+                          if electrum_obj.IsPublicOnly()
+                          else electrum_obj.MasterPrivateKey().Raw().ToBytes())
+            yield from HdWalletWorkers.Iter(_DeriveAddresses,
+                                            (electrum_obj.IsPublicOnly(), master_key, change_idx, key_types),
+                                            addr_num,
+                                            addr_off,
+                                            workers)
+        else:
+            for i in range(addr_num):
+                yield HdWalletElectrumV1DerivedKeys(electrum_obj, change_idx, i, addr_off, key_types)
+
+
+def _DeriveAddresses(worker_args: Tuple[bool, bytes, int, Optional[Set[HdWalletElectrumV1KeyTypes]]],
+                     addr_num: int,
+                     addr_off: int) -> List[HdWalletElectrumV1DerivedKeys]:
+    """
+    Derive addresses from a master key (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): Public-only flag, master key bytes, change index and key types
+        addr_num (int)     : Address number
+        addr_off (int)     : Starting address index
+
+    Returns:
+        list[HdWalletElectrumV1DerivedKeys]: Address keys
+    """
+    is_public_only, master_key, change_idx, key_types = worker_args
+    electrum_obj = (ElectrumV1.FromPublicKey(master_key)
+                    if is_public_only
+                    else ElectrumV1.FromPrivateKey(master_key))
+    return list(HdWalletElectrumV1Addresses.Iter(electrum_obj, change_idx, addr_num, addr_off, key_types))
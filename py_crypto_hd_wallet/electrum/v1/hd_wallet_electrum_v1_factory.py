@@ -21,9 +21,12 @@
 """Module for creating Electrum V1 wallet factories."""
 
 # Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
 from bip_utils import ElectrumV1, ElectrumV1MnemonicGenerator, ElectrumV1SeedGenerator
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletWorkers
 from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1 import HdWalletElectrumV1
 from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_enum import (
     HdWalletElectrumV1Languages,
@@ -31,6 +34,22 @@ from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_enum import (
 )
 
 
+def _GenerateSeed(mnemonic: str) -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic (str): Mnemonic
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    return ElectrumV1SeedGenerator(mnemonic).Generate()
+
+
 class HdWalletElectrumV1Factory:
     """
     HD wallet Electrum V1 factory class.
@@ -86,12 +105,54 @@ class HdWalletElectrumV1Factory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        seed_bytes = ElectrumV1SeedGenerator(mnemonic).Generate()
-        electrum_obj = ElectrumV1.FromSeed(seed_bytes)
-        return HdWalletElectrumV1(wallet_name=wallet_name,
-                                  electrum_obj=electrum_obj,
-                                  mnemonic=mnemonic,
-                                  seed_bytes=seed_bytes)
+        seed_bytes = _GenerateSeed(mnemonic)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
+
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed, mnemonics, lambda item: item[1:], workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -153,3 +214,25 @@ class HdWalletElectrumV1Factory:
         electrum_obj = ElectrumV1.FromPublicKey(pub_key_bytes)
         return HdWalletElectrumV1(wallet_name=wallet_name,
                                   electrum_obj=electrum_obj)
+
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
+        """
+        Create wallet from mnemonic and the seed generated from it.
+
+        Args:
+            wallet_name (str) : Wallet name
+            mnemonic (str)    : Mnemonic
+            seed_bytes (bytes): Seed bytes
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+        """
+        electrum_obj = ElectrumV1.FromSeed(seed_bytes)
+        return HdWalletElectrumV1(wallet_name=wallet_name,
+                                  electrum_obj=electrum_obj,
+                                  mnemonic=mnemonic,
+                                  seed_bytes=seed_bytes)
@@ -21,12 +21,34 @@
 """Module with helper class for storing Electrum V1 keys."""
 
 # Imports
-from bip_utils import CoinsConf, ElectrumV1, IPrivateKey, WifEncoder, WifPubKeyModes
-
-from py_crypto_hd_wallet.common import HdWalletKeysBase
+from typing import Optional, Set
+
+from bip_utils import (
+    CoinsConf,
+    ElectrumV1,
+    IPrivateKey,
+    IPublicKey,
+    P2PKHAddrEncoder,
+    P2PKHPubKeyModes,
+    WifEncoder,
+    WifPubKeyModes,
+)
+
+from py_crypto_hd_wallet.common import HdWalletCoinInfo, HdWalletKeysBase
 from py_crypto_hd_wallet.electrum.v1.hd_wallet_electrum_v1_enum import HdWalletElectrumV1KeyTypes
 
 
+class HdWalletElectrumV1KeysConst:
+    """Class container for HD wallet Electrum V1 keys constants."""
+
+    # Coin information, resolved once since Electrum is only for Bitcoin
+    COIN_INFO: HdWalletCoinInfo = HdWalletCoinInfo.FromConf(CoinsConf.BitcoinMainNet)
+    # WIF net version
+    WIF_NET_VER: bytes = CoinsConf.BitcoinMainNet.ParamByKey("wif_net_ver")
+    # P2PKH net version
+    P2PKH_NET_VER: bytes = CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver")
+
+
 class HdWalletElectrumV1KeyUtils:
     """Class container for HD wallet Electrum keys utility functions."""
 
@@ -43,10 +65,27 @@ class HdWalletElectrumV1KeyUtils:
         """
         return WifEncoder.Encode(
             priv_key,
-            CoinsConf.BitcoinMainNet.ParamByKey("wif_net_ver"),
+            HdWalletElectrumV1KeysConst.WIF_NET_VER,
             WifPubKeyModes.UNCOMPRESSED
         )
 
+    @staticmethod
+    def PubToAddress(pub_key: IPublicKey) -> str:
+        """
+        Encode public key to address, in the same way of ElectrumV1.
+
+        Args:
+            pub_key (IPublicKey object): Public key
+
+        Returns:
+            str: Address
+        """
+        return P2PKHAddrEncoder.EncodeKey(
+            pub_key,
+            net_ver=HdWalletElectrumV1KeysConst.P2PKH_NET_VER,
+            pub_key_mode=P2PKHPubKeyModes.UNCOMPRESSED
+        )
+
 
 class HdWalletElectrumV1MasterKeys(HdWalletKeysBase):
     """
@@ -56,14 +95,16 @@ class HdWalletElectrumV1MasterKeys(HdWalletKeysBase):
     """
 
     def __init__(self,
-                 electrum_obj: ElectrumV1) -> None:
+                 electrum_obj: ElectrumV1,
+                 key_types: Optional[Set[HdWalletElectrumV1KeyTypes]] = None) -> None:
         """
         Construct class.
 
         Args:
             electrum_obj (ElectrumV1 object): ElectrumV1 object
+            key_types (set, optional)       : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletElectrumV1KeyTypes)
+        super().__init__(HdWalletElectrumV1KeyTypes, key_types=key_types)
         self.__FromElectrumObj(electrum_obj)
 
     def __FromElectrumObj(self,
@@ -76,21 +117,21 @@ class HdWalletElectrumV1MasterKeys(HdWalletKeysBase):
         """
 
         # Add public key
-        self._Set(HdWalletElectrumV1KeyTypes.RAW_PUB,
-                  electrum_obj.MasterPublicKey().RawUncompressed().ToHex()[2:])
+        self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PUB,
+                     lambda: electrum_obj.MasterPublicKey().RawUncompressed().ToBytes()[1:])
 
         # Add private key only if not public-only
         if not electrum_obj.IsPublicOnly():
-            self._Set(HdWalletElectrumV1KeyTypes.RAW_PRIV,
-                      electrum_obj.MasterPrivateKey().Raw().ToHex())
-            self._Set(HdWalletElectrumV1KeyTypes.WIF_PRIV,
-                      HdWalletElectrumV1KeyUtils.PrivToWif(electrum_obj.MasterPrivateKey()))
+            self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PRIV,
+                         lambda: electrum_obj.MasterPrivateKey().Raw().ToBytes())
+            self._SetKey(HdWalletElectrumV1KeyTypes.WIF_PRIV,
+                         lambda: HdWalletElectrumV1KeyUtils.PrivToWif(electrum_obj.MasterPrivateKey()))
 
 
 class HdWalletElectrumV1DerivedKeys(HdWalletKeysBase):
     """
     HD wallet Electrum derived keys class.
-    It creates derived  from an Electrum object and stores them.
+    It creates derived keys from an Electrum object and stores them.
     Keys can be got individually, as dictionary or in JSON format.
     """
 
@@ -98,7 +139,8 @@ class HdWalletElectrumV1DerivedKeys(HdWalletKeysBase):
                  electrum_obj: ElectrumV1,
                  change_idx: int,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletElectrumV1KeyTypes]] = None) -> None:
         """
         Construct class.
 
@@ -107,8 +149,9 @@ class HdWalletElectrumV1DerivedKeys(HdWalletKeysBase):
             change_idx (int)                : Change index
             addr_num (int)                  : Address number
             addr_off (int)                  : Starting address index
+            key_types (set, optional)       : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletElectrumV1KeyTypes)
+        super().__init__(HdWalletElectrumV1KeyTypes, key_types=key_types)
         self.__FromElectrumObj(electrum_obj, change_idx, addr_num, addr_off)
 
     def __FromElectrumObj(self,
@@ -127,17 +170,20 @@ class HdWalletElectrumV1DerivedKeys(HdWalletKeysBase):
         """
         addr_idx = addr_num + addr_off
 
+        # Derive the key pair only once, all keys are computed from it
+        if electrum_obj.IsPublicOnly():
+            pub_key = electrum_obj.GetPublicKey(change_idx, addr_idx)
+        else:
+            priv_key = electrum_obj.GetPrivateKey(change_idx, addr_idx)
+            pub_key = priv_key.PublicKey()
+
         # Add public key
-        self._Set(HdWalletElectrumV1KeyTypes.RAW_PUB,
-                  electrum_obj.GetPublicKey(change_idx, addr_idx).RawUncompressed().ToHex()[2:])
+        self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PUB, lambda: pub_key.RawUncompressed().ToBytes()[1:])
 
         # Add private key only if not public-only
         if not electrum_obj.IsPublicOnly():
-            self._Set(HdWalletElectrumV1KeyTypes.RAW_PRIV,
-                      electrum_obj.GetPrivateKey(change_idx, addr_idx).Raw().ToHex())
-            self._Set(HdWalletElectrumV1KeyTypes.WIF_PRIV,
-                      HdWalletElectrumV1KeyUtils.PrivToWif(electrum_obj.GetPrivateKey(change_idx, addr_idx)))
+            self._SetKey(HdWalletElectrumV1KeyTypes.RAW_PRIV, lambda: priv_key.Raw().ToBytes())
+            self._SetKey(HdWalletElectrumV1KeyTypes.WIF_PRIV, lambda: HdWalletElectrumV1KeyUtils.PrivToWif(priv_key))
 
         # Address
-        self._Set(HdWalletElectrumV1KeyTypes.ADDRESS,
-                  electrum_obj.GetAddress(change_idx, addr_idx))
+        self._SetKey(HdWalletElectrumV1KeyTypes.ADDRESS, lambda: HdWalletElectrumV1KeyUtils.PubToAddress(pub_key))
@@ -21,17 +21,24 @@
 """Module for generating wallets based on Electrum V2."""
 
 # Imports
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, Optional, Set
 
-from bip_utils import CoinsConf
 from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst
 from bip_utils.electrum.electrum_v2 import ElectrumV2Base
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletWorkers
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsyncConst
 from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_addr import HdWalletElectrumV2Addresses
-from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import HdWalletElectrumV2DataTypes
-from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_keys import HdWalletElectrumV2MasterKeys
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import (
+    HdWalletElectrumV2DataTypes,
+    HdWalletElectrumV2KeyTypes,
+)
+from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_keys import (
+    HdWalletElectrumV2DerivedKeys,
+    HdWalletElectrumV2KeysConst,
+    HdWalletElectrumV2MasterKeys,
+)
 
 
 class HdWalletElectrumV2(HdWalletBase):
@@ -76,12 +83,21 @@ class HdWalletElectrumV2(HdWalletBase):
             change_idx (int, optional): Change index (default: 0)
             addr_num (int, optional)  : Number of addresses to be generated (default: 20)
             addr_off (int, optional)  : Starting address index (default: 0)
+            fields (set, optional)    : HdWalletElectrumV2DataTypes and HdWalletElectrumV2KeyTypes to be generated
+                                        (default: all)
+            workers (int, optional)   : Number of worker processes for deriving addresses
+                                        (default: None, i.e. current process only)
+            compact (bool, optional)  : True for storing address keys in a compact columnar form,
+                                        which reduces memory usage for many addresses (default: false)
         """
 
         # Get parameters
         change_idx = kwargs.get("change_idx", 0)
         addr_num = kwargs.get("addr_num", 20)
         addr_off = kwargs.get("addr_off", 0)
+        data_types, key_types = self._SplitFields(kwargs.get("fields", None), HdWalletElectrumV2KeyTypes)
+        workers = kwargs.get("workers", None)
+        compact = kwargs.get("compact", False)
 
         # Check parameters
         if change_idx < 0:
@@ -90,15 +106,84 @@ class HdWalletElectrumV2(HdWalletBase):
             raise ValueError("Address number shall be greater or equal to zero")
         if addr_off < 0 or ((addr_off + addr_num) > Bip32KeyDataConst.KEY_INDEX_MAX_VAL):
             raise ValueError("Address offset shall be greater or equal to zero")
+        HdWalletWorkers.CheckWorkersNum(workers)
 
         # Set master key
-        self._Set(HdWalletElectrumV2DataTypes.MASTER_KEY,
-                  HdWalletElectrumV2MasterKeys(self.m_electrum_obj))
+        self._SetIfSelected(HdWalletElectrumV2DataTypes.MASTER_KEY, data_types,
+                            HdWalletElectrumV2MasterKeys, self.m_electrum_obj, key_types)
 
         # Set addresses
         self._Set(HdWalletElectrumV2DataTypes.ADDRESS_OFF, addr_off)
-        self._Set(HdWalletElectrumV2DataTypes.ADDRESS,
-                  HdWalletElectrumV2Addresses(self.m_electrum_obj, change_idx, addr_num, addr_off))
+        self._SetIfSelected(HdWalletElectrumV2DataTypes.ADDRESS, data_types,
+                            HdWalletElectrumV2Addresses, self.m_electrum_obj, change_idx, addr_num, addr_off,
+                            key_types, workers=workers, compact=compact, rev_index=self.m_rev_index)
+
+    def IterAddresses(self,
+                      change_idx: int = 0,
+                      start: int = 0,
+                      stop: Optional[int] = None,
+                      *,
+                      key_types: Optional[Set[HdWalletElectrumV2KeyTypes]] = None,
+                      workers: Optional[int] = None) -> Iterator[HdWalletElectrumV2DerivedKeys]:
+        """
+        Iterate over the addresses in the specified index range.
+        Differently from Generate, addresses are derived one at a time and not stored in the wallet,
+        so memory usage does not depend on the range size.
+
+        Args:
+            change_idx (int, optional): Change index (default: 0)
+            start (int, optional)     : Starting address index (default: 0)
+            stop (int, optional)      : Ending address index, excluded (default: 2^32 - 1)
+            key_types (set, optional) : Key types to be computed, None for all (default)
+            workers (int, optional)   : Number of worker processes for deriving addresses
+                                        (default: None, i.e. current process only)
+
+        Returns:
+            Iterator object: Iterator over the address keys
+
+        Raises:
+            ValueError: If the change index or the address index range is not valid
+        """
+        stop = Bip32KeyDataConst.KEY_INDEX_MAX_VAL if stop is None else stop
+
+        # Check parameters
+        if change_idx < 0:
+            raise ValueError("Change index shall be greater or equal to zero")
+        if start < 0 or start > stop:
+            raise ValueError("Starting address index shall be greater or equal to zero and less than the ending one")
+        if stop > Bip32KeyDataConst.KEY_INDEX_MAX_VAL:
+            raise ValueError("Ending address index shall be less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        return HdWalletElectrumV2Addresses.Iter(self.m_electrum_obj,
+                                                change_idx,
+                                                stop - start,
+                                                start,
+                                                key_types,
+                                                workers=workers)
+
+    def IterAddressesAsync(self,
+                           *args: Any,
+                           chunk_size: int = HdWalletAsyncConst.DEF_CHUNK_SIZE,
+                           executor: Optional[ThreadPoolExecutor] = None,
+                           **kwargs: Any) -> AsyncIterator[HdWalletElectrumV2DerivedKeys]:
+        """
+        Iterate asynchronously over the addresses in the specified index range.
+        The addresses are derived in the executor in chunks and control is given back to the event loop after each
+        chunk, so that the iteration does not block it and it can be cancelled between chunks.
+        Parameters are checked as in IterAddresses.
+
+        Args:
+            *args                                  : Arguments of IterAddresses
+            chunk_size (int, optional)             : Number of addresses derived for each chunk (default: 32)
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of IterAddresses
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the address keys
+        """
+        return HdWalletAsync.Iter(self.IterAddresses, *args, chunk_size=chunk_size, executor=executor, **kwargs)
 
     def IsWatchOnly(self) -> bool:
         """
@@ -131,12 +216,11 @@ class HdWalletElectrumV2(HdWalletBase):
         # Set wallet name
         self._Set(HdWalletElectrumV2DataTypes.WALLET_NAME, wallet_name)
         # Set coin name
-        coin_names = CoinsConf.BitcoinMainNet.CoinNames()
-        self._Set(HdWalletElectrumV2DataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletElectrumV2DataTypes.COIN_NAME, HdWalletElectrumV2KeysConst.COIN_INFO.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletElectrumV2DataTypes.MNEMONIC, mnemonic)
             self._Set(HdWalletElectrumV2DataTypes.PASSPHRASE, passphrase)
         if seed_bytes != b"":
-            self._Set(HdWalletElectrumV2DataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletElectrumV2DataTypes.SEED_BYTES, seed_bytes)
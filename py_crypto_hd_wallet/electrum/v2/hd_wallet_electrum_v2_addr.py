@@ -21,9 +21,15 @@
 """Module with helper class for storing Electrum V2 addresses."""
 
 # Imports
+from typing import Iterator, List, Optional, Set, Tuple, Type
+
+from bip_utils import Bip32Slip10Secp256k1
 from bip_utils.electrum.electrum_v2 import ElectrumV2Base
 
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers
+from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import HdWalletElectrumV2KeyTypes
 from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_keys import HdWalletElectrumV2DerivedKeys
 
 
@@ -38,34 +44,86 @@ class HdWalletElectrumV2Addresses(HdWalletAddrBase):
                  electrum_obj: ElectrumV2Base,
                  change_idx: int,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletElectrumV2KeyTypes]] = None,
+                 *,
+                 workers: Optional[int] = None,
+                 compact: bool = False,
+                 rev_index: Optional[HdWalletReverseIndex] = None) -> None:
         """
         Construct class.
 
         Args:
-            electrum_obj (ElectrumV2Base object): ElectrumV2Base object
-            change_idx (int)                    : Change index
-            addr_num (int)                      : Address number
-            addr_off (int)                      : Starting address index
+            electrum_obj (ElectrumV2Base object)             : ElectrumV2Base object
+            change_idx (int)                                 : Change index
+            addr_num (int)                                   : Address number
+            addr_off (int)                                   : Starting address index
+            key_types (set, optional)                        : Key types to be computed, None for all (default)
+            workers (int, optional)                          : Number of worker processes, None for deriving in the
+                                                               current process (default)
+            compact (bool, optional)                         : True for storing keys in a compact columnar form,
+                                                               false otherwise (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which addresses are added, None for no
+                                                               reverse index (default)
         """
-        super().__init__(addr_off)
-        self.__FromElectrumObj(electrum_obj, change_idx, addr_num, addr_off)
-
-    def __FromElectrumObj(self,
-                          electrum_obj: ElectrumV2Base,
-                          change_idx: int,
-                          addr_num: int,
-                          addr_off: int) -> None:
+        super().__init__(addr_off, compact=compact, rev_index=rev_index, change_idx=change_idx)
+        for addr in self.Iter(electrum_obj, change_idx, addr_num, addr_off, key_types, workers=workers):
+            self._AddAddr(addr)
+
+    @staticmethod
+    def Iter(electrum_obj: ElectrumV2Base,
+             change_idx: int,
+             addr_num: int,
+             addr_off: int,
+             key_types: Optional[Set[HdWalletElectrumV2KeyTypes]] = None,
+             *,
+             workers: Optional[int] = None) -> Iterator[HdWalletElectrumV2DerivedKeys]:
         """
-        Create addresses from the specified Electrum object.
+        Iterate over addresses derived from the specified Electrum object, one at a time and without storing them.
 
         Args:
             electrum_obj (ElectrumV2Base object): ElectrumV2Base object
             change_idx (int)                    : Change index
             addr_num (int)                      : Address number
             addr_off (int)                      : Starting address index
+            key_types (set, optional)           : Key types to be computed, None for all (default)
+            workers (int, optional)             : Number of worker processes, None for deriving in the current
+                                                  process (default)
+
+        Returns:
+            Iterator object: Iterator over the address keys
         """
-        for i in range(addr_num):
-            self._AddAddr(
-                HdWalletElectrumV2DerivedKeys(electrum_obj, change_idx, i, addr_off)
-            )
+
+        # Only the master extended key is sent to the workers
+        if workers is not None:
+            bip32_obj = electrum_obj.Bip32Object()
+            ex_key = (bip32_obj.PublicKey().ToExtended()
+                      if bip32_obj.IsPublicOnly()
+                      else bip32_obj.PrivateKey().ToExtended())
+            yield from HdWalletWorkers.Iter(_DeriveAddresses,
+                                            (type(electrum_obj), ex_key, change_idx, key_types),
+                                            addr_num,
+                                            addr_off,
+                                            workers)
+        else:
+            for i in range(addr_num):
+                yield HdWalletElectrumV2DerivedKeys(electrum_obj, change_idx, i, addr_off, key_types)
+
+
+def _DeriveAddresses(worker_args: Tuple[Type[ElectrumV2Base], str, int, Optional[Set[HdWalletElectrumV2KeyTypes]]],
+                     addr_num: int,
+                     addr_off: int) -> List[HdWalletElectrumV2DerivedKeys]:
+    """
+    Derive addresses from a master extended key (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): ElectrumV2Base class, master extended key, change index and key types
+        addr_num (int)     : Address number
+        addr_off (int)     : Starting address index
+
+    Returns:
+        list[HdWalletElectrumV2DerivedKeys]: Address keys
+    """
+    electrum_cls, ex_key, change_idx, key_types = worker_args
+    electrum_obj = electrum_cls(Bip32Slip10Secp256k1.FromExtendedKey(ex_key))
+    return list(HdWalletElectrumV2Addresses.Iter(electrum_obj, change_idx, addr_num, addr_off, key_types))
@@ -21,7 +21,8 @@
 """Module for creating Electrum V2 wallet factories."""
 
 # Imports
-from typing import Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple, Type
 
 from bip_utils import (
     Bip32KeyError,
@@ -34,7 +35,7 @@ from bip_utils import (
 )
 from bip_utils.electrum.electrum_v2 import ElectrumV2Base
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletWorkers
 from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2 import HdWalletElectrumV2
 from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import (
     HdWalletElectrumV2Languages,
@@ -43,6 +44,33 @@ from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import (
 )
 
 
+def _GenerateSeed(mnemonic_type: HdWalletElectrumV2MnemonicTypes,
+                  mnemonic: str,
+                  passphrase: str = "") -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic_type (HdWalletElectrumV2MnemonicTypes): Mnemonic type
+        mnemonic (str)                                 : Mnemonic
+        passphrase (str, optional)                     : Passphrase for protecting mnemonic, empty if not specified
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        # Try to decode by specifying the type
+        ElectrumV2MnemonicDecoder(mnemonic_type).Decode(mnemonic)
+    except ValueError as ex:
+        raise ValueError(f"Invalid mnemonic or mnemonic type: {mnemonic}") from ex
+
+    # Mnemonic already validated, no need to try it
+    return ElectrumV2SeedGenerator(mnemonic).Generate(passphrase)
+
+
 class HdWalletElectrumV2Factory:
     """
     HD wallet Electrum V2 factory class.
@@ -119,15 +147,59 @@ class HdWalletElectrumV2Factory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        self.__ValidateMnemonicType(mnemonic)
+        seed_bytes = _GenerateSeed(self.m_mnemonic_type, mnemonic, passphrase)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, passphrase, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      passphrase: str = "",
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
 
-        # Mnemonic already validated, no need to try it
-        seed_bytes = ElectrumV2SeedGenerator(mnemonic).Generate(passphrase)
-        electrum_obj = self.m_electrum_cls.FromSeed(seed_bytes)
-        return HdWalletElectrumV2(wallet_name=wallet_name,
-                                  electrum_obj=electrum_obj,
-                                  mnemonic=mnemonic,
-                                  seed_bytes=seed_bytes)
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            passphrase (str, optional)             : Passphrase for protecting mnemonic, empty if not specified
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, passphrase, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) or (wallet name, mnemonic, passphrase) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed,
+                                                            mnemonics,
+                                                            lambda item: (self.m_mnemonic_type, *item[1:]),
+                                                            workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -179,19 +251,26 @@ class HdWalletElectrumV2Factory:
         return HdWalletElectrumV2(wallet_name=wallet_name,
                                   electrum_obj=electrum_obj)
 
-    def __ValidateMnemonicType(self,
-                               mnemonic: str) -> None:
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 passphrase: str = "",
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
         """
-        Validate the type of mnemonic.
+        Create wallet from mnemonic and the seed generated from it.
 
         Args:
-            mnemonic (str): Mnemonic
+            wallet_name (str)         : Wallet name
+            mnemonic (str)            : Mnemonic
+            passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+            seed_bytes (bytes)        : Seed bytes
 
-        Raises:
-            ValueError: If the mnemonic is not valid
+        Returns:
+            HdWalletBase object: HdWalletBase object
         """
-        try:
-            # Try to decode by specifying the type
-            ElectrumV2MnemonicDecoder(self.m_mnemonic_type).Decode(mnemonic)
-        except ValueError as ex:
-            raise ValueError(f"Invalid mnemonic or mnemonic type: {mnemonic}") from ex
+        electrum_obj = self.m_electrum_cls.FromSeed(seed_bytes)
+        return HdWalletElectrumV2(wallet_name=wallet_name,
+                                  electrum_obj=electrum_obj,
+                                  mnemonic=mnemonic,
+                                  seed_bytes=seed_bytes)
@@ -21,13 +21,39 @@
 """Module with helper class for storing Electrum V2 keys."""
 
 # Imports
-from bip_utils import Bip32PrivateKey, CoinsConf, WifEncoder
+from typing import Any, Dict, Optional, Set, Tuple, Type
+
+from bip_utils import (
+    Bip32PrivateKey,
+    Bip32PublicKey,
+    CoinsConf,
+    ElectrumV2Segwit,
+    ElectrumV2Standard,
+    P2PKHAddrEncoder,
+    P2WPKHAddrEncoder,
+    WifEncoder,
+)
+from bip_utils.addr.iaddr_encoder import IAddrEncoder
 from bip_utils.electrum.electrum_v2 import ElectrumV2Base
 
-from py_crypto_hd_wallet.common import HdWalletKeysBase
+from py_crypto_hd_wallet.common import HdWalletCoinInfo, HdWalletKeysBase
 from py_crypto_hd_wallet.electrum.v2.hd_wallet_electrum_v2_enum import HdWalletElectrumV2KeyTypes
 
 
+class HdWalletElectrumV2KeysConst:
+    """Class container for HD wallet Electrum V2 keys constants."""
+
+    # Coin information, resolved once since Electrum is only for Bitcoin
+    COIN_INFO: HdWalletCoinInfo = HdWalletCoinInfo.FromConf(CoinsConf.BitcoinMainNet)
+    # WIF net version
+    WIF_NET_VER: bytes = CoinsConf.BitcoinMainNet.ParamByKey("wif_net_ver")
+    # Address encoder and parameters for each ElectrumV2 class
+    ADDR_ENCODERS: Dict[Type[ElectrumV2Base], Tuple[Type[IAddrEncoder], Dict[str, Any]]] = {
+        ElectrumV2Standard: (P2PKHAddrEncoder, {"net_ver": CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver")}),
+        ElectrumV2Segwit: (P2WPKHAddrEncoder, {"hrp": CoinsConf.BitcoinMainNet.ParamByKey("p2wpkh_hrp")}),
+    }
+
+
 class HdWalletElectrumV1KeyUtils:
     """Class container for HD wallet Electrum keys utility functions."""
 
@@ -44,9 +70,33 @@ class HdWalletElectrumV1KeyUtils:
         """
         return WifEncoder.Encode(
             priv_key.KeyObject(),
-            CoinsConf.BitcoinMainNet.ParamByKey("wif_net_ver")
+            HdWalletElectrumV2KeysConst.WIF_NET_VER
         )
 
+    @staticmethod
+    def PubToAddress(electrum_obj: ElectrumV2Base,
+                     change_idx: int,
+                     addr_idx: int,
+                     pub_key: Bip32PublicKey) -> str:
+        """
+        Encode the public key already derived at the specified indexes to address, in the same way of the
+        ElectrumV2 object.
+
+        Args:
+            electrum_obj (ElectrumV2Base object): ElectrumV2Base object
+            change_idx (int)                    : Change index
+            addr_idx (int)                      : Address index
+            pub_key (Bip32PublicKey object)     : BIP32 public key
+
+        Returns:
+            str: Address
+        """
+        for electrum_cls, (addr_cls, addr_params) in HdWalletElectrumV2KeysConst.ADDR_ENCODERS.items():
+            if isinstance(electrum_obj, electrum_cls) and type(electrum_obj).GetAddress is electrum_cls.GetAddress:
+                return addr_cls.EncodeKey(pub_key.KeyObject(), **addr_params)
+        # Classes encoding addresses differently derive the address by themselves
+        return electrum_obj.GetAddress(change_idx, addr_idx)
+
 
 class HdWalletElectrumV2MasterKeys(HdWalletKeysBase):
     """
@@ -56,14 +106,16 @@ class HdWalletElectrumV2MasterKeys(HdWalletKeysBase):
     """
 
     def __init__(self,
-                 electrum_obj: ElectrumV2Base) -> None:
+                 electrum_obj: ElectrumV2Base,
+                 key_types: Optional[Set[HdWalletElectrumV2KeyTypes]] = None) -> None:
         """
         Construct class.
 
         Args:
             electrum_obj (ElectrumV2Base object): ElectrumV2Base object
+            key_types (set, optional)           : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletElectrumV2KeyTypes)
+        super().__init__(HdWalletElectrumV2KeyTypes, key_types=key_types)
         self.__FromElectrumObj(electrum_obj)
 
     def __FromElectrumObj(self,
@@ -77,15 +129,15 @@ class HdWalletElectrumV2MasterKeys(HdWalletKeysBase):
 
         # Add public key
         pub_key = electrum_obj.MasterPublicKey()
-        self._Set(HdWalletElectrumV2KeyTypes.EX_PUB, pub_key.ToExtended())
-        self._Set(HdWalletElectrumV2KeyTypes.RAW_PUB, pub_key.RawUncompressed().ToHex()[2:])
+        self._SetKey(HdWalletElectrumV2KeyTypes.EX_PUB, pub_key.ToExtended)
+        self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PUB, lambda: pub_key.RawUncompressed().ToBytes()[1:])
 
         # Add private key only if not public-only
         if not electrum_obj.IsPublicOnly():
             priv_key = electrum_obj.MasterPrivateKey()
-            self._Set(HdWalletElectrumV2KeyTypes.EX_PRIV, priv_key.ToExtended())
-            self._Set(HdWalletElectrumV2KeyTypes.RAW_PRIV, priv_key.Raw().ToHex())
-            self._Set(HdWalletElectrumV2KeyTypes.WIF_PRIV, HdWalletElectrumV1KeyUtils.PrivToWif(priv_key))
+            self._SetKey(HdWalletElectrumV2KeyTypes.EX_PRIV, priv_key.ToExtended)
+            self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PRIV, lambda: priv_key.Raw().ToBytes())
+            self._SetKey(HdWalletElectrumV2KeyTypes.WIF_PRIV, lambda: HdWalletElectrumV1KeyUtils.PrivToWif(priv_key))
 
 
 class HdWalletElectrumV2DerivedKeys(HdWalletKeysBase):
@@ -99,7 +151,8 @@ class HdWalletElectrumV2DerivedKeys(HdWalletKeysBase):
                  electrum_obj: ElectrumV2Base,
                  change_idx: int,
                  addr_num: int,
-                 addr_off: int) -> None:
+                 addr_off: int,
+                 key_types: Optional[Set[HdWalletElectrumV2KeyTypes]] = None) -> None:
         """
         Construct class.
 
@@ -108,8 +161,9 @@ class HdWalletElectrumV2DerivedKeys(HdWalletKeysBase):
             change_idx (int)                    : Change index
             addr_num (int)                      : Address number
             addr_off (int)                      : Starting address index
+            key_types (set, optional)           : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletElectrumV2KeyTypes)
+        super().__init__(HdWalletElectrumV2KeyTypes, key_types=key_types)
         self.__FromElectrumObj(electrum_obj, change_idx, addr_num, addr_off)
 
     def __FromElectrumObj(self,
@@ -128,17 +182,23 @@ class HdWalletElectrumV2DerivedKeys(HdWalletKeysBase):
         """
         addr_idx = addr_num + addr_off
 
+        # Derive the key pair only once, all keys are computed from it
+        if electrum_obj.IsPublicOnly():
+            pub_key = electrum_obj.GetPublicKey(change_idx, addr_idx)
+        else:
+            priv_key = electrum_obj.GetPrivateKey(change_idx, addr_idx)
+            pub_key = priv_key.PublicKey()
+
         # Add public key
-        pub_key = electrum_obj.GetPublicKey(change_idx, addr_idx)
-        self._Set(HdWalletElectrumV2KeyTypes.EX_PUB, pub_key.ToExtended())
-        self._Set(HdWalletElectrumV2KeyTypes.RAW_PUB, pub_key.RawUncompressed().ToHex()[2:])
+        self._SetKey(HdWalletElectrumV2KeyTypes.EX_PUB, pub_key.ToExtended)
+        self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PUB, lambda: pub_key.RawUncompressed().ToBytes()[1:])
 
         # Add private key only if Electrum object is not public-only
         if not electrum_obj.IsPublicOnly():
-            priv_key = electrum_obj.GetPrivateKey(change_idx, addr_idx)
-            self._Set(HdWalletElectrumV2KeyTypes.EX_PRIV, priv_key.ToExtended())
-            self._Set(HdWalletElectrumV2KeyTypes.RAW_PRIV, priv_key.Raw().ToHex())
-            self._Set(HdWalletElectrumV2KeyTypes.WIF_PRIV, HdWalletElectrumV1KeyUtils.PrivToWif(priv_key))
+            self._SetKey(HdWalletElectrumV2KeyTypes.EX_PRIV, priv_key.ToExtended)
+            self._SetKey(HdWalletElectrumV2KeyTypes.RAW_PRIV, lambda: priv_key.Raw().ToBytes())
+            self._SetKey(HdWalletElectrumV2KeyTypes.WIF_PRIV, lambda: HdWalletElectrumV1KeyUtils.PrivToWif(priv_key))
 
         # Address
-        self._Set(HdWalletElectrumV2KeyTypes.ADDRESS, electrum_obj.GetAddress(change_idx, addr_idx))
+        self._SetKey(HdWalletElectrumV2KeyTypes.ADDRESS,
+                     lambda: HdWalletElectrumV1KeyUtils.PubToAddress(electrum_obj, change_idx, addr_idx, pub_key))
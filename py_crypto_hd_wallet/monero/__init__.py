@@ -9,3 +9,5 @@ from py_crypto_hd_wallet.monero.hd_wallet_monero_enum import (
 from py_crypto_hd_wallet.monero.hd_wallet_monero_factory import HdWalletMoneroFactory
 from py_crypto_hd_wallet.monero.hd_wallet_monero_keys import HdWalletMoneroKeys
 from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr import HdWalletMoneroSubaddresses
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_batch import HdWalletMoneroSubaddressBatch
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_grid import HdWalletMoneroSubaddressGrid
@@ -21,16 +21,26 @@
 """Module for generating Monero wallets."""
 
 # Imports
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Tuple
 
 from bip_utils import Monero
 from bip_utils.monero.monero_subaddr import MoneroSubaddressConst
 
-from py_crypto_hd_wallet.common import HdWalletBase
-from py_crypto_hd_wallet.monero.hd_wallet_monero_enum import HdWalletMoneroDataTypes
+from py_crypto_hd_wallet.common import (
+    HdWalletAsync,
+    HdWalletBase,
+    HdWalletCoinInfo,
+    HdWalletReverseIndex,
+    HdWalletWorkers,
+)
+from py_crypto_hd_wallet.common.hd_wallet_async import HdWalletAsyncConst
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndexConst
+from py_crypto_hd_wallet.monero.hd_wallet_monero_enum import HdWalletMoneroDataTypes, HdWalletMoneroKeyTypes
 from py_crypto_hd_wallet.monero.hd_wallet_monero_keys import HdWalletMoneroKeys
 from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr import HdWalletMoneroSubaddresses
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_batch import HdWalletMoneroSubaddressBatch
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_grid import HdWalletMoneroSubaddressGrid
 
 
 class HdWalletMonero(HdWalletBase):
@@ -40,6 +50,7 @@ class HdWalletMonero(HdWalletBase):
     """
 
     m_monero_obj: Monero
+    m_coin_info: HdWalletCoinInfo
 
     #
     # Public methods
@@ -49,18 +60,23 @@ class HdWalletMonero(HdWalletBase):
                  wallet_name: str,
                  monero_obj: Monero,
                  mnemonic: str = "",
-                 seed_bytes: bytes = b"") -> None:
+                 seed_bytes: bytes = b"",
+                 *,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            wallet_name (str)           : Wallet name
-            monero_obj (Monero object)  : Monero object
-            mnemonic (str, optional)    : Mnemonic, empty if not specified
-            seed_bytes (bytes, optional): Seed_bytes, empty if not specified
+            wallet_name (str)                            : Wallet name
+            monero_obj (Monero object)                   : Monero object
+            mnemonic (str, optional)                     : Mnemonic, empty if not specified
+            seed_bytes (bytes, optional)                 : Seed_bytes, empty if not specified
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved by the factory, None for
+                                                           resolving it from monero_obj (default)
         """
         super().__init__(HdWalletMoneroDataTypes)
         self.m_monero_obj = monero_obj
+        self.m_coin_info = coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(monero_obj.CoinConf())
         # Initialize data
         self.__InitData(wallet_name, mnemonic, seed_bytes)
 
@@ -73,10 +89,16 @@ class HdWalletMonero(HdWalletBase):
             acc_idx (int, optional): Account index (default: 0)
             subaddr_num (int, optional): Subaddress number (default: 0)
             subaddr_off (int, optional): Starting subaddress index (default: 0)
+            fields (set, optional)     : HdWalletMoneroDataTypes and HdWalletMoneroKeyTypes to be generated
+                                         (default: all)
+            workers (int, optional)    : Number of worker processes for computing subaddresses
+                                         (default: None, i.e. current process only)
         """
         acc_idx = kwargs.get("acc_idx", 0)
         subaddr_num = kwargs.get("subaddr_num", 0)
         subaddr_off = kwargs.get("subaddr_off", 0)
+        data_types, key_types = self._SplitFields(kwargs.get("fields", None), HdWalletMoneroKeyTypes)
+        workers = kwargs.get("workers", None)
 
         # Check parameters
         if acc_idx < 0 or acc_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
@@ -85,20 +107,193 @@ class HdWalletMonero(HdWalletBase):
             raise ValueError("Subaddress number shall be greater or equal to zero and less than 2^32")
         if subaddr_off < 0 or ((subaddr_off + subaddr_num) > MoneroSubaddressConst.SUBADDR_MAX_IDX):
             raise ValueError("Subaddress offset shall be greater or equal to zero and less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
 
         # Set keys
-        self._Set(HdWalletMoneroDataTypes.KEY, HdWalletMoneroKeys(self.m_monero_obj))
+        self._SetIfSelected(HdWalletMoneroDataTypes.KEY, data_types,
+                            HdWalletMoneroKeys, self.m_monero_obj, key_types)
 
         if subaddr_num > 0:
             # Set subaddresses data
             self._Set(HdWalletMoneroDataTypes.ACCOUNT_IDX, acc_idx)
             self._Set(HdWalletMoneroDataTypes.SUBADDRESS_OFF, subaddr_off)
             # Set subaddresses
-            self._Set(HdWalletMoneroDataTypes.SUBADDRESS,
-                      HdWalletMoneroSubaddresses(self.m_monero_obj,
-                                                 acc_idx,
-                                                 subaddr_num,
-                                                 subaddr_off))
+            self._SetIfSelected(HdWalletMoneroDataTypes.SUBADDRESS, data_types,
+                                HdWalletMoneroSubaddresses, self.m_monero_obj, acc_idx, subaddr_num, subaddr_off,
+                                workers=workers, rev_index=self.m_rev_index)
+
+    def GenerateSubaddressGrid(self,
+                               acc_num: int,
+                               subaddr_num: int,
+                               acc_off: int = 0,
+                               subaddr_off: int = 0,
+                               *,
+                               workers: Optional[int] = None) -> None:
+        """
+        Generate the subaddresses of multiple accounts, i.e. of an account index range times a subaddress index range.
+        Subaddresses are stored by (account index, subaddress index) in a HdWalletMoneroSubaddressGrid object.
+
+        Args:
+            acc_num (int)              : Account number
+            subaddr_num (int)          : Subaddress number for each account
+            acc_off (int, optional)    : Starting account index (default: 0)
+            subaddr_off (int, optional): Starting subaddress index (default: 0)
+            workers (int, optional)    : Number of worker processes for computing subaddresses
+                                         (default: None, i.e. current process only)
+
+        Raises:
+            ValueError: If the account or subaddress index range is not valid
+        """
+        self.__CheckGridParams(acc_num, acc_off, subaddr_num, subaddr_off)
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        self._Set(HdWalletMoneroDataTypes.SUBADDRESS_GRID,
+                  HdWalletMoneroSubaddressGrid(self.m_monero_obj, acc_num, acc_off, subaddr_num, subaddr_off,
+                                               workers=workers, rev_index=self.m_rev_index))
+
+    def IterSubaddressGrid(self,
+                           acc_num: int,
+                           subaddr_num: int,
+                           acc_off: int = 0,
+                           subaddr_off: int = 0,
+                           *,
+                           workers: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over the subaddresses of multiple accounts, account by account.
+        Differently from GenerateSubaddressGrid, subaddresses are not stored in the wallet.
+
+        Args:
+            acc_num (int)              : Account number
+            subaddr_num (int)          : Subaddress number for each account
+            acc_off (int, optional)    : Starting account index (default: 0)
+            subaddr_off (int, optional): Starting subaddress index (default: 0)
+            workers (int, optional)    : Number of worker processes for computing subaddresses
+                                         (default: None, i.e. current process only)
+
+        Returns:
+            Iterator object: Iterator over (account index, subaddress index, subaddress) tuples
+
+        Raises:
+            ValueError: If the account or subaddress index range is not valid
+        """
+        self.__CheckGridParams(acc_num, acc_off, subaddr_num, subaddr_off)
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        return HdWalletMoneroSubaddressGrid.Iter(self.m_monero_obj, acc_num, acc_off, subaddr_num, subaddr_off,
+                                                 workers=workers)
+
+    def BuildSpendKeyIndex(self,
+                           acc_idxs: Iterable[int] = (0,),
+                           subaddr_num: int = 200,
+                           subaddr_off: int = 0,
+                           *,
+                           rev_index: Optional[HdWalletReverseIndex] = None) -> HdWalletReverseIndex:
+        """
+        Build a lookup table from the public spend key of each subaddress of the specified accounts to its indexes,
+        i.e. the table needed for recognizing the incoming outputs when scanning with the private view key.
+        Only the public spend keys are computed, so it can be built from a watch-only wallet.
+        Entries are added to a reverse index, so the table can be saved and loaded (also with memory mapping) and
+        it can be extended with new accounts by passing it again.
+
+        Args:
+            acc_idxs (iterable, optional)                    : Account indexes (default: only account 0)
+            subaddr_num (int, optional)                      : Subaddress number for each account (default: 200)
+            subaddr_off (int, optional)                      : Starting subaddress index (default: 0)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which entries are added, None for
+                                                               creating a new one (default)
+
+        Returns:
+            HdWalletReverseIndex object: HdWalletReverseIndex object, where each 32-byte public spend key is mapped
+                                         to (account index, None, subaddress index)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        acc_idxs = list(acc_idxs)
+
+        # Check parameters
+        if len(acc_idxs) == 0:
+            raise ValueError("At least one account index shall be specified")
+        for acc_idx in acc_idxs:
+            if acc_idx < 0 or acc_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+                raise ValueError("Account index shall be greater or equal to zero and less than 2^32")
+        if subaddr_num <= 0 or subaddr_num > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError("Subaddress number shall be greater than zero and less than 2^32")
+        if subaddr_off < 0 or ((subaddr_off + subaddr_num) > MoneroSubaddressConst.SUBADDR_MAX_IDX):
+            raise ValueError("Subaddress offset shall be greater or equal to zero and less than 2^32")
+
+        # Size the table for all the entries, so that it is not grown while adding them
+        if rev_index is None:
+            rev_index = HdWalletReverseIndex(len(acc_idxs) * subaddr_num * HdWalletReverseIndexConst.MAX_LOAD_DEN
+                                             // HdWalletReverseIndexConst.MAX_LOAD_NUM + 1)
+
+        subaddr_batch = HdWalletMoneroSubaddressBatch(self.m_monero_obj)
+        for acc_idx in acc_idxs:
+            for subaddr_idx, pub_skey_bytes in enumerate(subaddr_batch.IterSpendKeys(acc_idx, subaddr_num, subaddr_off),
+                                                         subaddr_off):
+                rev_index.Add(pub_skey_bytes, acc_idx, None, subaddr_idx)
+
+        return rev_index
+
+    def IterSubaddresses(self,
+                         acc_idx: int = 0,
+                         start: int = 0,
+                         stop: Optional[int] = None,
+                         *,
+                         workers: Optional[int] = None) -> Iterator[str]:
+        """
+        Iterate over the subaddresses in the specified index range.
+        Differently from Generate, subaddresses are computed one at a time and not stored in the wallet,
+        so memory usage does not depend on the range size.
+
+        Args:
+            acc_idx (int, optional): Account index (default: 0)
+            start (int, optional)  : Starting subaddress index (default: 0)
+            stop (int, optional)   : Ending subaddress index, excluded (default: 2^32 - 1)
+            workers (int, optional): Number of worker processes for computing subaddresses
+                                     (default: None, i.e. current process only)
+
+        Returns:
+            Iterator object: Iterator over the subaddresses
+
+        Raises:
+            ValueError: If the account index or the subaddress index range is not valid
+        """
+        stop = MoneroSubaddressConst.SUBADDR_MAX_IDX if stop is None else stop
+
+        # Check parameters
+        if acc_idx < 0 or acc_idx > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError("Account index shall be greater or equal to zero and less than 2^32")
+        if start < 0 or start > stop:
+            raise ValueError("Starting subaddress index shall be greater or equal to zero and less than the ending one")
+        if stop > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError("Ending subaddress index shall be less than 2^32")
+        HdWalletWorkers.CheckWorkersNum(workers)
+
+        return HdWalletMoneroSubaddresses.Iter(self.m_monero_obj, acc_idx, stop - start, start, workers=workers)
+
+    def IterSubaddressesAsync(self,
+                              *args: Any,
+                              chunk_size: int = HdWalletAsyncConst.DEF_CHUNK_SIZE,
+                              executor: Optional[ThreadPoolExecutor] = None,
+                              **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Iterate asynchronously over the subaddresses in the specified index range.
+        The subaddresses are derived in the executor in chunks and control is given back to the event loop after each
+        chunk, so that the iteration does not block it and it can be cancelled between chunks.
+        Parameters are checked as in IterSubaddresses.
+
+        Args:
+            *args                                  : Arguments of IterSubaddresses
+            chunk_size (int, optional)             : Number of subaddresses derived for each chunk (default: 32)
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+            **kwargs                               : Keyword arguments of IterSubaddresses
+
+        Returns:
+            AsyncIterator object: Asynchronous iterator over the subaddresses
+        """
+        return HdWalletAsync.Iter(self.IterSubaddresses, *args, chunk_size=chunk_size, executor=executor, **kwargs)
 
     def IsWatchOnly(self) -> bool:
         """
@@ -113,6 +308,32 @@ class HdWalletMonero(HdWalletBase):
     # Private methods
     #
 
+    @staticmethod
+    def __CheckGridParams(acc_num: int,
+                          acc_off: int,
+                          subaddr_num: int,
+                          subaddr_off: int) -> None:
+        """
+        Check the parameters of a subaddress grid.
+
+        Args:
+            acc_num (int)    : Account number
+            acc_off (int)    : Starting account index
+            subaddr_num (int): Subaddress number for each account
+            subaddr_off (int): Starting subaddress index
+
+        Raises:
+            ValueError: If the account or subaddress index range is not valid
+        """
+        if acc_num < 0 or acc_num > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError("Account number shall be greater or equal to zero and less than 2^32")
+        if acc_off < 0 or ((acc_off + acc_num) > MoneroSubaddressConst.SUBADDR_MAX_IDX):
+            raise ValueError("Account offset shall be greater or equal to zero and less than 2^32")
+        if subaddr_num < 0 or subaddr_num > MoneroSubaddressConst.SUBADDR_MAX_IDX:
+            raise ValueError("Subaddress number shall be greater or equal to zero and less than 2^32")
+        if subaddr_off < 0 or ((subaddr_off + subaddr_num) > MoneroSubaddressConst.SUBADDR_MAX_IDX):
+            raise ValueError("Subaddress offset shall be greater or equal to zero and less than 2^32")
+
     def __InitData(self,
                    wallet_name: str,
                    mnemonic: str,
@@ -129,11 +350,10 @@ class HdWalletMonero(HdWalletBase):
         # Set wallet name
         self._Set(HdWalletMoneroDataTypes.WALLET_NAME, wallet_name)
         # Set coin name
-        coin_names = self.m_monero_obj.CoinConf().CoinNames()
-        self._Set(HdWalletMoneroDataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletMoneroDataTypes.COIN_NAME, self.m_coin_info.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletMoneroDataTypes.MNEMONIC, mnemonic)
         if seed_bytes != b"":
-            self._Set(HdWalletMoneroDataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletMoneroDataTypes.SEED_BYTES, seed_bytes)
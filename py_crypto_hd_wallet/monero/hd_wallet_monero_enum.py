@@ -48,6 +48,7 @@ class HdWalletMoneroDataTypes(HdWalletDataTypes):
     ACCOUNT_IDX = auto()
     SUBADDRESS_OFF = auto()
     SUBADDRESS = auto()
+    SUBADDRESS_GRID = auto()
 
 
 @unique
@@ -21,6 +21,9 @@
 """Module for creating Monero wallet factories."""
 
 # Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
 from bip_utils import (
     MnemonicChecksumError,
     Monero,
@@ -29,8 +32,9 @@ from bip_utils import (
     MoneroMnemonicGenerator,
     MoneroSeedGenerator,
 )
+from bip_utils.monero.conf import MoneroConfGetter
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletCoinInfo, HdWalletWorkers
 from py_crypto_hd_wallet.monero.hd_wallet_monero import HdWalletMonero
 from py_crypto_hd_wallet.monero.hd_wallet_monero_enum import (
     HdWalletMoneroCoins,
@@ -40,6 +44,25 @@ from py_crypto_hd_wallet.monero.hd_wallet_monero_enum import (
 from py_crypto_hd_wallet.utils import Utils
 
 
+def _GenerateSeed(mnemonic: str) -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic (str): Mnemonic
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        return MoneroSeedGenerator(mnemonic).Generate()
+    except (ValueError, MnemonicChecksumError) as ex:
+        raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+
+
 class HdWalletMoneroFactory:
     """
     HD wallet Monero factory class.
@@ -47,6 +70,7 @@ class HdWalletMoneroFactory:
     """
 
     m_monero_coin: HdWalletMoneroCoins
+    m_coin_info: HdWalletCoinInfo
 
     def __init__(self,
                  coin_type: HdWalletMoneroCoins = HdWalletMoneroCoins.MONERO_MAINNET) -> None:
@@ -63,6 +87,7 @@ class HdWalletMoneroFactory:
             raise TypeError("Coin type is not an enumerative of HdWalletMoneroCoins")
 
         self.m_monero_coin = coin_type
+        self.m_coin_info = HdWalletCoinInfo.FromConf(MoneroConfGetter.GetConfig(coin_type))
 
     def CreateRandom(self,
                      wallet_name: str,
@@ -107,16 +132,54 @@ class HdWalletMoneroFactory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        try:
-            seed_bytes = MoneroSeedGenerator(mnemonic).Generate()
-        except (ValueError, MnemonicChecksumError) as ex:
-            raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+        seed_bytes = _GenerateSeed(mnemonic)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
 
-        monero_obj = Monero.FromSeed(seed_bytes, self.m_monero_coin)
-        return HdWalletMonero(wallet_name=wallet_name,
-                              monero_obj=monero_obj,
-                              mnemonic=mnemonic,
-                              seed_bytes=seed_bytes)
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed, mnemonics, lambda item: item[1:], workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -138,7 +201,8 @@ class HdWalletMoneroFactory:
         return HdWalletMonero(wallet_name=wallet_name,
                               monero_obj=monero_obj,
                               mnemonic=MoneroMnemonicEncoder().EncodeWithChecksum(seed_bytes).ToStr(),
-                              seed_bytes=seed_bytes)
+                              seed_bytes=seed_bytes,
+                              coin_info=self.m_coin_info)
 
     def CreateFromPrivateKey(self,
                              wallet_name: str,
@@ -164,7 +228,8 @@ class HdWalletMoneroFactory:
         return HdWalletMonero(wallet_name=wallet_name,
                               seed_bytes=priv_skey_bytes,
                               mnemonic=MoneroMnemonicEncoder().EncodeWithChecksum(priv_skey_bytes).ToStr(),
-                              monero_obj=monero_obj)
+                              monero_obj=monero_obj,
+                              coin_info=self.m_coin_info)
 
     def CreateFromWatchOnly(self,
                             wallet_name: str,
@@ -190,4 +255,28 @@ class HdWalletMoneroFactory:
             raise ValueError("Invalid keys for watch-only wallet") from ex
 
         return HdWalletMonero(wallet_name=wallet_name,
-                              monero_obj=monero_obj)
+                              monero_obj=monero_obj,
+                              coin_info=self.m_coin_info)
+
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
+        """
+        Create wallet from mnemonic and the seed generated from it.
+
+        Args:
+            wallet_name (str) : Wallet name
+            mnemonic (str)    : Mnemonic
+            seed_bytes (bytes): Seed bytes
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+        """
+        monero_obj = Monero.FromSeed(seed_bytes, self.m_monero_coin)
+        return HdWalletMonero(wallet_name=wallet_name,
+                              monero_obj=monero_obj,
+                              mnemonic=mnemonic,
+                              seed_bytes=seed_bytes,
+                              coin_info=self.m_coin_info)
@@ -21,6 +21,8 @@
 """Module with helper class for storing Monero keys."""
 
 # Imports
+from typing import Optional, Set
+
 from bip_utils import Monero
 
 from py_crypto_hd_wallet.common import HdWalletKeysBase
@@ -35,14 +37,16 @@ class HdWalletMoneroKeys(HdWalletKeysBase):
     """
 
     def __init__(self,
-                 monero_obj: Monero) -> None:
+                 monero_obj: Monero,
+                 key_types: Optional[Set[HdWalletMoneroKeyTypes]] = None) -> None:
         """
         Construct class.
 
         Args:
             monero_obj (Monero object): Monero object
+            key_types (set, optional) : Key types to be computed, None for all (default)
         """
-        super().__init__(HdWalletMoneroKeyTypes)
+        super().__init__(HdWalletMoneroKeyTypes, key_types=key_types)
         self.__FromMoneroObj(monero_obj)
 
     def __FromMoneroObj(self,
@@ -55,14 +59,14 @@ class HdWalletMoneroKeys(HdWalletKeysBase):
         """
 
         # Add public keys
-        self._Set(HdWalletMoneroKeyTypes.PUB_SPEND, monero_obj.PublicSpendKey().RawCompressed().ToHex())
-        self._Set(HdWalletMoneroKeyTypes.PUB_VIEW, monero_obj.PublicViewKey().RawCompressed().ToHex())
+        self._SetKey(HdWalletMoneroKeyTypes.PUB_SPEND, lambda: monero_obj.PublicSpendKey().RawCompressed().ToBytes())
+        self._SetKey(HdWalletMoneroKeyTypes.PUB_VIEW, lambda: monero_obj.PublicViewKey().RawCompressed().ToBytes())
         # Add private view key
-        self._Set(HdWalletMoneroKeyTypes.PRIV_VIEW, monero_obj.PrivateViewKey().Raw().ToHex())
+        self._SetKey(HdWalletMoneroKeyTypes.PRIV_VIEW, lambda: monero_obj.PrivateViewKey().Raw().ToBytes())
 
         # Add private spend key only if not watch-only
         if not monero_obj.IsWatchOnly():
-            self._Set(HdWalletMoneroKeyTypes.PRIV_SPEND, monero_obj.PrivateSpendKey().Raw().ToHex())
+            self._SetKey(HdWalletMoneroKeyTypes.PRIV_SPEND, lambda: monero_obj.PrivateSpendKey().Raw().ToBytes())
 
         # Add address
-        self._Set(HdWalletMoneroKeyTypes.PRIMARY_ADDRESS, monero_obj.PrimaryAddress())
+        self._SetKey(HdWalletMoneroKeyTypes.PRIMARY_ADDRESS, monero_obj.PrimaryAddress)
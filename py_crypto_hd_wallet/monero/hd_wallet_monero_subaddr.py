@@ -21,9 +21,15 @@
 """Module with helper class for storing Monero subaddresses."""
 
 # Imports
-from bip_utils import Monero
+from typing import Iterator, List, Optional, Tuple
+
+from bip_utils import Monero, MoneroCoins
+from bip_utils.monero.conf import MoneroConfGetter
 
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_batch import HdWalletMoneroSubaddressBatch
 
 
 class HdWalletMoneroSubaddressesConst:
@@ -44,33 +50,83 @@ class HdWalletMoneroSubaddresses(HdWalletAddrBase):
                  monero_obj: Monero,
                  acc_idx: int,
                  subaddr_num: int,
-                 subaddr_off: int) -> None:
+                 subaddr_off: int,
+                 *,
+                 workers: Optional[int] = None,
+                 rev_index: Optional[HdWalletReverseIndex] = None) -> None:
         """
         Construct class.
 
         Args:
-            monero_obj (Monero object): Monero object
-            acc_idx (int)             : Account index
-            subaddr_num (int)         : Subaddress number
-            subaddr_off (int)         : Starting subaddress index
+            monero_obj (Monero object)                       : Monero object
+            acc_idx (int)                                    : Account index
+            subaddr_num (int)                                : Subaddress number
+            subaddr_off (int)                                : Starting subaddress index
+            workers (int, optional)                          : Number of worker processes, None for computing in the
+                                                               current process (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which subaddresses are added, None for
+                                                               no reverse index (default)
         """
-        super().__init__(subaddr_off, HdWalletMoneroSubaddressesConst.DICT_KEY_FORMAT)
-        self.__FromMoneroObj(monero_obj, acc_idx, subaddr_num, subaddr_off)
-
-    def __FromMoneroObj(self,
-                        monero_obj: Monero,
-                        acc_idx: int,
-                        subaddr_num: int,
-                        subaddr_off: int) -> None:
+        super().__init__(subaddr_off,
+                         HdWalletMoneroSubaddressesConst.DICT_KEY_FORMAT,
+                         rev_index=rev_index,
+                         acc_idx=acc_idx)
+        for subaddr in self.Iter(monero_obj, acc_idx, subaddr_num, subaddr_off, workers=workers):
+            self._AddAddr(subaddr)
+
+    @staticmethod
+    def Iter(monero_obj: Monero,
+             acc_idx: int,
+             subaddr_num: int,
+             subaddr_off: int,
+             *,
+             workers: Optional[int] = None) -> Iterator[str]:
         """
-        Create addresses from the specified Monero object.
+        Iterate over subaddresses computed from the specified Monero object, one at a time and without storing them.
+        Subaddresses are computed in batch by HdWalletMoneroSubaddressBatch, so the account data is computed once.
 
         Args:
             monero_obj (Monero object): Monero object
             acc_idx (int)             : Account index
             subaddr_num (int)         : Subaddress number
             subaddr_off (int)         : Starting subaddress index
+            workers (int, optional)   : Number of worker processes, None for computing in the current process (default)
+
+        Returns:
+            Iterator object: Iterator over the subaddresses
         """
-        for i in range(subaddr_num):
-            subaddr = monero_obj.Subaddress(i + subaddr_off, acc_idx)
-            self._AddAddr(subaddr)
+
+        # Only the private view key and the public spend key are sent to the workers
+        if workers is not None:
+            coin_type = next(coin_type for coin_type in MoneroCoins
+                             if MoneroConfGetter.GetConfig(coin_type) is monero_obj.CoinConf())
+            yield from HdWalletWorkers.Iter(_ComputeSubaddresses,
+                                            (monero_obj.PrivateViewKey().Raw().ToBytes(),
+                                             monero_obj.PublicSpendKey().RawCompressed().ToBytes(),
+                                             coin_type,
+                                             acc_idx),
+                                            subaddr_num,
+                                            subaddr_off,
+                                            workers)
+        else:
+            yield from HdWalletMoneroSubaddressBatch(monero_obj).Iter(acc_idx, subaddr_num, subaddr_off)
+
+
+def _ComputeSubaddresses(worker_args: Tuple[bytes, bytes, MoneroCoins, int],
+                         subaddr_num: int,
+                         subaddr_off: int) -> List[str]:
+    """
+    Compute subaddresses from the private view key and the public spend key
+    (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): Private view key bytes, public spend key bytes, coin type and account index
+        subaddr_num (int)  : Subaddress number
+        subaddr_off (int)  : Starting subaddress index
+
+    Returns:
+        list[str]: Subaddresses
+    """
+    priv_vkey, pub_skey, coin_type, acc_idx = worker_args
+    monero_obj = Monero.FromWatchOnly(priv_vkey, pub_skey, coin_type)
+    return list(HdWalletMoneroSubaddresses.Iter(monero_obj, acc_idx, subaddr_num, subaddr_off))
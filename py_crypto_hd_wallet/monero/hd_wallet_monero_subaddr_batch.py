@@ -0,0 +1,298 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for computing Monero subaddresses in batch."""
+
+# Imports
+from typing import Iterator, Optional, Tuple
+
+from bip_utils import Base58XmrEncoder, Ed25519Monero, Monero
+from bip_utils.ecc.ed25519.lib import ed25519_lib
+from bip_utils.utils.crypto import Kekkak256
+
+
+class HdWalletMoneroSubaddressBatchConst:
+    """Class container for HD wallet Monero subaddress batch constants."""
+
+    # Subaddress prefix
+    SUBADDR_PREFIX: bytes = b"SubAddr\x00"
+    # Subaddress maximum index
+    SUBADDR_MAX_IDX: int = 2**32 - 1
+    # Subaddress index length in byte
+    SUBADDR_IDX_BYTE_LEN: int = 4
+    # Scalar length in byte
+    SCALAR_BYTE_LEN: int = 32
+    # Address checksum length in byte
+    CHECKSUM_BYTE_LEN: int = 4
+    # Curve order
+    CURVE_ORDER: int = Ed25519Monero.Order()
+
+
+class _Ed25519Points:
+    """
+    Ed25519 points class.
+    It wraps the point operations of the ed25519 library of bip_utils, which is not part of its public interface,
+    so that it is the only place to be adapted if the library changes.
+    Points are compressed points bytes, scalars are integers already reduced modulo the curve order.
+    """
+
+    @staticmethod
+    def Add(point_1_bytes: bytes,
+            point_2_bytes: bytes) -> bytes:
+        """
+        Add two points.
+
+        Args:
+            point_1_bytes (bytes): First point bytes
+            point_2_bytes (bytes): Second point bytes
+
+        Returns:
+            bytes: Sum point bytes
+        """
+        return ed25519_lib.point_add(point_1_bytes, point_2_bytes)
+
+    @staticmethod
+    def ScalarMul(scalar: int,
+                  point_bytes: bytes) -> bytes:
+        """
+        Multiply a point by a scalar.
+
+        Args:
+            scalar (int)      : Scalar
+            point_bytes (bytes): Point bytes
+
+        Returns:
+            bytes: Product point bytes
+        """
+        return ed25519_lib.point_scalar_mul(
+            scalar.to_bytes(HdWalletMoneroSubaddressBatchConst.SCALAR_BYTE_LEN, "little"), point_bytes
+        )
+
+    @staticmethod
+    def ScalarMulBase(scalar: int) -> bytes:
+        """
+        Multiply the generator by a scalar.
+
+        Args:
+            scalar (int): Scalar
+
+        Returns:
+            bytes: Product point bytes
+        """
+        return ed25519_lib.point_scalar_mul_base(
+            scalar.to_bytes(HdWalletMoneroSubaddressBatchConst.SCALAR_BYTE_LEN, "little")
+        )
+
+
+class HdWalletMoneroSubaddressBatch:
+    """
+    HD wallet Monero subaddress batch class.
+    It computes subaddresses of a Monero object in batch, giving the same result of Monero.Subaddress.
+
+    For each subaddress, with a the private view key, B the generator and K_s the public spend key:
+    m = Keccak256("SubAddr" + a + major_idx + minor_idx) mod l, D = K_s + m*B and C = a*D.
+    The values that do not depend on the subaddress (a*K_s) or on the minor index (the hash prefix) are computed once,
+    and C is computed as a*K_s + (a*m mod l)*B, so both public keys only require a fixed-base multiplication.
+    """
+
+    m_monero_obj: Monero
+    m_priv_vkey_bytes: bytes
+    m_priv_vkey_int: int
+    m_pub_skey_bytes: bytes
+    m_pub_vkey_base_bytes: bytes
+    m_net_ver: bytes
+
+    def __init__(self,
+                 monero_obj: Monero) -> None:
+        """
+        Construct class.
+
+        Args:
+            monero_obj (Monero object): Monero object
+        """
+        self.m_monero_obj = monero_obj
+        self.m_priv_vkey_bytes = monero_obj.PrivateViewKey().Raw().ToBytes()
+        self.m_priv_vkey_int = int.from_bytes(self.m_priv_vkey_bytes, "little")
+        self.m_pub_skey_bytes = monero_obj.PublicSpendKey().RawCompressed().ToBytes()
+        # a*K_s
+        self.m_pub_vkey_base_bytes = _Ed25519Points.ScalarMul(self.m_priv_vkey_int, self.m_pub_skey_bytes)
+        self.m_net_ver = monero_obj.CoinConf().SubaddrNetVersion()
+
+    def Iter(self,
+             acc_idx: int,
+             subaddr_num: int,
+             subaddr_off: int) -> Iterator[str]:
+        """
+        Iterate over the subaddresses of the specified account, one at a time and without storing them.
+
+        Args:
+            acc_idx (int)    : Account index
+            subaddr_num (int): Subaddress number
+            subaddr_off (int): Starting subaddress index
+
+        Returns:
+            Iterator object: Iterator over the subaddresses
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        for subaddr_idx, (pub_skey_bytes, pub_vkey_bytes) in enumerate(self.IterKeys(acc_idx, subaddr_num, subaddr_off),
+                                                                       subaddr_off):
+            # Subaddress 0,0 is the primary address, which is encoded with a different net version
+            yield (self.m_monero_obj.PrimaryAddress()
+                   if subaddr_idx == 0 and acc_idx == 0
+                   else self.EncodeKeys(pub_skey_bytes, pub_vkey_bytes))
+
+    def IterKeys(self,
+                 acc_idx: int,
+                 subaddr_num: int,
+                 subaddr_off: int) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterate over the public keys of the subaddresses of the specified account.
+
+        Args:
+            acc_idx (int)    : Account index
+            subaddr_num (int): Subaddress number
+            subaddr_off (int): Starting subaddress index
+
+        Returns:
+            Iterator object: Iterator over (public spend key bytes, public view key bytes) tuples
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        for m_int in self.__IterScalars(acc_idx, subaddr_num, subaddr_off):
+            # Subaddress 0,0 has the primary keys
+            if m_int is None:
+                yield (self.m_pub_skey_bytes,
+                       self.m_monero_obj.PublicViewKey().RawCompressed().ToBytes())
+                continue
+
+            # D = K_s + m*B
+            pub_skey_bytes = _Ed25519Points.Add(self.m_pub_skey_bytes, _Ed25519Points.ScalarMulBase(m_int))
+            # C = a*D = a*K_s + (a*m)*B
+            pub_vkey_bytes = _Ed25519Points.Add(
+                self.m_pub_vkey_base_bytes,
+                _Ed25519Points.ScalarMulBase(
+                    self.m_priv_vkey_int * m_int % HdWalletMoneroSubaddressBatchConst.CURVE_ORDER
+                )
+            )
+            yield pub_skey_bytes, pub_vkey_bytes
+
+    def IterSpendKeys(self,
+                      acc_idx: int,
+                      subaddr_num: int,
+                      subaddr_off: int) -> Iterator[bytes]:
+        """
+        Iterate over the public spend keys of the subaddresses of the specified account.
+        The public view keys are not computed, so it is about twice as fast as IterKeys.
+
+        Args:
+            acc_idx (int)    : Account index
+            subaddr_num (int): Subaddress number
+            subaddr_off (int): Starting subaddress index
+
+        Returns:
+            Iterator object: Iterator over the public spend key bytes
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        for m_int in self.__IterScalars(acc_idx, subaddr_num, subaddr_off):
+            # D = K_s + m*B (K_s for subaddress 0,0)
+            yield (self.m_pub_skey_bytes
+                   if m_int is None
+                   else _Ed25519Points.Add(self.m_pub_skey_bytes, _Ed25519Points.ScalarMulBase(m_int)))
+
+    def EncodeKeys(self,
+                   pub_skey_bytes: bytes,
+                   pub_vkey_bytes: bytes) -> str:
+        """
+        Encode the public keys of a subaddress, without validating them since they were computed by the class.
+
+        Args:
+            pub_skey_bytes (bytes): Public spend key bytes
+            pub_vkey_bytes (bytes): Public view key bytes
+
+        Returns:
+            str: Subaddress string
+        """
+        payload_bytes = self.m_net_ver + pub_skey_bytes + pub_vkey_bytes
+        return Base58XmrEncoder.Encode(
+            payload_bytes + Kekkak256.QuickDigest(payload_bytes)[:HdWalletMoneroSubaddressBatchConst.CHECKSUM_BYTE_LEN]
+        )
+
+    def __IterScalars(self,
+                      acc_idx: int,
+                      subaddr_num: int,
+                      subaddr_off: int) -> Iterator[Optional[int]]:
+        """
+        Iterate over the scalars m of the subaddresses of the specified account.
+
+        Args:
+            acc_idx (int)    : Account index
+            subaddr_num (int): Subaddress number
+            subaddr_off (int): Starting subaddress index
+
+        Returns:
+            Iterator object: Iterator over the scalars, None for subaddress 0,0 (i.e. the primary keys)
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        self.__ValidateIndexes(acc_idx, subaddr_num, subaddr_off)
+
+        # Hash prefix, which only depends on the account
+        hash_prefix = (HdWalletMoneroSubaddressBatchConst.SUBADDR_PREFIX
+                       + self.m_priv_vkey_bytes
+                       + acc_idx.to_bytes(HdWalletMoneroSubaddressBatchConst.SUBADDR_IDX_BYTE_LEN, "little"))
+
+        curve_order = HdWalletMoneroSubaddressBatchConst.CURVE_ORDER
+        idx_byte_len = HdWalletMoneroSubaddressBatchConst.SUBADDR_IDX_BYTE_LEN
+        for subaddr_idx in range(subaddr_off, subaddr_off + subaddr_num):
+            if subaddr_idx == 0 and acc_idx == 0:
+                yield None
+            else:
+                yield int.from_bytes(
+                    Kekkak256.QuickDigest(hash_prefix + subaddr_idx.to_bytes(idx_byte_len, "little")), "little"
+                ) % curve_order
+
+    @staticmethod
+    def __ValidateIndexes(acc_idx: int,
+                          subaddr_num: int,
+                          subaddr_off: int) -> None:
+        """
+        Validate account and subaddress indexes.
+
+        Args:
+            acc_idx (int)    : Account index
+            subaddr_num (int): Subaddress number
+            subaddr_off (int): Starting subaddress index
+
+        Raises:
+            ValueError: If one of the indexes is not valid
+        """
+        max_idx = HdWalletMoneroSubaddressBatchConst.SUBADDR_MAX_IDX
+        if acc_idx < 0 or acc_idx > max_idx:
+            raise ValueError(f"Invalid major index ({acc_idx})")
+        if subaddr_off < 0:
+            raise ValueError(f"Invalid minor index ({subaddr_off})")
+        if subaddr_off + subaddr_num - 1 > max_idx:
+            raise ValueError(f"Invalid minor index ({subaddr_off + subaddr_num - 1})")
@@ -0,0 +1,278 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper class for storing Monero subaddresses of multiple accounts."""
+
+# Imports
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bip_utils import Monero, MoneroCoins
+from bip_utils.monero.conf import MoneroConfGetter
+
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
+from py_crypto_hd_wallet.common.hd_wallet_workers import HdWalletWorkers
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr import HdWalletMoneroSubaddressesConst
+from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr_batch import HdWalletMoneroSubaddressBatch
+
+
+class HdWalletMoneroSubaddressGridConst:
+    """Class container for HD wallet Monero subaddress grid constants."""
+
+    # Account key string format for dictionary
+    ACC_DICT_KEY_FORMAT: str = "account_{:d}"
+    # Maximum number of subaddresses of a tile (i.e. a part of an account row) computed by a worker
+    TILE_MAX_SIZE: int = 256
+
+
+class HdWalletMoneroSubaddressGrid:
+    """
+    HD wallet Monero subaddress grid class.
+    It creates the subaddresses of an account index range times a subaddress index range from a Monero object and
+    stores them by (major, minor) index, i.e. (account index, subaddress index).
+    Subaddresses can be got individually, as dictionary or in JSON format.
+    """
+
+    m_acc_off: int
+    m_subaddr_off: int
+    m_subaddr_num: int
+    m_rows: List[List[str]]
+
+    def __init__(self,
+                 monero_obj: Monero,
+                 acc_num: int,
+                 acc_off: int,
+                 subaddr_num: int,
+                 subaddr_off: int,
+                 *,
+                 workers: Optional[int] = None,
+                 rev_index: Optional[HdWalletReverseIndex] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            monero_obj (Monero object)                       : Monero object
+            acc_num (int)                                    : Account number
+            acc_off (int)                                    : Starting account index
+            subaddr_num (int)                                : Subaddress number for each account
+            subaddr_off (int)                                : Starting subaddress index
+            workers (int, optional)                          : Number of worker processes, None for computing in the
+                                                               current process (default)
+            rev_index (HdWalletReverseIndex object, optional): Reverse index to which subaddresses are added, None for
+                                                               no reverse index (default)
+        """
+        self.m_acc_off = acc_off
+        self.m_subaddr_off = subaddr_off
+        self.m_subaddr_num = subaddr_num
+        self.m_rows = [[] for _ in range(acc_num if subaddr_num > 0 else 0)]
+
+        for acc_idx, subaddr_idx, subaddr in self.Iter(monero_obj, acc_num, acc_off, subaddr_num, subaddr_off,
+                                                       workers=workers):
+            self.m_rows[acc_idx - acc_off].append(subaddr)
+            if rev_index is not None:
+                rev_index.Add(subaddr, acc_idx, None, subaddr_idx)
+
+    @staticmethod
+    def Iter(monero_obj: Monero,
+             acc_num: int,
+             acc_off: int,
+             subaddr_num: int,
+             subaddr_off: int,
+             *,
+             workers: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over the subaddresses of the grid, account by account, without storing them.
+        With worker processes, each account row is split into tiles that are computed in parallel.
+
+        Args:
+            monero_obj (Monero object): Monero object
+            acc_num (int)             : Account number
+            acc_off (int)             : Starting account index
+            subaddr_num (int)         : Subaddress number for each account
+            subaddr_off (int)         : Starting subaddress index
+            workers (int, optional)   : Number of worker processes, None for computing in the current process (default)
+
+        Returns:
+            Iterator object: Iterator over (account index, subaddress index, subaddress) tuples
+        """
+        if workers is None:
+            subaddr_batch = HdWalletMoneroSubaddressBatch(monero_obj)
+            for acc_idx in range(acc_off, acc_off + acc_num):
+                for subaddr_idx, subaddr in enumerate(subaddr_batch.Iter(acc_idx, subaddr_num, subaddr_off),
+                                                      subaddr_off):
+                    yield acc_idx, subaddr_idx, subaddr
+            return
+
+        # Only the private view key and the public spend key are sent to the workers
+        coin_type = next(coin_type for coin_type in MoneroCoins
+                         if MoneroConfGetter.GetConfig(coin_type) is monero_obj.CoinConf())
+        worker_args = (monero_obj.PrivateViewKey().Raw().ToBytes(),
+                       monero_obj.PublicSpendKey().RawCompressed().ToBytes(),
+                       coin_type)
+
+        tile_size = HdWalletMoneroSubaddressGridConst.TILE_MAX_SIZE
+        subaddr_end = subaddr_off + subaddr_num
+        tiles = ((acc_idx, min(tile_size, subaddr_end - tile_off), tile_off)
+                 for acc_idx in range(acc_off, acc_off + acc_num)
+                 for tile_off in range(subaddr_off, subaddr_end, tile_size))
+        for (acc_idx, _, tile_off), subaddrs in HdWalletWorkers.Map(_ComputeSubaddressTile,
+                                                                    tiles,
+                                                                    lambda tile: (worker_args, *tile),
+                                                                    workers):
+            for subaddr_idx, subaddr in enumerate(subaddrs, tile_off):
+                yield acc_idx, subaddr_idx, subaddr
+
+    def ToDict(self) -> Dict[str, Any]:
+        """
+        Get subaddresses as a dictionary, indexed by account and then by subaddress.
+
+        Returns:
+            dict: Subaddresses as a dictionary
+        """
+        return dict(self.IterDictItems())
+
+    def IterDictItems(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the accounts as dictionary items.
+        It allows the subaddresses to be serialized incrementally.
+
+        Returns:
+            Iterator object: Iterator over (dict key, account subaddresses dictionary) tuples
+        """
+        for acc_idx, row in enumerate(self.m_rows, self.m_acc_off):
+            yield (HdWalletMoneroSubaddressGridConst.ACC_DICT_KEY_FORMAT.format(acc_idx),
+                   {HdWalletMoneroSubaddressesConst.DICT_KEY_FORMAT.format(subaddr_idx): subaddr
+                    for subaddr_idx, subaddr in enumerate(row, self.m_subaddr_off)})
+
+    def ToJson(self,
+               json_indent: int = 4) -> str:
+        """
+        Get subaddresses as string in JSON format.
+
+        Args:
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Returns:
+            str: Subaddresses as string in JSON format
+        """
+        return json.dumps(self.ToDict(), indent=json_indent)
+
+    def Count(self) -> int:
+        """
+        Get the subaddresses count.
+
+        Returns:
+            int: Number of subaddresses
+        """
+        return len(self.m_rows) * self.m_subaddr_num
+
+    def AccountIndexes(self) -> range:
+        """
+        Get the account indexes.
+
+        Returns:
+            range: Account indexes
+        """
+        return range(self.m_acc_off, self.m_acc_off + len(self.m_rows))
+
+    def SubaddressIndexes(self) -> range:
+        """
+        Get the subaddress indexes of each account.
+
+        Returns:
+            range: Subaddress indexes
+        """
+        return range(self.m_subaddr_off, self.m_subaddr_off + (self.m_subaddr_num if self.m_rows else 0))
+
+    def Items(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over subaddresses together with their indexes, account by account.
+
+        Returns:
+            Iterator object: Iterator over (account index, subaddress index, subaddress) tuples
+        """
+        for acc_idx, row in enumerate(self.m_rows, self.m_acc_off):
+            for subaddr_idx, subaddr in enumerate(row, self.m_subaddr_off):
+                yield acc_idx, subaddr_idx, subaddr
+
+    def __contains__(self,
+                     idx: Tuple[int, int]) -> bool:
+        """
+        Get if the specified (account index, subaddress index) is in the grid.
+
+        Args:
+            idx (tuple[int, int]): Account index and subaddress index
+
+        Returns:
+            bool: True if existent, false otherwise
+        """
+        acc_idx, subaddr_idx = idx
+        return acc_idx in self.AccountIndexes() and subaddr_idx in self.SubaddressIndexes()
+
+    def __getitem__(self,
+                    idx: Tuple[int, int]) -> str:
+        """
+        Get the subaddress of the specified (account index, subaddress index).
+
+        Args:
+            idx (tuple[int, int]): Account index and subaddress index
+
+        Returns:
+            str: Subaddress
+
+        Raises:
+            KeyError: If the indexes are not in the grid
+        """
+        if idx not in self:
+            raise KeyError(idx)
+        acc_idx, subaddr_idx = idx
+        return self.m_rows[acc_idx - self.m_acc_off][subaddr_idx - self.m_subaddr_off]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Get the iterator to the current element.
+
+        Returns:
+            Iterator object: Iterator to the current element
+        """
+        for row in self.m_rows:
+            yield from row
+
+
+def _ComputeSubaddressTile(worker_args: Tuple[bytes, bytes, MoneroCoins],
+                           acc_idx: int,
+                           subaddr_num: int,
+                           subaddr_off: int) -> List[str]:
+    """
+    Compute a tile of subaddresses of an account from the private view key and the public spend key
+    (worker function, executed in a separate process).
+
+    Args:
+        worker_args (tuple): Private view key bytes, public spend key bytes and coin type
+        acc_idx (int)      : Account index
+        subaddr_num (int)  : Subaddress number
+        subaddr_off (int)  : Starting subaddress index
+
+    Returns:
+        list[str]: Subaddresses
+    """
+    priv_vkey, pub_skey, coin_type = worker_args
+    monero_obj = Monero.FromWatchOnly(priv_vkey, pub_skey, coin_type)
+    return list(HdWalletMoneroSubaddressBatch(monero_obj).Iter(acc_idx, subaddr_num, subaddr_off))
@@ -1 +1,10 @@
+from py_crypto_hd_wallet.saver.hd_wallet_addr_index import (
+    HdWalletAddrIndexReader,
+    HdWalletAddrIndexView,
+    HdWalletAddrIndexWriter,
+)
+from py_crypto_hd_wallet.saver.hd_wallet_columnar import HdWalletColumnarReader, HdWalletColumnarWriter
+from py_crypto_hd_wallet.saver.hd_wallet_json_writer import HdWalletJsonWriter
+from py_crypto_hd_wallet.saver.hd_wallet_ndjson_writer import HdWalletNdjsonWriter
 from py_crypto_hd_wallet.saver.hd_wallet_saver import HdWalletSaver
+from py_crypto_hd_wallet.saver.hd_wallet_writer_base import HdWalletWriterBase
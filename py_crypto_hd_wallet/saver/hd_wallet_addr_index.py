@@ -0,0 +1,601 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for saving addresses in a fixed-stride index file and reading them back.
+
+The file can be memory-mapped and each address is a record of the same size, so the address with a given
+derivation index is found in constant time. All integers are little-endian.
+
+    magic         : 8 bytes, "HDWIDX01"
+    header length : uint32
+    header        : UTF-8 JSON header describing the content
+    padding       : zero bytes up to a multiple of 8 bytes
+    records       : one record of "stride" bytes for each address, sorted by address index
+
+The header contains the format version, the number of records, the record size ("stride"), the index of the first
+address, the account and change indexes (null if not applicable) and a list of fields, each one with:
+
+    name   : field name (i.e. the key name, like "address" or "raw_compr_pub")
+    type   : "bytes" for raw keys, "str" for UTF-8 strings (e.g. addresses)
+    offset : field offset in the record
+    width  : maximum value length in bytes
+
+Each field occupies 1 + width bytes in the record: the value length (0 if the key is not present), followed by the
+value padded with zero bytes.
+
+Raw keys are read back as read-only memoryview objects of the mapped file, so they are never copied.
+"""
+
+# Imports
+import json
+import mmap
+import struct
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Type
+
+from py_crypto_hd_wallet.common import HdWalletAddrBase
+
+
+class HdWalletAddrIndexConst:
+    """Class container for HD wallet address index constants."""
+
+    # Magic bytes at the beginning of the file
+    MAGIC: bytes = b"HDWIDX01"
+    # Format version
+    VERSION: int = 1
+    # Alignment of records in bytes
+    ALIGNMENT: int = 8
+    # Struct format of header length
+    HEADER_LEN_FORMAT: str = "<I"
+    # Maximum length of a value in bytes
+    MAX_VALUE_LEN: int = 255
+    # Field name for addresses stored as strings
+    ADDRESS_FIELD: str = "address"
+    # Tag contained in the names of private key fields
+    PRIV_FIELD_TAG: str = "priv"
+    # Field types
+    TYPE_BYTES: str = "bytes"
+    TYPE_STR: str = "str"
+
+
+class HdWalletAddrIndexWriter:
+    """
+    HD wallet address index writer class.
+    It writes addresses to a binary file object in the fixed-stride format described in the module documentation.
+    Private keys are included only if requested.
+    """
+
+    m_file_obj: BinaryIO
+    m_include_priv: bool
+
+    def __init__(self,
+                 file_obj: BinaryIO,
+                 include_priv: bool = False) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_obj (file object)       : File object opened in binary mode
+            include_priv (bool, optional): True for including private keys, false otherwise (default)
+        """
+        self.m_file_obj = file_obj
+        self.m_include_priv = include_priv
+
+    def Write(self,
+              hd_wallet_addr: HdWalletAddrBase,
+              acc_idx: Optional[int] = None,
+              change_idx: Optional[int] = None) -> None:
+        """
+        Write the specified addresses.
+        Addresses are walked twice, the first time for computing the record layout.
+
+        Args:
+            hd_wallet_addr (HdWalletAddrBase object): Addresses
+            acc_idx (int, optional)                 : Account index of the addresses (default: None)
+            change_idx (int, optional)              : Change index of the addresses (default: None)
+
+        Raises:
+            ValueError: If a value is too long to be stored
+        """
+        fields = self.__Fields(hd_wallet_addr)
+        stride = sum(1 + field["width"] for field in fields)
+
+        header = json.dumps({
+            "version": HdWalletAddrIndexConst.VERSION,
+            "count": hd_wallet_addr.Count(),
+            "stride": stride,
+            "addr_off": hd_wallet_addr.NextIndex() - hd_wallet_addr.Count(),
+            "acc_idx": acc_idx,
+            "change_idx": change_idx,
+            "fields": fields,
+        }).encode("utf-8")
+        header_end = (len(HdWalletAddrIndexConst.MAGIC)
+                      + struct.calcsize(HdWalletAddrIndexConst.HEADER_LEN_FORMAT)
+                      + len(header))
+
+        self.m_file_obj.write(HdWalletAddrIndexConst.MAGIC)
+        self.m_file_obj.write(struct.pack(HdWalletAddrIndexConst.HEADER_LEN_FORMAT, len(header)))
+        self.m_file_obj.write(header)
+        self.m_file_obj.write(b"\x00" * (-header_end % HdWalletAddrIndexConst.ALIGNMENT))
+
+        for _, addr in hd_wallet_addr.IterWithIndex():
+            record = bytearray(stride)
+            values = self.__RowValues(addr)
+            for field in fields:
+                value = values.get(field["name"])
+                if value is not None:
+                    record[field["offset"]] = len(value)
+                    record[field["offset"] + 1:field["offset"] + 1 + len(value)] = value
+            self.m_file_obj.write(record)
+
+    def __Fields(self,
+                 hd_wallet_addr: HdWalletAddrBase) -> List[Dict[str, Any]]:
+        """
+        Compute the record fields, so that every value fits in its field.
+
+        Args:
+            hd_wallet_addr (HdWalletAddrBase object): Addresses
+
+        Returns:
+            list[dict]: Fields
+
+        Raises:
+            ValueError: If a value is too long to be stored
+        """
+        fields: Dict[str, Dict[str, Any]] = {}
+        for _, addr in hd_wallet_addr.IterWithIndex():
+            for name, value in self.__RowValues(addr, encode=False).items():
+                field = fields.setdefault(name, {
+                    "name": name,
+                    "type": HdWalletAddrIndexConst.TYPE_BYTES if isinstance(value, bytes)
+                    else HdWalletAddrIndexConst.TYPE_STR,
+                    "offset": 0,
+                    "width": 0,
+                })
+                value_len = len(value if isinstance(value, bytes) else value.encode("utf-8"))
+                if value_len > HdWalletAddrIndexConst.MAX_VALUE_LEN:
+                    raise ValueError(f"Value of {name} is too long to be stored ({value_len} bytes)")
+                field["width"] = max(field["width"], value_len)
+
+        offset = 0
+        for field in fields.values():
+            field["offset"] = offset
+            offset += 1 + field["width"]
+        return list(fields.values())
+
+    def __RowValues(self,
+                    addr: Any,
+                    encode: bool = True) -> Dict[str, Any]:
+        """
+        Get the values of an address record.
+
+        Args:
+            addr (Any)             : Address (keys object or string)
+            encode (bool, optional): True for encoding strings to bytes (default), false otherwise
+
+        Returns:
+            dict: Values of the record
+        """
+        values = ({HdWalletAddrIndexConst.ADDRESS_FIELD: addr} if not hasattr(addr, "ToRawDict")
+                  else addr.ToRawDict())
+        return {
+            name: value.encode("utf-8") if encode and isinstance(value, str) else value
+            for name, value in values.items()
+            if self.m_include_priv or HdWalletAddrIndexConst.PRIV_FIELD_TAG not in name
+        }
+
+
+class HdWalletAddrIndexView:
+    """
+    HD wallet address index view class.
+    It gives access to the keys of a single record of a HdWalletAddrIndexReader, with the same interface of the keys
+    classes. Views only hold a reference to the reader and the record offset, so the record is never copied and each
+    key is read from the memory-mapped file only when requested.
+    """
+
+    __slots__ = ("m_reader", "m_rec_off")
+
+    m_reader: "HdWalletAddrIndexReader"
+    m_rec_off: int
+
+    def __init__(self,
+                 reader: "HdWalletAddrIndexReader",
+                 rec_off: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            reader (HdWalletAddrIndexReader object): Address index reader
+            rec_off (int)                          : Record offset in the file
+        """
+        self.m_reader = reader
+        self.m_rec_off = rec_off
+
+    def KeyEnum(self) -> Type[Enum]:
+        """
+        Get key enumerative type.
+
+        Returns:
+            Enum: Key enumerative type
+        """
+        return self.m_reader.KeyEnum()
+
+    def IsLazy(self) -> bool:
+        """
+        Get if keys are computed lazily (always false, since keys are read from file).
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def HasKey(self,
+               key: Enum) -> bool:
+        """
+        Get if the specified key is present.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            bool: True if present, false otherwise
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        return self.GetKey(key) is not None
+
+    def GetKey(self,
+               key: Enum) -> Optional[Any]:
+        """
+        Get the specified key value.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            str: Key value
+            None: If the key type is not found
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        value = self.m_reader.ReadValue(self.m_rec_off, self.__KeyName(key))
+        return value.hex() if isinstance(value, memoryview) else value
+
+    def GetKeyBytes(self,
+                    key: Enum) -> Optional[memoryview]:
+        """
+        Get the specified key value as raw bytes, without converting it to hex string.
+        The value is a read-only view of the file, which is valid until the reader is closed (use bytes() to copy it).
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            memoryview: Key value
+            None: If the key type is not found or it is not a binary key
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        value = self.m_reader.ReadValue(self.m_rec_off, self.__KeyName(key))
+        return value if isinstance(value, memoryview) else None
+
+    def ToDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return {
+            name: value.hex() if isinstance(value, memoryview) else value
+            for name, value in self.ToRawDict().items()
+        }
+
+    def ToRawDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary, with binary keys as read-only views of the file (see GetKeyBytes).
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        raw_dict = {}
+        for name in self.m_reader.Fields():
+            value = self.m_reader.ReadValue(self.m_rec_off, name)
+            if value is not None:
+                raw_dict[name] = value
+        return raw_dict
+
+    def ToJson(self,
+               json_indent: int = 4) -> str:
+        """
+        Get keys as string in JSON format.
+
+        Args:
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Returns:
+            str: Keys as string in JSON format
+        """
+        return json.dumps(self.ToDict(), indent=json_indent)
+
+    def __KeyName(self,
+                  key: Enum) -> str:
+        """
+        Get the field name of the specified key.
+
+        Args:
+            key (HdWalletKeyTypes): Key
+
+        Returns:
+            str: Field name
+
+        Raises:
+            TypeError: If the enumerative is not of the correct type
+        """
+        if not isinstance(key, self.KeyEnum()):
+            raise TypeError(f"Key is not an enumerative of {self.KeyEnum()} type")
+        return key.name.lower()
+
+
+class HdWalletAddrIndexReader:
+    """
+    HD wallet address index reader class.
+    It reads a file in the fixed-stride format described in the module documentation by memory-mapping it.
+    Addresses are got by position with operator [] or by derivation index with GetByIndex, in constant time,
+    as HdWalletAddrIndexView objects (which have the same interface of the keys objects).
+    """
+
+    m_file_obj: BinaryIO
+    m_mmap: mmap.mmap
+    m_mview: memoryview
+    m_key_enum: Type[Enum]
+    m_count: int
+    m_stride: int
+    m_addr_off: int
+    m_acc_idx: Optional[int]
+    m_change_idx: Optional[int]
+    m_fields: Dict[str, Dict[str, Any]]
+    m_records_off: int
+
+    def __init__(self,
+                 file_path: str,
+                 key_enum: Type[Enum]) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str)            : File path
+            key_enum (HdWalletKeyTypes): Key type enumerative of the saved wallet (e.g. HdWalletBipKeyTypes)
+
+        Raises:
+            ValueError: If the file is not valid or it is not compatible with the key type enumerative
+        """
+        self.m_key_enum = key_enum
+        self.m_file_obj = open(file_path, "rb")
+        try:
+            self.m_mmap = mmap.mmap(self.m_file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__ReadHeader()
+            self.m_mview = memoryview(self.m_mmap)
+        except (ValueError, OSError):
+            self.Close()
+            raise
+
+    def Close(self) -> None:
+        """
+        Close the file.
+        If raw keys read from the file are still referenced, the mapping is released only when they are.
+        """
+        if hasattr(self, "m_mview"):
+            self.m_mview.release()
+        if hasattr(self, "m_mmap"):
+            try:
+                self.m_mmap.close()
+            except BufferError:
+                pass
+        self.m_file_obj.close()
+
+    def KeyEnum(self) -> Type[Enum]:
+        """
+        Get key enumerative type.
+
+        Returns:
+            Enum: Key enumerative type
+        """
+        return self.m_key_enum
+
+    def Count(self) -> int:
+        """
+        Get the number of addresses.
+
+        Returns:
+            int: Number of addresses
+        """
+        return self.m_count
+
+    def AddressOffset(self) -> int:
+        """
+        Get the index of the first address.
+
+        Returns:
+            int: Address offset
+        """
+        return self.m_addr_off
+
+    def AccountIndex(self) -> Optional[int]:
+        """
+        Get the account index of the addresses.
+
+        Returns:
+            int: Account index
+            None: If not applicable
+        """
+        return self.m_acc_idx
+
+    def ChangeIndex(self) -> Optional[int]:
+        """
+        Get the change index of the addresses.
+
+        Returns:
+            int: Change index
+            None: If not applicable
+        """
+        return self.m_change_idx
+
+    def Fields(self) -> List[str]:
+        """
+        Get the field names.
+
+        Returns:
+            list[str]: Field names
+        """
+        return list(self.m_fields.keys())
+
+    def GetByIndex(self,
+                   addr_idx: int) -> HdWalletAddrIndexView:
+        """
+        Get the address with the specified derivation index.
+
+        Args:
+            addr_idx (int): Address derivation index
+
+        Returns:
+            HdWalletAddrIndexView object: Address view
+
+        Raises:
+            IndexError: If the address index is not in the file
+        """
+        if not self.m_addr_off <= addr_idx < self.m_addr_off + self.m_count:
+            raise IndexError(f"Address index {addr_idx} is not in the file")
+        return self[addr_idx - self.m_addr_off]
+
+    def ReadValue(self,
+                  rec_off: int,
+                  name: str) -> Optional[Any]:
+        """
+        Read the value of a field of the record at the specified offset.
+
+        Args:
+            rec_off (int): Record offset in the file
+            name (str)   : Field name
+
+        Returns:
+            memoryview or str: Value (read-only view of the file for raw keys, str for the other ones)
+            None: If the field is not found or the value is not present
+        """
+        field = self.m_fields.get(name)
+        if field is None:
+            return None
+
+        field_off = rec_off + field["offset"]
+        value_len = self.m_mmap[field_off]
+        if value_len == 0:
+            return None
+        value = self.m_mview[field_off + 1:field_off + 1 + value_len]
+        return value if field["type"] == HdWalletAddrIndexConst.TYPE_BYTES else str(value, "utf-8")
+
+    def __ReadHeader(self) -> None:
+        """
+        Read the header.
+
+        Raises:
+            ValueError: If the file is not valid or it is not compatible with the key type enumerative
+        """
+        magic_len = len(HdWalletAddrIndexConst.MAGIC)
+        header_len_size = struct.calcsize(HdWalletAddrIndexConst.HEADER_LEN_FORMAT)
+        if len(self.m_mmap) < magic_len + header_len_size or self.m_mmap[:magic_len] != HdWalletAddrIndexConst.MAGIC:
+            raise ValueError("Invalid address index file")
+
+        header_len = struct.unpack_from(HdWalletAddrIndexConst.HEADER_LEN_FORMAT, self.m_mmap, magic_len)[0]
+        header_end = magic_len + header_len_size + header_len
+        header = json.loads(self.m_mmap[magic_len + header_len_size:header_end].decode("utf-8"))
+        if header.get("version") != HdWalletAddrIndexConst.VERSION:
+            raise ValueError(f"Unsupported address index file version: {header.get('version')}")
+
+        self.m_count = header["count"]
+        self.m_stride = header["stride"]
+        self.m_addr_off = header["addr_off"]
+        self.m_acc_idx = header["acc_idx"]
+        self.m_change_idx = header["change_idx"]
+        self.m_fields = {field["name"]: field for field in header["fields"]}
+        self.m_records_off = header_end + (-header_end % HdWalletAddrIndexConst.ALIGNMENT)
+
+        if len(self.m_mmap) < self.m_records_off + self.m_count * self.m_stride:
+            raise ValueError("Invalid address index file")
+        key_names = {key.name.lower() for key in self.m_key_enum}
+        if self.m_fields.keys() - key_names - {HdWalletAddrIndexConst.ADDRESS_FIELD}:
+            raise ValueError(f"Address index file is not compatible with {self.m_key_enum} type")
+
+    def __enter__(self) -> "HdWalletAddrIndexReader":
+        """
+        Enter the context (the file is closed when exiting).
+
+        Returns:
+            HdWalletAddrIndexReader object: This object
+        """
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """
+        Exit the context, closing the file.
+
+        Args:
+            *args: Exception information
+        """
+        self.Close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of addresses.
+
+        Returns:
+            int: Number of addresses
+        """
+        return self.m_count
+
+    def __getitem__(self,
+                    pos: int) -> HdWalletAddrIndexView:
+        """
+        Get the address at the specified position using operator [].
+
+        Args:
+            pos (int): Address position in the file (negative values count from the end)
+
+        Returns:
+            HdWalletAddrIndexView object: Address view
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        return HdWalletAddrIndexView(self, self.m_records_off + range(self.m_count)[pos] * self.m_stride)
+
+    def __iter__(self) -> Iterator[HdWalletAddrIndexView]:
+        """
+        Get the iterator over the addresses.
+
+        Returns:
+            Iterator object: Iterator over the address views
+        """
+        for pos in range(self.m_count):
+            yield self[pos]
@@ -0,0 +1,451 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for saving addresses in a columnar binary format and reading them back.
+
+The format is self-describing and can be memory-mapped. All integers are little-endian.
+
+    magic          : 8 bytes, "HDWCOL01"
+    column buffers : for each column, the data buffer followed (only for variable-width columns) by the offsets
+                     buffer; each buffer starts at a multiple of 8 bytes
+    footer         : UTF-8 JSON directory describing the content
+    footer length  : uint64
+    magic          : 8 bytes, "HDWCOL01"
+
+The footer directory contains the format version, the number of rows, the index of the first address and a list of
+columns, each one with:
+
+    name           : column name (i.e. the key name, like "address" or "raw_compr_pub")
+    type           : "bytes" for raw keys, "str" for UTF-8 strings (e.g. addresses)
+    width          : value width in bytes for fixed-width columns, null for variable-width ones
+    data_offset    : offset of the data buffer in the file
+    data_length    : length of the data buffer
+    offsets_offset : offset of the offsets buffer (null for fixed-width columns)
+
+Row N of a fixed-width column is at data_offset + N * width. Variable-width columns have an offsets buffer of
+(rows + 1) uint64 values and row N is between offsets N and N + 1 (relative to data_offset). An empty value means
+that the key is not present for that row.
+"""
+
+# Imports
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+
+from py_crypto_hd_wallet.common import HdWalletAddrBase
+from py_crypto_hd_wallet.utils import Utils
+
+
+class HdWalletColumnarConst:
+    """Class container for HD wallet columnar format constants."""
+
+    # Magic bytes at the beginning and at the end of the file
+    MAGIC: bytes = b"HDWCOL01"
+    # Format version
+    VERSION: int = 1
+    # Alignment of column buffers in bytes
+    ALIGNMENT: int = 8
+    # Struct format of footer length and offsets
+    UINT64_FORMAT: str = "<Q"
+    # Column name for addresses stored as strings
+    ADDRESS_COLUMN: str = "address"
+    # Tag contained in the names of private key columns
+    PRIV_COLUMN_TAG: str = "priv"
+    # Column types
+    TYPE_BYTES: str = "bytes"
+    TYPE_STR: str = "str"
+
+
+class HdWalletColumnarWriter:
+    """
+    HD wallet columnar writer class.
+    It writes addresses to a binary file object in the columnar format described in the module documentation.
+    Private keys are included only if requested.
+    """
+
+    m_file_obj: BinaryIO
+    m_include_priv: bool
+
+    def __init__(self,
+                 file_obj: BinaryIO,
+                 include_priv: bool = False) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_obj (file object)       : File object opened in binary mode
+            include_priv (bool, optional): True for including private keys, false otherwise (default)
+        """
+        self.m_file_obj = file_obj
+        self.m_include_priv = include_priv
+
+    def Write(self,
+              hd_wallet_addr: HdWalletAddrBase) -> None:
+        """
+        Write the specified addresses.
+
+        Args:
+            hd_wallet_addr (HdWalletAddrBase object): Addresses
+        """
+        columns: Dict[str, Dict[str, Any]] = {}
+        row_count = 0
+        for _, addr in hd_wallet_addr.IterWithIndex():
+            self.__AddRow(columns, row_count, self.__RowValues(addr))
+            row_count += 1
+
+        self.m_file_obj.write(HdWalletColumnarConst.MAGIC)
+        file_off = len(HdWalletColumnarConst.MAGIC)
+
+        col_dir = []
+        for name, column in columns.items():
+            file_off = self.__WritePadding(file_off)
+            data_off = file_off
+            file_off += self.m_file_obj.write(column["data"])
+
+            offsets_off = None
+            if column["width"] is None:
+                file_off = self.__WritePadding(file_off)
+                offsets_off = file_off
+                offsets = column["offsets"]
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                file_off += self.m_file_obj.write(offsets.tobytes())
+
+            col_dir.append({
+                "name": name,
+                "type": column["type"],
+                "width": column["width"],
+                "data_offset": data_off,
+                "data_length": len(column["data"]),
+                "offsets_offset": offsets_off,
+            })
+
+        footer = json.dumps({
+            "version": HdWalletColumnarConst.VERSION,
+            "row_count": row_count,
+            "addr_off": hd_wallet_addr.NextIndex() - row_count,
+            "columns": col_dir,
+        }).encode("utf-8")
+        self.m_file_obj.write(footer)
+        self.m_file_obj.write(struct.pack(HdWalletColumnarConst.UINT64_FORMAT, len(footer)))
+        self.m_file_obj.write(HdWalletColumnarConst.MAGIC)
+
+    def __RowValues(self,
+                    addr: Any) -> Dict[str, Any]:
+        """
+        Get the values of an address row.
+
+        Args:
+            addr (Any): Address (keys object or string)
+
+        Returns:
+            dict: Values of the row
+        """
+        if not hasattr(addr, "ToRawDict"):
+            return {HdWalletColumnarConst.ADDRESS_COLUMN: addr}
+        return {
+            name: value
+            for name, value in addr.ToRawDict().items()
+            if self.m_include_priv or HdWalletColumnarConst.PRIV_COLUMN_TAG not in name
+        }
+
+    @staticmethod
+    def __AddRow(columns: Dict[str, Dict[str, Any]],
+                 row_idx: int,
+                 values: Dict[str, Any]) -> None:
+        """
+        Add a row to the column buffers.
+        A column is fixed-width as long as all its values have the same length.
+
+        Args:
+            columns (dict): Column buffers
+            row_idx (int) : Row index
+            values (dict) : Values of the row
+        """
+        for name, value in values.items():
+            if name not in columns:
+                columns[name] = {
+                    "type": HdWalletColumnarConst.TYPE_BYTES if isinstance(value, bytes)
+                    else HdWalletColumnarConst.TYPE_STR,
+                    "width": len(value) if row_idx == 0 else None,
+                    "data": bytearray(),
+                    "offsets": array("Q", [0] * (row_idx + 1)),
+                }
+            column = columns[name]
+            column["data"] += value if isinstance(value, bytes) else value.encode("utf-8")
+
+        for column in columns.values():
+            data_len = len(column["data"])
+            if column["width"] is not None and data_len != (row_idx + 1) * column["width"]:
+                column["width"] = None
+            column["offsets"].append(data_len)
+
+    def __WritePadding(self,
+                       file_off: int) -> int:
+        """
+        Write padding bytes for aligning the next buffer.
+
+        Args:
+            file_off (int): Current file offset
+
+        Returns:
+            int: Aligned file offset
+        """
+        padding_len = -file_off % HdWalletColumnarConst.ALIGNMENT
+        return file_off + self.m_file_obj.write(b"\x00" * padding_len)
+
+
+class HdWalletColumnarReader:
+    """
+    HD wallet columnar reader class.
+    It reads a file in the columnar format described in the module documentation by memory-mapping it, so any row
+    can be accessed in constant time without loading the whole file.
+    Rows can be got by position with operator [], as dictionaries like the ones of addresses ToDict.
+    """
+
+    m_file_obj: BinaryIO
+    m_mmap: mmap.mmap
+    m_row_count: int
+    m_addr_off: int
+    m_columns: Dict[str, Dict[str, Any]]
+
+    def __init__(self,
+                 file_path: str) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        self.m_file_obj = open(file_path, "rb")
+        try:
+            self.m_mmap = mmap.mmap(self.m_file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__ReadFooter()
+        except (ValueError, OSError):
+            self.Close()
+            raise
+
+    def Close(self) -> None:
+        """Close the file."""
+        if hasattr(self, "m_mmap"):
+            self.m_mmap.close()
+        self.m_file_obj.close()
+
+    def Count(self) -> int:
+        """
+        Get the number of rows (i.e. addresses).
+
+        Returns:
+            int: Number of rows
+        """
+        return self.m_row_count
+
+    def AddressOffset(self) -> int:
+        """
+        Get the index of the first address.
+
+        Returns:
+            int: Address offset
+        """
+        return self.m_addr_off
+
+    def Columns(self) -> List[str]:
+        """
+        Get the column names.
+
+        Returns:
+            list[str]: Column names
+        """
+        return list(self.m_columns.keys())
+
+    def GetValue(self,
+                 row_idx: int,
+                 name: str) -> Optional[Union[bytes, str]]:
+        """
+        Get the value of the specified column in the specified row.
+
+        Args:
+            row_idx (int): Row index (negative values count from the end)
+            name (str)   : Column name
+
+        Returns:
+            bytes or str: Value (bytes for raw keys, str for the other ones)
+            None: If the column is not found or the value is not present
+
+        Raises:
+            IndexError: If the row index is out of range
+        """
+        row_idx = range(self.m_row_count)[row_idx]
+        column = self.m_columns.get(name)
+        if column is None:
+            return None
+
+        if column["width"] is not None:
+            start = column["data_offset"] + row_idx * column["width"]
+            end = start + column["width"]
+        else:
+            offsets_off = column["offsets_offset"] + row_idx * 8
+            start = column["data_offset"] + self.__ReadUint64(offsets_off)
+            end = column["data_offset"] + self.__ReadUint64(offsets_off + 8)
+            if start == end:
+                return None
+
+        value = self.m_mmap[start:end]
+        return value if column["type"] == HdWalletColumnarConst.TYPE_BYTES else value.decode("utf-8")
+
+    def GetRawRow(self,
+                  row_idx: int) -> Dict[str, Any]:
+        """
+        Get the specified row as a dictionary, with raw keys as bytes.
+
+        Args:
+            row_idx (int): Row index (negative values count from the end)
+
+        Returns:
+            dict: Row
+
+        Raises:
+            IndexError: If the row index is out of range
+        """
+        row = {}
+        for name in self.m_columns:
+            value = self.GetValue(row_idx, name)
+            if value is not None:
+                row[name] = value
+        return row
+
+    def GetRow(self,
+               row_idx: int) -> Dict[str, Any]:
+        """
+        Get the specified row as a dictionary, with raw keys as hex strings (i.e. like addresses ToDict).
+
+        Args:
+            row_idx (int): Row index (negative values count from the end)
+
+        Returns:
+            dict: Row
+
+        Raises:
+            IndexError: If the row index is out of range
+        """
+        return {
+            name: Utils.BytesToHexString(value) if isinstance(value, bytes) else value
+            for name, value in self.GetRawRow(row_idx).items()
+        }
+
+    def __ReadFooter(self) -> None:
+        """
+        Read the footer directory.
+
+        Raises:
+            ValueError: If the file is not valid
+        """
+        magic_len = len(HdWalletColumnarConst.MAGIC)
+        file_len = len(self.m_mmap)
+        if (file_len < (2 * magic_len) + 8
+                or self.m_mmap[:magic_len] != HdWalletColumnarConst.MAGIC
+                or self.m_mmap[-magic_len:] != HdWalletColumnarConst.MAGIC):
+            raise ValueError("Invalid columnar file")
+
+        footer_len = self.__ReadUint64(file_len - magic_len - 8)
+        footer_off = file_len - magic_len - 8 - footer_len
+        if footer_off < magic_len:
+            raise ValueError("Invalid columnar file")
+        footer = json.loads(self.m_mmap[footer_off:footer_off + footer_len].decode("utf-8"))
+        if footer.get("version") != HdWalletColumnarConst.VERSION:
+            raise ValueError(f"Unsupported columnar file version: {footer.get('version')}")
+
+        self.m_row_count = footer["row_count"]
+        self.m_addr_off = footer["addr_off"]
+        self.m_columns = {column["name"]: column for column in footer["columns"]}
+
+    def __ReadUint64(self,
+                     file_off: int) -> int:
+        """
+        Read an uint64 value.
+
+        Args:
+            file_off (int): File offset
+
+        Returns:
+            int: Value
+        """
+        return struct.unpack_from(HdWalletColumnarConst.UINT64_FORMAT, self.m_mmap, file_off)[0]
+
+    def __enter__(self) -> "HdWalletColumnarReader":
+        """
+        Enter the context (the file is closed when exiting).
+
+        Returns:
+            HdWalletColumnarReader object: This object
+        """
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """
+        Exit the context, closing the file.
+
+        Args:
+            *args: Exception information
+        """
+        self.Close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows.
+
+        Returns:
+            int: Number of rows
+        """
+        return self.m_row_count
+
+    def __getitem__(self,
+                    row_idx: int) -> Dict[str, Any]:
+        """
+        Get the specified row using operator [].
+
+        Args:
+            row_idx (int): Row index (negative values count from the end)
+
+        Returns:
+            dict: Row
+
+        Raises:
+            IndexError: If the row index is out of range
+        """
+        return self.GetRow(row_idx)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Get the iterator over the rows.
+
+        Returns:
+            Iterator object: Iterator over the rows
+        """
+        for row_idx in range(self.m_row_count):
+            yield self.GetRow(row_idx)
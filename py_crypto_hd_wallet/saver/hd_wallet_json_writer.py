@@ -0,0 +1,125 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for writing wallets in JSON format incrementally."""
+
+# Imports
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+from py_crypto_hd_wallet.saver.hd_wallet_writer_base import HdWalletWriterBase, HdWalletWriterBaseConst
+
+
+class HdWalletJsonWriterConst:
+    """Class container for HD wallet JSON writer constants."""
+
+    # Default indent for JSON format
+    DEF_JSON_INDENT: int = 4
+
+
+class HdWalletJsonWriter(HdWalletWriterBase):
+    """
+    HD wallet JSON writer class.
+    It writes a wallet in JSON format to a file object incrementally, by walking the wallet, keys and addresses
+    objects, so the whole JSON document is never built in memory.
+    The output is the same of json.dumps with the same indent.
+    """
+
+    m_json_indent: int
+
+    def __init__(self,
+                 file_obj: TextIO,
+                 chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE,
+                 json_indent: int = HdWalletJsonWriterConst.DEF_JSON_INDENT) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_obj (file object)     : File object opened in text mode
+            chunk_size (int, optional) : Size in characters of the chunks written to the file object
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        super().__init__(file_obj, chunk_size)
+        self.m_json_indent = json_indent
+
+    def Write(self,
+              value: Any) -> None:
+        """
+        Write the specified value (e.g. a wallet) and flush it to the file object.
+
+        Args:
+            value (Any): Value to be written
+        """
+        self.__WriteValue(value, 0)
+        self.Flush()
+
+    def __WriteValue(self,
+                     value: Any,
+                     level: int) -> None:
+        """
+        Write a value at the specified nesting level.
+        Objects that can be iterated as dictionary items (i.e. wallets and addresses) are written incrementally,
+        while other objects (i.e. keys) are small and they are converted at once.
+
+        Args:
+            value (Any): Value to be written
+            level (int): Nesting level
+        """
+        if hasattr(value, "IterDictItems"):
+            self.__WriteItems(value.IterDictItems(), level)
+        else:
+            json_str = json.dumps(value.ToDict() if hasattr(value, "ToDict") else value, indent=self.m_json_indent)
+            self._Append(json_str.replace("\n", "\n" + self.__Indent(level)) if level > 0 else json_str)
+
+    def __WriteItems(self,
+                     items: Iterator[Tuple[str, Any]],
+                     level: int) -> None:
+        """
+        Write dictionary items as a JSON object at the specified nesting level.
+
+        Args:
+            items (iterator): Iterator over (dict key, value) tuples
+            level (int)     : Nesting level
+        """
+        item_indent = self.__Indent(level + 1)
+
+        is_empty = True
+        for dict_key, value in items:
+            self._Append(("{\n" if is_empty else ",\n") + item_indent + json.dumps(dict_key) + ": ")
+            self.__WriteValue(value, level + 1)
+            is_empty = False
+
+        self._Append("{}" if is_empty else "\n" + self.__Indent(level) + "}")
+
+    def __Indent(self,
+                 level: int) -> str:
+        """
+        Get the indent string for the specified nesting level.
+
+        Args:
+            level (int): Nesting level
+
+        Returns:
+            str: Indent string
+        """
+        return " " * (self.m_json_indent * level)
@@ -0,0 +1,117 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for writing addresses in NDJSON (JSON Lines) format incrementally."""
+
+# Imports
+import json
+from typing import Any, Dict, Optional, TextIO
+
+from py_crypto_hd_wallet.common import HdWalletAddrBase
+from py_crypto_hd_wallet.saver.hd_wallet_writer_base import HdWalletWriterBase, HdWalletWriterBaseConst
+
+
+class HdWalletNdjsonWriterConst:
+    """Class container for HD wallet NDJSON writer constants."""
+
+    # Name of the address index field
+    INDEX_FIELD: str = "index"
+    # Name of the change index field
+    CHANGE_IDX_FIELD: str = "change_idx"
+    # Name of the address field, for addresses stored as strings
+    ADDRESS_FIELD: str = "address"
+    # Tag contained in the names of private key fields
+    PRIV_FIELD_TAG: str = "priv"
+
+
+class HdWalletNdjsonWriter(HdWalletWriterBase):
+    """
+    HD wallet NDJSON writer class.
+    It writes addresses to a file object in NDJSON format, i.e. one JSON record for each line, so they can be
+    consumed line by line.
+    Each record contains the address index and the address keys. Private keys are included only if requested.
+    If a change index is specified (i.e. for addresses of more than one change chain), it is included too.
+    """
+
+    m_include_priv: bool
+
+    def __init__(self,
+                 file_obj: TextIO,
+                 include_priv: bool = False,
+                 chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_obj (file object)       : File object opened in text mode
+            include_priv (bool, optional): True for including private keys in records, false otherwise (default)
+            chunk_size (int, optional)   : Size in characters of the chunks written to the file object
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        super().__init__(file_obj, chunk_size)
+        self.m_include_priv = include_priv
+
+    def Write(self,
+              hd_wallet_addr: HdWalletAddrBase,
+              start_idx: int = 0,
+              change_idx: Optional[int] = None) -> None:
+        """
+        Write the specified addresses and flush them to the file object.
+
+        Args:
+            hd_wallet_addr (HdWalletAddrBase object): Addresses
+            start_idx (int, optional)               : Only addresses starting from this index are written (default: 0)
+            change_idx (int, optional)              : Change index written with each record, None for not writing it
+                                                      (default)
+        """
+        for addr_idx, addr in hd_wallet_addr.IterWithIndex():
+            if addr_idx >= start_idx:
+                self._Append(json.dumps(self.__ToRecord(addr_idx, addr, change_idx)) + "\n")
+        self.Flush()
+
+    def __ToRecord(self,
+                   addr_idx: int,
+                   addr: Any,
+                   change_idx: Optional[int]) -> Dict[str, Any]:
+        """
+        Convert an address to a record.
+
+        Args:
+            addr_idx (int)          : Address index
+            addr (Any)              : Address (keys object or string)
+            change_idx (int or None): Change index, None for not including it
+
+        Returns:
+            dict: Record
+        """
+        record = {HdWalletNdjsonWriterConst.INDEX_FIELD: addr_idx}
+        if change_idx is not None:
+            record[HdWalletNdjsonWriterConst.CHANGE_IDX_FIELD] = change_idx
+        if hasattr(addr, "ToDict"):
+            record.update({
+                dict_key: value
+                for dict_key, value in addr.ToDict().items()
+                if self.m_include_priv or HdWalletNdjsonWriterConst.PRIV_FIELD_TAG not in dict_key
+            })
+        else:
+            record[HdWalletNdjsonWriterConst.ADDRESS_FIELD] = addr
+        return record
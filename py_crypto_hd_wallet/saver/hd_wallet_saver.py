@@ -21,7 +21,23 @@
 """Module for saving wallets to file."""
 
 # Imports
-from py_crypto_hd_wallet.common import HdWalletBase
+from typing import Optional, TextIO, Union
+
+from py_crypto_hd_wallet.common import HdWalletAddrBase, HdWalletBase, HdWalletChangeAddrBase
+from py_crypto_hd_wallet.saver.hd_wallet_addr_index import HdWalletAddrIndexWriter
+from py_crypto_hd_wallet.saver.hd_wallet_columnar import HdWalletColumnarWriter
+from py_crypto_hd_wallet.saver.hd_wallet_json_writer import HdWalletJsonWriter
+from py_crypto_hd_wallet.saver.hd_wallet_ndjson_writer import HdWalletNdjsonWriter
+from py_crypto_hd_wallet.saver.hd_wallet_writer_base import HdWalletWriterBaseConst
+
+
+class HdWalletSaverConst:
+    """Class container for HD wallet saver constants."""
+
+    # Dict key of the account index in wallet data
+    ACC_IDX_KEY: str = "account_idx"
+    # Dict key of the change index in wallet data
+    CHANGE_IDX_KEY: str = "change_idx"
 
 
 class HdWalletSaver:
@@ -47,12 +63,180 @@ class HdWalletSaver:
         self.m_hd_wallet = hd_wallet
 
     def SaveToFile(self,
-                   file_path: str) -> None:
+                   file_path: str,
+                   stream: bool = False,
+                   chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
         """
         Save wallet to file in JSON format.
 
         Args:
-            file_path (str): File path
+            file_path (str)           : File path
+            stream (bool, optional)   : True for writing the wallet incrementally with bounded memory usage,
+                                        false for building the whole JSON document before writing it (default)
+            chunk_size (int, optional): Size in characters of the chunks written to file in stream mode
+
+        Raises:
+            ValueError: If the chunk size is not valid
         """
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(self.m_hd_wallet.ToJson())
+            if stream:
+                self.SaveToStream(f, chunk_size)
+            else:
+                f.write(self.m_hd_wallet.ToJson())
+
+    def SaveToStream(self,
+                     file_obj: TextIO,
+                     chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Save wallet to a file object in JSON format, incrementally.
+        The output is the same of SaveToFile, but the whole JSON document is never built in memory.
+
+        Args:
+            file_obj (file object)    : File object opened in text mode
+            chunk_size (int, optional): Size in characters of the chunks written to the file object
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        HdWalletJsonWriter(file_obj, chunk_size).Write(self.m_hd_wallet)
+
+    def SaveToNdjsonFile(self,
+                         file_path: str,
+                         *,
+                         append: bool = False,
+                         include_priv: bool = False,
+                         start_idx: int = 0,
+                         chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Save wallet addresses to file in NDJSON format, i.e. one address record for each line.
+
+        Args:
+            file_path (str)              : File path
+            append (bool, optional)      : True for appending records to the file, false for overwriting it (default)
+            include_priv (bool, optional): True for including private keys in records, false otherwise (default)
+            start_idx (int, optional)    : Only addresses starting from this index are saved (default: 0)
+            chunk_size (int, optional)   : Size in characters of the chunks written to file
+
+        Raises:
+            ValueError: If the wallet has no addresses or the chunk size is not valid
+        """
+        with open(file_path, "a" if append else "w", encoding="utf-8") as f:
+            self.SaveToNdjsonStream(f, include_priv=include_priv, start_idx=start_idx, chunk_size=chunk_size)
+
+    def SaveToNdjsonStream(self,
+                           file_obj: TextIO,
+                           *,
+                           include_priv: bool = False,
+                           start_idx: int = 0,
+                           chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Save wallet addresses to a file object in NDJSON format, i.e. one address record for each line.
+        If the wallet has the addresses of more than one change chain, all of them are saved and each record
+        contains the change index too.
+
+        Args:
+            file_obj (file object)       : File object opened in text mode
+            include_priv (bool, optional): True for including private keys in records, false otherwise (default)
+            start_idx (int, optional)    : Only addresses starting from this index are saved (default: 0)
+            chunk_size (int, optional)   : Size in characters of the chunks written to the file object
+
+        Raises:
+            ValueError: If the wallet has no addresses or the chunk size is not valid
+        """
+        hd_wallet_addr = self.__GetAddresses()
+        writer = HdWalletNdjsonWriter(file_obj, include_priv, chunk_size)
+        if isinstance(hd_wallet_addr, HdWalletChangeAddrBase):
+            for change_idx, change_addr in hd_wallet_addr.Items():
+                writer.Write(change_addr, start_idx, int(change_idx))
+        else:
+            writer.Write(hd_wallet_addr, start_idx)
+
+    def SaveToColumnarFile(self,
+                           file_path: str,
+                           *,
+                           include_priv: bool = False,
+                           change_idx: Optional[int] = None) -> None:
+        """
+        Save wallet addresses to file in columnar binary format, which can be read with HdWalletColumnarReader.
+        The file contains the addresses of a single change chain.
+
+        Args:
+            file_path (str)              : File path
+            include_priv (bool, optional): True for including private keys, false otherwise (default)
+            change_idx (int, optional)   : Change index of the addresses to be saved, required if the wallet has the
+                                           addresses of more than one change chain (default: None)
+
+        Raises:
+            ValueError: If the wallet has no addresses of the specified change chain
+        """
+        hd_wallet_addr = self.__GetChangeAddresses(change_idx)
+        with open(file_path, "wb") as f:
+            HdWalletColumnarWriter(f, include_priv).Write(hd_wallet_addr)
+
+    def SaveToIndexFile(self,
+                        file_path: str,
+                        *,
+                        include_priv: bool = False,
+                        change_idx: Optional[int] = None) -> None:
+        """
+        Save wallet addresses to a fixed-stride index file, which can be read with HdWalletAddrIndexReader.
+        The file contains the addresses of a single change chain. The account and change indexes, if any, are saved too.
+
+        Args:
+            file_path (str)              : File path
+            include_priv (bool, optional): True for including private keys, false otherwise (default)
+            change_idx (int, optional)   : Change index of the addresses to be saved, required if the wallet has the
+                                           addresses of more than one change chain (default: None)
+
+        Raises:
+            ValueError: If the wallet has no addresses of the specified change chain or a value is too long to be stored
+        """
+        hd_wallet_addr = self.__GetChangeAddresses(change_idx)
+        wallet_dict = dict(self.m_hd_wallet.IterDictItems())
+        with open(file_path, "wb") as f:
+            HdWalletAddrIndexWriter(f, include_priv).Write(
+                hd_wallet_addr,
+                wallet_dict.get(HdWalletSaverConst.ACC_IDX_KEY),
+                wallet_dict.get(HdWalletSaverConst.CHANGE_IDX_KEY, None if change_idx is None else int(change_idx))
+            )
+
+    def __GetChangeAddresses(self,
+                             change_idx: Optional[int]) -> HdWalletAddrBase:
+        """
+        Get the wallet addresses of a single change chain.
+
+        Args:
+            change_idx (int or None): Change index, None if the wallet has the addresses of a single change chain
+
+        Returns:
+            HdWalletAddrBase object: Addresses
+
+        Raises:
+            ValueError: If the wallet has no addresses of the specified change chain
+        """
+        hd_wallet_addr = self.__GetAddresses()
+        if isinstance(hd_wallet_addr, HdWalletChangeAddrBase):
+            if change_idx is None:
+                raise ValueError("Change index shall be specified for addresses of more than one change chain")
+            try:
+                return hd_wallet_addr[change_idx]
+            except KeyError as ex:
+                raise ValueError(f"Wallet has no addresses of change chain {change_idx}") from ex
+        if change_idx is not None and change_idx != hd_wallet_addr.ChangeIndex():
+            raise ValueError(f"Wallet has no addresses of change chain {change_idx}")
+        return hd_wallet_addr
+
+    def __GetAddresses(self) -> Union[HdWalletAddrBase, HdWalletChangeAddrBase]:
+        """
+        Get the wallet addresses.
+
+        Returns:
+            HdWalletAddrBase or HdWalletChangeAddrBase object: Addresses
+
+        Raises:
+            ValueError: If the wallet has no addresses
+        """
+        for _, value in self.m_hd_wallet.IterDictItems():
+            if isinstance(value, (HdWalletAddrBase, HdWalletChangeAddrBase)):
+                return value
+        raise ValueError("Wallet has no addresses")
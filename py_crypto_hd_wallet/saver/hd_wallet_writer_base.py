@@ -0,0 +1,90 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with base class for wallet writers."""
+
+# Imports
+from typing import List, TextIO
+
+
+class HdWalletWriterBaseConst:
+    """Class container for HD wallet writer base constants."""
+
+    # Default chunk size in characters
+    DEF_CHUNK_SIZE: int = 64 * 1024
+
+
+class HdWalletWriterBase:
+    """
+    HD wallet writer base class.
+    It shall be inherited by classes that write wallets to a file object incrementally.
+    Written data is buffered and passed to the file object in chunks of the specified size.
+    """
+
+    m_file_obj: TextIO
+    m_chunk_size: int
+    m_buff: List[str]
+    m_buff_len: int
+
+    def __init__(self,
+                 file_obj: TextIO,
+                 chunk_size: int = HdWalletWriterBaseConst.DEF_CHUNK_SIZE) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_obj (file object)    : File object opened in text mode
+            chunk_size (int, optional): Size in characters of the chunks written to the file object
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size shall be greater than zero")
+
+        self.m_file_obj = file_obj
+        self.m_chunk_size = chunk_size
+        self.m_buff = []
+        self.m_buff_len = 0
+
+    def Flush(self) -> None:
+        """Write the buffered data to the file object and flush it."""
+        self.__WriteBuffer()
+        self.m_file_obj.flush()
+
+    def _Append(self,
+                data: str) -> None:
+        """
+        Append data to the buffer, writing it to the file object when the chunk size is reached.
+
+        Args:
+            data (str): Data
+        """
+        self.m_buff.append(data)
+        self.m_buff_len += len(data)
+        if self.m_buff_len >= self.m_chunk_size:
+            self.__WriteBuffer()
+
+    def __WriteBuffer(self) -> None:
+        """Write the buffered data to the file object."""
+        if self.m_buff:
+            self.m_file_obj.write("".join(self.m_buff))
+            self.m_buff = []
+            self.m_buff_len = 0
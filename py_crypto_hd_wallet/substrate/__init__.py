@@ -8,3 +8,4 @@ from py_crypto_hd_wallet.substrate.hd_wallet_substrate_enum import (
 )
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate_factory import HdWalletSubstrateFactory
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate_keys import HdWalletSubstrateKeys
+from py_crypto_hd_wallet.substrate.hd_wallet_substrate_path_keys import HdWalletSubstratePathKeys
@@ -21,14 +21,14 @@
 """Module for generating Substrate wallets."""
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, Optional
 
 from bip_utils import Substrate, SubstrateKeyError, SubstratePathError
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletBase, HdWalletCoinInfo
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate_enum import HdWalletSubstrateDataTypes
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate_keys import HdWalletSubstrateKeys
-from py_crypto_hd_wallet.utils import Utils
+from py_crypto_hd_wallet.substrate.hd_wallet_substrate_path_keys import HdWalletSubstratePathKeys
 
 
 class HdWalletSubstrate(HdWalletBase):
@@ -38,6 +38,7 @@ class HdWalletSubstrate(HdWalletBase):
     """
 
     m_substrate_obj: Substrate
+    m_coin_info: HdWalletCoinInfo
 
     #
     # Public methods
@@ -48,19 +49,24 @@ class HdWalletSubstrate(HdWalletBase):
                  substrate_obj: Substrate,
                  mnemonic: str = "",
                  passphrase: str = "",
-                 seed_bytes: bytes = b"") -> None:
+                 seed_bytes: bytes = b"",
+                 *,
+                 coin_info: Optional[HdWalletCoinInfo] = None) -> None:
         """
         Construct class.
 
         Args:
-            wallet_name (str)               : Wallet name
-            substrate_obj (Substrate object): Substrate object
-            mnemonic (str, optional)        : Mnemonic, empty if not specified
-            passphrase (str, optional)      : Passphrase, empty if not specified
-            seed_bytes (bytes, optional)    : Seed_bytes, empty if not specified
+            wallet_name (str)                            : Wallet name
+            substrate_obj (Substrate object)             : Substrate object
+            mnemonic (str, optional)                     : Mnemonic, empty if not specified
+            passphrase (str, optional)                   : Passphrase, empty if not specified
+            seed_bytes (bytes, optional)                 : Seed_bytes, empty if not specified
+            coin_info (HdWalletCoinInfo object, optional): Coin information already resolved by the factory, None for
+                                                           resolving it from substrate_obj (default)
         """
         super().__init__(HdWalletSubstrateDataTypes)
         self.m_substrate_obj = substrate_obj
+        self.m_coin_info = coin_info if coin_info is not None else HdWalletCoinInfo.FromConf(substrate_obj.CoinConf())
         # Initialize data
         self.__InitData(wallet_name, mnemonic, passphrase, seed_bytes)
 
@@ -83,6 +89,21 @@ class HdWalletSubstrate(HdWalletBase):
         except (SubstrateKeyError, SubstratePathError) as ex:
             raise ValueError(f"Invalid path: {path}") from ex
 
+    def GenerateMany(self,
+                     paths: Iterable[str]) -> None:
+        """
+        Generate wallet keys and addresses for multiple derivation paths.
+        The junctions shared by more paths (e.g. "//hard/soft" for "//hard/soft/0", "//hard/soft/1", ...) are derived
+        only once. Keys are stored by path in a HdWalletSubstratePathKeys object.
+
+        Args:
+            paths (iterable of str): Derivation paths
+
+        Raises:
+            ValueError: If one of the paths is not valid
+        """
+        self._Set(HdWalletSubstrateDataTypes.PATH_KEYS, HdWalletSubstratePathKeys(self.m_substrate_obj, paths))
+
     def IsWatchOnly(self) -> bool:
         """
         Get if the wallet is watch-only.
@@ -114,12 +135,11 @@ class HdWalletSubstrate(HdWalletBase):
         # Set wallet name
         self._Set(HdWalletSubstrateDataTypes.WALLET_NAME, wallet_name)
         # Set coin name
-        coin_names = self.m_substrate_obj.CoinConf().CoinNames()
-        self._Set(HdWalletSubstrateDataTypes.COIN_NAME, f"{coin_names.Name()} ({coin_names.Abbreviation()})")
+        self._Set(HdWalletSubstrateDataTypes.COIN_NAME, self.m_coin_info.Name())
 
         # Set optional data if specified
         if mnemonic != "":
             self._Set(HdWalletSubstrateDataTypes.MNEMONIC, mnemonic)
             self._Set(HdWalletSubstrateDataTypes.PASSPHRASE, passphrase)
         if seed_bytes != b"":
-            self._Set(HdWalletSubstrateDataTypes.SEED_BYTES, Utils.BytesToHexString(seed_bytes))
+            self._Set(HdWalletSubstrateDataTypes.SEED_BYTES, seed_bytes)
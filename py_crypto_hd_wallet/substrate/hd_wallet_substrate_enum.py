@@ -48,6 +48,7 @@ class HdWalletSubstrateDataTypes(HdWalletDataTypes):
     SEED_BYTES = auto()
     PATH = auto()
     KEY = auto()
+    PATH_KEYS = auto()
 
 
 @unique
@@ -21,6 +21,9 @@
 """Module for creating Substrate wallet factories."""
 
 # Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
 from bip_utils import (
     Bip39MnemonicGenerator,
     MnemonicChecksumError,
@@ -28,8 +31,9 @@ from bip_utils import (
     SubstrateBip39SeedGenerator,
     SubstrateKeyError,
 )
+from bip_utils.substrate.conf import SubstrateConfGetter
 
-from py_crypto_hd_wallet.common import HdWalletBase
+from py_crypto_hd_wallet.common import HdWalletAsync, HdWalletBase, HdWalletCoinInfo, HdWalletWorkers
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate import HdWalletSubstrate
 from py_crypto_hd_wallet.substrate.hd_wallet_substrate_enum import (
     HdWalletSubstrateCoins,
@@ -39,6 +43,27 @@ from py_crypto_hd_wallet.substrate.hd_wallet_substrate_enum import (
 from py_crypto_hd_wallet.utils import Utils
 
 
+def _GenerateSeed(mnemonic: str,
+                  passphrase: str = "") -> bytes:
+    """
+    Generate seed from mnemonic (worker function).
+
+    Args:
+        mnemonic (str)            : Mnemonic
+        passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+
+    Returns:
+        bytes: Seed bytes
+
+    Raises:
+        ValueError: If the mnemonic is not valid
+    """
+    try:
+        return SubstrateBip39SeedGenerator(mnemonic).Generate(passphrase)
+    except (ValueError, MnemonicChecksumError) as ex:
+        raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+
+
 class HdWalletSubstrateFactory:
     """
     HD wallet Substrate factory class.
@@ -46,6 +71,7 @@ class HdWalletSubstrateFactory:
     """
 
     m_substrate_coin: HdWalletSubstrateCoins
+    m_coin_info: HdWalletCoinInfo
 
     def __init__(self,
                  coin_type: HdWalletSubstrateCoins) -> None:
@@ -62,6 +88,7 @@ class HdWalletSubstrateFactory:
             raise TypeError("Coin type is not an enumerative of HdWalletSubstrateCoins")
 
         self.m_substrate_coin = coin_type
+        self.m_coin_info = HdWalletCoinInfo.FromConf(SubstrateConfGetter.GetConfig(coin_type))
 
     def CreateRandom(self,
                      wallet_name: str,
@@ -108,17 +135,56 @@ class HdWalletSubstrateFactory:
         Raises:
             ValueError: If the mnemonic is not valid
         """
-        try:
-            seed_bytes = SubstrateBip39SeedGenerator(mnemonic).Generate(passphrase)
-        except (ValueError, MnemonicChecksumError) as ex:
-            raise ValueError(f"Invalid mnemonic: {mnemonic}") from ex
+        seed_bytes = _GenerateSeed(mnemonic, passphrase)
+        return self.__CreateFromMnemonicSeed(wallet_name, mnemonic, passphrase, seed_bytes=seed_bytes)
+
+    async def CreateFromMnemonicAsync(self,
+                                      wallet_name: str,
+                                      mnemonic: str,
+                                      passphrase: str = "",
+                                      *,
+                                      executor: Optional[ThreadPoolExecutor] = None) -> HdWalletBase:
+        """
+        Create wallet from mnemonic asynchronously.
+        The seed is generated in the executor, so that the event loop is not blocked.
 
-        substrate_obj = Substrate.FromSeed(seed_bytes, self.m_substrate_coin)
-        return HdWalletSubstrate(wallet_name=wallet_name,
-                                 substrate_obj=substrate_obj,
-                                 mnemonic=mnemonic,
-                                 passphrase=passphrase,
-                                 seed_bytes=seed_bytes)
+        Args:
+            wallet_name (str)                      : Wallet name
+            mnemonic (str)                         : Mnemonic
+            passphrase (str, optional)             : Passphrase for protecting mnemonic, empty if not specified
+            executor (ThreadPoolExecutor, optional): Thread pool executor, None for the default one of the event loop
+                                                     (default)
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        return await HdWalletAsync.Run(self.CreateFromMnemonic, wallet_name, mnemonic, passphrase, executor=executor)
+
+    def CreateFromMnemonics(self,
+                            mnemonics: Iterable[Tuple[str, ...]],
+                            workers: Optional[int] = None) -> Iterator[HdWalletBase]:
+        """
+        Create wallets from mnemonics.
+        Wallets are created lazily, in the same order of the mnemonics. If workers are specified, the seeds are
+        generated in a pool of processes, which is useful for creating a large number of wallets.
+        Use list() on the returned iterator for getting all the wallets at once.
+
+        Args:
+            mnemonics (iterable)   : (wallet name, mnemonic) or (wallet name, mnemonic, passphrase) tuples
+            workers (int, optional): Number of worker processes for generating seeds, None for the current process
+
+        Returns:
+            Iterator object: Iterator over HdWalletBase objects
+
+        Raises:
+            ValueError: If the number of workers or a mnemonic is not valid
+        """
+        HdWalletWorkers.CheckWorkersNum(workers)
+        return (self.__CreateFromMnemonicSeed(*item, seed_bytes=seed_bytes)
+                for item, seed_bytes in HdWalletWorkers.Map(_GenerateSeed, mnemonics, lambda item: item[1:], workers))
 
     def CreateFromSeed(self,
                        wallet_name: str,
@@ -139,7 +205,8 @@ class HdWalletSubstrateFactory:
         substrate_obj = Substrate.FromSeed(seed_bytes, self.m_substrate_coin)
         return HdWalletSubstrate(wallet_name=wallet_name,
                                  substrate_obj=substrate_obj,
-                                 seed_bytes=seed_bytes)
+                                 seed_bytes=seed_bytes,
+                                 coin_info=self.m_coin_info)
 
     def CreateFromPrivateKey(self,
                              wallet_name: str,
@@ -163,7 +230,8 @@ class HdWalletSubstrateFactory:
             raise ValueError(f"Invalid private key: {Utils.BytesToHexString(priv_key_bytes)}") from ex
 
         return HdWalletSubstrate(wallet_name=wallet_name,
-                                 substrate_obj=substrate_obj)
+                                 substrate_obj=substrate_obj,
+                                 coin_info=self.m_coin_info)
 
     def CreateFromPublicKey(self,
                             wallet_name: str,
@@ -187,4 +255,31 @@ class HdWalletSubstrateFactory:
             raise ValueError(f"Invalid public key: {Utils.BytesToHexString(pub_key_bytes)}") from ex
 
         return HdWalletSubstrate(wallet_name=wallet_name,
-                                 substrate_obj=substrate_obj)
+                                 substrate_obj=substrate_obj,
+                                 coin_info=self.m_coin_info)
+
+    def __CreateFromMnemonicSeed(self,
+                                 wallet_name: str,
+                                 mnemonic: str,
+                                 passphrase: str = "",
+                                 *,
+                                 seed_bytes: bytes) -> HdWalletBase:
+        """
+        Create wallet from mnemonic and the seed generated from it.
+
+        Args:
+            wallet_name (str)         : Wallet name
+            mnemonic (str)            : Mnemonic
+            passphrase (str, optional): Passphrase for protecting mnemonic, empty if not specified
+            seed_bytes (bytes)        : Seed bytes
+
+        Returns:
+            HdWalletBase object: HdWalletBase object
+        """
+        substrate_obj = Substrate.FromSeed(seed_bytes, self.m_substrate_coin)
+        return HdWalletSubstrate(wallet_name=wallet_name,
+                                 substrate_obj=substrate_obj,
+                                 mnemonic=mnemonic,
+                                 passphrase=passphrase,
+                                 seed_bytes=seed_bytes,
+                                 coin_info=self.m_coin_info)
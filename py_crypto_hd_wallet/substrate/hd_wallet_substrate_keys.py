@@ -55,11 +55,11 @@ class HdWalletSubstrateKeys(HdWalletKeysBase):
         """
 
         # Add public key
-        self._Set(HdWalletSubstrateKeyTypes.PUB, substrate_obj.PublicKey().RawCompressed().ToHex())
+        self._Set(HdWalletSubstrateKeyTypes.PUB, substrate_obj.PublicKey().RawCompressed().ToBytes())
 
         # Add private key only if not public-only
         if not substrate_obj.IsPublicOnly():
-            self._Set(HdWalletSubstrateKeyTypes.PRIV, substrate_obj.PrivateKey().Raw().ToHex())
+            self._Set(HdWalletSubstrateKeyTypes.PRIV, substrate_obj.PrivateKey().Raw().ToBytes())
 
         # Add aAddress
         self._Set(HdWalletSubstrateKeyTypes.ADDRESS, substrate_obj.PublicKey().ToAddress())
@@ -0,0 +1,268 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with helper classes for deriving and storing the keys of multiple Substrate paths."""
+
+# Imports
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bip_utils import Substrate, SubstrateKeyError, SubstratePathElem, SubstratePathError, SubstratePathParser
+
+from py_crypto_hd_wallet.substrate.hd_wallet_substrate_keys import HdWalletSubstrateKeys
+
+
+class HdWalletSubstratePathNode:
+    """
+    HD wallet Substrate path node class.
+    It represents a junction of the prefix trie built from the derivation paths.
+    """
+
+    __slots__ = ("m_elem", "m_children", "m_paths")
+
+    m_elem: Optional[SubstratePathElem]
+    m_children: Dict[Tuple[bool, bytes], "HdWalletSubstratePathNode"]
+    m_paths: List[str]
+
+    def __init__(self,
+                 elem: Optional[SubstratePathElem] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            elem (SubstratePathElem object, optional): Path element of the junction, None for the root
+        """
+        self.m_elem = elem
+        self.m_children = {}
+        self.m_paths = []
+
+    def AddPath(self,
+                path: str) -> None:
+        """
+        Add a path to the trie, creating the missing junctions.
+        Junctions are identified by their chain code and type, so equivalent elements (e.g. "/0" and "/00") are
+        shared.
+
+        Args:
+            path (str): Derivation path
+
+        Raises:
+            ValueError: If the path is not valid
+        """
+        try:
+            path_elems = SubstratePathParser.Parse(path)
+        except SubstratePathError as ex:
+            raise ValueError(f"Invalid path: {path}") from ex
+
+        node = self
+        for path_elem in path_elems:
+            node_key = (path_elem.IsHard(), path_elem.ChainCode())
+            child = node.m_children.get(node_key)
+            if child is None:
+                child = HdWalletSubstratePathNode(path_elem)
+                node.m_children[node_key] = child
+            node = child
+        node.m_paths.append(path)
+
+
+class HdWalletSubstratePathKeys:
+    """
+    HD wallet Substrate path keys class.
+    It derives the keys of multiple paths from a Substrate object and stores them by path.
+    Paths are arranged in a prefix trie, so each junction shared by more paths is derived only once.
+    """
+
+    m_keys: Dict[str, HdWalletSubstrateKeys]
+    m_deriv_num: int
+
+    def __init__(self,
+                 substrate_obj: Substrate,
+                 paths: Iterable[str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            substrate_obj (Substrate object): Substrate object
+            paths (iterable of str)         : Derivation paths
+
+        Raises:
+            ValueError: If one of the paths is not valid
+        """
+        root = HdWalletSubstratePathNode()
+        # Duplicated paths are added once, the specified order is kept
+        path_list = list(dict.fromkeys(paths))
+        for path in path_list:
+            root.AddPath(path)
+
+        self.m_deriv_num = 0
+        path_keys = dict(self.__Derive(substrate_obj, root))
+        self.m_keys = {path: path_keys[path] for path in path_list}
+
+    def ToDict(self) -> Dict[str, Any]:
+        """
+        Get keys as a dictionary, indexed by path.
+
+        Returns:
+            dict: Keys as a dictionary
+        """
+        return {path: keys.ToDict() for path, keys in self.m_keys.items()}
+
+    def ToJson(self,
+               json_indent: int = 4) -> str:
+        """
+        Get keys as string in JSON format.
+
+        Args:
+            json_indent (int, optional): Indent for JSON format, 4 by default
+
+        Returns:
+            str: Keys as string in JSON format
+        """
+        return json.dumps(self.ToDict(), indent=json_indent)
+
+    def Count(self) -> int:
+        """
+        Get the paths count.
+
+        Returns:
+            int: Number of paths
+        """
+        return len(self.m_keys)
+
+    def DerivationsNum(self) -> int:
+        """
+        Get the number of child key derivations performed (i.e. the number of distinct junctions of the trie).
+
+        Returns:
+            int: Number of derivations
+        """
+        return self.m_deriv_num
+
+    def Paths(self) -> List[str]:
+        """
+        Get the paths, in the order they were specified.
+
+        Returns:
+            list[str]: Paths
+        """
+        return list(self.m_keys)
+
+    def HasPath(self,
+                path: str) -> bool:
+        """
+        Get if the specified path is existent.
+
+        Args:
+            path (str): Derivation path
+
+        Returns:
+            bool: True if existent, false otherwise
+        """
+        return path in self.m_keys
+
+    def Items(self) -> Iterator[Tuple[str, HdWalletSubstrateKeys]]:
+        """
+        Iterate over paths together with their keys.
+
+        Returns:
+            Iterator object: Iterator over (path, keys) tuples
+        """
+        yield from self.m_keys.items()
+
+    def __getitem__(self,
+                    path: str) -> HdWalletSubstrateKeys:
+        """
+        Get the keys of the specified path.
+
+        Args:
+            path (str): Derivation path
+
+        Returns:
+            HdWalletSubstrateKeys object: HdWalletSubstrateKeys object
+
+        Raises:
+            KeyError: If the path is not existent
+        """
+        return self.m_keys[path]
+
+    def __iter__(self) -> Iterator[HdWalletSubstrateKeys]:
+        """
+        Get the iterator to the current element.
+
+        Returns:
+            Iterator object: Iterator to the current element
+        """
+        yield from self.m_keys.values()
+
+    def __Derive(self,
+                 substrate_obj: Substrate,
+                 root: HdWalletSubstratePathNode) -> Iterator[Tuple[str, HdWalletSubstrateKeys]]:
+        """
+        Derive the keys of the trie paths, visiting it depth-first.
+        Only the Substrate objects of the current branch are kept in memory.
+
+        Args:
+            substrate_obj (Substrate object)       : Substrate object of the root
+            root (HdWalletSubstratePathNode object): Root of the trie
+
+        Returns:
+            Iterator object: Iterator over (path, keys) tuples
+
+        Raises:
+            ValueError: If a path cannot be derived
+        """
+        if root.m_paths:
+            yield from self.__NodeKeys(root, substrate_obj)
+
+        stack = [(iter(root.m_children.values()), substrate_obj, "")]
+        while stack:
+            children_it, node_obj, node_path = stack[-1]
+            child = next(children_it, None)
+            if child is None:
+                stack.pop()
+                continue
+
+            child_path = node_path + child.m_elem.ToStr()  # type: ignore [union-attr]
+            try:
+                child_obj = node_obj.ChildKey(child.m_elem)  # type: ignore [arg-type]
+            except SubstrateKeyError as ex:
+                raise ValueError(f"Invalid path: {child_path}") from ex
+            self.m_deriv_num += 1
+
+            if child.m_paths:
+                yield from self.__NodeKeys(child, child_obj)
+            stack.append((iter(child.m_children.values()), child_obj, child_path))
+
+    @staticmethod
+    def __NodeKeys(node: HdWalletSubstratePathNode,
+                   substrate_obj: Substrate) -> Iterator[Tuple[str, HdWalletSubstrateKeys]]:
+        """
+        Create the keys of a trie node, for all the paths ending in it.
+
+        Args:
+            node (HdWalletSubstratePathNode object): Trie node
+            substrate_obj (Substrate object)       : Substrate object of the node
+
+        Returns:
+            Iterator object: Iterator over (path, keys) tuples
+        """
+        keys = HdWalletSubstrateKeys(substrate_obj)
+        for path in node.m_paths:
+            yield path, keys
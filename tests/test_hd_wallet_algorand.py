@@ -21,8 +21,9 @@
 
 # Imports
 import binascii
+import io
 
-from py_crypto_hd_wallet import HdWalletAlgorandFactory, HdWalletAlgorandWordsNum
+from py_crypto_hd_wallet import HdWalletAlgorandFactory, HdWalletAlgorandWordsNum, HdWalletSaver
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -140,6 +141,25 @@ class HdWalletAlgorandTests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletAlgorandFactory(), test)
 
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_async(HdWalletAlgorandFactory(), test)
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletAlgorandFactory(), test, workers)
+
+    # Test saving in NDJSON format (Algorand wallets have no addresses to be saved)
+    def test_ndjson(self):
+        hd_wallet = HdWalletAlgorandFactory().CreateRandom("test_wallet")
+        hd_wallet.Generate()
+        self.assertRaises(ValueError, HdWalletSaver(hd_wallet).SaveToNdjsonStream, io.StringIO())
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Construct a wallet factory
@@ -154,6 +174,10 @@ class HdWalletAlgorandTests(HdWalletBaseTests):
         invalid_mnemonic = "abandon abandon notexistent abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon invest"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"e6914a31dc45fe52a979acde7128cfb4a0f8c1b693fc79529eb97ea12afe02")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)
@@ -20,14 +20,17 @@
 
 
 # Imports
+import asyncio
 import binascii
 import json
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from py_crypto_hd_wallet import HdWalletSaver
+from py_crypto_hd_wallet import HdWalletAddrIndexReader, HdWalletColumnarReader, HdWalletSaver
 from py_crypto_hd_wallet.common.hd_wallet_addr_base import HdWalletAddrBase, HdWalletAddrBaseConst
 from py_crypto_hd_wallet.common.hd_wallet_keys_base import HdWalletKeysBase
+from py_crypto_hd_wallet.common.hd_wallet_reverse_index import HdWalletReverseIndex
 
 
 #
@@ -53,20 +56,7 @@ class HdWalletBaseTests(unittest.TestCase):
             self.assertFalse(hd_wallet.IsWatchOnly())
             self.__test_wallet_content(compare_wallet.ToDict(), hd_wallet, addr_off_enum, addr_key_format)
         else:
-            if test["type"] == "mnemonic":
-                hd_wallet = hd_wallet_fact.CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
-            elif test["type"] == "from_seed":
-                hd_wallet = hd_wallet_fact.CreateFromSeed(test["wallet_name"], binascii.unhexlify(test["seed"]))
-            elif test["type"] == "from_ex_key":
-                hd_wallet = hd_wallet_fact.CreateFromExtendedKey(test["wallet_name"], test["ex_key"])
-            elif test["type"] == "from_priv_key":
-                hd_wallet = hd_wallet_fact.CreateFromPrivateKey(test["wallet_name"], binascii.unhexlify(test["priv_key"]))
-            elif test["type"] == "from_pub_key":
-                hd_wallet = hd_wallet_fact.CreateFromPublicKey(test["wallet_name"], binascii.unhexlify(test["pub_key"]))
-            elif test["type"] == "from_monero_wo":
-                hd_wallet = hd_wallet_fact.CreateFromWatchOnly(test["wallet_name"], binascii.unhexlify(test["priv_key"]), binascii.unhexlify(test["pub_key"]))
-            else:
-                raise RuntimeError("Invalid test type")
+            hd_wallet = self._create_wallet(hd_wallet_fact, test)
 
             # Generate wallet
             hd_wallet.Generate(**test["gen_params"])
@@ -78,10 +68,236 @@ class HdWalletBaseTests(unittest.TestCase):
         # Test save to file
         self.__test_wallet_save_to_file(hd_wallet, "test_wallet.txt")
 
+    # Run a test in test vector by generating only the specified fields
+    def _test_wallet_fields(self, hd_wallet_fact, test, fields):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        hd_wallet.Generate(**test["gen_params"], fields=fields)
+
+        data_enum = hd_wallet.KeyEnum()
+        data_names = {field.name.lower() for field in fields if isinstance(field, data_enum)}
+        key_fields = [field for field in fields if not isinstance(field, data_enum)]
+
+        # Build the reference dictionary by keeping only the selected fields
+        ref_wallet_dict = {}
+        for dict_key, data in test["wallet_data_dict"].items():
+            if not isinstance(data, dict):
+                ref_wallet_dict[dict_key] = data
+            elif len(data_names) == 0 or dict_key in data_names:
+                ref_wallet_dict[dict_key] = self.__filter_keys_dict(data, key_fields)
+
+        self.assertEqual(ref_wallet_dict, hd_wallet.ToDict())
+        self.assertEqual(json.dumps(ref_wallet_dict, indent=4), hd_wallet.ToJson())
+
+    # Run a test in test vector by iterating over the addresses instead of generating them
+    def _test_wallet_iter(self, hd_wallet_fact, test, iter_fct_name, iter_params, addr_data_name="address"):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        addr_iter = getattr(hd_wallet, iter_fct_name)(**iter_params)
+
+        ref_addr = list(test["wallet_data_dict"].get(addr_data_name, {}).values())
+        self.assertEqual(ref_addr, [addr.ToDict() if hasattr(addr, "ToDict") else addr for addr in addr_iter])
+
+    # Run a test in test vector by using the asynchronous API
+    def _test_wallet_async(self, hd_wallet_fact, test, iter_fct_name=None, iter_params=None, addr_data_name="address"):
+        self.maxDiff = None
+
+        async def create_and_generate():
+            if test["type"] == "mnemonic":
+                hd_wallet = await hd_wallet_fact.CreateFromMnemonicAsync(test["wallet_name"], test["mnemonic"])
+            else:
+                hd_wallet = self._create_wallet(hd_wallet_fact, test)
+            await hd_wallet.GenerateAsync(**test["gen_params"])
+            return hd_wallet
+
+        async def iterate(hd_wallet, executor):
+            addr_iter = getattr(hd_wallet, iter_fct_name + "Async")(**iter_params, chunk_size=3, executor=executor)
+            return [addr.ToDict() if hasattr(addr, "ToDict") else addr async for addr in addr_iter]
+
+        hd_wallet = asyncio.run(create_and_generate())
+        self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+
+        if iter_fct_name is not None:
+            ref_addr = list(test["wallet_data_dict"].get(addr_data_name, {}).values())
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertEqual(ref_addr, asyncio.run(iterate(hd_wallet, executor)))
+
+    # Run a test in test vector by saving the addresses in NDJSON format
+    def _test_wallet_ndjson(self, hd_wallet_fact, test, file_path, addr_data_name="address"):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        hd_wallet.Generate(**test["gen_params"])
+
+        ref_records = []
+        for dict_key, addr in test["wallet_data_dict"][addr_data_name].items():
+            ref_addr = addr if isinstance(addr, dict) else {"address": addr}
+            ref_records.append({"index": int(dict_key.rsplit("_", 1)[1]), **ref_addr})
+
+        # Save with private keys and then append the last address again, without private keys
+        HdWalletSaver(hd_wallet).SaveToNdjsonFile(file_path, include_priv=True, chunk_size=64)
+        HdWalletSaver(hd_wallet).SaveToNdjsonFile(file_path, append=True, start_idx=ref_records[-1]["index"])
+        with open(file_path, "r") as f:
+            records = [json.loads(line) for line in f]
+        os.remove(file_path)
+
+        self.assertEqual(ref_records, records[:-1])
+        self.assertEqual({k: v for k, v in ref_records[-1].items() if "priv" not in k}, records[-1])
+
+    # Run a test in test vector by saving the addresses in columnar format
+    def _test_wallet_columnar(self, hd_wallet_fact, test, file_path, addr_data_name="address"):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        hd_wallet.Generate(**test["gen_params"])
+
+        ref_rows = [addr if isinstance(addr, dict) else {"address": addr}
+                    for addr in test["wallet_data_dict"][addr_data_name].values()]
+        ref_addr_off = int(next(iter(test["wallet_data_dict"][addr_data_name])).rsplit("_", 1)[1])
+
+        # Save with private keys
+        HdWalletSaver(hd_wallet).SaveToColumnarFile(file_path, include_priv=True)
+        with HdWalletColumnarReader(file_path) as reader:
+            self.assertEqual(len(ref_rows), len(reader))
+            self.assertEqual(ref_addr_off, reader.AddressOffset())
+            self.assertEqual(ref_rows, list(reader))
+            self.assertEqual(ref_rows[-1], reader[-1])
+            self.assertEqual(None, reader.GetValue(0, "not_existent"))
+            self.assertRaises(IndexError, reader.GetValue, len(ref_rows), "address")
+
+        # Save without private keys
+        HdWalletSaver(hd_wallet).SaveToColumnarFile(file_path)
+        with HdWalletColumnarReader(file_path) as reader:
+            self.assertEqual([{k: v for k, v in row.items() if "priv" not in k} for row in ref_rows], list(reader))
+        os.remove(file_path)
+
+    # Run a test in test vector by saving the addresses in an index file
+    def _test_wallet_addr_index(self, hd_wallet_fact, test, file_path, key_enum, addr_data_name="address"):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        hd_wallet.Generate(**test["gen_params"])
+
+        ref_wallet_dict = test["wallet_data_dict"]
+        ref_addr = list(ref_wallet_dict[addr_data_name].values())
+        ref_addr_off = int(next(iter(ref_wallet_dict[addr_data_name])).rsplit("_", 1)[1])
+
+        # Save with private keys
+        HdWalletSaver(hd_wallet).SaveToIndexFile(file_path, include_priv=True)
+        with HdWalletAddrIndexReader(file_path, key_enum) as reader:
+            self.assertEqual(len(ref_addr), len(reader))
+            self.assertEqual(ref_addr_off, reader.AddressOffset())
+            self.assertEqual(ref_wallet_dict.get("account_idx"), reader.AccountIndex())
+            self.assertEqual(ref_wallet_dict.get("change_idx"), reader.ChangeIndex())
+            for i, addr in enumerate(ref_addr):
+                addr_view = reader.GetByIndex(ref_addr_off + i)
+                if isinstance(addr, dict):
+                    self.__test_wallet_keys(addr, addr_view)
+                else:
+                    self.assertEqual({"address": addr}, addr_view.ToDict())
+            self.assertRaises(IndexError, reader.GetByIndex, ref_addr_off + len(ref_addr))
+            self.assertRaises(IndexError, reader.__getitem__, len(ref_addr))
+
+        # Save without private keys
+        HdWalletSaver(hd_wallet).SaveToIndexFile(file_path)
+        with HdWalletAddrIndexReader(file_path, key_enum) as reader:
+            self.assertEqual([{k: v for k, v in addr.items() if "priv" not in k} if isinstance(addr, dict)
+                              else {"address": addr} for addr in ref_addr],
+                             [addr_view.ToDict() for addr_view in reader])
+        os.remove(file_path)
+
+    # Run a test in test vector by generating the wallet with a reverse index
+    def _test_wallet_reverse_index(self, hd_wallet_fact, test, file_path, addr_data_name="address", change_idx=None):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        # Small capacity, so that the table is grown while adding addresses
+        hd_wallet.SetReverseIndex(HdWalletReverseIndex(1))
+        hd_wallet.Generate(**test["gen_params"])
+
+        ref_wallet_dict = test["wallet_data_dict"]
+        ref_addr = [addr["address"] if isinstance(addr, dict) else addr
+                    for addr in ref_wallet_dict[addr_data_name].values()]
+        ref_addr_off = int(next(iter(ref_wallet_dict[addr_data_name])).rsplit("_", 1)[1])
+        ref_change_idx = ref_wallet_dict.get("change_idx") if change_idx is None else change_idx
+        ref_entries = [(ref_wallet_dict.get("account_idx"), ref_change_idx, ref_addr_off + i)
+                       for i in range(len(ref_addr))]
+
+        rev_index = hd_wallet.ReverseIndex()
+        self.assertEqual(len(ref_addr), len(rev_index))
+        self.assertEqual(ref_entries, [rev_index.Lookup(addr) for addr in ref_addr])
+        self.assertTrue(ref_addr[0] in rev_index)
+        self.assertIsNone(rev_index.Lookup("invalid"))
+
+        # Save and load
+        rev_index.Save(file_path)
+        rev_index = HdWalletReverseIndex.Load(file_path)
+        self.assertEqual(len(ref_addr), rev_index.Count())
+        self.assertEqual(ref_entries, [rev_index.Lookup(addr) for addr in ref_addr])
+        os.remove(file_path)
+
+    # Run a test in test vector by creating the wallet from a batch of mnemonics
+    def _test_wallet_batch(self, hd_wallet_fact, test, workers):
+        mnemonics = [(test["wallet_name"], test["mnemonic"])] * 3
+        hd_wallets = list(hd_wallet_fact.CreateFromMnemonics(iter(mnemonics), workers))
+
+        self.assertEqual(len(mnemonics), len(hd_wallets))
+        for hd_wallet in hd_wallets:
+            hd_wallet.Generate(**test["gen_params"])
+            self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+
+    # Run a test in test vector by generating it twice, checking the derivation cache
+    def _test_wallet_deriv_cache(self, hd_wallet_fact, test):
+        hd_wallet = self._create_wallet(hd_wallet_fact, test)
+        deriv_cache = hd_wallet.DerivationCache()
+
+        # First generation derives all the levels
+        hd_wallet.Generate(**{**test["gen_params"], "addr_off": test["gen_params"]["addr_off"] + 1})
+        misses = deriv_cache.Misses()
+        self.assertEqual(0, deriv_cache.Hits())
+        self.assertEqual(misses, deriv_cache.Size())
+        # Second generation on the same path gets all the levels from the cache
+        hd_wallet.Generate(**test["gen_params"])
+        self.assertEqual(misses, deriv_cache.Misses())
+        self.assertEqual(misses, deriv_cache.Hits())
+        self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+
+        # Disable cache
+        deriv_cache.SetMaxSize(0)
+        self.assertEqual(0, deriv_cache.Size())
+        hd_wallet.Generate(**test["gen_params"])
+        self.assertEqual(misses, deriv_cache.Hits())
+        self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+
+        self.assertRaises(ValueError, deriv_cache.SetMaxSize, -1)
+
+    # Create a wallet from a test in test vector (random wallets are not supported)
+    @staticmethod
+    def _create_wallet(hd_wallet_fact, test):
+        if test["type"] == "mnemonic":
+            return hd_wallet_fact.CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
+        if test["type"] == "from_seed":
+            return hd_wallet_fact.CreateFromSeed(test["wallet_name"], binascii.unhexlify(test["seed"]))
+        if test["type"] == "from_ex_key":
+            return hd_wallet_fact.CreateFromExtendedKey(test["wallet_name"], test["ex_key"])
+        if test["type"] == "from_priv_key":
+            return hd_wallet_fact.CreateFromPrivateKey(test["wallet_name"], binascii.unhexlify(test["priv_key"]))
+        if test["type"] == "from_pub_key":
+            return hd_wallet_fact.CreateFromPublicKey(test["wallet_name"], binascii.unhexlify(test["pub_key"]))
+        if test["type"] == "from_monero_wo":
+            return hd_wallet_fact.CreateFromWatchOnly(test["wallet_name"], binascii.unhexlify(test["priv_key"]), binascii.unhexlify(test["pub_key"]))
+        raise RuntimeError("Invalid test type")
+
     #
     # Helper methods
     #
 
+    # Helper method for filtering a keys (or addresses) dictionary by key types
+    def __filter_keys_dict(self, data_dict, key_fields):
+        if len(key_fields) == 0:
+            return data_dict
+
+        key_names = {key_field.name.lower() for key_field in key_fields}
+        all_key_names = {key_type.name.lower() for key_type in type(key_fields[0])}
+
+        filtered_dict = {}
+        for dict_key, data in data_dict.items():
+            if isinstance(data, dict):
+                filtered_dict[dict_key] = self.__filter_keys_dict(data, key_fields)
+            elif dict_key not in all_key_names or dict_key in key_names:
+                filtered_dict[dict_key] = data
+        return filtered_dict
+
     # Helper method for testing a wallet content
     def __test_wallet_content(self, ref_wallet_dict, ut_wallet, addr_off_enum, addr_key_format):
         # Check the whole data as a dictionary
@@ -136,10 +352,15 @@ class HdWalletBaseTests(unittest.TestCase):
             if dict_key in ref_keys_dict:
                 self.assertTrue(ut_wallet_keys.HasKey(key_type))
                 self.assertEqual(ref_keys_dict[dict_key], ut_wallet_keys.GetKey(key_type))
+                # Binary keys shall be the same of the hex ones
+                key_bytes = ut_wallet_keys.GetKeyBytes(key_type)
+                if key_bytes is not None:
+                    self.assertEqual(ref_keys_dict[dict_key], key_bytes.hex())
             # If key type is not present, it shall be None
             else:
                 self.assertFalse(ut_wallet_keys.HasKey(key_type))
                 self.assertEqual(None, ut_wallet_keys.GetKey(key_type))
+                self.assertEqual(None, ut_wallet_keys.GetKeyBytes(key_type))
 
     # Helper method for testing wallet addresses
     def __test_wallet_addresses(self, test_addr_dict, ut_wallet_addr, addr_off, addr_key_format):
@@ -180,5 +401,11 @@ class HdWalletBaseTests(unittest.TestCase):
             saved_data = json.load(f)
         # Loaded data shall be the same
         self.assertEqual(ut_wallet.ToDict(), saved_data)
+
+        # Save wallet to file in stream mode, using a small chunk size to write it in many chunks
+        HdWalletSaver(ut_wallet).SaveToFile(file_path, stream=True, chunk_size=64)
+        # Content shall be the same of the JSON format
+        with open(file_path, "r") as f:
+            self.assertEqual(ut_wallet.ToJson(), f.read())
         # Remove file
         os.remove(file_path)
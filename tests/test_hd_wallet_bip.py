@@ -20,12 +20,27 @@
 
 
 # Imports
+import asyncio
 import binascii
+import copy
+import io
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from bip_utils import (
+    Bip44, Bip44Changes, Bip44Coins, Bip44Levels, Bip49, Bip49Coins, Bip84, Bip84Coins, Bip86, Bip86Coins
+)
 
 from py_crypto_hd_wallet import (
     HdWalletBip44Coins, HdWalletBip49Coins, HdWalletBip84Coins, HdWalletBip86Coins, HdWalletBipChanges,
-    HdWalletBipFactory, HdWalletBipWordsNum
+    HdWalletAddrIndexReader, HdWalletBipDataTypes, HdWalletBipDiscovery, HdWalletBipFactory, HdWalletBipUsedAddresses, HdWalletBipKeys, HdWalletBipKeyTypes, HdWalletBipSnapshot,
+    HdWalletBipWordsNum,
+    HdWalletColumnarReader, HdWalletMoneroKeyTypes, HdWalletSaver
 )
+from py_crypto_hd_wallet.common import HdWalletBloomFilter, HdWalletCoinInfo, HdWalletReverseIndex
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -527,6 +542,661 @@ class HdWalletBipTests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletBipFactory(test["coin"]), test)
 
+    # Run all tests in test vector with lazy keys
+    def test_vector_lazy_keys(self):
+        for test in TEST_VECTOR:
+            test_lazy = {**test, "gen_params": {**test["gen_params"], "lazy_keys": True}}
+            self._test_wallet(HdWalletBipFactory(test["coin"]), test_lazy)
+
+    # Test lazy keys
+    def test_lazy_keys(self):
+        test = TEST_VECTOR[2]
+        hd_wallet_fact = HdWalletBipFactory(test["coin"])
+
+        hd_wallet = hd_wallet_fact.CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
+        hd_wallet.Generate(**test["gen_params"], lazy_keys=True)
+
+        # Access single keys before the whole dictionary, the keys order shall not change
+        addr = hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS)[0]
+        self.assertTrue(addr.IsLazy())
+        self.assertEqual(test["wallet_data_dict"]["address"]["address_0"]["address"],
+                         addr.GetKey(HdWalletBipKeyTypes.ADDRESS))
+        self.assertFalse(addr.HasKey(HdWalletBipKeyTypes.WIF_PRIV))
+        self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+        self.assertEqual(json.dumps(test["wallet_data_dict"], indent=4), hd_wallet.ToJson())
+
+    # Run all tests in test vector with worker processes
+    def test_vector_workers(self):
+        for test in TEST_VECTOR:
+            test_workers = {**test, "gen_params": {**test["gen_params"], "workers": 2}}
+            self._test_wallet(HdWalletBipFactory(test["coin"]), test_workers)
+
+    # Run all tests in test vector by storing addresses in compact form
+    def test_vector_compact(self):
+        for test in TEST_VECTOR:
+            test_compact = {**test, "gen_params": {**test["gen_params"], "compact": True}}
+            self._test_wallet(HdWalletBipFactory(test["coin"]), test_compact)
+
+    # Test worker processes with more chunks than workers
+    def test_workers_chunks(self):
+        test = TEST_VECTOR[2]
+        hd_wallet = HdWalletBipFactory(test["coin"]).CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
+
+        hd_wallet.Generate(addr_num=100, addr_off=5)
+        ref_json = hd_wallet.ToJson()
+        hd_wallet.Generate(addr_num=100, addr_off=5, workers=3)
+        self.assertEqual(ref_json, hd_wallet.ToJson())
+
+        ref_addr = [addr.ToDict() for addr in hd_wallet.IterAddresses(start=5, stop=105)]
+        self.assertEqual(ref_addr, [addr.ToDict() for addr in hd_wallet.IterAddresses(start=5, stop=105, workers=3)])
+
+    # Test keys as raw bytes
+    def test_key_bytes(self):
+        test = TEST_VECTOR[2]
+        hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+        hd_wallet.Generate(**test["gen_params"])
+
+        for hd_wallet_keys in (hd_wallet.GetData(HdWalletBipDataTypes.ACCOUNT_KEY),
+                               hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS)[0]):
+            raw_priv = hd_wallet_keys.GetKeyBytes(HdWalletBipKeyTypes.RAW_PRIV)
+            self.assertTrue(isinstance(raw_priv, bytes))
+            self.assertEqual(hd_wallet_keys.GetKey(HdWalletBipKeyTypes.RAW_PRIV), raw_priv.hex())
+            self.assertEqual(raw_priv, hd_wallet_keys.ToRawDict()["raw_priv"])
+            # Textual keys are not returned as bytes
+            self.assertEqual(None, hd_wallet_keys.GetKeyBytes(HdWalletBipKeyTypes.ADDRESS))
+            self.assertEqual(None, hd_wallet_keys.GetKeyBytes(HdWalletBipKeyTypes.EX_PRIV))
+        self.assertRaises(TypeError, hd_wallet.GetData(HdWalletBipDataTypes.ACCOUNT_KEY).GetKeyBytes,
+                          HdWalletBipDataTypes.ADDRESS)
+
+    # Test that keys computed with cached coin information are the same of the coin configuration ones
+    def test_coin_info(self):
+        seed_bytes = binascii.unhexlify(b"5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc1"
+                                        b"9a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4")
+        # Bitcoin Cash and Cardano Byron addresses depend on the configuration or on the key, so they are not cached
+        for bip_cls, coin, is_addr_cached in ((Bip44, Bip44Coins.BITCOIN, True),
+                                              (Bip44, Bip44Coins.ETHEREUM, True),
+                                              (Bip44, Bip44Coins.NEO, True),
+                                              (Bip44, Bip44Coins.SOLANA, True),
+                                              (Bip44, Bip44Coins.BITCOIN_CASH, False),
+                                              (Bip44, Bip44Coins.CARDANO_BYRON_ICARUS, False),
+                                              (Bip49, Bip49Coins.LITECOIN, False),
+                                              (Bip84, Bip84Coins.BITCOIN, True),
+                                              (Bip86, Bip86Coins.BITCOIN, True)):
+            bip_obj = (bip_cls.FromSeed(seed_bytes, coin).Purpose().Coin().Account(0)
+                       .Change(Bip44Changes.CHAIN_EXT).AddressIndex(0))
+            coin_info = HdWalletCoinInfo.FromConf(bip_obj.CoinConf())
+            self.assertEqual(is_addr_cached, coin_info.HasAddressEncoder())
+
+            for hd_wallet_keys in (HdWalletBipKeys(bip_obj),
+                                   HdWalletBipKeys(bip_obj, coin_info=coin_info),
+                                   HdWalletBipKeys(bip_obj, True, coin_info=coin_info)):
+                self.assertEqual(bip_obj.PublicKey().ToAddress(), hd_wallet_keys.GetKey(HdWalletBipKeyTypes.ADDRESS))
+                self.assertEqual(bip_obj.PrivateKey().ToWif() or None,
+                                 hd_wallet_keys.GetKey(HdWalletBipKeyTypes.WIF_PRIV))
+
+        # Address cannot be encoded if not cached
+        coin_info = HdWalletCoinInfo.FromConf(Bip44.FromSeed(seed_bytes, Bip44Coins.BITCOIN_CASH).CoinConf())
+        self.assertRaises(ValueError, coin_info.EncodeAddress, bip_obj.PublicKey().Bip32Key().KeyObject())
+
+        # Unknown coin configuration layout (i.e. internal flag not found), the address is encoded by the public key
+        bip_obj = Bip44.FromSeed(seed_bytes, Bip44Coins.BITCOIN).Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
+        coin_conf = copy.copy(bip_obj.CoinConf())
+        del coin_conf.m_any_addr_params_fct_call
+        coin_info = HdWalletCoinInfo.FromConf(coin_conf)
+        self.assertFalse(coin_info.HasAddressEncoder())
+        self.assertEqual(bip_obj.PublicKey().ToAddress(),
+                         HdWalletBipKeys(bip_obj, coin_info=coin_info).GetKey(HdWalletBipKeyTypes.ADDRESS))
+
+    # Test saving in stream mode
+    def test_save_stream(self):
+        test = TEST_VECTOR[2]
+        hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+        hd_wallet.Generate(**test["gen_params"], lazy_keys=True)
+
+        file_obj = io.StringIO()
+        HdWalletSaver(hd_wallet).SaveToStream(file_obj, chunk_size=1)
+        self.assertEqual(hd_wallet.ToJson(), file_obj.getvalue())
+
+        self.assertRaises(ValueError, HdWalletSaver(hd_wallet).SaveToStream, io.StringIO(), 0)
+
+    # Test reading invalid columnar files
+    def test_columnar_invalid(self):
+        file_path = "test_wallet.hdwc"
+        for data in (b"", b"HDWCOL01", b"HDWCOL01" + b"\x00" * 16, b"{}" * 16):
+            with open(file_path, "wb") as f:
+                f.write(data)
+            self.assertRaises(ValueError, HdWalletColumnarReader, file_path)
+        os.remove(file_path)
+
+    # Test reading invalid index files
+    def test_addr_index_invalid(self):
+        file_path = "test_wallet.hdwi"
+        for data in (b"", b"HDWIDX01", b"HDWIDX01" + b"\x02\x00\x00\x00{}", b"{}" * 16):
+            with open(file_path, "wb") as f:
+                f.write(data)
+            self.assertRaises(ValueError, HdWalletAddrIndexReader, file_path, HdWalletBipKeyTypes)
+
+        # Key type enumerative not compatible with the saved wallet
+        test = TEST_VECTOR[2]
+        hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+        hd_wallet.Generate(**test["gen_params"])
+        HdWalletSaver(hd_wallet).SaveToIndexFile(file_path)
+        self.assertRaises(ValueError, HdWalletAddrIndexReader, file_path, HdWalletMoneroKeyTypes)
+        os.remove(file_path)
+
+    # Test raw keys read from index files, which are views of the file
+    def test_addr_index_key_bytes(self):
+        file_path = "test_wallet.hdwi"
+        test = TEST_VECTOR[2]
+        hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+        hd_wallet.Generate(**test["gen_params"])
+        HdWalletSaver(hd_wallet).SaveToIndexFile(file_path, include_priv=True)
+
+        hd_wallet_keys = hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS)[0]
+        with HdWalletAddrIndexReader(file_path, HdWalletBipKeyTypes) as reader:
+            key_bytes = reader[0].GetKeyBytes(HdWalletBipKeyTypes.RAW_COMPR_PUB)
+            self.assertIsInstance(key_bytes, memoryview)
+            self.assertTrue(key_bytes.readonly)
+            self.assertEqual(hd_wallet_keys.GetKeyBytes(HdWalletBipKeyTypes.RAW_COMPR_PUB), key_bytes)
+            self.assertIsInstance(reader[0].ToRawDict()["address"], str)
+        # Closing the reader while a key is still referenced shall not fail
+        self.assertEqual(hd_wallet_keys.GetKeyBytes(HdWalletBipKeyTypes.RAW_COMPR_PUB), bytes(key_bytes))
+        del key_bytes
+        os.remove(file_path)
+
+    # Test reverse index
+    def test_reverse_index(self):
+        self.assertRaises(ValueError, HdWalletReverseIndex, 0)
+
+        rev_index = HdWalletReverseIndex(3)
+        self.assertEqual(4, rev_index.Capacity())
+        for i in range(100):
+            rev_index.Add(f"addr_{i}", 0, i % 2, i)
+        self.assertEqual(100, len(rev_index))
+        self.assertEqual(256, rev_index.Capacity())
+        self.assertEqual((0, 1, 99), rev_index.Lookup("addr_99"))
+        # Existing keys are replaced
+        rev_index.Add(b"addr_99", None, None, 1000)
+        self.assertEqual(100, len(rev_index))
+        self.assertEqual((None, None, 1000), rev_index.Lookup("addr_99"))
+        self.assertRaises(ValueError, rev_index.Add, "addr", 0, 0, -1)
+        self.assertRaises(ValueError, rev_index.Add, "addr", 0, 0, 2**32)
+
+        # Memory mapped index, slots are copied to memory when adding entries
+        file_path = "test_wallet.hdwr"
+        rev_index.Save(file_path)
+        mapped_index = HdWalletReverseIndex.Load(file_path, use_mmap=True)
+        self.assertTrue(mapped_index.IsMapped())
+        self.assertEqual(100, len(mapped_index))
+        self.assertEqual(256, mapped_index.Capacity())
+        self.assertEqual((0, 0, 98), mapped_index.Lookup("addr_98"))
+        self.assertEqual((None, None, 1000), mapped_index.Lookup("addr_99"))
+        mapped_index.Add("addr_100", 1, 0, 100)
+        self.assertFalse(mapped_index.IsMapped())
+        self.assertEqual((1, 0, 100), mapped_index.Lookup("addr_100"))
+        self.assertEqual((0, 0, 98), mapped_index.Lookup("addr_98"))
+        self.assertFalse(HdWalletReverseIndex.Load(file_path).IsMapped())
+        del mapped_index
+        os.remove(file_path)
+
+        rev_index.Clear()
+        self.assertEqual(0, len(rev_index))
+        self.assertEqual(256, rev_index.Capacity())
+        self.assertFalse("addr_0" in rev_index)
+
+        # Invalid files
+        for data in (b"", b"HDWRIX01", b"HDWRIX01" + b"\x02\x00\x00\x00{}", b"{}" * 16):
+            with open(file_path, "wb") as f:
+                f.write(data)
+            for use_mmap in (False, True):
+                self.assertRaises(ValueError, HdWalletReverseIndex.Load, file_path, use_mmap)
+        os.remove(file_path)
+
+    # Test Bloom filter
+    def test_filter(self):
+        # Address and scriptPubKey of the first external address of account 0 for each specification
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        filter_tests = [
+            (HdWalletBip44Coins.BITCOIN, "1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabA",
+             "76a914d986ed01b7a22225a70edbf2ba7cfb63a15cb3aa88ac"),
+            (HdWalletBip49Coins.BITCOIN, "37VucYSaXLCAsxYyAPfbSi9eh4iEcbShgf",
+             "a9143fb6e95812e57bb4691f9a4a628862a61a4f769b87"),
+            (HdWalletBip84Coins.BITCOIN, "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu",
+             "0014c0cebcd6c3d3ca8c75dc5ec62ebe55330ef910e2"),
+            (HdWalletBip86Coins.BITCOIN, "bc1p5cyxnuxmeuwuvkwfem96lqzszd02n6xdcjrs20cac6yqjjwudpxqkedrcr",
+             "5120a60869f0dbcf1dc659c9cecbaf8050135ea9e8cdc487053f1dc6880949dc684c"),
+        ]
+        for coin, address, script_pub_key in filter_tests:
+            hd_wallet = HdWalletBipFactory(coin).CreateFromMnemonic("test", mnemonic)
+            bloom_filter = hd_wallet.BuildFilter(range(2), 10)
+            self.assertEqual(2 * 2 * 10 * 2, len(bloom_filter))
+            self.assertTrue(address in bloom_filter)
+            self.assertTrue(binascii.unhexlify(script_pub_key) in bloom_filter)
+
+        # All the addresses of both accounts and chains are added
+        for acc_idx in range(2):
+            for change_idx in HdWalletBipChanges:
+                hd_wallet.Generate(acc_idx=acc_idx, change_idx=change_idx, addr_num=10)
+                for addr in hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS):
+                    self.assertTrue(bloom_filter.MayContain(addr.GetKey(HdWalletBipKeyTypes.ADDRESS)))
+        # Addresses not belonging to the wallet are (almost always) rejected
+        self.assertLessEqual(sum(f"addr_{i}" in bloom_filter for i in range(10000)), 50)
+
+        # Save and load
+        file_path = "test_wallet.hdwb"
+        bloom_filter.Save(file_path)
+        loaded_filter = HdWalletBloomFilter.Load(file_path)
+        self.assertEqual(len(bloom_filter), len(loaded_filter))
+        self.assertEqual(bloom_filter.BitNum(), loaded_filter.BitNum())
+        self.assertEqual(bloom_filter.HashNum(), loaded_filter.HashNum())
+        self.assertTrue(address in loaded_filter)
+        for data in (b"", b"HDWBLM01", b"HDWBLM01" + b"\x02\x00\x00\x00{}", b"{}" * 16):
+            with open(file_path, "wb") as f:
+                f.write(data)
+            self.assertRaises(ValueError, HdWalletBloomFilter.Load, file_path)
+        os.remove(file_path)
+
+        # Invalid parameters
+        self.assertRaises(ValueError, hd_wallet.BuildFilter, [], 10)
+        self.assertRaises(ValueError, hd_wallet.BuildFilter, range(2), 0)
+        self.assertRaises(ValueError, hd_wallet.BuildFilter, range(2), 10, -1)
+        self.assertRaises(ValueError, hd_wallet.BuildFilter, range(2), 10, fp_rate=0.0)
+        self.assertRaises(ValueError, HdWalletBloomFilter, 0)
+
+    # Test discovery
+    def test_discovery(self):
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("test", mnemonic)
+
+        # Used addresses: index 30 of account 0 external chain is after the gap, so it shall not be discovered
+        used_idxs = {
+            (0, HdWalletBipChanges.CHAIN_EXT): [0, 5, 30],
+            (0, HdWalletBipChanges.CHAIN_INT): [2],
+            (1, HdWalletBipChanges.CHAIN_EXT): [19],
+            (3, HdWalletBipChanges.CHAIN_EXT): [0],
+        }
+        used_addr = []
+        for (acc_idx, change_idx), addr_idxs in used_idxs.items():
+            addresses = list(hd_wallet.IterAddresses(acc_idx, change_idx, 0, 31))
+            used_addr += [addresses[addr_idx].GetKey(HdWalletBipKeyTypes.ADDRESS) for addr_idx in addr_idxs]
+        ref_chains = [
+            (0, HdWalletBipChanges.CHAIN_EXT, [0, 5], 6),
+            (0, HdWalletBipChanges.CHAIN_INT, [2], 3),
+            (1, HdWalletBipChanges.CHAIN_EXT, [19], 20),
+            (1, HdWalletBipChanges.CHAIN_INT, [], 0),
+        ]
+
+        async def is_used_async(addresses):
+            await asyncio.sleep(0)
+            return HdWalletBipUsedAddresses(used_addr)(addresses)
+
+        for batch_size in (None, 1, 7, 100):
+            discovery = HdWalletBipDiscovery(hd_wallet, HdWalletBipUsedAddresses(used_addr), batch_size=batch_size)
+            for chains in (discovery.Discover(),
+                           asyncio.run(HdWalletBipDiscovery(hd_wallet, is_used_async,
+                                                            batch_size=batch_size).DiscoverAsync())):
+                self.assertEqual(ref_chains,
+                                 [(chain.AccountIndex(), chain.ChangeIndex(), chain.UsedIndexes(), chain.AddressNum())
+                                  for chain in chains])
+
+            stats = discovery.Stats()
+            self.assertGreaterEqual(stats.DerivedAddresses(), 6 + 20 + 3 + 20 + 20 + 20 + 20)
+            self.assertGreater(stats.CallbackCalls(), 0)
+            self.assertGreater(stats.DerivationsPerSecond(), 0)
+            self.assertGreaterEqual(stats.MaxCallbackLatency(), stats.AvgCallbackLatency())
+            stats.Reset()
+            self.assertEqual(0, stats.DerivedAddresses())
+
+        # No used address
+        self.assertEqual([], HdWalletBipDiscovery(hd_wallet, HdWalletBipUsedAddresses([])).Discover())
+
+        # Asynchronous function with synchronous discovery
+        self.assertRaises(TypeError, HdWalletBipDiscovery(hd_wallet, is_used_async).Discover)
+        # Wrong number of flags
+        self.assertRaises(ValueError, HdWalletBipDiscovery(hd_wallet, lambda addresses: [True]).Discover)
+        # Invalid parameters
+        self.assertRaises(ValueError, HdWalletBipDiscovery, hd_wallet, is_used_async, gap_limit=0)
+        self.assertRaises(ValueError, HdWalletBipDiscovery, hd_wallet, is_used_async, batch_size=0)
+        hd_wallet.Generate(addr_num=1)
+        change_ex_key = hd_wallet.GetData(HdWalletBipDataTypes.CHANGE_KEY).GetKey(HdWalletBipKeyTypes.EX_PRIV)
+        hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromExtendedKey("test", change_ex_key)
+        self.assertRaises(ValueError, HdWalletBipDiscovery, hd_wallet, is_used_async)
+
+    # Test discovery with worker processes, checking that a single pool is used for the whole discovery
+    def test_discovery_workers(self):
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("test", mnemonic)
+
+        used_idxs = {
+            (0, HdWalletBipChanges.CHAIN_EXT): [0, 5, 24],
+            (0, HdWalletBipChanges.CHAIN_INT): [2],
+            (1, HdWalletBipChanges.CHAIN_EXT): [19],
+        }
+        used_addr = []
+        for (acc_idx, change_idx), addr_idxs in used_idxs.items():
+            addresses = list(hd_wallet.IterAddresses(acc_idx, change_idx, 0, 25))
+            used_addr += [addresses[addr_idx].GetKey(HdWalletBipKeyTypes.ADDRESS) for addr_idx in addr_idxs]
+        ref_chains = HdWalletBipDiscovery(hd_wallet, HdWalletBipUsedAddresses(used_addr), batch_size=7).Discover()
+
+        async def is_used_async(addresses):
+            await asyncio.sleep(0)
+            return HdWalletBipUsedAddresses(used_addr)(addresses)
+
+        for discover_fct in (HdWalletBipDiscovery(hd_wallet, HdWalletBipUsedAddresses(used_addr),
+                                                  batch_size=7, workers=2).Discover,
+                             lambda: asyncio.run(HdWalletBipDiscovery(hd_wallet, is_used_async,
+                                                                      batch_size=7, workers=2).DiscoverAsync())):
+            with mock.patch("py_crypto_hd_wallet.common.hd_wallet_workers.ProcessPoolExecutor",
+                            wraps=ProcessPoolExecutor) as executor_mock:
+                chains = discover_fct()
+            self.assertEqual([(chain.AccountIndex(), chain.ChangeIndex(), chain.UsedIndexes(), chain.AddressNum())
+                              for chain in ref_chains],
+                             [(chain.AccountIndex(), chain.ChangeIndex(), chain.UsedIndexes(), chain.AddressNum())
+                              for chain in chains])
+            self.assertEqual(1, executor_mock.call_count)
+
+    # Test discovery with a batch size smaller than the gap limit, checking that the gap is counted across batches
+    def test_discovery_small_batch(self):
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("test", mnemonic)
+
+        # Index 5 is right before the gap (4 unused addresses), index 11 right after it (5 unused addresses)
+        addresses = list(hd_wallet.IterAddresses(0, HdWalletBipChanges.CHAIN_EXT, 0, 12))
+        used_addr = [addresses[addr_idx].GetKey(HdWalletBipKeyTypes.ADDRESS) for addr_idx in (0, 5, 11)]
+
+        for batch_size in (1, 2, 3, 4):
+            call_sizes = []
+
+            def is_used(addresses):
+                call_sizes.append(len(addresses))
+                return HdWalletBipUsedAddresses(used_addr)(addresses)
+
+            chains = HdWalletBipDiscovery(hd_wallet, is_used, gap_limit=5, batch_size=batch_size).Discover()
+            self.assertEqual([(0, HdWalletBipChanges.CHAIN_EXT, [0, 5], 6), (0, HdWalletBipChanges.CHAIN_INT, [], 0)],
+                             [(chain.AccountIndex(), chain.ChangeIndex(), chain.UsedIndexes(), chain.AddressNum())
+                              for chain in chains])
+            # The batch size is not raised to the gap limit
+            self.assertEqual(batch_size, max(call_sizes))
+
+    # Test asynchronous API
+    def test_async(self):
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        hd_wallet = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonic("test", mnemonic)
+
+        async def invalid_mnemonic():
+            await HdWalletBipFactory(HdWalletBip84Coins.BITCOIN).CreateFromMnemonicAsync("test", mnemonic[:-1])
+
+        async def iterate(**kwargs):
+            return [addr async for addr in hd_wallet.IterAddressesAsync(**kwargs)]
+
+        async def iterate_and_cancel():
+            iter_addr = []
+            loop_turns = 0
+
+            async def iterate_all():
+                async for addr in hd_wallet.IterAddressesAsync(stop=2**31 - 1, chunk_size=1):
+                    iter_addr.append(addr)
+
+            task = asyncio.ensure_future(iterate_all())
+            # The event loop shall be free while iterating
+            while len(iter_addr) < 5:
+                loop_turns += 1
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return iter_addr, loop_turns
+
+        self.assertRaises(ValueError, asyncio.run, invalid_mnemonic())
+        self.assertRaises(ValueError, asyncio.run, iterate(chunk_size=0))
+        self.assertRaises(ValueError, asyncio.run, iterate(start=2, stop=1))
+        self.assertEqual([addr.ToDict() for addr in hd_wallet.IterAddresses(start=3, stop=10)],
+                         [addr.ToDict() for addr in asyncio.run(iterate(start=3, stop=10, chunk_size=4))])
+
+        # Only thread pool executors are supported
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertRaises(TypeError, asyncio.run, iterate(stop=1, executor=executor))
+            self.assertRaises(TypeError, asyncio.run, hd_wallet.GenerateAsync(addr_num=1, executor=executor))
+
+        iter_addr, loop_turns = asyncio.run(iterate_and_cancel())
+        self.assertGreater(loop_turns, 1)
+        self.assertLess(len(iter_addr), 100)
+        self.assertEqual([addr.ToDict() for addr in hd_wallet.IterAddresses(stop=len(iter_addr))],
+                         [addr.ToDict() for addr in iter_addr])
+
+        # The iterator (i.e. the derivation of the parent keys) shall be created in the executor
+        iter_thread_ids = []
+        iter_addresses = hd_wallet.IterAddresses
+
+        def iter_addresses_thread(*args, **kwargs):
+            iter_thread_ids.append(threading.get_ident())
+            return iter_addresses(*args, **kwargs)
+
+        hd_wallet.IterAddresses = iter_addresses_thread
+        self.assertEqual(2, len(asyncio.run(iterate(acc_idx=1, stop=2))))
+        self.assertEqual(1, len(iter_thread_ids))
+        self.assertNotEqual(threading.get_ident(), iter_thread_ids[0])
+
+    # Test snapshot
+    def test_snapshot(self):
+        mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+        hd_wallet_fact = HdWalletBipFactory(HdWalletBip84Coins.BITCOIN)
+        hd_wallet = hd_wallet_fact.CreateFromMnemonic("test", mnemonic)
+
+        # Restored wallets shall be the same of the ones created from the account extended public key,
+        # without deriving the change level again
+        hd_wallet.Generate(acc_idx=1, addr_num=0)
+        acc_ex_key = hd_wallet.GetData(HdWalletBipDataTypes.ACCOUNT_KEY).ToDict()["ex_pub"]
+        pub_wallet = hd_wallet_fact.CreateFromExtendedKey("test", acc_ex_key)
+
+        snapshot = HdWalletBipSnapshot.FromBytes(hd_wallet.Snapshot(1).ToBytes())
+        self.assertEqual("test", snapshot.WalletName())
+        restored_wallet = hd_wallet_fact.CreateFromSnapshot(snapshot)
+        self.assertTrue(restored_wallet.IsWatchOnly())
+        for change_idx in HdWalletBipChanges:
+            pub_wallet.Generate(change_idx=change_idx, addr_num=3, addr_off=5)
+            restored_wallet.Generate(change_idx=change_idx, addr_num=3, addr_off=5)
+            self.assertEqual(pub_wallet.ToDict(), restored_wallet.ToDict())
+        self.assertEqual(0, restored_wallet.DerivationCache().Misses())
+
+        # Snapshot of a wallet at change level
+        change_ex_key = pub_wallet.GetData(HdWalletBipDataTypes.CHANGE_KEY).ToDict()["ex_pub"]
+        change_wallet = hd_wallet_fact.CreateFromExtendedKey("test", change_ex_key)
+        restored_wallet = hd_wallet_fact.CreateFromSnapshot(change_wallet.Snapshot())
+        self.assertEqual([addr.ToDict() for addr in change_wallet.IterAddresses(stop=3)],
+                         [addr.ToDict() for addr in restored_wallet.IterAddresses(stop=3)])
+
+        # Invalid wallet level or coin
+        addr_wallet = hd_wallet_fact.CreateFromExtendedKey(
+            "test", pub_wallet.GetData(HdWalletBipDataTypes.ADDRESS)[0].ToDict()["ex_pub"]
+        )
+        self.assertRaises(ValueError, addr_wallet.Snapshot)
+        self.assertRaises(ValueError, HdWalletBipFactory(HdWalletBip84Coins.LITECOIN).CreateFromSnapshot, snapshot)
+        self.assertRaises(ValueError, HdWalletBipFactory(HdWalletBip44Coins.BITCOIN).CreateFromSnapshot, snapshot)
+
+        # Invalid data
+        snapshot_bytes = snapshot.ToBytes()
+        for data in (b"", snapshot_bytes[:-1], snapshot_bytes + b"\x00"):
+            self.assertRaises(ValueError, HdWalletBipSnapshot.FromBytes, data)
+        self.assertRaises(ValueError, HdWalletBipSnapshot, "test", "BIP-0084", "Bitcoin (BTC)", [])
+        invalid_point = snapshot_bytes[:-65] + b"\x04" + b"\x00" * 64
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromSnapshot, HdWalletBipSnapshot.FromBytes(invalid_point))
+
+        # Invalid files
+        file_path = "test_wallet.hdws"
+        for data in (b"", b"HDWBSN01", b"HDWBSN01" + b"\x01\x00\x00\x00", b"HDWBSN00" + b"\x00" * 4):
+            with open(file_path, "wb") as f:
+                f.write(data)
+            self.assertRaises(ValueError, HdWalletBipSnapshot.LoadFromFile, file_path)
+        os.remove(file_path)
+
+    # Test compact addresses
+    def test_compact(self):
+        test = TEST_VECTOR[3]
+        hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+        hd_wallet.Generate(**test["gen_params"], compact=True)
+
+        hd_wallet_addr = hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS)
+        ref_addr = list(test["wallet_data_dict"]["address"].values())
+        self.assertTrue(hd_wallet_addr.IsCompact())
+        self.assertFalse(hd_wallet_addr[0].IsLazy())
+        self.assertEqual(HdWalletBipKeyTypes, hd_wallet_addr[0].KeyEnum())
+        self.assertEqual(ref_addr[-1], hd_wallet_addr[-1].ToDict())
+        self.assertEqual(json.dumps(ref_addr[0], indent=4), hd_wallet_addr[0].ToJson())
+        self.assertRaises(IndexError, hd_wallet_addr.__getitem__, len(ref_addr))
+        self.assertRaises(TypeError, hd_wallet_addr[0].GetKey, HdWalletBipDataTypes.ADDRESS)
+
+        # Lazy keys are computed before storing them, appended addresses are stored in compact form too
+        hd_wallet.Generate(**test["gen_params"], lazy_keys=True, compact=True)
+        hd_wallet.Generate(addr_num=2, append=True)
+        self.assertTrue(hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS).IsCompact())
+        self.assertEqual(ref_addr, [addr.ToDict() for addr in hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS)][:3])
+
+    # Run all tests in test vector by generating only some fields
+    def test_vector_fields(self):
+        fields = {
+            HdWalletBipDataTypes.ACCOUNT_KEY,
+            HdWalletBipDataTypes.ADDRESS,
+            HdWalletBipKeyTypes.EX_PUB,
+            HdWalletBipKeyTypes.ADDRESS,
+        }
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_fields(HdWalletBipFactory(test["coin"]), test, fields)
+
+    # Run all tests in test vector by iterating over the addresses
+    def test_vector_iter(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_iter(HdWalletBipFactory(test["coin"]),
+                                       test,
+                                       "IterAddresses",
+                                       {
+                                           "acc_idx": gen_params["acc_idx"],
+                                           "change_idx": gen_params["change_idx"],
+                                           "start": gen_params["addr_off"],
+                                           "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                       })
+
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_async(HdWalletBipFactory(test["coin"]),
+                                        test,
+                                        "IterAddresses",
+                                        {
+                                            "acc_idx": gen_params["acc_idx"],
+                                            "change_idx": gen_params["change_idx"],
+                                            "start": gen_params["addr_off"],
+                                            "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                        })
+
+    # Run all tests in test vector by restoring them from a snapshot
+    def test_vector_snapshot(self):
+        file_path = "test_wallet.hdws"
+        for test in TEST_VECTOR:
+            if test["type"] == "random":
+                continue
+
+            hd_wallet_fact = HdWalletBipFactory(test["coin"])
+            hd_wallet = self._create_wallet(hd_wallet_fact, test)
+            if hd_wallet.Level() == Bip44Levels.ADDRESS_INDEX:
+                self.assertRaises(ValueError, hd_wallet.Snapshot)
+                continue
+
+            gen_params = test["gen_params"]
+            HdWalletBipSnapshot.SaveToFile(file_path, [hd_wallet.Snapshot(gen_params["acc_idx"])] * 2)
+            snapshots = HdWalletBipSnapshot.LoadFromFile(file_path)
+            self.assertEqual(2, len(snapshots))
+
+            restored_wallet = hd_wallet_fact.CreateFromSnapshot(snapshots[-1])
+            restored_wallet.Generate(**gen_params)
+            self.assertEqual(test["wallet_name"], restored_wallet.GetData(HdWalletBipDataTypes.WALLET_NAME))
+            self.assertEqual([{k: v for k, v in addr.items() if "priv" not in k}
+                              for addr in test["wallet_data_dict"]["address"].values()],
+                             list(restored_wallet.GetData(HdWalletBipDataTypes.ADDRESS).ToDict().values()))
+        os.remove(file_path)
+
+    # Run all tests in test vector by generating them twice with the derivation cache
+    def test_vector_deriv_cache(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_deriv_cache(HdWalletBipFactory(test["coin"]), test)
+
+    # Run all tests in test vector by generating the first address and appending the other ones
+    def test_vector_append(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                for workers in (None, 2):
+                    hd_wallet = self._create_wallet(HdWalletBipFactory(test["coin"]), test)
+                    hd_wallet.Generate(**{**test["gen_params"], "addr_num": 1})
+                    hd_wallet.Generate(**{**test["gen_params"], "addr_num": test["gen_params"]["addr_num"] - 1},
+                                       append=True,
+                                       workers=workers)
+
+                    self.assertEqual(test["wallet_data_dict"], hd_wallet.ToDict())
+                    self.assertEqual(json.dumps(test["wallet_data_dict"], indent=4), hd_wallet.ToJson())
+
+    # Test appending addresses in more steps
+    def test_append(self):
+        test = TEST_VECTOR[2]
+        hd_wallet = HdWalletBipFactory(test["coin"]).CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
+
+        hd_wallet.Generate(addr_num=30, addr_off=5)
+        ref_json = hd_wallet.ToJson()
+
+        # Appending to a wallet without addresses generates them from the address offset
+        hd_wallet = HdWalletBipFactory(test["coin"]).CreateFromMnemonic(test["wallet_name"], test["mnemonic"])
+        hd_wallet.Generate(addr_num=10, addr_off=5, append=True)
+        # Address offset is ignored when appending
+        hd_wallet.Generate(addr_num=10, addr_off=100, append=True)
+        hd_wallet.Generate(addr_num=0, append=True)
+        hd_wallet.Generate(addr_num=10, append=True)
+
+        self.assertEqual(30, hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS).Count())
+        self.assertEqual(35, hd_wallet.GetData(HdWalletBipDataTypes.ADDRESS).NextIndex())
+        self.assertEqual(ref_json, hd_wallet.ToJson())
+
+        # Different account or change index
+        self.assertRaises(ValueError, hd_wallet.Generate, acc_idx=1, append=True)
+        self.assertRaises(ValueError, hd_wallet.Generate, change_idx=HdWalletBipChanges.CHAIN_INT, append=True)
+        # Address index beyond 2^32
+        self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2**32 - 35, append=True)
+
+    # Run all tests in test vector by saving the addresses in NDJSON format
+    def test_vector_ndjson(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_ndjson(HdWalletBipFactory(test["coin"]), test, "test_wallet.ndjson")
+
+    # Run all tests in test vector by saving the addresses in columnar format
+    def test_vector_columnar(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_columnar(HdWalletBipFactory(test["coin"]), test, "test_wallet.hdwc")
+
+    # Run all tests in test vector by saving the addresses in an index file
+    def test_vector_addr_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_addr_index(HdWalletBipFactory(test["coin"]), test, "test_wallet.hdwi", HdWalletBipKeyTypes)
+
+    # Run all tests in test vector by generating the addresses with a reverse index
+    def test_vector_reverse_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_reverse_index(HdWalletBipFactory(test["coin"]), test, "test_wallet.hdwr")
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletBipFactory(test["coin"]), test, workers)
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Invalid parameters during construction
@@ -544,6 +1214,10 @@ class HdWalletBipTests(HdWalletBaseTests):
         invalid_mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon notexistent about"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)
@@ -557,11 +1231,19 @@ class HdWalletBipTests(HdWalletBaseTests):
 
         # Invalid parameters for Generate
         self.assertRaises(TypeError, hd_wallet.Generate, change_idx=0)
+        self.assertRaises(TypeError, hd_wallet.Generate, fields={HdWalletBipChanges.CHAIN_EXT})
+        # Invalid parameters for IterAddresses
+        self.assertRaises(TypeError, hd_wallet.IterAddresses, change_idx=0)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=2, stop=1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, stop=2**32)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, workers=0)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2, addr_off=2**32-2)
+        self.assertRaises(ValueError, hd_wallet.Generate, workers=0)
         # Invalid parameters for getting data
         self.assertRaises(TypeError, hd_wallet.GetData, 0)
         self.assertRaises(TypeError, hd_wallet.HasData, 0)
@@ -21,13 +21,18 @@
 
 # Imports
 import binascii
+import json
+import os
 
-from bip_utils import Bip44, Bip44Coins, Cip1852, Cip1852Coins
+from bip_utils import Bip44, Bip44Coins, CardanoShelley, Cip1852, Cip1852Coins
+from bip_utils.utils.crypto import Blake2b224
 
 from py_crypto_hd_wallet import (
-    HdWalletCardanoShelley, HdWalletCardanoShelleyChanges, HdWalletCardanoShelleyCoins, HdWalletCardanoShelleyFactory,
-    HdWalletCardanoShelleyWordsNum
+    HdWalletAddrIndexReader, HdWalletCardanoShelley, HdWalletCardanoShelleyAddressBatch, HdWalletCardanoShelleyAddresses, HdWalletCardanoShelleyChanges,
+    HdWalletCardanoShelleyCoins, HdWalletCardanoShelleyDataTypes, HdWalletCardanoShelleyFactory,
+    HdWalletCardanoShelleyKeyTypes, HdWalletCardanoShelleyWordsNum, HdWalletColumnarReader, HdWalletSaver
 )
+from py_crypto_hd_wallet.common import HdWalletReverseIndex
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -324,6 +329,211 @@ class HdWalletCardanoShelleyTests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletCardanoShelleyFactory(test["coin"]), test)
 
+    # Run all tests in test vector with worker processes
+    def test_vector_workers(self):
+        for test in TEST_VECTOR:
+            test_workers = {**test, "gen_params": {**test["gen_params"], "workers": 2}}
+            self._test_wallet(HdWalletCardanoShelleyFactory(test["coin"]), test_workers)
+
+    # Run all tests in test vector by storing addresses in compact form
+    def test_vector_compact(self):
+        for test in TEST_VECTOR:
+            test_compact = {**test, "gen_params": {**test["gen_params"], "compact": True}}
+            self._test_wallet(HdWalletCardanoShelleyFactory(test["coin"]), test_compact)
+
+    # Run all tests in test vector by generating only some fields
+    def test_vector_fields(self):
+        fields = {
+            HdWalletCardanoShelleyDataTypes.ADDRESS,
+            HdWalletCardanoShelleyDataTypes.STAKING_KEY,
+            HdWalletCardanoShelleyKeyTypes.RAW_PUB,
+            HdWalletCardanoShelleyKeyTypes.ADDRESS,
+        }
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_fields(HdWalletCardanoShelleyFactory(test["coin"]), test, fields)
+
+    # Run all tests in test vector by iterating over the addresses
+    def test_vector_iter(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_iter(HdWalletCardanoShelleyFactory(test["coin"]),
+                                       test,
+                                       "IterAddresses",
+                                       {
+                                           "acc_idx": gen_params["acc_idx"],
+                                           "change_idx": gen_params["change_idx"],
+                                           "start": gen_params["addr_off"],
+                                           "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                       })
+
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_async(HdWalletCardanoShelleyFactory(test["coin"]),
+                                        test,
+                                        "IterAddresses",
+                                        {
+                                            "acc_idx": gen_params["acc_idx"],
+                                            "change_idx": gen_params["change_idx"],
+                                            "start": gen_params["addr_off"],
+                                            "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                        })
+
+    # Run all tests in test vector by generating them twice with the derivation cache
+    def test_vector_deriv_cache(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_deriv_cache(HdWalletCardanoShelleyFactory(test["coin"]), test)
+
+    # Run all tests in test vector by saving the addresses in NDJSON format
+    def test_vector_ndjson(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_ndjson(HdWalletCardanoShelleyFactory(test["coin"]), test, "test_wallet.ndjson")
+
+    # Run all tests in test vector by saving the addresses in columnar format
+    def test_vector_columnar(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_columnar(HdWalletCardanoShelleyFactory(test["coin"]), test, "test_wallet.hdwc")
+
+    # Run all tests in test vector by saving the addresses in an index file
+    def test_vector_addr_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_addr_index(HdWalletCardanoShelleyFactory(test["coin"]), test, "test_wallet.hdwi", HdWalletCardanoShelleyKeyTypes)
+
+    # Run all tests in test vector by generating the addresses with a reverse index
+    def test_vector_reverse_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_reverse_index(HdWalletCardanoShelleyFactory(test["coin"]), test, "test_wallet.hdwr")
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletCardanoShelleyFactory(test["coin"]), test, workers)
+
+    # Run all tests in test vector by generating both change chains, by comparing them with the ones generated for each chain
+    def test_vector_all_changes(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                hd_wallet = self._create_wallet(HdWalletCardanoShelleyFactory(test["coin"]), test)
+                hd_wallet.SetReverseIndex(HdWalletReverseIndex())
+
+                ref_wallet_dict = {key: value for key, value in test["wallet_data_dict"].items() if key != "change_idx"}
+                ref_wallet_dict["address"] = {}
+                for change_idx in HdWalletCardanoShelleyChanges:
+                    hd_wallet.Generate(**{**test["gen_params"], "change_idx": change_idx})
+                    ref_wallet_dict["address"][f"change_{int(change_idx)}"] = hd_wallet.GetData(HdWalletCardanoShelleyDataTypes.ADDRESS).ToDict()
+
+                # Change levels were already derived, so they shall be got from the derivation cache
+                deriv_cache = hd_wallet.DerivationCache()
+                misses = deriv_cache.Misses()
+                hd_wallet.SetReverseIndex(HdWalletReverseIndex())
+                for workers in (None, 2):
+                    hits = deriv_cache.Hits()
+                    hd_wallet.Generate(**test["gen_params"], all_changes=True, workers=workers)
+                    self.assertEqual(ref_wallet_dict, hd_wallet.ToDict())
+                    self.assertEqual(hits + deriv_cache.Size(), deriv_cache.Hits())
+                self.assertEqual(misses, deriv_cache.Misses())
+                self.assertFalse(hd_wallet.HasData(HdWalletCardanoShelleyDataTypes.CHANGE_IDX))
+
+                change_addrs = hd_wallet.GetData(HdWalletCardanoShelleyDataTypes.ADDRESS)
+                addr_num, addr_off = test["gen_params"]["addr_num"], test["gen_params"]["addr_off"]
+                self.assertEqual(2 * addr_num, change_addrs.Count())
+                self.assertEqual([change_idx for change_idx, _ in change_addrs.Items()], list(HdWalletCardanoShelleyChanges))
+                for change_idx in HdWalletCardanoShelleyChanges:
+                    ref_addrs = ref_wallet_dict["address"][f"change_{int(change_idx)}"]
+                    self.assertEqual(ref_addrs, change_addrs[change_idx].ToDict())
+                    for i, addr in enumerate(ref_addrs.values()):
+                        self.assertEqual((test["wallet_data_dict"].get("account_idx"), int(change_idx), addr_off + i),
+                                         hd_wallet.ReverseIndex().Lookup(addr["address"]))
+                self.assertEqual([addr["address"] for addrs in ref_wallet_dict["address"].values() for addr in addrs.values()],
+                                 [addr.ToDict()["address"] for addr in change_addrs])
+
+    # Run all tests in test vector by saving both change chains to the address files
+    def test_vector_all_changes_savers(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                hd_wallet = self._create_wallet(HdWalletCardanoShelleyFactory(test["coin"]), test)
+                hd_wallet.Generate(**test["gen_params"], all_changes=True)
+                change_addrs = hd_wallet.GetData(HdWalletCardanoShelleyDataTypes.ADDRESS)
+                saver = HdWalletSaver(hd_wallet)
+
+                # NDJSON files contain both chains, with the change index in each record
+                saver.SaveToNdjsonFile("test_wallet.ndjson")
+                with open("test_wallet.ndjson", "r") as f:
+                    records = [json.loads(line) for line in f]
+                os.remove("test_wallet.ndjson")
+                self.assertEqual([{"index": addr_idx, "change_idx": int(change_idx), **{k: v for k, v in addr.ToDict().items() if "priv" not in k}}
+                                  for change_idx, addrs in change_addrs.Items()
+                                  for addr_idx, addr in addrs.IterWithIndex()],
+                                 records)
+
+                # Columnar and index files contain the specified chain
+                for change_idx, addrs in change_addrs.Items():
+                    ref_addrs = [{k: v for k, v in addr.ToDict().items() if "priv" not in k} for addr in addrs]
+
+                    saver.SaveToColumnarFile("test_wallet.hdwc", change_idx=change_idx)
+                    with HdWalletColumnarReader("test_wallet.hdwc") as reader:
+                        self.assertEqual(test["gen_params"]["addr_off"], reader.AddressOffset())
+                        self.assertEqual(ref_addrs, list(reader))
+                    os.remove("test_wallet.hdwc")
+
+                    saver.SaveToIndexFile("test_wallet.hdwi", change_idx=int(change_idx))
+                    with HdWalletAddrIndexReader("test_wallet.hdwi", HdWalletCardanoShelleyKeyTypes) as reader:
+                        self.assertEqual(test["wallet_data_dict"].get("account_idx"), reader.AccountIndex())
+                        self.assertEqual(int(change_idx), reader.ChangeIndex())
+                        self.assertEqual(ref_addrs, [addr_view.ToDict() for addr_view in reader])
+                    os.remove("test_wallet.hdwi")
+
+                # The change index shall be specified and valid
+                self.assertRaises(ValueError, saver.SaveToColumnarFile, "test_wallet.hdwc")
+                self.assertRaises(ValueError, saver.SaveToIndexFile, "test_wallet.hdwi")
+                self.assertRaises(ValueError, saver.SaveToIndexFile, "test_wallet.hdwi", change_idx=2)
+                # The change index of a single chain shall match
+                hd_wallet.Generate(**test["gen_params"])
+                self.assertRaises(ValueError, saver.SaveToIndexFile, "test_wallet.hdwi",
+                                  change_idx=1 - int(test["gen_params"]["change_idx"]))
+        self.assertFalse(os.path.exists("test_wallet.hdwc") or os.path.exists("test_wallet.hdwi"))
+
+    # Test addresses derived by worker processes from the change-level Cip1852 object
+    def test_addr_iter_workers(self):
+        acc_obj = Cip1852.FromSeed(binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f"), Cip1852Coins.CARDANO_ICARUS).Purpose().Coin().Account(0)
+        shelley_obj = CardanoShelley.FromCip1852Object(acc_obj)
+        for change_idx in HdWalletCardanoShelleyChanges:
+            bip_obj = acc_obj.Change(change_idx)
+            change_shelley_obj = CardanoShelley(bip_obj, shelley_obj.StakingObject())
+            self.assertEqual([addr.ToDict() for addr in HdWalletCardanoShelleyAddresses.Iter(shelley_obj.Change(change_idx), 40, 5)],
+                             [addr.ToDict() for addr in HdWalletCardanoShelleyAddresses.Iter(change_shelley_obj, 40, 5, workers=2, bip_obj=bip_obj)])
+        # The Cip1852 object is required by worker processes
+        self.assertRaises(ValueError, lambda: list(HdWalletCardanoShelleyAddresses.Iter(shelley_obj.Change(change_idx), 40, 5, workers=2)))
+        self.assertRaises(ValueError, HdWalletCardanoShelleyAddresses, shelley_obj.Change(change_idx), 40, 5, workers=2)
+
+    # Test batch address encoding, by comparing it with the addresses encoded with the staking key
+    def test_addr_batch(self):
+        for coin in (Cip1852Coins.CARDANO_ICARUS, Cip1852Coins.CARDANO_LEDGER_TESTNET):
+            acc_obj = Cip1852.FromSeed(binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f"), coin).Purpose().Coin().Account(0)
+            for shelley_obj in (CardanoShelley.FromCip1852Object(acc_obj),
+                                CardanoShelley.FromCip1852Object(Cip1852.FromExtendedKey(acc_obj.PublicKey().ToExtended(), coin))):
+                addr_batch = HdWalletCardanoShelleyAddressBatch(shelley_obj)
+                self.assertEqual(Blake2b224.QuickDigest(shelley_obj.PublicKeys().StakingKey().RawCompressed().ToBytes()[1:]),
+                                 addr_batch.StakingKeyHash())
+
+                for change_idx in HdWalletCardanoShelleyChanges:
+                    chg_obj = shelley_obj.Change(change_idx)
+                    for addr_idx in [*range(50), 1000, 2**31 - 1]:
+                        pub_keys = chg_obj.AddressIndex(addr_idx).PublicKeys()
+                        self.assertEqual(pub_keys.ToAddress(),
+                                         addr_batch.EncodeKey(pub_keys.AddressKey().RawCompressed().ToBytes()[1:]))
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Invalid parameters during construction
@@ -341,6 +551,10 @@ class HdWalletCardanoShelleyTests(HdWalletBaseTests):
         invalid_mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon notexistent about"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)
@@ -368,11 +582,19 @@ class HdWalletCardanoShelleyTests(HdWalletBaseTests):
 
         # Invalid parameters for Generate
         self.assertRaises(TypeError, hd_wallet.Generate, change_idx=0)
+        self.assertRaises(TypeError, hd_wallet.Generate, fields={HdWalletCardanoShelleyChanges.CHAIN_EXT})
+        # Invalid parameters for IterAddresses
+        self.assertRaises(TypeError, hd_wallet.IterAddresses, change_idx=0)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=2, stop=1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, stop=2**32)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, workers=0)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2, addr_off=2**32-2)
+        self.assertRaises(ValueError, hd_wallet.Generate, workers=0)
         # Invalid parameters for getting data
         self.assertRaises(TypeError, hd_wallet.GetData, 0)
         self.assertRaises(TypeError, hd_wallet.HasData, 0)
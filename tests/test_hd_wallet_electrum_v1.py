@@ -22,7 +22,12 @@
 # Imports
 import binascii
 
-from py_crypto_hd_wallet import HdWalletElectrumV1Factory, HdWalletElectrumV1WordsNum
+from bip_utils import ElectrumV1
+
+from py_crypto_hd_wallet import (
+    HdWalletElectrumV1DataTypes, HdWalletElectrumV1DerivedKeys, HdWalletElectrumV1Factory, HdWalletElectrumV1KeyTypes,
+    HdWalletElectrumV1WordsNum
+)
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -226,6 +231,21 @@ TEST_VECTOR = [
 ]
 
 
+# ElectrumV1 class counting the key derivations
+class ElectrumV1Counter(ElectrumV1):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.m_deriv_num = 0
+
+    def GetPrivateKey(self, change_idx, addr_idx):
+        self.m_deriv_num += 1
+        return super().GetPrivateKey(change_idx, addr_idx)
+
+    def GetPublicKey(self, change_idx, addr_idx):
+        self.m_deriv_num += 1
+        return super().GetPublicKey(change_idx, addr_idx)
+
+
 #
 # Tests
 #
@@ -235,6 +255,103 @@ class HdWalletElectrumV1Tests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletElectrumV1Factory(), test)
 
+    # Test that keys are derived only once for each address
+    def test_derive_once(self):
+        ref_obj = ElectrumV1.FromSeed(binascii.unhexlify(TEST_VECTOR[1]["wallet_data_dict"]["seed_bytes"]))
+        for electrum_obj in (ElectrumV1Counter(ref_obj.MasterPrivateKey(), None),
+                             ElectrumV1Counter(None, ref_obj.MasterPublicKey())):
+            for addr_idx in range(3):
+                hd_wallet_keys = HdWalletElectrumV1DerivedKeys(electrum_obj, 1, addr_idx, 0)
+                self.assertEqual(addr_idx + 1, electrum_obj.m_deriv_num)
+                self.assertEqual(ref_obj.GetAddress(1, addr_idx),
+                                 hd_wallet_keys.GetKey(HdWalletElectrumV1KeyTypes.ADDRESS))
+                self.assertEqual(ref_obj.GetPublicKey(1, addr_idx).RawUncompressed().ToHex()[2:],
+                                 hd_wallet_keys.GetKey(HdWalletElectrumV1KeyTypes.RAW_PUB))
+            self.assertEqual(electrum_obj.IsPublicOnly(),
+                             not hd_wallet_keys.HasKey(HdWalletElectrumV1KeyTypes.WIF_PRIV))
+
+    # Run all tests in test vector with worker processes
+    def test_vector_workers(self):
+        for test in TEST_VECTOR:
+            test_workers = {**test, "gen_params": {**test["gen_params"], "workers": 2}}
+            self._test_wallet(HdWalletElectrumV1Factory(), test_workers)
+
+    # Run all tests in test vector by storing addresses in compact form
+    def test_vector_compact(self):
+        for test in TEST_VECTOR:
+            test_compact = {**test, "gen_params": {**test["gen_params"], "compact": True}}
+            self._test_wallet(HdWalletElectrumV1Factory(), test_compact)
+
+    # Run all tests in test vector by generating only some fields
+    def test_vector_fields(self):
+        fields = {
+            HdWalletElectrumV1DataTypes.ADDRESS,
+            HdWalletElectrumV1KeyTypes.ADDRESS,
+        }
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_fields(HdWalletElectrumV1Factory(), test, fields)
+
+    # Run all tests in test vector by iterating over the addresses
+    def test_vector_iter(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_iter(HdWalletElectrumV1Factory(),
+                                       test,
+                                       "IterAddresses",
+                                       {
+                                           "change_idx": gen_params["change_idx"],
+                                           "start": gen_params["addr_off"],
+                                           "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                       })
+
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_async(HdWalletElectrumV1Factory(),
+                                        test,
+                                        "IterAddresses",
+                                        {
+                                            "change_idx": gen_params["change_idx"],
+                                            "start": gen_params["addr_off"],
+                                            "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                        })
+
+    # Run all tests in test vector by saving the addresses in NDJSON format
+    def test_vector_ndjson(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_ndjson(HdWalletElectrumV1Factory(), test, "test_wallet.ndjson")
+
+    # Run all tests in test vector by saving the addresses in columnar format
+    def test_vector_columnar(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_columnar(HdWalletElectrumV1Factory(), test, "test_wallet.hdwc")
+
+    # Run all tests in test vector by saving the addresses in an index file
+    def test_vector_addr_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_addr_index(HdWalletElectrumV1Factory(), test, "test_wallet.hdwi", HdWalletElectrumV1KeyTypes)
+
+    # Run all tests in test vector by generating the addresses with a reverse index
+    def test_vector_reverse_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_reverse_index(HdWalletElectrumV1Factory(), test, "test_wallet.hdwr",
+                                                change_idx=test["gen_params"]["change_idx"])
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletElectrumV1Factory(), test, workers)
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Construct a wallet factory
@@ -249,6 +366,10 @@ class HdWalletElectrumV1Tests(HdWalletBaseTests):
         invalid_mnemonic = "like like notexistent like like like like like like like like like"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"e6914a31dc45fe52a979acde7128cfb4a0f8c1b693fc79529eb97ea12afe02")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)
@@ -262,11 +383,19 @@ class HdWalletElectrumV1Tests(HdWalletBaseTests):
 
         # Invalid parameters for Generate
         self.assertRaises(ValueError, hd_wallet.Generate, change_idx=-1)
+        self.assertRaises(TypeError, hd_wallet.Generate, fields={HdWalletElectrumV1WordsNum.WORDS_NUM_12})
+        # Invalid parameters for IterAddresses
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, change_idx=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=2, stop=1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, stop=2**32)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, workers=0)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2, addr_off=2 ** 32 - 2)
+        self.assertRaises(ValueError, hd_wallet.Generate, workers=0)
         # Invalid parameters for getting data
         self.assertRaises(TypeError, hd_wallet.GetData, 0)
         self.assertRaises(TypeError, hd_wallet.HasData, 0)
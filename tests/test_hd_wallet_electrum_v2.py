@@ -22,7 +22,12 @@
 # Imports
 import binascii
 
-from py_crypto_hd_wallet import HdWalletElectrumV2Factory, HdWalletElectrumV2MnemonicTypes, HdWalletElectrumV2WordsNum
+from bip_utils import Bip32Slip10Secp256k1, ElectrumV2Segwit, ElectrumV2Standard
+
+from py_crypto_hd_wallet import (
+    HdWalletElectrumV2DataTypes, HdWalletElectrumV2DerivedKeys, HdWalletElectrumV2Factory, HdWalletElectrumV2KeyTypes,
+    HdWalletElectrumV2MnemonicTypes, HdWalletElectrumV2WordsNum
+)
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -296,6 +301,27 @@ TEST_VECTOR = [
 ]
 
 
+# Mixin for ElectrumV2 classes counting the key derivations
+class ElectrumV2CounterMixin:
+    m_deriv_num = 0
+
+    def GetPrivateKey(self, change_idx, addr_idx):
+        self.m_deriv_num += 1
+        return super().GetPrivateKey(change_idx, addr_idx)
+
+    def GetPublicKey(self, change_idx, addr_idx):
+        self.m_deriv_num += 1
+        return super().GetPublicKey(change_idx, addr_idx)
+
+
+class ElectrumV2StandardCounter(ElectrumV2CounterMixin, ElectrumV2Standard):
+    pass
+
+
+class ElectrumV2SegwitCounter(ElectrumV2CounterMixin, ElectrumV2Segwit):
+    pass
+
+
 #
 # Tests
 #
@@ -305,6 +331,110 @@ class HdWalletElectrumV2Tests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletElectrumV2Factory(test["mnemonic_type"]), test)
 
+    # Test that keys are derived only once for each address
+    def test_derive_once(self):
+        seed_bytes = binascii.unhexlify(TEST_VECTOR[1]["wallet_data_dict"]["seed_bytes"])
+        bip32_pub = Bip32Slip10Secp256k1.FromExtendedKey(
+            Bip32Slip10Secp256k1.FromSeed(seed_bytes).PublicKey().ToExtended()
+        )
+        # Only one key is derived (the private one, or the public one if public-only), all keys are computed from it
+        for electrum_obj, ref_obj in ((ElectrumV2StandardCounter.FromSeed(seed_bytes),
+                                       ElectrumV2Standard.FromSeed(seed_bytes)),
+                                      (ElectrumV2SegwitCounter.FromSeed(seed_bytes),
+                                       ElectrumV2Segwit.FromSeed(seed_bytes)),
+                                      (ElectrumV2StandardCounter(bip32_pub),
+                                       ElectrumV2Standard(bip32_pub))):
+            for addr_idx in range(3):
+                hd_wallet_keys = HdWalletElectrumV2DerivedKeys(electrum_obj, 1, addr_idx, 0)
+                self.assertEqual(addr_idx + 1, electrum_obj.m_deriv_num)
+                self.assertEqual(ref_obj.GetAddress(1, addr_idx),
+                                 hd_wallet_keys.GetKey(HdWalletElectrumV2KeyTypes.ADDRESS))
+
+    # Run all tests in test vector with worker processes
+    def test_vector_workers(self):
+        for test in TEST_VECTOR:
+            test_workers = {**test, "gen_params": {**test["gen_params"], "workers": 2}}
+            self._test_wallet(HdWalletElectrumV2Factory(test["mnemonic_type"]), test_workers)
+
+    # Run all tests in test vector by storing addresses in compact form
+    def test_vector_compact(self):
+        for test in TEST_VECTOR:
+            test_compact = {**test, "gen_params": {**test["gen_params"], "compact": True}}
+            self._test_wallet(HdWalletElectrumV2Factory(test["mnemonic_type"]), test_compact)
+
+    # Run all tests in test vector by generating only some fields
+    def test_vector_fields(self):
+        fields = {
+            HdWalletElectrumV2DataTypes.MASTER_KEY,
+            HdWalletElectrumV2DataTypes.ADDRESS,
+            HdWalletElectrumV2KeyTypes.EX_PUB,
+            HdWalletElectrumV2KeyTypes.RAW_PUB,
+            HdWalletElectrumV2KeyTypes.ADDRESS,
+        }
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_fields(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, fields)
+
+    # Run all tests in test vector by iterating over the addresses
+    def test_vector_iter(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_iter(HdWalletElectrumV2Factory(test["mnemonic_type"]),
+                                       test,
+                                       "IterAddresses",
+                                       {
+                                           "change_idx": gen_params["change_idx"],
+                                           "start": gen_params["addr_off"],
+                                           "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                       })
+
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_async(HdWalletElectrumV2Factory(test["mnemonic_type"]),
+                                        test,
+                                        "IterAddresses",
+                                        {
+                                            "change_idx": gen_params["change_idx"],
+                                            "start": gen_params["addr_off"],
+                                            "stop": gen_params["addr_off"] + gen_params["addr_num"],
+                                        })
+
+    # Run all tests in test vector by saving the addresses in NDJSON format
+    def test_vector_ndjson(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_ndjson(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, "test_wallet.ndjson")
+
+    # Run all tests in test vector by saving the addresses in columnar format
+    def test_vector_columnar(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_columnar(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, "test_wallet.hdwc")
+
+    # Run all tests in test vector by saving the addresses in an index file
+    def test_vector_addr_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_addr_index(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, "test_wallet.hdwi", HdWalletElectrumV2KeyTypes)
+
+    # Run all tests in test vector by generating the addresses with a reverse index
+    def test_vector_reverse_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_reverse_index(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, "test_wallet.hdwr",
+                                                change_idx=test["gen_params"]["change_idx"])
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletElectrumV2Factory(test["mnemonic_type"]), test, workers)
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Invalid parameters during construction
@@ -324,6 +454,10 @@ class HdWalletElectrumV2Tests(HdWalletBaseTests):
         invalid_mnemonic = "buddy notexistent recycle material point hotel easily order diesel globe differ awkward"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)
@@ -339,11 +473,19 @@ class HdWalletElectrumV2Tests(HdWalletBaseTests):
 
         # Invalid parameters for Generate
         self.assertRaises(ValueError, hd_wallet.Generate, change_idx=-1)
+        self.assertRaises(TypeError, hd_wallet.Generate, fields={HdWalletElectrumV2WordsNum.WORDS_NUM_12})
+        # Invalid parameters for IterAddresses
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, change_idx=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=-1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, start=2, stop=1)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, stop=2**32)
+        self.assertRaises(ValueError, hd_wallet.IterAddresses, workers=0)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_off=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, addr_num=2, addr_off=2 ** 32 - 2)
+        self.assertRaises(ValueError, hd_wallet.Generate, workers=0)
         # Invalid parameters for getting data
         self.assertRaises(TypeError, hd_wallet.GetData, 0)
         self.assertRaises(TypeError, hd_wallet.HasData, 0)
@@ -21,10 +21,20 @@
 
 # Imports
 import binascii
+import os
+
+from bip_utils import Monero
+from bip_utils.monero.monero_subaddr import MoneroSubaddress
 
 from py_crypto_hd_wallet import (
-    HdWalletMoneroCoins, HdWalletMoneroDataTypes, HdWalletMoneroFactory, HdWalletMoneroWordsNum
+    HdWalletMoneroCoins,
+    HdWalletMoneroDataTypes,
+    HdWalletMoneroFactory,
+    HdWalletMoneroKeyTypes,
+    HdWalletMoneroSubaddressBatch,
+    HdWalletMoneroWordsNum,
 )
+from py_crypto_hd_wallet.common import HdWalletReverseIndex
 from py_crypto_hd_wallet.monero.hd_wallet_monero_subaddr import HdWalletMoneroSubaddressesConst
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
@@ -224,6 +234,199 @@ class HdWalletMoneroTests(HdWalletBaseTests):
                               HdWalletMoneroDataTypes.SUBADDRESS_OFF,
                               HdWalletMoneroSubaddressesConst.DICT_KEY_FORMAT)
 
+    # Run all tests in test vector with worker processes
+    def test_vector_workers(self):
+        for test in TEST_VECTOR:
+            test_workers = {**test, "gen_params": {**test["gen_params"], "workers": 2}}
+            self._test_wallet(HdWalletMoneroFactory(test["coin"]),
+                              test_workers,
+                              HdWalletMoneroDataTypes.SUBADDRESS_OFF,
+                              HdWalletMoneroSubaddressesConst.DICT_KEY_FORMAT)
+    # Run all tests in test vector by generating only some fields
+    def test_vector_fields(self):
+        fields = {
+            HdWalletMoneroDataTypes.KEY,
+            HdWalletMoneroDataTypes.SUBADDRESS,
+            HdWalletMoneroKeyTypes.PUB_SPEND,
+            HdWalletMoneroKeyTypes.PRIMARY_ADDRESS,
+        }
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_fields(HdWalletMoneroFactory(test["coin"]), test, fields)
+
+    # Run all tests in test vector by iterating over the addresses
+    def test_vector_iter(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_iter(HdWalletMoneroFactory(test["coin"]),
+                                       test,
+                                       "IterSubaddresses",
+                                       {
+                                           "acc_idx": gen_params["acc_idx"],
+                                           "start": gen_params["subaddr_off"],
+                                           "stop": gen_params["subaddr_off"] + gen_params["subaddr_num"],
+                                       },
+                                       "subaddress")
+
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                gen_params = test["gen_params"]
+                self._test_wallet_async(HdWalletMoneroFactory(test["coin"]),
+                                        test,
+                                        "IterSubaddresses",
+                                        {
+                                            "acc_idx": gen_params["acc_idx"],
+                                            "start": gen_params["subaddr_off"],
+                                            "stop": gen_params["subaddr_off"] + gen_params["subaddr_num"],
+                                        },
+                                        "subaddress")
+
+    # Run all tests in test vector by saving the addresses in NDJSON format
+    def test_vector_ndjson(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_ndjson(HdWalletMoneroFactory(test["coin"]), test, "test_wallet.ndjson", "subaddress")
+
+    # Run all tests in test vector by saving the addresses in columnar format
+    def test_vector_columnar(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_columnar(HdWalletMoneroFactory(test["coin"]), test, "test_wallet.hdwc", "subaddress")
+
+    # Run all tests in test vector by saving the addresses in an index file
+    def test_vector_addr_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_addr_index(HdWalletMoneroFactory(test["coin"]), test, "test_wallet.hdwi", HdWalletMoneroKeyTypes, "subaddress")
+
+    # Run all tests in test vector by generating the addresses with a reverse index
+    def test_vector_reverse_index(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_reverse_index(HdWalletMoneroFactory(test["coin"]), test, "test_wallet.hdwr", "subaddress")
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletMoneroFactory(test["coin"]), test, workers)
+
+    # Test subaddresses computed in batch, by comparing them with the ones computed by bip_utils
+    def test_subaddr_batch(self):
+        for coin in (HdWalletMoneroCoins.MONERO_MAINNET, HdWalletMoneroCoins.MONERO_STAGENET):
+            monero_obj = Monero.FromSeed(binascii.unhexlify(b"2c9623882df4940a734b009e0732ce5a8de7a62c4c1a2a53767a8f6c04874107"),
+                                         coin)
+            subaddr_batch = HdWalletMoneroSubaddressBatch(monero_obj)
+
+            for acc_idx, subaddr_num, subaddr_off in ((0, 10, 0), (1, 10, 0), (300, 5, 1000), (2**32 - 1, 2, 2**32 - 2)):
+                self.assertEqual(
+                    [monero_obj.Subaddress(subaddr_idx, acc_idx) for subaddr_idx in range(subaddr_off, subaddr_off + subaddr_num)],
+                    list(subaddr_batch.Iter(acc_idx, subaddr_num, subaddr_off))
+                )
+            # Watch-only
+            monero_obj = Monero.FromWatchOnly(monero_obj.PrivateViewKey().Raw().ToBytes(),
+                                              monero_obj.PublicSpendKey().RawCompressed().ToBytes(),
+                                              coin)
+            self.assertEqual([monero_obj.Subaddress(subaddr_idx, 2) for subaddr_idx in range(5)],
+                             list(HdWalletMoneroSubaddressBatch(monero_obj).Iter(2, 5, 0)))
+
+        # Invalid indexes
+        self.assertRaises(ValueError, lambda: list(subaddr_batch.Iter(-1, 1, 0)))
+        self.assertRaises(ValueError, lambda: list(subaddr_batch.Iter(2**32, 1, 0)))
+        self.assertRaises(ValueError, lambda: list(subaddr_batch.Iter(0, 1, -1)))
+        self.assertRaises(ValueError, lambda: list(subaddr_batch.Iter(0, 2, 2**32 - 1)))
+
+    # Test subaddress keys computed in batch, by comparing them with the ones computed by bip_utils
+    def test_subaddr_batch_keys(self):
+        monero_obj = Monero.FromSeed(binascii.unhexlify(b"2c9623882df4940a734b009e0732ce5a8de7a62c4c1a2a53767a8f6c04874107"))
+        monero_subaddr = MoneroSubaddress(monero_obj.PrivateViewKey(), monero_obj.PublicSpendKey())
+        subaddr_batch = HdWalletMoneroSubaddressBatch(monero_obj)
+
+        # Account 0 crossing subaddress 0 (i.e. the primary address), non-zero accounts
+        for acc_idx, subaddr_num, subaddr_off in ((0, 1, 0), (0, 5, 0), (1, 5, 0), (5, 3, 7), (2**32 - 1, 3, 0)):
+            subaddr_idxs = range(subaddr_off, subaddr_off + subaddr_num)
+            keys = [monero_subaddr.ComputeKeys(subaddr_idx, acc_idx) for subaddr_idx in subaddr_idxs]
+
+            self.assertEqual(
+                [(pub_skey.RawCompressed().ToBytes(), pub_vkey.RawCompressed().ToBytes()) for pub_skey, pub_vkey in keys],
+                list(subaddr_batch.IterKeys(acc_idx, subaddr_num, subaddr_off))
+            )
+            self.assertEqual([pub_skey.RawCompressed().ToBytes() for pub_skey, _ in keys],
+                             list(subaddr_batch.IterSpendKeys(acc_idx, subaddr_num, subaddr_off)))
+            self.assertEqual([monero_obj.Subaddress(subaddr_idx, acc_idx) for subaddr_idx in subaddr_idxs],
+                             list(subaddr_batch.Iter(acc_idx, subaddr_num, subaddr_off)))
+
+        self.assertEqual([monero_obj.PrimaryAddress()], list(subaddr_batch.Iter(0, 1, 0)))
+
+    # Test subaddresses of multiple accounts, by comparing them with the ones generated for each account
+    def test_subaddr_grid(self):
+        hd_wallet = HdWalletMoneroFactory().CreateRandom("test_wallet")
+        hd_wallet.SetReverseIndex(HdWalletReverseIndex())
+
+        acc_num, subaddr_num, acc_off, subaddr_off = 3, 4, 1, 10
+        hd_wallet.GenerateSubaddressGrid(acc_num, subaddr_num, acc_off, subaddr_off)
+        subaddr_grid = hd_wallet.GetData(HdWalletMoneroDataTypes.SUBADDRESS_GRID)
+
+        self.assertEqual(acc_num * subaddr_num, subaddr_grid.Count())
+        self.assertEqual(range(acc_off, acc_off + acc_num), subaddr_grid.AccountIndexes())
+        self.assertEqual(range(subaddr_off, subaddr_off + subaddr_num), subaddr_grid.SubaddressIndexes())
+        self.assertEqual([f"account_{acc_idx}" for acc_idx in range(acc_off, acc_off + acc_num)],
+                         list(hd_wallet.ToDict()["subaddress_grid"].keys()))
+
+        for acc_idx in range(acc_off, acc_off + acc_num):
+            subaddrs = list(hd_wallet.IterSubaddresses(acc_idx, subaddr_off, subaddr_off + subaddr_num))
+            for subaddr_idx, subaddr in enumerate(subaddrs, subaddr_off):
+                self.assertEqual(subaddr, subaddr_grid[acc_idx, subaddr_idx])
+                self.assertEqual((acc_idx, None, subaddr_idx), hd_wallet.ReverseIndex().Lookup(subaddr))
+
+        self.assertNotIn((acc_off - 1, subaddr_off), subaddr_grid)
+        self.assertNotIn((acc_off, subaddr_off + subaddr_num), subaddr_grid)
+        self.assertRaises(KeyError, lambda: subaddr_grid[acc_off, subaddr_off - 1])
+
+        # Iterating with or without worker processes gives the same result
+        subaddrs = list(hd_wallet.IterSubaddressGrid(2, 300, 0, 0))
+        self.assertEqual(600, len(subaddrs))
+        self.assertEqual(subaddrs, list(hd_wallet.IterSubaddressGrid(2, 300, 0, 0, workers=2)))
+        self.assertEqual(subaddrs[:4], [(0, i, subaddr) for i, subaddr in enumerate(hd_wallet.IterSubaddresses(0, 0, 4))])
+
+    # Test the public spend keys lookup table built from a watch-only wallet
+    def test_spend_key_index(self):
+        monero_obj = Monero.FromSeed(binascii.unhexlify(b"2c9623882df4940a734b009e0732ce5a8de7a62c4c1a2a53767a8f6c04874107"))
+        hd_wallet = HdWalletMoneroFactory().CreateFromWatchOnly("test_wallet",
+                                                                monero_obj.PrivateViewKey().Raw().ToBytes(),
+                                                                monero_obj.PublicSpendKey().RawCompressed().ToBytes())
+        monero_subaddr = MoneroSubaddress(monero_obj.PrivateViewKey(), monero_obj.PublicSpendKey())
+
+        def spend_key(acc_idx, subaddr_idx):
+            return monero_subaddr.ComputeKeys(subaddr_idx, acc_idx)[0].RawCompressed().ToBytes()
+
+        rev_index = hd_wallet.BuildSpendKeyIndex([0, 1], 10)
+        self.assertEqual(20, rev_index.Count())
+        # Incremental growth with a new account
+        self.assertIs(rev_index, hd_wallet.BuildSpendKeyIndex([5], 10, 100, rev_index=rev_index))
+        self.assertEqual(30, rev_index.Count())
+
+        file_path = "test_wallet.hdwr"
+        rev_index.Save(file_path)
+        for loaded_index in (rev_index, HdWalletReverseIndex.Load(file_path), HdWalletReverseIndex.Load(file_path, True)):
+            for acc_idx, subaddr_idxs in ((0, range(10)), (1, range(10)), (5, range(100, 110))):
+                for subaddr_idx in subaddr_idxs:
+                    self.assertEqual((acc_idx, None, subaddr_idx), loaded_index.Lookup(spend_key(acc_idx, subaddr_idx)))
+            self.assertIsNone(loaded_index.Lookup(spend_key(5, 99)))
+        os.remove(file_path)
+
+        # Invalid parameters
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [])
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [-1])
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [2**32])
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [0], 0)
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [0], 1, -1)
+        self.assertRaises(ValueError, hd_wallet.BuildSpendKeyIndex, [0], 2, 2**32 - 2)
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Invalid parameters during construction
@@ -241,6 +444,10 @@ class HdWalletMoneroTests(HdWalletBaseTests):
         invalid_mnemonic = "abbey abbey abbey abbey abbey abbey abbey abbey abbey abbey abbey notexistent abbey"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromPrivateKey
         invalid_priv_key = binascii.unhexlify(b"132750b8489385430d8bfa3871ade97da7f5d5ef134a5c85184f88743b526e71d0")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromPrivateKey, "test_wallet", invalid_priv_key)
@@ -254,12 +461,28 @@ class HdWalletMoneroTests(HdWalletBaseTests):
 
         # Invalid parameters for Generate
         self.assertRaises(ValueError, hd_wallet.Generate, acc_idx=-1)
+        self.assertRaises(TypeError, hd_wallet.Generate, fields={HdWalletMoneroWordsNum.WORDS_NUM_12})
+        # Invalid parameters for IterSubaddresses
+        self.assertRaises(ValueError, hd_wallet.IterSubaddresses, acc_idx=-1)
+        self.assertRaises(ValueError, hd_wallet.IterSubaddresses, start=-1)
+        self.assertRaises(ValueError, hd_wallet.IterSubaddresses, start=2, stop=1)
+        self.assertRaises(ValueError, hd_wallet.IterSubaddresses, stop=2**32)
+        self.assertRaises(ValueError, hd_wallet.IterSubaddresses, workers=0)
         self.assertRaises(ValueError, hd_wallet.Generate, acc_idx=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, subaddr_num=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, subaddr_num=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, subaddr_off=-1)
         self.assertRaises(ValueError, hd_wallet.Generate, subaddr_off=2**32)
         self.assertRaises(ValueError, hd_wallet.Generate, subaddr_num=2, subaddr_off=2**32-2)
+        self.assertRaises(ValueError, hd_wallet.Generate, workers=0)
+        # Invalid parameters for GenerateSubaddressGrid and IterSubaddressGrid
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, -1, 1)
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, 1, -1)
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, 1, 1, -1)
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, 2, 1, 2**32 - 2)
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, 1, 2, 0, 2**32 - 2)
+        self.assertRaises(ValueError, hd_wallet.GenerateSubaddressGrid, 1, 1, workers=0)
+        self.assertRaises(ValueError, hd_wallet.IterSubaddressGrid, 1, 1, 0, -1)
         # Invalid parameters for getting data
         self.assertRaises(TypeError, hd_wallet.GetData, 0)
         self.assertRaises(TypeError, hd_wallet.HasData, 0)
@@ -22,7 +22,13 @@
 # Imports
 import binascii
 
-from py_crypto_hd_wallet import HdWalletSubstrateCoins, HdWalletSubstrateFactory, HdWalletSubstrateWordsNum
+from py_crypto_hd_wallet import (
+    HdWalletSubstrateCoins,
+    HdWalletSubstrateDataTypes,
+    HdWalletSubstrateFactory,
+    HdWalletSubstrateKeyTypes,
+    HdWalletSubstrateWordsNum,
+)
 from tests.test_hd_wallet_base import HdWalletBaseTests
 
 
@@ -169,6 +175,45 @@ class HdWalletSubstrateTests(HdWalletBaseTests):
         for test in TEST_VECTOR:
             self._test_wallet(HdWalletSubstrateFactory(test["coin"]), test)
 
+    # Run all tests in test vector by using the asynchronous API
+    def test_vector_async(self):
+        for test in TEST_VECTOR:
+            if test["type"] != "random":
+                self._test_wallet_async(HdWalletSubstrateFactory(test["coin"]), test)
+
+    # Run all mnemonic tests in test vector by creating wallets in batch
+    def test_vector_batch(self):
+        for test in TEST_VECTOR:
+            if test["type"] == "mnemonic":
+                for workers in (None, 2):
+                    self._test_wallet_batch(HdWalletSubstrateFactory(test["coin"]), test, workers)
+
+    # Test generation of multiple paths, by comparing it with the generation of each single path
+    def test_generate_many(self):
+        hd_wallet = HdWalletSubstrateFactory(HdWalletSubstrateCoins.POLKADOT).CreateRandom("test_wallet")
+        paths = [f"//hard/soft/{i}" for i in range(5)] + ["", "//hard", "//other/0", "//hard/soft/00"]
+
+        hd_wallet.GenerateMany(paths + ["//hard"])
+        path_keys = hd_wallet.GetData(HdWalletSubstrateDataTypes.PATH_KEYS)
+
+        # Duplicated paths are stored once, in the specified order
+        self.assertEqual(len(paths), path_keys.Count())
+        self.assertEqual(paths, path_keys.Paths())
+        self.assertEqual(paths, list(path_keys.ToDict().keys()))
+        # Each shared junction is derived once ("//hard/soft/00" is the same junction of "//hard/soft/0")
+        self.assertEqual(9, path_keys.DerivationsNum())
+
+        for path in paths:
+            hd_wallet.Generate(path=path)
+            keys = hd_wallet.GetData(HdWalletSubstrateDataTypes.KEY)
+            # The nonce of soft-derived private keys is random, so only the public keys and addresses are compared
+            for key_type in (HdWalletSubstrateKeyTypes.PUB, HdWalletSubstrateKeyTypes.ADDRESS):
+                self.assertEqual(keys.GetKey(key_type), path_keys[path].GetKey(key_type))
+
+        # Invalid paths
+        self.assertRaises(ValueError, hd_wallet.GenerateMany, ["//hard", "///0"])
+        self.assertRaises(ValueError, hd_wallet.GenerateMany, ["hard"])
+
     # Test invalid parameters
     def test_invalid_params(self):
         # Invalid parameters during construction
@@ -186,6 +231,10 @@ class HdWalletSubstrateTests(HdWalletBaseTests):
         invalid_mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon notexistent about"
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonic, "test_wallet", invalid_mnemonic)
 
+        # Invalid parameters for CreateFromMnemonics
+        self.assertRaises(ValueError, hd_wallet_fact.CreateFromMnemonics, [], 0)
+        self.assertRaises(ValueError, lambda: list(hd_wallet_fact.CreateFromMnemonics([("test_wallet", invalid_mnemonic)], 2)))
+
         # Invalid parameter for CreateFromSeed
         invalid_seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e")
         self.assertRaises(ValueError, hd_wallet_fact.CreateFromSeed, "test_wallet", invalid_seed)